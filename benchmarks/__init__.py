@@ -0,0 +1,10 @@
+"""
+NetworkX benchmarks.
+
+The benchmarks follow the conventions of airspeed velocity (asv): each
+module holds classes whose ``time_*`` methods are timed, after calling
+``setup`` with every combination of the values listed in ``params``.
+They can be run with ``asv run`` from the root of the repository or,
+without asv, with ``python -m benchmarks.run`` which writes the timings
+and the peak memory of every benchmark to a JSON file.
+"""
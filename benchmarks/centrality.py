@@ -0,0 +1,76 @@
+"""
+Benchmarks of centrality and link analysis algorithms.
+"""
+import networkx as nx
+
+from .common import SIZES, SMALL_SIZES, random_graph, requires
+
+
+class PathCentrality(object):
+    params = [SMALL_SIZES]
+    param_names = ['n']
+
+    def setup(self, n):
+        self.G = random_graph(n)
+        self.W = random_graph(n, weight='weight')
+
+    def time_betweenness_centrality(self, n):
+        nx.betweenness_centrality(self.G)
+
+    def time_betweenness_centrality_weighted(self, n):
+        nx.betweenness_centrality(self.W, weight='weight')
+
+    def time_betweenness_centrality_sampled(self, n):
+        nx.betweenness_centrality(self.G, k=n // 10, seed=42)
+
+    def time_approximate_betweenness_centrality(self, n):
+        nx.approximate_betweenness_centrality(self.G, epsilon=0.05, seed=42)
+
+    def time_edge_betweenness_centrality(self, n):
+        nx.edge_betweenness_centrality(self.G)
+
+    def time_closeness_centrality(self, n):
+        nx.closeness_centrality(self.G)
+
+    def time_harmonic_centrality(self, n):
+        nx.harmonic_centrality(self.G)
+
+
+class SpectralCentrality(object):
+    params = [SIZES]
+    param_names = ['n']
+
+    def setup(self, n):
+        self.G = random_graph(n)
+        self.D = random_graph(n, directed=True)
+
+    def time_degree_centrality(self, n):
+        nx.degree_centrality(self.G)
+
+    def time_eigenvector_centrality(self, n):
+        nx.eigenvector_centrality(self.G)
+
+    def time_pagerank(self, n):
+        nx.pagerank(self.D)
+
+    def time_hits(self, n):
+        nx.hits(self.D)
+
+
+class SparseCentrality(object):
+    params = [SIZES]
+    param_names = ['n']
+
+    def setup(self, n):
+        requires('numpy', 'scipy')
+        self.G = random_graph(n)
+        self.D = random_graph(n, directed=True)
+
+    def time_pagerank_scipy(self, n):
+        nx.pagerank_scipy(self.D)
+
+    def time_eigenvector_centrality_numpy(self, n):
+        nx.eigenvector_centrality_numpy(self.G)
+
+    def time_katz_centrality_numpy(self, n):
+        nx.katz_centrality_numpy(self.G, alpha=0.01)
@@ -0,0 +1,88 @@
+"""
+Benchmarks of graph construction and reporting.
+"""
+import networkx as nx
+
+from .common import SIZES, random_graph
+
+CLASSES = ['Graph', 'DiGraph', 'MultiGraph', 'MultiDiGraph']
+
+
+class Construction(object):
+    params = [CLASSES, SIZES]
+    param_names = ['graph_class', 'n']
+
+    def setup(self, graph_class, n):
+        self.graph_class = getattr(nx, graph_class)
+        self.edges = list(random_graph(n, weight='weight').edges(data=True))
+        self.pairs = [(u, v) for u, v, d in self.edges]
+        self.G = self.graph_class(self.edges)
+        self.nodes = list(range(0, n, 2))
+
+    def time_add_nodes_from(self, graph_class, n):
+        self.graph_class().add_nodes_from(self.G)
+
+    def time_add_edges_from(self, graph_class, n):
+        self.graph_class().add_edges_from(self.edges)
+
+    def time_add_edge(self, graph_class, n):
+        G = self.graph_class()
+        for u, v, d in self.edges:
+            G.add_edge(u, v, weight=d['weight'])
+
+    def time_remove_edges_from(self, graph_class, n):
+        self.graph_class(self.edges).remove_edges_from(self.pairs)
+
+    def time_copy(self, graph_class, n):
+        self.G.copy()
+
+    def time_subgraph(self, graph_class, n):
+        self.G.subgraph(self.nodes)
+
+    def time_to_directed(self, graph_class, n):
+        self.G.to_directed()
+
+    def time_to_undirected(self, graph_class, n):
+        self.G.to_undirected()
+
+
+class Reporting(object):
+    params = [CLASSES, SIZES]
+    param_names = ['graph_class', 'n']
+
+    def setup(self, graph_class, n):
+        self.G = getattr(nx, graph_class)(random_graph(n, weight='weight'))
+
+    def time_edges(self, graph_class, n):
+        for e in self.G.edges(data='weight'):
+            pass
+
+    def time_neighbors(self, graph_class, n):
+        G = self.G
+        for u in G:
+            for v in G.neighbors(u):
+                pass
+
+    def time_degree(self, graph_class, n):
+        for u, d in self.G.degree(weight='weight'):
+            pass
+
+    def time_adjacency(self, graph_class, n):
+        for u, nbrs in self.G.adjacency():
+            for v in nbrs:
+                pass
+
+
+class CompactGraphs(object):
+    params = [SIZES]
+    param_names = ['n']
+
+    def setup(self, n):
+        self.G = random_graph(n, weight='weight')
+        self.D = random_graph(n, directed=True, weight='weight')
+
+    def time_csr_graph(self, n):
+        nx.CSRGraph(self.G)
+
+    def time_csr_digraph(self, n):
+        nx.CSRDiGraph(self.D)
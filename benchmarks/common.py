@@ -0,0 +1,55 @@
+"""
+Graphs shared by the benchmarks.
+"""
+import random
+
+import networkx as nx
+
+# Number of nodes of the graphs used by most benchmarks. Graphs have five
+# times as many edges as nodes.
+SIZES = [100, 1000, 10000]
+
+# Sizes for the algorithms taking more than linear time.
+SMALL_SIZES = [100, 500]
+
+_graphs = {}
+
+
+def random_graph(n, directed=False, weight=None, seed=42):
+    """Return a random graph with `n` nodes and ``5 * n`` edges.
+
+    Graphs are cached, so that they must not be modified.  If `weight`
+    is not None, edges get random integer weights between 1 and 100 as
+    the attribute `weight`.
+    """
+    key = (n, directed, weight, seed)
+    if key not in _graphs:
+        G = nx.gnm_random_graph(n, 5 * n, seed=seed, directed=directed)
+        if weight is not None:
+            rng = random.Random(seed)
+            for u, v, d in G.edges(data=True):
+                d[weight] = rng.randint(1, 100)
+        _graphs[key] = G
+    return _graphs[key]
+
+
+def random_dag(n, seed=42):
+    """Return a random directed acyclic graph with `n` nodes and about
+    ``5 * n`` edges.
+    """
+    G = nx.DiGraph()
+    G.add_nodes_from(range(n))
+    G.add_edges_from((min(u, v), max(u, v))
+                     for u, v in random_graph(n, seed=seed).edges())
+    return G
+
+
+def requires(*modules):
+    """Raise NotImplementedError, which makes asv and the runner skip a
+    benchmark, if one of `modules` cannot be imported.
+    """
+    for name in modules:
+        try:
+            __import__(name)
+        except ImportError:
+            raise NotImplementedError('%s is not available' % name)
@@ -0,0 +1,52 @@
+"""
+Benchmarks of flow algorithms.
+"""
+import networkx as nx
+from networkx.algorithms import flow
+
+from .common import SMALL_SIZES, random_graph
+
+FLOW_FUNCS = ['edmonds_karp', 'preflow_push', 'shortest_augmenting_path']
+
+
+class MaximumFlow(object):
+    params = [FLOW_FUNCS, SMALL_SIZES]
+    param_names = ['flow_func', 'n']
+
+    def setup(self, flow_func, n):
+        self.G = random_graph(n, directed=True, weight='capacity')
+        self.flow_func = getattr(flow, flow_func)
+
+    def time_maximum_flow_value(self, flow_func, n):
+        nx.maximum_flow_value(self.G, 0, 1, flow_func=self.flow_func)
+
+    def time_minimum_cut(self, flow_func, n):
+        nx.minimum_cut(self.G, 0, 1, flow_func=self.flow_func)
+
+
+class MinimumCostFlow(object):
+    params = [SMALL_SIZES]
+    param_names = ['n']
+
+    def setup(self, n):
+        G = random_graph(n, directed=True, weight='capacity').copy()
+        for u, v, d in G.edges(data=True):
+            d['weight'] = (u * v) % 10 + 1
+        self.G = G
+
+    def time_max_flow_min_cost(self, n):
+        nx.max_flow_min_cost(self.G, 0, 1)
+
+
+class Connectivity(object):
+    params = [[50, 100]]
+    param_names = ['n']
+
+    def setup(self, n):
+        self.G = random_graph(n)
+
+    def time_node_connectivity(self, n):
+        nx.node_connectivity(self.G)
+
+    def time_edge_connectivity(self, n):
+        nx.edge_connectivity(self.G)
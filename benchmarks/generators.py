@@ -0,0 +1,41 @@
+"""
+Benchmarks of graph generators.
+"""
+import networkx as nx
+
+from .common import SIZES
+
+
+class Generators(object):
+    params = [SIZES]
+    param_names = ['n']
+
+    def time_complete_graph(self, n):
+        nx.complete_graph(n // 10)
+
+    def time_grid_2d_graph(self, n):
+        nx.grid_2d_graph(n // 10, 10)
+
+    def time_gnp_random_graph(self, n):
+        nx.gnp_random_graph(n, 10.0 / n, seed=42)
+
+    def time_fast_gnp_random_graph(self, n):
+        nx.fast_gnp_random_graph(n, 10.0 / n, seed=42)
+
+    def time_gnm_random_graph(self, n):
+        nx.gnm_random_graph(n, 5 * n, seed=42)
+
+    def time_barabasi_albert_graph(self, n):
+        nx.barabasi_albert_graph(n, 5, seed=42)
+
+    def time_watts_strogatz_graph(self, n):
+        nx.watts_strogatz_graph(n, 10, 0.1, seed=42)
+
+    def time_random_regular_graph(self, n):
+        nx.random_regular_graph(4, n, seed=42)
+
+    def time_configuration_model(self, n):
+        nx.configuration_model([4] * n, seed=42)
+
+    def time_powerlaw_cluster_graph(self, n):
+        nx.powerlaw_cluster_graph(n, 5, 0.1, seed=42)
@@ -0,0 +1,64 @@
+"""
+Benchmarks of isomorphism tests.
+"""
+import random
+
+import networkx as nx
+from networkx.algorithms import isomorphism as iso
+
+from .common import random_graph
+
+
+def _shuffled(G, seed=42):
+    """Return a copy of `G` with nodes relabeled at random."""
+    nodes = list(G)
+    labels = list(nodes)
+    random.Random(seed).shuffle(labels)
+    return nx.relabel_nodes(G, dict(zip(nodes, labels)))
+
+
+class Isomorphism(object):
+    params = [[100, 300]]
+    param_names = ['n']
+
+    def setup(self, n):
+        self.G = random_graph(n)
+        self.H = _shuffled(self.G)
+        self.D = random_graph(n, directed=True)
+        self.E = _shuffled(self.D)
+        # Regular graphs have no degree information to guide the search.
+        self.R = nx.random_regular_graph(3, n // 10, seed=42)
+        self.S = _shuffled(self.R)
+
+    def time_is_isomorphic(self, n):
+        nx.is_isomorphic(self.G, self.H)
+
+    def time_is_isomorphic_directed(self, n):
+        nx.is_isomorphic(self.D, self.E)
+
+    def time_is_isomorphic_regular(self, n):
+        nx.is_isomorphic(self.R, self.S)
+
+    def time_could_be_isomorphic(self, n):
+        nx.could_be_isomorphic(self.G, self.H)
+
+    def time_faster_could_be_isomorphic(self, n):
+        nx.faster_could_be_isomorphic(self.G, self.H)
+
+
+class SubgraphIsomorphism(object):
+    params = [[100, 300]]
+    param_names = ['n']
+
+    def setup(self, n):
+        self.G = random_graph(n)
+        self.triangle = nx.complete_graph(3)
+        self.square = nx.cycle_graph(4)
+
+    def time_subgraph_is_isomorphic(self, n):
+        iso.GraphMatcher(self.G, self.square).subgraph_is_isomorphic()
+
+    def time_triangle_isomorphisms(self, n):
+        for mapping in iso.GraphMatcher(
+                self.G, self.triangle).subgraph_isomorphisms_iter():
+            pass
@@ -0,0 +1,105 @@
+"""
+Benchmarks of reading and writing graphs in every supported format.
+
+Shapefiles are left out: they need GDAL and graphs with coordinates as
+nodes.
+"""
+import json
+import os
+import shutil
+import tempfile
+
+import networkx as nx
+from networkx.readwrite import json_graph
+
+from .common import SIZES, random_graph, requires
+
+
+def _write_leda(G, path):
+    # NetworkX only reads the LEDA format.
+    index = dict((u, i) for i, u in enumerate(G, 1))
+    with open(path, 'w') as f:
+        f.write('LEDA.GRAPH\nstring\nstring\n-2\n%d\n' % len(G))
+        for u in G:
+            f.write('|{%s}|\n' % u)
+        f.write('%d\n' % G.number_of_edges())
+        for u, v, w in G.edges(data='weight'):
+            f.write('%d %d 0 |{%s}|\n' % (index[u], index[v], w))
+
+
+def _write_json(data):
+    def write(G, path):
+        with open(path, 'w') as f:
+            json.dump(data(G), f)
+    return write
+
+
+def _read_json(graph):
+    def read(path):
+        with open(path) as f:
+            return graph(json.load(f))
+    return read
+
+
+def _write_edgelist_weights(G, path):
+    nx.write_edgelist(G, path, data=['weight'])
+
+
+def _read_edgelist_fast(path):
+    return nx.read_edgelist(path, nodetype=int, data=[('weight', int)],
+                            engine='fast')
+
+
+def _read_binary_mmap(path):
+    return nx.read_binary_graph(path, mmap=True)
+
+
+# name: (writer, reader, required modules)
+FORMATS = {
+    'adjlist': (nx.write_adjlist, nx.read_adjlist, ()),
+    'multiline_adjlist': (nx.write_multiline_adjlist,
+                          nx.read_multiline_adjlist, ()),
+    'edgelist': (nx.write_edgelist, nx.read_edgelist, ()),
+    'edgelist_fast': (_write_edgelist_weights, _read_edgelist_fast, ()),
+    'weighted_edgelist': (nx.write_weighted_edgelist,
+                          nx.read_weighted_edgelist, ()),
+    'gpickle': (nx.write_gpickle, nx.read_gpickle, ()),
+    'binary': (nx.write_binary_graph, nx.read_binary_graph, ()),
+    'binary_mmap': (nx.write_binary_graph, _read_binary_mmap, ('numpy',)),
+    'gml': (nx.write_gml, nx.read_gml, ()),
+    'graphml': (nx.write_graphml, nx.read_graphml, ()),
+    'gexf': (nx.write_gexf, nx.read_gexf, ()),
+    'pajek': (nx.write_pajek, nx.read_pajek, ()),
+    'leda': (_write_leda, nx.read_leda, ()),
+    'graph6': (nx.write_graph6, nx.read_graph6, ()),
+    'sparse6': (nx.write_sparse6, nx.read_sparse6, ()),
+    'yaml': (nx.write_yaml, nx.read_yaml, ('yaml',)),
+    'node_link': (_write_json(json_graph.node_link_data),
+                  _read_json(json_graph.node_link_graph), ()),
+    'adjacency': (_write_json(json_graph.adjacency_data),
+                  _read_json(json_graph.adjacency_graph), ()),
+}
+
+
+class ReadWrite(object):
+    params = [sorted(FORMATS), SIZES]
+    param_names = ['format', 'n']
+
+    def setup(self, format, n):
+        self.write, self.read, modules = FORMATS[format]
+        requires(*modules)
+        if format == 'graph6' and n > 1000:
+            raise NotImplementedError('graph6 stores the adjacency matrix')
+        self.G = random_graph(n, weight='weight')
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'graph')
+        self.write(self.G, self.path)
+
+    def teardown(self, format, n):
+        shutil.rmtree(self.dir)
+
+    def time_read(self, format, n):
+        self.read(self.path)
+
+    def time_write(self, format, n):
+        self.write(self.G, os.path.join(self.dir, 'output'))
@@ -0,0 +1,248 @@
+"""
+Run the benchmarks without asv and record their results in JSON.
+
+For every benchmark and combination of its parameters, the runner
+records the best time of a call over several repeats and the peak
+memory allocated during a call, as traced by :mod:`tracemalloc` (on
+Python 3.4 and later; the memory is ``null`` otherwise).
+
+Usage, from the root of the repository::
+
+    python -m benchmarks.run -o results.json
+    python -m benchmarks.run -b "shortest_paths|readwrite" -o new.json \\
+        --compare old.json
+
+With ``--compare``, the benchmarks whose time or peak memory grew by
+more than the ``--threshold`` factor since the results of a previous run
+are listed, and the exit status is 1 if there are any.
+"""
+from __future__ import print_function
+
+import argparse
+from datetime import datetime
+import gc
+import importlib
+import itertools
+import json
+import os
+import pkgutil
+import platform
+import re
+import subprocess
+import sys
+import timeit
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+import networkx as nx
+
+import benchmarks
+
+# Modules of the benchmarks package holding no benchmarks.
+_HELPERS = ('common', 'run')
+
+
+def discover(pattern=None):
+    """Generate the benchmarks whose name matches `pattern`.
+
+    Benchmarks are generated as (name, class, method, parameters) tuples,
+    one for each combination of the parameters of the class.  The name of
+    a benchmark is ``module.Class.method``.
+    """
+    regex = re.compile(pattern) if pattern else None
+    for _, module_name, _ in pkgutil.iter_modules(benchmarks.__path__):
+        if module_name in _HELPERS:
+            continue
+        module = importlib.import_module('benchmarks.' + module_name)
+        for class_name, cls in sorted(vars(module).items()):
+            if not isinstance(cls, type) or cls.__module__ != module.__name__:
+                continue
+            for method in sorted(dir(cls)):
+                if not method.startswith('time_'):
+                    continue
+                name = '%s.%s.%s' % (module_name, class_name, method)
+                if regex is not None and not regex.search(name):
+                    continue
+                for values in parameters(cls):
+                    yield name, cls, method, values
+
+
+def parameters(cls):
+    """Return the list of the combinations of the parameters of `cls`.
+
+    As in asv, `params` is either the list of the values of a single
+    parameter or a list of such lists.
+    """
+    params = getattr(cls, 'params', [])
+    if params and not isinstance(params[0], list):
+        params = [params]
+    return list(itertools.product(*params))
+
+
+def peak_memory(func):
+    """Return the peak memory in bytes allocated while calling `func`."""
+    if tracemalloc is None:
+        return None
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmark(cls, method, values, repeat=3, min_time=0.1):
+    """Run a benchmark and return its result as a dict.
+
+    The benchmark is called in loops lasting at least `min_time` seconds
+    and the time of a call is measured `repeat` times.  The result holds
+    the best time, all the times, the number of calls per loop and the
+    peak memory of one call, or the reason why the benchmark was skipped
+    or failed.
+    """
+    instance = cls()
+    try:
+        if hasattr(instance, 'setup'):
+            instance.setup(*values)
+    except NotImplementedError as e:
+        return {'skipped': str(e)}
+    try:
+        bound = getattr(instance, method)
+        func = lambda: bound(*values)
+        timer = timeit.Timer(func)
+        number = 1
+        while True:
+            total = timer.timeit(number)
+            if total >= min_time:
+                break
+            if total <= 0:
+                number *= 10
+            else:
+                number = max(number + 1, int(number * 1.2 * min_time / total))
+        times = [total / number]
+        times.extend(timer.timeit(number) / number
+                     for i in range(repeat - 1))
+        return {'time': min(times), 'times': times, 'number': number,
+                'peak_memory': peak_memory(func)}
+    except Exception as e:
+        return {'error': '%s: %s' % (type(e).__name__, e)}
+    finally:
+        if hasattr(instance, 'teardown'):
+            instance.teardown(*values)
+
+
+def environment():
+    """Return a dict describing the machine and the code benchmarked."""
+    try:
+        commit = subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], stderr=subprocess.STDOUT,
+            cwd=os.path.dirname(os.path.abspath(nx.__file__)))
+        commit = commit.decode('ascii').strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {'networkx': nx.__version__,
+            'commit': commit,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'date': datetime.utcnow().isoformat()}
+
+
+def compare(old, new, threshold):
+    """Return the (name, measure, old value, new value) tuples of the
+    results of `new` worse than those of `old` by a factor larger than
+    `threshold`.
+    """
+    regressions = []
+    for name in sorted(set(old) & set(new)):
+        for measure in ('time', 'peak_memory'):
+            before = old[name].get(measure)
+            after = new[name].get(measure)
+            if before and after and after > before * threshold:
+                regressions.append((name, measure, before, after))
+    return regressions
+
+
+def _format(measure, value):
+    if value is None:
+        return '-'
+    if measure == 'time':
+        for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+            if value >= scale:
+                break
+        return '%.4g%s' % (value / scale, unit)
+    for unit, scale in (('MiB', 2 ** 20), ('KiB', 2 ** 10), ('B', 1)):
+        if value >= scale:
+            break
+    return '%.1f%s' % (value / float(scale), unit)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.run',
+        description='Run the NetworkX benchmarks and record the results '
+                    'in JSON.')
+    parser.add_argument('-b', '--bench', metavar='REGEX',
+                        help='only run the benchmarks whose name matches')
+    parser.add_argument('-o', '--output', metavar='FILE',
+                        help='write the results to FILE')
+    parser.add_argument('--compare', metavar='FILE',
+                        help='compare the results to those saved in FILE')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='ratio above which a result is deemed a '
+                             'regression (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of measures of each benchmark '
+                             '(default: %(default)s)')
+    parser.add_argument('--min-time', type=float, default=0.1,
+                        help='minimal duration in seconds of a measure '
+                             '(default: %(default)s)')
+    parser.add_argument('--quick', action='store_true',
+                        help='call each benchmark only once')
+    args = parser.parse_args(argv)
+    if args.quick:
+        args.repeat = 1
+        args.min_time = 0
+
+    results = {}
+    for name, cls, method, values in discover(args.bench):
+        result = run_benchmark(cls, method, values, args.repeat,
+                               args.min_time)
+        names = getattr(cls, 'param_names', [])
+        result['params'] = dict(zip(names, values))
+        key = '%s(%s)' % (name, ', '.join(repr(v) for v in values))
+        results[key] = result
+        if 'time' in result:
+            status = '%10s %10s' % (_format('time', result['time']),
+                                    _format('memory', result['peak_memory']))
+        else:
+            status = ('skipped: %s' % result['skipped'] if 'skipped' in result
+                      else 'failed: %s' % result['error'])
+        print('%-70s %s' % (key, status))
+        sys.stdout.flush()
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'environment': environment(), 'results': results}, f,
+                      indent=1, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            old = json.load(f)['results']
+        regressions = compare(old, results, args.threshold)
+        for name, measure, before, after in regressions:
+            print('%s: %s regressed from %s to %s (x%.2f)'
+                  % (name, measure, _format(measure, before),
+                     _format(measure, after), after / float(before)))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
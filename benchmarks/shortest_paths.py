@@ -0,0 +1,87 @@
+"""
+Benchmarks of shortest path algorithms.
+"""
+import networkx as nx
+
+from .common import SIZES, SMALL_SIZES, random_graph, requires
+
+
+class SingleSource(object):
+    params = [SIZES]
+    param_names = ['n']
+
+    def setup(self, n):
+        self.G = random_graph(n, weight='weight')
+        self.D = random_graph(n, directed=True, weight='weight')
+        self.target = n - 1
+
+    def time_bfs(self, n):
+        dict(nx.single_source_shortest_path_length(self.G, 0))
+
+    def time_dijkstra(self, n):
+        nx.single_source_dijkstra(self.G, 0)
+
+    def time_dijkstra_csr(self, n):
+        nx.single_source_dijkstra(self.G, 0, method='csr')
+
+    def time_dijkstra_dary_heap(self, n):
+        nx.single_source_dijkstra(self.G, 0, heap=nx.utils.DaryHeap)
+
+    def time_dijkstra_directed(self, n):
+        nx.single_source_dijkstra(self.D, 0)
+
+    def time_bellman_ford(self, n):
+        nx.single_source_bellman_ford(self.G, 0)
+
+    def time_bidirectional_dijkstra(self, n):
+        nx.bidirectional_dijkstra(self.G, 0, self.target)
+
+    def time_astar(self, n):
+        nx.astar_path(self.G, 0, self.target)
+
+
+class AllPairs(object):
+    params = [SMALL_SIZES]
+    param_names = ['n']
+
+    def setup(self, n):
+        self.G = random_graph(n, weight='weight')
+
+    def time_all_pairs_shortest_path_length(self, n):
+        for s, lengths in nx.all_pairs_shortest_path_length(self.G):
+            pass
+
+    def time_all_pairs_dijkstra_path_length(self, n):
+        for s, lengths in nx.all_pairs_dijkstra_path_length(self.G):
+            pass
+
+    def time_all_pairs_dijkstra_path_length_csr(self, n):
+        for s, lengths in nx.all_pairs_dijkstra_path_length(self.G,
+                                                            method='csr'):
+            pass
+
+    def time_johnson(self, n):
+        nx.johnson(self.G)
+
+
+class FloydWarshall(object):
+    params = [[100, 200]]
+    param_names = ['n']
+
+    def setup(self, n):
+        self.G = random_graph(n, weight='weight')
+
+    def time_floyd_warshall(self, n):
+        nx.floyd_warshall(self.G)
+
+
+class FloydWarshallNumpy(object):
+    params = [[100, 200, 1000]]
+    param_names = ['n']
+
+    def setup(self, n):
+        requires('numpy')
+        self.G = random_graph(n, weight='weight')
+
+    def time_floyd_warshall_numpy(self, n):
+        nx.floyd_warshall_numpy(self.G)
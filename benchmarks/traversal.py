@@ -0,0 +1,42 @@
+"""
+Benchmarks of graph traversals and components.
+"""
+import networkx as nx
+
+from .common import SIZES, random_dag, random_graph
+
+
+class Traversal(object):
+    params = [SIZES]
+    param_names = ['n']
+
+    def setup(self, n):
+        self.G = random_graph(n)
+        self.D = random_graph(n, directed=True)
+        self.dag = random_dag(n)
+
+    def time_bfs_edges(self, n):
+        for e in nx.bfs_edges(self.G, 0):
+            pass
+
+    def time_dfs_edges(self, n):
+        for e in nx.dfs_edges(self.G, 0):
+            pass
+
+    def time_dfs_postorder_nodes(self, n):
+        for u in nx.dfs_postorder_nodes(self.D, 0):
+            pass
+
+    def time_connected_components(self, n):
+        for c in nx.connected_components(self.G):
+            pass
+
+    def time_strongly_connected_components(self, n):
+        for c in nx.strongly_connected_components(self.D):
+            pass
+
+    def time_topological_sort(self, n):
+        nx.topological_sort(self.dag)
+
+    def time_core_number(self, n):
+        nx.core_number(self.G)
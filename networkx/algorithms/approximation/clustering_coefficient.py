@@ -4,10 +4,11 @@
 #   Jordi Torrents <jtorrents@milnou.net>
 #   All rights reserved.
 #   BSD license.
+import bisect
 import random
 from networkx.utils import not_implemented_for
 
-__all__ = ['average_clustering']
+__all__ = ['average_clustering', 'transitivity']
 __author__ = """\n""".join(['Fred Morstatter <fred.morstatter@asu.edu>',
                             'Jordi Torrents <jtorrents@milnou.net>'])
 
@@ -58,3 +59,69 @@ def average_clustering(G, trials=1000):
         if u in G[v]:
             triangles += 1
     return triangles / float(trials)
+
+
+@not_implemented_for('directed')
+@not_implemented_for('multigraph')
+def transitivity(G, trials=1000):
+    r"""Estimates the transitivity of G.
+
+    The transitivity of `G` is the fraction of the triads of `G` (pairs of
+    edges with a shared node) that are closed by a third edge, forming a
+    triangle.
+
+    This function finds an approximate transitivity by repeating `n`
+    times (defined in `trials`) the following experiment: choose a triad
+    uniformly at random, by choosing a node with a probability
+    proportional to its number of triads and then two of its neighbors
+    at random, and check if they are connected.  The approximate
+    transitivity is the fraction of triangles found over the number of
+    trials [1]_.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    trials : integer
+        Number of trials to perform (default 1000).
+
+    Returns
+    -------
+    t : float
+        Approximated transitivity.
+
+    Notes
+    -----
+    Self loops are ignored.
+
+    See Also
+    --------
+    networkx.algorithms.cluster.transitivity
+
+    References
+    ----------
+    .. [1] Schank, Thomas, and Dorothea Wagner. Approximating clustering
+       coefficient and transitivity. Universität Karlsruhe, Fakultät für
+       Informatik, 2004.
+       http://www.emis.ams.org/journals/JGAA/accepted/2005/SchankWagner2005.9.2.pdf
+
+    """
+    nodes = []
+    cumulative = []
+    total = 0
+    for v, nbrs in G.adj.items():
+        d = len(nbrs) - (v in nbrs)
+        if d > 1:
+            total += d * (d - 1)
+            nodes.append(v)
+            cumulative.append(total)
+    if total == 0:
+        return 0.0
+    triangles = 0
+    for i in range(trials):
+        v = nodes[bisect.bisect_right(cumulative, random.random() * total)]
+        nbrs = [u for u in G[v] if u != v]
+        u, w = random.sample(nbrs, 2)
+        if u in G[w]:
+            triangles += 1
+    return triangles / float(trials)
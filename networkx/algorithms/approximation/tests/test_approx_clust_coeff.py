@@ -1,6 +1,7 @@
-from nose.tools import assert_equal
+from nose.tools import assert_equal, assert_true
 import networkx as nx
 from networkx.algorithms.approximation import average_clustering
+from networkx.algorithms.approximation import transitivity
 
 # This approximation has to be be exact in regular graphs 
 # with no triangles or with all possible triangles.
@@ -31,3 +32,17 @@ def test_complete():
     assert_equal(average_clustering(G, trials=int(len(G)/2)), 1)
     G = nx.complete_graph(7)
     assert_equal(average_clustering(G, trials=int(len(G)/2)), 1)
+
+def test_transitivity():
+    # The approximation is exact with no triangles or all triangles.
+    assert_equal(transitivity(nx.petersen_graph(), trials=10), 0)
+    assert_equal(transitivity(nx.complete_graph(5), trials=10), 1)
+    assert_equal(transitivity(nx.empty_graph(5), trials=10), 0)
+    G = nx.complete_graph(4)
+    G.add_edge(0, 0)
+    assert_equal(transitivity(G, trials=10), 1)
+
+def test_transitivity_estimate():
+    G = nx.complete_graph(5)
+    G.remove_edge(1, 2)
+    assert_true(abs(transitivity(G, trials=2000) - 0.875) < 0.1)
@@ -8,20 +8,24 @@ Betweenness centrality measures.
 #    Pieter Swart <swart@lanl.gov>
 #    All rights reserved.
 #    BSD license.
+from collections import deque
 from heapq import heappush, heappop
 from itertools import count
+from math import ceil, floor, log, sqrt
 import networkx as nx
+from networkx.utils import map_sources
 import random
 __author__ = """Aric Hagberg (hagberg@lanl.gov)"""
 
 __all__ = ['betweenness_centrality',
+           'approximate_betweenness_centrality',
            'edge_betweenness_centrality',
            'edge_betweenness']
 
 
 def betweenness_centrality(G, k=None, normalized=True, weight=None,
                            endpoints=False,
-                           seed=None):
+                           seed=None, n_jobs=None):
     r"""Compute the shortest-path betweenness centrality for nodes.
 
     Betweenness centrality of a node `v` is the sum of the
@@ -59,6 +63,11 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
     endpoints : bool, optional
       If True include the endpoints in the shortest path counts.
 
+    n_jobs : int, optional (default=None)
+      The number of worker processes computing the contributions of
+      the sources in parallel.  None and 1 mean no parallelism and -1
+      means one process per CPU.
+
     Returns
     -------
     nodes : dictionary
@@ -83,6 +92,12 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
     Zero edge weights can produce an infinite number of equal length
     paths between pairs of nodes.
 
+    With `n_jobs` the sources are split in chunks, each worker process
+    accumulates the betweenness of its chunks and the partial results
+    are added up.  The graph is sent once to each worker.  Because the
+    sums are made in a different order, the values may differ from the
+    serial computation in the last digits.
+
     References
     ----------
     .. [1] Ulrik Brandes:
@@ -104,23 +119,19 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
        http://moreno.ss.uci.edu/23.pdf
 
     """
-    betweenness = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
     if k is None:
         nodes = G
     else:
         random.seed(seed)
         nodes = random.sample(G.nodes(), k)
-    for s in nodes:
-        # single source shortest paths
-        if weight is None:  # use BFS
-            S, P, sigma = _single_source_shortest_path_basic(G, s)
-        else:  # use Dijkstra's algorithm
-            S, P, sigma = _single_source_dijkstra_path_basic(G, s, weight)
-        # accumulation
-        if endpoints:
-            betweenness = _accumulate_endpoints(betweenness, S, P, sigma, s)
-        else:
-            betweenness = _accumulate_basic(betweenness, S, P, sigma, s)
+    if n_jobs is None:
+        betweenness = _sources_betweenness(G, nodes, weight, endpoints)
+    else:
+        betweenness = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
+        for partial in map_sources(_sources_betweenness, G, nodes, n_jobs,
+                                   args=(weight, endpoints)):
+            for v, b in partial.items():
+                betweenness[v] += b
     # rescaling
     betweenness = _rescale(betweenness, len(G),
                            normalized=normalized,
@@ -129,8 +140,206 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
     return betweenness
 
 
+def approximate_betweenness_centrality(G, epsilon=0.01, delta=0.1,
+                                       normalized=True, weight=None,
+                                       seed=None):
+    r"""Estimate the betweenness centrality of nodes by adaptive sampling.
+
+    Pairs of nodes `(s, t)` are drawn uniformly at random and for each
+    pair a shortest `(s, t)`-path is drawn uniformly at random among all
+    shortest `(s, t)`-paths.  The betweenness of a node is estimated by
+    the fraction of sampled paths it lies inside [1]_.  Sampling stops
+    as soon as, with probability at least `1 - delta`, all the estimates
+    are within `epsilon` of the betweenness values normalized by the
+    number of ordered pairs of nodes [2]_.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph
+
+    epsilon : float, optional (default=0.01)
+      The maximum absolute error of the estimates, in `(0, 1)`.
+
+    delta : float, optional (default=0.1)
+      The probability that some estimate is further than `epsilon` from
+      the exact value, in `(0, 1)`.
+
+    normalized : bool, optional
+      If True the betweenness values are normalized as in
+      :func:`betweenness_centrality`.
+
+    weight : None or string, optional
+      If None, all edge weights are considered equal.
+      Otherwise holds the name of the edge attribute used as weight.
+
+    seed : integer, optional
+      Seed for the random number generator.
+
+    Returns
+    -------
+    nodes : dictionary
+       Dictionary of nodes with estimated betweenness centrality as the
+       value.
+
+    Raises
+    ------
+    ValueError
+      If `epsilon` or `delta` is not in `(0, 1)`.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(5)
+    >>> b = nx.approximate_betweenness_centrality(G, epsilon=0.05, seed=1)
+    >>> abs(b[2] - nx.betweenness_centrality(G)[2]) < 0.1
+    True
+
+    See Also
+    --------
+    betweenness_centrality
+
+    Notes
+    -----
+    Each sample computes the shortest paths from its source `s` with
+    the same breadth-first or Dijkstra search as
+    :func:`betweenness_centrality`, so that the cost of the estimation
+    is the cost of the exact computation times the number of samples
+    over the number of nodes.  The number of samples depends on
+    `epsilon` and `delta` and on the vertex diameter of the graph (the
+    largest number of nodes in a shortest path), not on the size of
+    the graph.  It is at most
+
+    .. math::
+
+       \frac{1}{2 \epsilon^2} \left(\lfloor \log_2 (VD - 2) \rfloor + 1
+       + \ln \frac{2}{\delta} \right)
+
+    where `VD` is an upper bound of the vertex diameter [1]_, twice the
+    largest eccentricity found by a breadth-first search in each
+    connected component for unweighted undirected graphs and the number
+    of nodes otherwise.  Sampling usually stops before this bound, when
+    the empirical confidence intervals of [2]_ of all the estimates are
+    smaller than `epsilon`.  If the bound is larger than the number of
+    nodes, the exact betweenness is computed instead.
+
+    The error guarantee holds for the betweenness divided by the number
+    `n(n-1)` of ordered pairs of nodes.  The normalized values returned
+    differ from it by the factor `n / (n - 2)`.
+
+    References
+    ----------
+    .. [1] Matteo Riondato and Evgenios M. Kornaropoulos:
+       Fast approximation of betweenness centrality through sampling.
+       Data Mining and Knowledge Discovery 30(2):438-475, 2016.
+       http://dx.doi.org/10.1007/s10618-015-0423-0
+    .. [2] Michele Borassi and Emanuele Natale:
+       KADABRA is an ADaptive Algorithm for Betweenness via Random
+       Approximation. European Symposium on Algorithms (ESA), 2016.
+       https://arxiv.org/abs/1604.08553
+    """
+    if not 0 < epsilon < 1:
+        raise ValueError('epsilon must be in (0, 1).')
+    if not 0 < delta < 1:
+        raise ValueError('delta must be in (0, 1).')
+    betweenness = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
+    n = len(G)
+    if n <= 2:
+        return betweenness
+    random.seed(seed)
+    nodes = list(G)
+    # Half of the failure probability bounds the number of samples, the
+    # other half the adaptive confidence intervals of the 2n bounds.
+    omega = _max_samples(G, nodes, epsilon, delta / 2, weight)
+    if omega >= n:
+        # sampling would cost more than the exact computation
+        return betweenness_centrality(G, normalized=normalized,
+                                      weight=weight)
+    log_delta = log(4.0 * n / delta)
+    counts = {}
+    tau = 0
+    next_check = min(omega, 100)
+    while tau < omega:
+        s = random.choice(nodes)
+        t = random.choice(nodes)
+        while t == s:
+            t = random.choice(nodes)
+        if weight is None:  # use BFS
+            S, P, sigma = _single_source_shortest_path_basic(G, s)
+        else:  # use Dijkstra's algorithm
+            S, P, sigma = _single_source_dijkstra_path_basic(G, s, weight)
+        if sigma[t] > 0:
+            # walk back a random shortest path from t to s
+            w = t
+            while True:
+                r = random.random() * sigma[w]
+                for v in P[w]:
+                    r -= sigma[v]
+                    if r < 0:
+                        break
+                if v == s:
+                    break
+                counts[v] = counts.get(v, 0) + 1
+                w = v
+        tau += 1
+        if tau == next_check:
+            b = max(counts.values()) / float(tau) if counts else 0.0
+            if _bounds_within(b, tau, omega, log_delta, epsilon):
+                break
+            next_check = min(omega, int(1.2 * tau) + 1)
+    # rescaling
+    if normalized:
+        scale = n / float(n - 2)
+    elif G.is_directed():
+        scale = n * (n - 1.0)
+    else:
+        scale = n * (n - 1.0) / 2
+    for v, c in counts.items():
+        betweenness[v] = scale * c / tau
+    return betweenness
+
+
+def _max_samples(G, nodes, epsilon, delta, weight):
+    """Return the number of samples of the bound of Riondato and
+    Kornaropoulos, based on an upper bound of the vertex diameter.
+    """
+    if weight is None and not G.is_directed():
+        vd = 0
+        seen = set()
+        for v in nodes:
+            if v not in seen:
+                lengths = dict(nx.single_source_shortest_path_length(G, v))
+                seen.update(lengths)
+                vd = max(vd, 2 * max(lengths.values()) + 1)
+    else:
+        vd = len(nodes)
+    vd = max(vd, 3)
+    return int(ceil(0.5 / epsilon ** 2 *
+                    (floor(log(vd - 2, 2)) + 1 + log(1 / delta))))
+
+
+def _bounds_within(b, tau, omega, log_delta, epsilon):
+    """Return True if the confidence interval of an estimate `b` after
+    `tau` samples out of at most `omega` is within `epsilon`.
+
+    The lower and upper bounds are those of Borassi and Natale.  Both
+    increase with `b`, so that the largest estimate and the zero
+    estimate of nodes never sampled are the only ones to check.
+    """
+    for x in (0.0, b):
+        ratio = omega / float(tau)
+        lower = log_delta / tau * (
+            1 / 3.0 - ratio +
+            sqrt((1 / 3.0 - ratio) ** 2 + 2 * x * omega / log_delta))
+        upper = log_delta / tau * (
+            1 / 3.0 + ratio +
+            sqrt((1 / 3.0 + ratio) ** 2 + 2 * x * omega / log_delta))
+        if lower >= epsilon or upper >= epsilon:
+            return False
+    return True
+
+
 def edge_betweenness_centrality(G, k=None, normalized=True, weight=None,
-                                seed=None):
+                                seed=None, n_jobs=None):
     r"""Compute betweenness centrality for edges.
 
     Betweenness centrality of an edge `e` is the sum of the
@@ -163,6 +372,11 @@ def edge_betweenness_centrality(G, k=None, normalized=True, weight=None,
       If None, all edge weights are considered equal.
       Otherwise holds the name of the edge attribute used as weight.
 
+    n_jobs : int, optional (default=None)
+      The number of worker processes computing the contributions of
+      the sources in parallel.  None and 1 mean no parallelism and -1
+      means one process per CPU.
+
     Returns
     -------
     edges : dictionary
@@ -191,22 +405,21 @@ def edge_betweenness_centrality(G, k=None, normalized=True, weight=None,
        Social Networks 30(2):136-145, 2008.
        http://www.inf.uni-konstanz.de/algo/publications/b-vspbc-08.pdf
     """
-    betweenness = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
-    # b[e]=0 for e in G.edges()
-    betweenness.update(dict.fromkeys(G.edges(), 0.0))
     if k is None:
         nodes = G
     else:
         random.seed(seed)
         nodes = random.sample(G.nodes(), k)
-    for s in nodes:
-        # single source shortest paths
-        if weight is None:  # use BFS
-            S, P, sigma = _single_source_shortest_path_basic(G, s)
-        else:  # use Dijkstra's algorithm
-            S, P, sigma = _single_source_dijkstra_path_basic(G, s, weight)
-        # accumulation
-        betweenness = _accumulate_edges(betweenness, S, P, sigma, s)
+    if n_jobs is None:
+        betweenness = _sources_edge_betweenness(G, nodes, weight)
+    else:
+        betweenness = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
+        # b[e]=0 for e in G.edges()
+        betweenness.update(dict.fromkeys(G.edges(), 0.0))
+        for partial in map_sources(_sources_edge_betweenness, G, nodes,
+                                   n_jobs, args=(weight,)):
+            for e, b in partial.items():
+                betweenness[e] += b
     # rescaling
     for n in G:  # remove nodes to only return edges
         del betweenness[n]
@@ -218,12 +431,46 @@ def edge_betweenness_centrality(G, k=None, normalized=True, weight=None,
 # obsolete name
 
 
-def edge_betweenness(G, k=None, normalized=True, weight=None, seed=None):
-    return edge_betweenness_centrality(G, k, normalized, weight, seed)
+def edge_betweenness(G, k=None, normalized=True, weight=None, seed=None,
+                     n_jobs=None):
+    return edge_betweenness_centrality(G, k, normalized, weight, seed, n_jobs)
 
 
 # helpers for betweenness centrality
 
+def _sources_betweenness(G, sources, weight, endpoints):
+    """Return the unscaled betweenness accumulated from `sources`."""
+    betweenness = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
+    for s in sources:
+        # single source shortest paths
+        if weight is None:  # use BFS
+            S, P, sigma = _single_source_shortest_path_basic(G, s)
+        else:  # use Dijkstra's algorithm
+            S, P, sigma = _single_source_dijkstra_path_basic(G, s, weight)
+        # accumulation
+        if endpoints:
+            betweenness = _accumulate_endpoints(betweenness, S, P, sigma, s)
+        else:
+            betweenness = _accumulate_basic(betweenness, S, P, sigma, s)
+    return betweenness
+
+
+def _sources_edge_betweenness(G, sources, weight):
+    """Return the unscaled edge betweenness accumulated from `sources`."""
+    betweenness = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
+    # b[e]=0 for e in G.edges()
+    betweenness.update(dict.fromkeys(G.edges(), 0.0))
+    for s in sources:
+        # single source shortest paths
+        if weight is None:  # use BFS
+            S, P, sigma = _single_source_shortest_path_basic(G, s)
+        else:  # use Dijkstra's algorithm
+            S, P, sigma = _single_source_dijkstra_path_basic(G, s, weight)
+        # accumulation
+        betweenness = _accumulate_edges(betweenness, S, P, sigma, s)
+    return betweenness
+
+
 def _single_source_shortest_path_basic(G, s):
     S = []
     P = {}
@@ -233,9 +480,9 @@ def _single_source_shortest_path_basic(G, s):
     D = {}
     sigma[s] = 1.0
     D[s] = 0
-    Q = [s]
+    Q = deque([s])
     while Q:   # use BFS to find shortest paths
-        v = Q.pop(0)
+        v = Q.popleft()
         S.append(v)
         Dv = D[v]
         sigmav = sigma[v]
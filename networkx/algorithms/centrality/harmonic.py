@@ -55,6 +55,6 @@ def harmonic_centrality(G, distance=None):
            Internet Mathematics 10.3-4 (2014): 222-262.
     """
     if G.is_directed():
-        G = G.reverse()
+        G = nx.reverse_view(G)
     sp = nx.shortest_path_length(G, weight=distance)
     return {n: sum(1 / d if d > 0 else 0 for d in dd.values()) for n, dd in sp}
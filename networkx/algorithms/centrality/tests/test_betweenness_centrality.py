@@ -329,6 +329,20 @@ class TestWeightedBetweennessCentrality(object):
         for n in sorted(G):
             assert_almost_equal(b[n],b_answer[n])
 
+    def test_n_jobs(self):
+        """Weighted betweenness centrality: worker processes"""
+        G = nx.florentine_families_graph()
+        for u, v in G.edges():
+            G[u][v]['weight'] = len(u) + len(v)
+        b_answer = nx.betweenness_centrality(G, weight='weight')
+        b = nx.betweenness_centrality(G, weight='weight', n_jobs=2)
+        for n in sorted(G):
+            assert_almost_equal(b[n], b_answer[n])
+        b_answer = nx.betweenness_centrality(G, endpoints=True)
+        b = nx.betweenness_centrality(G, endpoints=True, n_jobs=2)
+        for n in sorted(G):
+            assert_almost_equal(b[n], b_answer[n])
+
 
 class TestEdgeBetweennessCentrality(object):
         
@@ -460,3 +474,52 @@ class TestWeightedEdgeBetweennessCentrality(object):
         for n in sorted(G.edges()):
             assert_almost_equal(b[n],b_answer[n]/norm)
 
+    def test_n_jobs(self):
+        G = nx.florentine_families_graph()
+        for u, v in G.edges():
+            G[u][v]['weight'] = len(u) + len(v)
+        b_answer = nx.edge_betweenness_centrality(G, weight='weight')
+        b = nx.edge_betweenness_centrality(G, weight='weight', n_jobs=2)
+        for e in b_answer:
+            assert_almost_equal(b[e], b_answer[e])
+
+
+class TestApproximateBetweennessCentrality(object):
+
+    def test_sampling(self):
+        G = nx.barabasi_albert_graph(400, 2, seed=1)
+        exact = nx.betweenness_centrality(G)
+        b = nx.approximate_betweenness_centrality(G, epsilon=0.1, delta=0.1,
+                                                  seed=1)
+        assert_equal(set(b), set(G))
+        for v in G:
+            assert_true(abs(b[v] - exact[v]) < 0.1)
+
+    def test_weighted_directed(self):
+        G = nx.gnp_random_graph(300, 0.02, seed=1, directed=True)
+        for u, v in G.edges():
+            G[u][v]['weight'] = (u + v) % 3 + 1
+        exact = nx.betweenness_centrality(G, weight='weight',
+                                          normalized=False)
+        b = nx.approximate_betweenness_centrality(G, epsilon=0.2,
+                                                  normalized=False,
+                                                  weight='weight', seed=1)
+        scale = len(G) * (len(G) - 1)
+        for v in G:
+            assert_true(abs(b[v] - exact[v]) / scale < 0.2)
+
+    def test_exact_fallback(self):
+        G = nx.krackhardt_kite_graph()
+        b = nx.approximate_betweenness_centrality(G, epsilon=0.01, seed=1)
+        exact = nx.betweenness_centrality(G)
+        for v in G:
+            assert_almost_equal(b[v], exact[v])
+
+    def test_small_and_errors(self):
+        assert_equal(nx.approximate_betweenness_centrality(nx.path_graph(2)),
+                     {0: 0.0, 1: 0.0})
+        G = nx.path_graph(4)
+        assert_raises(ValueError, nx.approximate_betweenness_centrality, G,
+                      epsilon=0)
+        assert_raises(ValueError, nx.approximate_betweenness_centrality, G,
+                      delta=1)
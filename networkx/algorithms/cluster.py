@@ -10,6 +10,7 @@
 from __future__ import division
 
 from itertools import combinations
+from operator import add
 
 import networkx as nx
 from networkx import NetworkXError
@@ -25,7 +26,7 @@ __all__= ['triangles', 'average_clustering', 'clustering', 'transitivity',
 
 
 @not_implemented_for('directed')
-def triangles(G, nodes=None):
+def triangles(G, nodes=None, n_jobs=None):
     """Compute the number of triangles.
 
     Finds the number of triangles that include a node as one vertex.
@@ -36,6 +37,9 @@ def triangles(G, nodes=None):
        A networkx graph
     nodes : container of nodes, optional (default= all nodes in G)
        Compute triangles for nodes in this container. 
+    n_jobs : int or None, optional (default=None)
+       The number of worker processes counting the triangles when `nodes`
+       is None, see :func:`networkx.utils.effective_n_jobs`.
 
     Returns
     -------
@@ -57,6 +61,21 @@ def triangles(G, nodes=None):
     When computing triangles for the entire graph each triangle is counted 
     three times, once at each node.  Self loops are ignored.
 
+    The triangles of all the nodes are counted in `O(m^{3/2})` time with
+    the forward algorithm of Schank and Wagner [1]_, where `m` is the
+    number of edges.  The triangles of the nodes in `nodes` are counted by
+    intersecting the neighborhoods of their neighbors.
+
+    See Also
+    --------
+    networkx.algorithms.approximation.clustering_coefficient.transitivity
+
+    References
+    ----------
+    .. [1] Thomas Schank and Dorothea Wagner.
+       Finding, counting and listing all triangles in large graphs,
+       an experimental study.
+       In: Experimental and Efficient Algorithms, pp. 606--609, 2005.
     """
     # If `nodes` represents a single node in the graph, return only its number
     # of triangles.
@@ -64,22 +83,79 @@ def triangles(G, nodes=None):
         return next(_triangles_and_degree_iter(G,nodes))[2] // 2
     # Otherwise, `nodes` represents an iterable of nodes, so return a
     # dictionary mapping node to number of triangles.
-    return {v: t // 2 for v, d, t in _triangles_and_degree_iter(G, nodes)}
+    return {v: t // 2 for v, d, t in _triangles_and_degree_iter(G, nodes,
+                                                                n_jobs)}
+
+
+def _forward_triangles(out, sources):
+    """Return the number of triangles at each node found from `sources`.
+
+    The nodes are the integers ``0, ..., n - 1`` and ``out[u]`` is the set
+    of the neighbors of `u` larger than `u`.  Each triangle ``u < v < w``
+    is found once, from the edge ``(u, v)``, so that the triangles found
+    from disjoint chunks of sources can be added up.
+    """
+    counts = [0] * len(out)
+    for u in sources:
+        out_u = out[u]
+        for v in out_u:
+            common = out_u.intersection(out[v])
+            if common:
+                k = len(common)
+                counts[u] += k
+                counts[v] += k
+                for w in common:
+                    counts[w] += 1
+    return counts
+
+
+def _all_triangles(G, n_jobs=None):
+    """Return a dict of the number of triangles at each node of `G`.
+
+    This is the forward algorithm of Schank and Wagner: the nodes are
+    relabeled with integers in increasing order of degree and each edge
+    is oriented from its smaller end to its larger end.  The triangles
+    are the common out-neighbors of the ends of each edge, found once
+    each, and the out-neighborhoods have at most ``O(sqrt(m))`` nodes.
+    """
+    nodes = sorted(G, key=lambda v: len(G.adj[v]))
+    index = dict(zip(nodes, range(len(nodes))))
+    out = []
+    for u, v in enumerate(nodes):
+        out.append({j for j in map(index.__getitem__, G.adj[v]) if j > u})
+    sources = [u for u in range(len(out)) if len(out[u]) > 1]
+    if n_jobs is None:
+        counts = _forward_triangles(out, sources)
+    else:
+        counts = [0] * len(out)
+        for partial in nx.utils.map_sources(_forward_triangles, out, sources,
+                                            n_jobs):
+            counts = list(map(add, counts, partial))
+    return dict(zip(nodes, counts))
 
 
 @not_implemented_for('multigraph')
-def _triangles_and_degree_iter(G, nodes=None):
+def _triangles_and_degree_iter(G, nodes=None, n_jobs=None):
     """ Return an iterator of (node, degree, triangles).  
 
     This double counts triangles so you may want to divide by 2.
     See degree() and triangles() for definitions and details.
 
+    The triangles of all the nodes of an undirected graph are counted at
+    once with the forward algorithm, those of a few nodes or of a directed
+    graph by intersecting the successor sets.
+
     """
+    if nodes is None and not G.is_directed():
+        triangles = _all_triangles(G, n_jobs)
+        for v, v_nbrs in G.adj.items():
+            yield (v, len(v_nbrs) - (v in v_nbrs), 2 * triangles[v])
+        return
+
     if nodes is None:
         nodes_nbrs = G.adj.items()
     else:
         nodes_nbrs = ((n, G[n]) for n in G.nbunch_iter(nodes))
-
     for v, v_nbrs in nodes_nbrs:
         vs = set(v_nbrs) - {v}
         ntriangles = sum(len(vs & (set(G[w]) - {w})) for w in vs)
@@ -121,7 +197,8 @@ def _weighted_triangles_and_degree_iter(G, nodes=None, weight='weight'):
         yield (i, len(inbrs), 2 * weighted_triangles)
 
 
-def average_clustering(G, nodes=None, weight=None, count_zeros=True):
+def average_clustering(G, nodes=None, weight=None, count_zeros=True,
+                       n_jobs=None):
     r"""Compute the average clustering coefficient for the graph G.
 
     The clustering coefficient for the graph is the average, 
@@ -146,6 +223,10 @@ def average_clustering(G, nodes=None, weight=None, count_zeros=True):
     count_zeros : bool
        If False include only the nodes with nonzero clustering in the average.
 
+    n_jobs : int or None, optional (default=None)
+       The number of worker processes counting the triangles when `nodes`
+       is None, see :func:`networkx.utils.effective_n_jobs`.
+
     Returns
     -------
     avg : float
@@ -174,14 +255,14 @@ def average_clustering(G, nodes=None, weight=None, count_zeros=True):
        nodes and leafs on clustering measures for small-world networks.
        http://arxiv.org/abs/0802.2512
     """
-    c = clustering(G, nodes, weight=weight).values()
+    c = clustering(G, nodes, weight=weight, n_jobs=n_jobs).values()
     if not count_zeros:
         c = [v for v in c if v > 0]
     return sum(c) / len(c)
 
 
 @not_implemented_for('directed')
-def clustering(G, nodes=None, weight=None):
+def clustering(G, nodes=None, weight=None, n_jobs=None):
     r"""Compute the clustering coefficient for nodes.
 
     For unweighted graphs, the clustering of a node `u`
@@ -218,6 +299,11 @@ def clustering(G, nodes=None, weight=None):
        The edge attribute that holds the numerical value used as a weight.
        If None, then each edge has weight 1.
 
+    n_jobs : int or None, optional (default=None)
+       The number of worker processes counting the triangles of an
+       unweighted graph when `nodes` is None, see
+       :func:`networkx.utils.effective_n_jobs`.
+
     Returns
     -------
     out : float, or dictionary
@@ -245,7 +331,7 @@ def clustering(G, nodes=None, weight=None):
     if weight is not None:
         td_iter = _weighted_triangles_and_degree_iter(G, nodes, weight)
     else:
-        td_iter = _triangles_and_degree_iter(G, nodes)
+        td_iter = _triangles_and_degree_iter(G, nodes, n_jobs)
     clusterc = {v: 0 if t == 0 else t / (d * (d - 1)) for v, d, t in td_iter}
     if nodes in G: 
         # Return the value of the sole entry in the dictionary.
@@ -253,7 +339,7 @@ def clustering(G, nodes=None, weight=None):
     return clusterc
 
 
-def transitivity(G):
+def transitivity(G, n_jobs=None):
     r"""Compute graph transitivity, the fraction of all possible triangles 
     present in G.
 
@@ -270,6 +356,10 @@ def transitivity(G):
     ----------
     G : graph
 
+    n_jobs : int or None, optional (default=None)
+       The number of worker processes counting the triangles of an
+       undirected graph, see :func:`networkx.utils.effective_n_jobs`.
+
     Returns
     -------
     out : float
@@ -281,8 +371,10 @@ def transitivity(G):
     >>> print(nx.transitivity(G))
     1.0
     """
-    triangles = sum(t for v, d, t in _triangles_and_degree_iter(G))
-    contri = sum(d * (d - 1) for v, d, t in _triangles_and_degree_iter(G))
+    triangles = contri = 0
+    for v, d, t in _triangles_and_degree_iter(G, n_jobs=n_jobs):
+        triangles += t
+        contri += d * (d - 1)
     return 0 if triangles == 0 else triangles / contri
 
 def square_clustering(G, nodes=None):
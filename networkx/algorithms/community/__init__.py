@@ -2,4 +2,6 @@ from networkx.algorithms.community.asyn_lpa import *
 from networkx.algorithms.community.centrality import *
 from networkx.algorithms.community.kernighan_lin import *
 from networkx.algorithms.community.kclique import *
+from networkx.algorithms.community.louvain import *
 from networkx.algorithms.community.quality import *
+from networkx.algorithms.community.spectral import *
@@ -1,10 +1,16 @@
 #-*- coding: utf-8 -*-
-import networkx as nx
+from bisect import insort
+from heapq import heappop, heappush, nlargest
+from operator import itemgetter
+
+from networkx.algorithms.centrality.betweenness import \
+    _sources_edge_betweenness
+from networkx.algorithms.components.connected import _plain_bfs
 
 __all__ = ['girvan_newman']
 
 
-def girvan_newman(G, weight=None):
+def girvan_newman(G, weight=None, batch_size=1):
     """Find communities in graph using Girvan–Newman method.
 
     Parameters
@@ -14,12 +20,25 @@ def girvan_newman(G, weight=None):
     weight : string, optional (default=None)
        Edge data key corresponding to the edge weight.
 
+    batch_size : int, optional (default=1)
+       The number of edges with the highest betweenness centrality removed
+       before the betweenness centrality is recomputed. All edges tied with
+       the last of them are removed as well. The default removes the edges
+       of highest betweenness one at a time, as in the original algorithm;
+       larger batches trade accuracy for speed on large graphs.
+
     Returns
     -------
     List of tuples which contains the clusters of nodes.
 
+    Raises
+    ------
+    ValueError
+       If `batch_size` is less than one.
+
     Examples
     --------
+    >>> import networkx as nx
     >>> G = nx.path_graph(10)
     >>> comp = girvan_newman(G)
     >>> comp[0]
@@ -32,35 +51,86 @@ def girvan_newman(G, weight=None):
     betweenness centrality at each step. As the graph breaks down into pieces,
     the tightly knit community structure is exposed and result can be depicted
     as a dendrogram.
+
+    Removing an edge only changes the betweenness centrality of the edges in
+    its connected component, so the betweenness centrality is recomputed
+    only for the components that lost an edge. A heap of the largest
+    betweenness centrality of each component gives the next edges to
+    remove.
     """
+    if batch_size < 1:
+        raise ValueError('batch_size must be at least 1.')
     # The copy of G here must include the edge weight data.
     g = G.copy().to_undirected()
-    components = []
-    while g.number_of_edges() > 0:
-        _remove_max_edge(g, weight)
-        components.append(tuple(list(H)
-                                for H in nx.connected_component_subgraphs(g)))
-    return components
+    nodes = list(g)
+    position = dict((v, i) for i, v in enumerate(nodes))
+    n = len(nodes)
+    # Betweenness centrality is normalized by the size of the whole graph.
+    scale = 1.0 / (n * (n - 1)) if n > 1 else None
+    # Each connected component is keyed by its first node in g, which
+    # orders the components as connected_components(g) does.
+    members = {}
+    keys = []
+    # Edges of each component sorted by decreasing betweenness centrality,
+    # and a heap of the largest betweenness centrality of each component.
+    betweenness = {}
+    heap = []
 
+    def split(component):
+        seen = set()
+        for v in sorted(component, key=position.__getitem__):
+            if v in seen:
+                continue
+            c = set(_plain_bfs(g, v))
+            seen.update(c)
+            if v not in members:
+                insort(keys, position[v])
+            members[v] = c
+            if len(c) > 1:
+                edges = _component_betweenness(g, c, position, weight, scale)
+                betweenness[v] = edges
+                heappush(heap, (-edges[0][0], position[v], v))
 
-def _remove_max_edge(G, weight=None):
-    """
-    Removes edge with the highest value on betweenness centrality.
+    split(nodes)
+    components = []
+    while heap:
+        number_components = len(members)
+        while len(members) <= number_components:
+            # Pop components until the edges with the batch_size highest
+            # values and all edges tied with them are found.
+            affected = []
+            values = []
+            while heap and (len(values) < batch_size or -heap[0][0] >= cut):
+                key = heappop(heap)[2]
+                affected.append(key)
+                values.extend(b for b, e in betweenness[key])
+                cut = nlargest(batch_size, values)[-1]
+            for key in affected:
+                for b, edge in betweenness.pop(key):
+                    if b < cut:
+                        break
+                    g.remove_edge(*edge)
+            for key in affected:
+                split(members[key])
+        components.append(tuple(list(members[nodes[i]]) for i in keys))
+    return components
 
-    Repeat this step until more connected components than the connected
-    components of the original graph are detected.
 
-    It is part of Girvan–Newman algorithm.
+def _component_betweenness(g, component, position, weight, scale):
+    """Return the edges of a connected component of `g` and their
+    betweenness centrality in `g`, sorted by decreasing betweenness.
 
-    :param G: NetworkX graph
-    :param weight: string, optional (default=None) Edge data key corresponding
-    to the edge weight.
+    The component is copied with the node and neighbor order of `g`, so that
+    the values are exactly those of :func:`edge_betweenness_centrality`
+    on `g` and ties between edges are preserved.
     """
-    number_components = nx.number_connected_components(G)
-    while nx.number_connected_components(G) <= number_components:
-        betweenness = nx.edge_betweenness_centrality(G, weight=weight)
-        max_value = max(betweenness.values())
-        # Use a list of edges because G is changed in the loop
-        for edge in list(G.edges()):
-            if betweenness[edge] == max_value:
-                G.remove_edge(*edge)
+    H = g.fresh_copy()
+    sources = sorted(component, key=position.__getitem__)
+    for u in sources:
+        H.node[u] = g.node[u]
+        # All neighbors of u are in the component.
+        H.adj[u] = g.adj[u]
+    b = _sources_edge_betweenness(H, sources, weight)
+    edges = [(b[e] * scale, e) for e in H.edges()]
+    edges.sort(key=itemgetter(0), reverse=True)
+    return edges
@@ -0,0 +1,500 @@
+# -*- coding: utf-8 -*-
+#
+# louvain.py - Louvain and Leiden modularity community detection
+#
+# Copyright 2016 NetworkX developers.
+#
+# This file is part of NetworkX.
+#
+# NetworkX is distributed under a BSD license; see LICENSE.txt for more
+# information.
+"""Functions for detecting communities by modularity optimization with
+the Louvain and Leiden algorithms.
+
+Both algorithms alternate two phases.  Nodes are first moved between
+communities, one at a time, while this increases the modularity; then
+each community becomes a single node of a smaller aggregated graph, and
+the moves start again on that graph.  The Leiden algorithm refines the
+communities before aggregating them, so that the communities found are
+always connected.
+
+The graphs of all levels are stored in integer-indexed compressed
+adjacency lists, and the total degree of each community is updated as
+nodes move, so that each move only costs the degree of the moved node.
+"""
+from __future__ import division
+
+from collections import deque
+import random
+
+from networkx.utils import not_implemented_for
+
+__all__ = ['louvain_communities', 'louvain_partitions', 'leiden_communities']
+
+
+def _compile_graph(G, weight):
+    """Returns the nodes of `G` and its compressed adjacency lists.
+
+    The neighbors of node `i` are ``targets[offsets[i]:offsets[i + 1]]``
+    and the weights of these edges are at the same positions in
+    ``weights``.  Self-loops are not in the lists: ``loops[i]`` is twice
+    the weight of the self-loops of node `i`, as each of them adds twice
+    its weight to the degree of the node.
+    """
+    nodes = list(G)
+    index = dict(zip(nodes, range(len(nodes))))
+    multigraph = G.is_multigraph()
+    offsets = [0]
+    targets = []
+    weights = []
+    loops = [0] * len(nodes)
+    for i, u in enumerate(nodes):
+        nbrs = G.adj[u]
+        if weight is None:
+            if multigraph:
+                w = [len(e) for e in nbrs.values()]
+            else:
+                w = [1] * len(nbrs)
+        elif multigraph:
+            w = [sum(d.get(weight, 1) for d in e.values())
+                 for e in nbrs.values()]
+        else:
+            w = [e.get(weight, 1) for e in nbrs.values()]
+        t = [index[v] for v in nbrs]
+        if u in nbrs:
+            p = t.index(i)
+            loops[i] = 2 * w.pop(p)
+            del t[p]
+        targets.extend(t)
+        weights.extend(w)
+        offsets.append(len(targets))
+    return nodes, (offsets, targets, weights, loops)
+
+
+def _degrees(graph):
+    """Returns the weighted degrees of the nodes of `graph`."""
+    offsets, targets, weights, loops = graph
+    return [sum(weights[offsets[i]:offsets[i + 1]]) + loops[i]
+            for i in range(len(loops))]
+
+
+def _modularity(graph, community, degree, total, resolution):
+    """Returns the modularity of the partition of `graph` in which the
+    node `i` belongs to the community ``community[i]``.  `total` is the
+    sum of the degrees of the nodes."""
+    offsets, targets, weights, loops = graph
+    internal = 0
+    degrees = {}
+    for i, c in enumerate(community):
+        internal += loops[i]
+        for p in range(offsets[i], offsets[i + 1]):
+            if community[targets[p]] == c:
+                internal += weights[p]
+        degrees[c] = degrees.get(c, 0) + degree[i]
+    return (internal / total -
+            resolution * sum(d * d for d in degrees.values()) / total ** 2)
+
+
+def _move_nodes(graph, community, degree, total, resolution, rng):
+    """Moves nodes between communities while this increases the
+    modularity, updating `community` in place.
+
+    Every node is examined once in random order; when a node moves, its
+    neighbors in other communities are queued to be examined again.
+    """
+    offsets, targets, weights, loops = graph
+    n = len(community)
+    # The sum of the degrees of the nodes of each community.
+    community_degree = [0] * n
+    for i, c in enumerate(community):
+        community_degree[c] += degree[i]
+    order = list(range(n))
+    rng.shuffle(order)
+    queue = deque(order)
+    queued = [True] * n
+    while queue:
+        i = queue.popleft()
+        queued[i] = False
+        start, end = offsets[i], offsets[i + 1]
+        if start == end:
+            continue
+        neighbors = targets[start:end]
+        # The weights of the edges from i to each neighboring community.
+        links = {}
+        for j, w in zip(neighbors, weights[start:end]):
+            c = community[j]
+            if c in links:
+                links[c] += w
+            else:
+                links[c] = w
+        old = community[i]
+        k = degree[i]
+        community_degree[old] -= k
+        # The modularity gained by adding i to community c, up to a
+        # constant factor, is links[c] minus the expected weight of the
+        # edges from i to c.
+        scale = resolution * k / total
+        best = old
+        best_gain = links.get(old, 0) - scale * community_degree[old]
+        for c, w in links.items():
+            gain = w - scale * community_degree[c]
+            if gain > best_gain:
+                best = c
+                best_gain = gain
+        community_degree[best] += k
+        if best != old:
+            community[i] = best
+            for j in neighbors:
+                if not queued[j] and community[j] != best:
+                    queue.append(j)
+                    queued[j] = True
+
+
+def _refine(graph, community, degree, total, resolution, rng):
+    """Returns the refinement of the partition `community` used by the
+    Leiden algorithm.
+
+    Each community is split into singletons, and each node still alone
+    is merged into the subcommunity of its community that increases the
+    modularity the most.  Only nodes and subcommunities well connected
+    to the rest of their community are merged, so that the
+    subcommunities are connected.
+    """
+    offsets, targets, weights, loops = graph
+    n = len(community)
+    community_degree = {}
+    for i, c in enumerate(community):
+        community_degree[c] = community_degree.get(c, 0) + degree[i]
+    refined = list(range(n))
+    refined_degree = list(degree)
+    size = [1] * n
+    # The weight of the edges from each subcommunity to the rest of its
+    # community.
+    external = [0] * n
+    for i, c in enumerate(community):
+        for p in range(offsets[i], offsets[i + 1]):
+            if community[targets[p]] == c:
+                external[i] += weights[p]
+    order = list(range(n))
+    rng.shuffle(order)
+    for i in order:
+        if size[refined[i]] > 1:
+            continue
+        c = community[i]
+        rest = community_degree[c]
+        scale = resolution / total
+        if external[i] < scale * degree[i] * (rest - degree[i]):
+            continue
+        links = {}
+        for p in range(offsets[i], offsets[i + 1]):
+            j = targets[p]
+            if community[j] == c:
+                r = refined[j]
+                links[r] = links.get(r, 0) + weights[p]
+        best = i
+        best_gain = 0
+        for r, w in links.items():
+            if external[r] < (scale * refined_degree[r] *
+                              (rest - refined_degree[r])):
+                continue
+            gain = w - scale * degree[i] * refined_degree[r]
+            if gain > best_gain:
+                best = r
+                best_gain = gain
+        if best != i:
+            refined[i] = best
+            size[i] -= 1
+            size[best] += 1
+            refined_degree[best] += degree[i]
+            external[best] += external[i] - 2 * links[best]
+    return refined
+
+
+def _aggregate(graph, community):
+    """Returns the graph of the communities of `graph`, in which the node
+    ``label[c]`` stands for community `c`, and the dict `label`."""
+    offsets, targets, weights, loops = graph
+    label = {}
+    for c in community:
+        if c not in label:
+            label[c] = len(label)
+    n = len(label)
+    rows = [{} for c in range(n)]
+    new_loops = [0] * n
+    for i, c in enumerate(community):
+        c = label[c]
+        row = rows[c]
+        # The edges inside a community are seen from both ends, which
+        # adds twice their weight to the self-loops of the community.
+        new_loops[c] += loops[i]
+        for p in range(offsets[i], offsets[i + 1]):
+            d = label[community[targets[p]]]
+            if d == c:
+                new_loops[c] += weights[p]
+            else:
+                row[d] = row.get(d, 0) + weights[p]
+    new_offsets = [0]
+    new_targets = []
+    new_weights = []
+    for row in rows:
+        new_targets.extend(row.keys())
+        new_weights.extend(row.values())
+        new_offsets.append(len(new_targets))
+    return (new_offsets, new_targets, new_weights, new_loops), label
+
+
+def _partitions(G, weight, resolution, threshold, seed, refine):
+    """Yields the partitions of the levels of the Louvain algorithm, or
+    of the Leiden algorithm if `refine` is True."""
+    rng = random.Random(seed)
+    nodes, graph = _compile_graph(G, weight)
+    degree = _degrees(graph)
+    total = sum(degree)
+    if total == 0:
+        return
+    # The original nodes in each node of the aggregated graph.
+    members = [[i] for i in range(len(nodes))]
+    community = list(range(len(nodes)))
+    modularity = _modularity(graph, community, degree, total, resolution)
+    while True:
+        _move_nodes(graph, community, degree, total, resolution, rng)
+        new_modularity = _modularity(graph, community, degree, total,
+                                     resolution)
+        if new_modularity - modularity <= threshold:
+            return
+        modularity = new_modularity
+        blocks = {}
+        for i, c in enumerate(community):
+            blocks.setdefault(c, []).extend(members[i])
+        yield [set(nodes[i] for i in block) for block in blocks.values()]
+        if len(blocks) == len(community):
+            return
+        if refine:
+            refined = _refine(graph, community, degree, total, resolution,
+                              rng)
+            if len(set(refined)) == len(refined):
+                refined = community
+        else:
+            refined = community
+        new_graph, label = _aggregate(graph, refined)
+        new_members = [[] for c in label]
+        new_community = [None] * len(label)
+        # Each node of the aggregated graph starts in the community of
+        # its nodes, which is named after one of its aggregated nodes.
+        name = {}
+        for i, r in enumerate(refined):
+            new_members[label[r]].extend(members[i])
+            new_community[label[r]] = name.setdefault(community[i],
+                                                      label[r])
+        members = new_members
+        community = new_community
+        graph = new_graph
+        degree = _degrees(graph)
+
+
+@not_implemented_for('directed')
+def louvain_partitions(G, weight='weight', resolution=1, threshold=1e-7,
+                       seed=None):
+    """Yields the partitions of the levels of the Louvain community
+    detection algorithm.
+
+    Each partition is coarser than the previous one and has a higher
+    modularity.  The partitions are yielded until the modularity
+    increases by at most `threshold`.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        An undirected graph.
+
+    weight : string or None, optional (default='weight')
+        The edge attribute holding the weight of edges.  Edges without
+        this attribute have weight 1.  If None, every edge has weight 1.
+
+    resolution : float, optional (default=1)
+        The resolution of the modularity.  Values greater than 1 favor
+        smaller communities, values less than 1 larger communities.
+
+    threshold : float, optional (default=1e-7)
+        The minimum increase of modularity for a level to be yielded.
+
+    seed : integer or None, optional (default=None)
+        Seed of the random order in which nodes are examined.
+
+    Yields
+    ------
+    partition : list
+        The communities of a level as a list of sets of nodes.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If G is directed.
+
+    See Also
+    --------
+    louvain_communities
+    """
+    return _partitions(G, weight, resolution, threshold, seed, False)
+
+
+@not_implemented_for('directed')
+def louvain_communities(G, weight='weight', resolution=1, threshold=1e-7,
+                        seed=None):
+    r"""Returns the communities of `G` found by the Louvain algorithm.
+
+    The Louvain algorithm [1]_ greedily maximizes the modularity of the
+    partition of the nodes.  Each node starts in its own community and
+    is moved to the community of a neighbor while this increases the
+    modularity.  The communities then become the nodes of an aggregated
+    graph, on which nodes are moved again, until the modularity stops
+    increasing.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        An undirected graph.
+
+    weight : string or None, optional (default='weight')
+        The edge attribute holding the weight of edges.  Edges without
+        this attribute have weight 1.  If None, every edge has weight 1.
+
+    resolution : float, optional (default=1)
+        The resolution :math:`\gamma` of the modularity
+
+        .. math::
+
+           Q = \frac{1}{2m} \sum_{ij} \left(A_{ij} - \gamma
+           \frac{k_i k_j}{2m}\right) \delta(c_i, c_j).
+
+        Values greater than 1 favor smaller communities, values less than
+        1 larger communities.
+
+    threshold : float, optional (default=1e-7)
+        The algorithm stops when a level increases the modularity by at
+        most `threshold`.
+
+    seed : integer or None, optional (default=None)
+        Seed of the random order in which nodes are examined.
+
+    Returns
+    -------
+    communities : list
+        The communities as a list of sets of nodes, which can be passed to
+        the functions of :mod:`networkx.algorithms.community.quality`.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If G is directed.
+
+    Examples
+    --------
+    >>> import networkx as nx
+    >>> G = nx.barbell_graph(5, 0)
+    >>> communities = nx.louvain_communities(G, seed=1)
+    >>> sorted(map(sorted, communities))
+    [[0, 1, 2, 3, 4], [5, 6, 7, 8, 9]]
+
+    Notes
+    -----
+    Moving a node only costs its degree: the total degree of each
+    community is kept up to date as nodes move, and a node whose
+    neighbors did not move is not examined again.
+
+    The communities found by the Louvain algorithm may be disconnected;
+    :func:`leiden_communities` avoids this.
+
+    See Also
+    --------
+    leiden_communities
+    louvain_partitions
+    modularity
+
+    References
+    ----------
+    .. [1] Vincent D. Blondel, Jean-Loup Guillaume, Renaud Lambiotte and
+       Etienne Lefebvre.  Fast unfolding of communities in large
+       networks.  J. Stat. Mech. (2008) P10008.
+    """
+    partition = [set([u]) for u in G]
+    for partition in _partitions(G, weight, resolution, threshold, seed,
+                                 False):
+        pass
+    return partition
+
+
+@not_implemented_for('directed')
+def leiden_communities(G, weight='weight', resolution=1, threshold=1e-7,
+                       seed=None):
+    """Returns the communities of `G` found by the Leiden algorithm.
+
+    The Leiden algorithm [1]_ improves the Louvain algorithm
+    (:func:`louvain_communities`) by refining the communities before
+    aggregating them.  Each community is split into singletons, which
+    are merged into the subcommunities that increase the modularity the
+    most, as long as they are well connected to the rest of their
+    community.  The subcommunities become the nodes of the aggregated
+    graph, starting in the community they were found in.  Communities
+    are then always connected.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        An undirected graph.
+
+    weight : string or None, optional (default='weight')
+        The edge attribute holding the weight of edges.  Edges without
+        this attribute have weight 1.  If None, every edge has weight 1.
+
+    resolution : float, optional (default=1)
+        The resolution of the modularity, as for
+        :func:`louvain_communities`.
+
+    threshold : float, optional (default=1e-7)
+        The algorithm stops when a level increases the modularity by at
+        most `threshold`.
+
+    seed : integer or None, optional (default=None)
+        Seed of the random order in which nodes are examined.
+
+    Returns
+    -------
+    communities : list
+        The communities as a list of sets of nodes.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If G is directed.
+
+    Examples
+    --------
+    >>> import networkx as nx
+    >>> G = nx.barbell_graph(5, 0)
+    >>> communities = nx.leiden_communities(G, seed=1)
+    >>> sorted(map(sorted, communities))
+    [[0, 1, 2, 3, 4], [5, 6, 7, 8, 9]]
+
+    Notes
+    -----
+    The refinement merges each node into the best subcommunity rather
+    than into a random one as in [1]_, which is the limit of the
+    randomness parameter of the Leiden algorithm going to zero.
+
+    See Also
+    --------
+    louvain_communities
+    modularity
+
+    References
+    ----------
+    .. [1] Vincent A. Traag, Ludo Waltman and Nees Jan van Eck.  From
+       Louvain to Leiden: guaranteeing well-connected communities.
+       Scientific Reports 9, 5233 (2019).
+    """
+    partition = [set([u]) for u in G]
+    for partition in _partitions(G, weight, resolution, threshold, seed,
+                                 True):
+        pass
+    return partition
@@ -17,7 +17,7 @@ from functools import wraps
 import networkx as nx
 from networkx.utils import not_implemented_for
 
-__all__ = ['coverage', 'performance']
+__all__ = ['coverage', 'modularity', 'performance']
 
 
 def is_partition(G, partition):
@@ -33,12 +33,15 @@ def is_partition(G, partition):
     `G`.
 
     """
-    # Alternate implementation:
-    #
-    #     return (len(G) == sum(len(c) for c in community) and
-    #             set(G) == set().union(*community))
-    #
-    return all(sum(1 if v in c else 0 for c in partition) == 1 for v in G)
+    # The blocks are pairwise disjoint if and only if the sum of their
+    # sizes is the size of their union.
+    union = set()
+    total = 0
+    for block in partition:
+        block = set(block)
+        total += len(block)
+        union |= block
+    return total == len(union) == len(G) and all(v in G for v in union)
 
 
 def require_partition(func):
@@ -249,3 +252,102 @@ def coverage(G, partition):
     intra_edges = intra_community_edges(G, partition)
     total_edges = G.number_of_edges()
     return intra_edges / total_edges
+
+
+@require_partition
+def modularity(G, partition, weight='weight', resolution=1):
+    r"""Returns the modularity of a partition.
+
+    The *modularity* of a partition of an undirected graph is
+
+    .. math::
+
+       Q = \frac{1}{2m} \sum_{ij} \left(A_{ij} - \gamma
+       \frac{k_i k_j}{2m}\right) \delta(c_i, c_j),
+
+    where :math:`m` is the total weight of the edges, :math:`A` is the
+    weighted adjacency matrix, :math:`k_i` is the weighted degree of node
+    :math:`i`, :math:`\gamma` is the resolution and :math:`\delta(c_i,
+    c_j)` is 1 if the nodes :math:`i` and :math:`j` are in the same block
+    of the partition and 0 otherwise [1]_.  For directed graphs, the
+    degrees :math:`k_i k_j` are replaced by the out-degree of :math:`i`
+    times the in-degree of :math:`j`, and :math:`2m` by :math:`m`.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    partition : sequence
+        Partition of the nodes of `G`, represented as a sequence of
+        sets of nodes. Each block of the partition represents a
+        community.
+
+    weight : string or None, optional (default='weight')
+        The edge attribute holding the weight of edges.  Edges without
+        this attribute have weight 1.  If None, every edge has weight 1.
+
+    resolution : float, optional (default=1)
+        The resolution :math:`\gamma` of the modularity.
+
+    Returns
+    -------
+    float
+        The modularity of the partition, as defined above.
+
+    Raises
+    ------
+    NetworkXError
+        If `partition` is not a valid partition of the nodes of `G`.
+
+    Examples
+    --------
+    >>> G = nx.barbell_graph(3, 0)
+    >>> round(nx.modularity(G, [{0, 1, 2}, {3, 4, 5}]), 4)
+    0.3571
+
+    Notes
+    -----
+    If `G` is a multigraph, the weights of parallel edges are summed.
+
+    See Also
+    --------
+    louvain_communities
+
+    References
+    ----------
+    .. [1] M. E. J. Newman.
+           "Networks: An Introduction", page 224.
+           Oxford University Press 2011.
+
+    """
+    block_of = {}
+    for i, block in enumerate(partition):
+        for v in block:
+            block_of[v] = i
+    directed = G.is_directed()
+    out_degree = [0] * len(partition)
+    in_degree = [0] * len(partition)
+    internal = 0
+    total = 0
+    if weight is None:
+        edges = ((u, v, 1) for u, v in G.edges())
+    else:
+        edges = G.edges(data=weight, default=1)
+    for u, v, w in edges:
+        b, c = block_of[u], block_of[v]
+        total += w
+        out_degree[b] += w
+        in_degree[c] += w
+        if not directed:
+            out_degree[c] += w
+            in_degree[b] += w
+        if b == c:
+            internal += w
+    if total == 0:
+        return 0
+    if not directed:
+        # Each edge counts twice in the adjacency matrix.
+        internal *= 2
+        total *= 2
+    expected = sum(k_out * k_in for k_out, k_in in zip(out_degree, in_degree))
+    return internal / total - resolution * expected / total ** 2
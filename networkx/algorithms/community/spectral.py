@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+#
+# spectral.py - spectral bisection of graphs
+#
+# Copyright 2016 NetworkX developers.
+#
+# This file is part of NetworkX.
+#
+# NetworkX is distributed under a BSD license; see LICENSE.txt for more
+# information.
+"""Functions for partitioning graphs with the Fiedler vector."""
+from __future__ import division
+
+import networkx as nx
+
+__all__ = ['spectral_bisection', 'recursive_spectral_bisection']
+
+
+def spectral_bisection(G, weight='weight', normalized=False, tol=1e-4,
+                       method='multilevel'):
+    """Partition a graph into two blocks of equal size using the Fiedler
+    vector.
+
+    The nodes are sorted by :func:`spectral_ordering`, which orders the
+    nodes of each connected component by their value in the Fiedler vector
+    of the component, and the first half of the nodes is split from the
+    second half.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        Directed graphs are treated as undirected graphs.
+
+    weight : key
+        Edge data key to use as weight. If None, the weights are all
+        set to one.
+
+    normalized : bool
+        Whether the normalized Laplacian matrix is used.
+
+    tol : float
+        Tolerance of relative residual in eigenvalue computation.  Only the
+        order of the entries of the Fiedler vector matters, which does not
+        require a tight tolerance.
+
+    method : string
+        Method of eigenvalue computation, as for :func:`fiedler_vector`.
+        The default 'multilevel' solves the eigenvalue problem on coarser
+        and coarser graphs first, which is suited to large graphs.
+
+    Returns
+    -------
+    partition : tuple
+        A pair of sets of nodes representing the bipartition, the sizes of
+        which differ by at most one.
+
+    Raises
+    ------
+    NetworkXError
+        If G is empty.
+
+    Examples
+    --------
+    >>> G = nx.barbell_graph(5, 0)
+    >>> A, B = nx.spectral_bisection(G)
+    >>> sorted(map(sorted, (A, B)))
+    [[0, 1, 2, 3, 4], [5, 6, 7, 8, 9]]
+
+    See Also
+    --------
+    kernighan_lin_bisection
+    recursive_spectral_bisection
+    spectral_ordering
+    """
+    order = nx.spectral_ordering(G, weight=weight, normalized=normalized,
+                                 tol=tol, method=method)
+    half = len(order) // 2
+    return set(order[:half]), set(order[half:])
+
+
+def recursive_spectral_bisection(G, k, weight='weight', normalized=False,
+                                 tol=1e-4, method='multilevel'):
+    """Partition a graph into `k` blocks of about equal size by recursive
+    spectral bisection.
+
+    The nodes are sorted by :func:`spectral_ordering` and split into two
+    blocks, the sizes of which are proportional to the number of blocks
+    each of them is then split into, until `k` blocks are found.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        Directed graphs are treated as undirected graphs.
+
+    k : int
+        The number of blocks.
+
+    weight : key
+        Edge data key to use as weight. If None, the weights are all
+        set to one.
+
+    normalized : bool
+        Whether the normalized Laplacian matrix is used.
+
+    tol : float
+        Tolerance of relative residual in eigenvalue computation.
+
+    method : string
+        Method of eigenvalue computation, as for :func:`fiedler_vector`.
+
+    Returns
+    -------
+    partition : list
+        A list of `k` sets of nodes of about equal size.
+
+    Raises
+    ------
+    NetworkXError
+        If `k` is not between 1 and the number of nodes of G.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(9)
+    >>> blocks = nx.recursive_spectral_bisection(G, 3)
+    >>> sorted(map(sorted, blocks))
+    [[0, 1, 2], [3, 4, 5], [6, 7, 8]]
+
+    See Also
+    --------
+    spectral_bisection
+    """
+    if not 1 <= k <= len(G):
+        raise nx.NetworkXError('k must be between 1 and the number of '
+                               'nodes of G.')
+    blocks = []
+    stack = [(list(G), k)]
+    while stack:
+        nodes, k = stack.pop()
+        if k == 1:
+            blocks.append(set(nodes))
+            continue
+        H = nx.induced_subgraph_view(G, nodes)
+        order = nx.spectral_ordering(H, weight=weight, normalized=normalized,
+                                     tol=tol, method=method)
+        # The first block is split into k // 2 blocks and the second into
+        # k - k // 2, so that all blocks have about the same size.
+        split = len(order) * (k // 2) // k
+        stack.append((order[split:], k - k // 2))
+        stack.append((order[:split], k // 2))
+    return blocks
+
+
+# fixture for nose tests
+def setup_module(module):
+    from nose import SkipTest
+    try:
+        import numpy
+        import scipy.sparse
+    except ImportError:
+        raise SkipTest('SciPy not available.')
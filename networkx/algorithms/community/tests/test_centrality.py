@@ -1,5 +1,5 @@
 #!/usr/bin/env python
-from nose.tools import assert_equal
+from nose.tools import assert_equal, assert_raises
 import networkx as nx
 import collections
 
@@ -77,3 +77,49 @@ class TestCommunities():
         validate_communities(result[3], [(1,), (2, ), (3, ), (4, ), (5, ), (6, ),
                                          (7, ), (8, ), (9, ), (10,), (11, ), (12, ),
                                          (13, ), (14, )])
+
+    def test_girvan_newman_components(self):
+        g = nx.disjoint_union(nx.barbell_graph(4, 1), nx.path_graph(5))
+        result = nx.girvan_newman(g)
+        assert_equal(len(result), 3)
+        validate_communities(result[0], [(0, 1, 2, 3), (8, ), (4, 5, 6, 7),
+                                         (9, 10, 11, 12, 13)])
+        validate_communities(result[1], [(0, 1, 2, 3), (8, ), (4, 5, 6, 7),
+                                         (9, 10), (11, ), (12, 13)])
+        assert_equal(result[2], tuple([v] for v in g))
+
+    def test_girvan_newman_whole_graph(self):
+        # Recomputing the betweenness only in the components that lose an
+        # edge gives the same result as recomputing it in the whole graph.
+        def girvan_newman(g, weight):
+            g = g.copy()
+            components = []
+            while g.number_of_edges() > 0:
+                number_components = nx.number_connected_components(g)
+                while nx.number_connected_components(g) <= number_components:
+                    betweenness = nx.edge_betweenness_centrality(g, weight=weight)
+                    max_value = max(betweenness.values())
+                    g.remove_edges_from([e for e in g.edges()
+                                         if betweenness[e] == max_value])
+                components.append(tuple(list(c) for c in
+                                        nx.connected_components(g)))
+            return components
+
+        for seed in range(3):
+            g = nx.gnm_random_graph(30, 50, seed=seed)
+            for u, v in g.edges():
+                g[u][v]['weight'] = (u + v) % 3 + 1
+            for weight in (None, 'weight'):
+                assert_equal(nx.girvan_newman(g, weight),
+                             girvan_newman(g, weight))
+
+    def test_girvan_newman_batch_size(self):
+        g = nx.barbell_graph(5, 0)
+        result = nx.girvan_newman(g, batch_size=4)
+        assert_equal(len(result), 2)
+        assert_equal(set(map(frozenset, result[0])),
+                     set(map(frozenset, [(0, 1, 2, 3), (4, ), (5, ),
+                                         (6, 7, 8, 9)])))
+        result = nx.girvan_newman(g, batch_size=100)
+        assert_equal(result, [tuple([v] for v in g)])
+        assert_raises(ValueError, nx.girvan_newman, g, batch_size=0)
@@ -0,0 +1,97 @@
+"""Unit tests for the :mod:`networkx.algorithms.community.louvain`
+module.
+
+"""
+from nose.tools import assert_almost_equal
+from nose.tools import assert_equal
+from nose.tools import assert_raises
+from nose.tools import assert_true
+
+import networkx as nx
+from networkx.algorithms.community.quality import is_partition
+
+
+def assert_partition_equal(x, y):
+    assert_equal(set(map(frozenset, x)), set(map(frozenset, y)))
+
+
+class TestLouvain(object):
+
+    functions = (nx.louvain_communities, nx.leiden_communities)
+
+    def test_caveman(self):
+        G = nx.connected_caveman_graph(10, 6)
+        expected = [set(range(i, i + 6)) for i in range(0, 60, 6)]
+        for f in self.functions:
+            assert_partition_equal(f(G, seed=1), expected)
+
+    def test_karate_club(self):
+        G = nx.karate_club_graph()
+        for f in self.functions:
+            for seed in range(5):
+                communities = f(G, seed=seed)
+                assert_true(is_partition(G, communities))
+                assert_true(nx.modularity(G, communities) > 0.41)
+
+    def test_partitions(self):
+        G = nx.karate_club_graph()
+        previous = -1
+        for partition in nx.louvain_partitions(G, seed=1):
+            assert_true(is_partition(G, partition))
+            Q = nx.modularity(G, partition)
+            assert_true(Q > previous)
+            previous = Q
+        assert_almost_equal(previous, nx.modularity(
+            G, nx.louvain_communities(G, seed=1)))
+
+    def test_weight(self):
+        # The heavy edge joining the two triangles is a community.
+        G = nx.barbell_graph(3, 0)
+        G[2][3]['weight'] = 100
+        for f in self.functions:
+            assert_partition_equal(f(G, seed=1), [{0, 1}, {2, 3}, {4, 5}])
+            assert_partition_equal(f(G, weight=None, seed=1),
+                                   [{0, 1, 2}, {3, 4, 5}])
+
+    def test_resolution(self):
+        G = nx.connected_caveman_graph(10, 6)
+        for f in self.functions:
+            assert_equal(len(f(G, resolution=0, seed=1)), 1)
+            assert_true(len(f(G, resolution=0.1, seed=1)) < 10)
+            assert_equal(len(f(G, resolution=100, seed=1)), 60)
+
+    def test_multigraph(self):
+        G = nx.MultiGraph(nx.barbell_graph(3, 0))
+        G.add_edge(0, 0)
+        for i in range(4):
+            G.add_edge(2, 3)
+        H = nx.Graph(nx.barbell_graph(3, 0))
+        H.add_edge(0, 0)
+        H[2][3]['weight'] = 5
+        for f in self.functions:
+            assert_partition_equal(f(G, seed=1), f(H, seed=1))
+
+    def test_edgeless(self):
+        G = nx.empty_graph(3)
+        for f in self.functions:
+            assert_partition_equal(f(G), [{0}, {1}, {2}])
+        assert_equal(list(nx.louvain_partitions(G)), [])
+        for f in self.functions:
+            assert_equal(f(nx.Graph()), [])
+
+    def test_disconnected(self):
+        G = nx.disjoint_union(nx.complete_graph(5), nx.complete_graph(4))
+        G.add_node(9)
+        for f in self.functions:
+            assert_partition_equal(f(G, seed=1), [set(range(5)),
+                                                  set(range(5, 9)), {9}])
+
+    def test_leiden_connected(self):
+        G = nx.connected_watts_strogatz_graph(500, 6, 0.1, seed=1)
+        for seed in range(3):
+            for community in nx.leiden_communities(G, seed=seed):
+                assert_true(nx.is_connected(G.subgraph(community)))
+
+    def test_directed(self):
+        for f in self.functions + (nx.louvain_partitions,):
+            assert_raises(nx.NetworkXNotImplemented, f, nx.DiGraph())
@@ -13,9 +13,15 @@ module.
 from __future__ import division
 
 from nose.tools import assert_almost_equal
+from nose.tools import assert_false
+from nose.tools import assert_raises
+from nose.tools import assert_true
 
+import networkx as nx
 from networkx.generators.classic import barbell_graph
 from networkx.algorithms.community.quality import coverage
+from networkx.algorithms.community.quality import is_partition
+from networkx.algorithms.community.quality import modularity
 from networkx.algorithms.community.quality import performance
 
 class TestPerformance(object):
@@ -50,3 +56,61 @@ class TestCoverage(object):
         G = barbell_graph(3, 0)
         partition = [{0, 1, 2}, {3, 4, 5}]
         assert_almost_equal(6 / 7, coverage(G, partition))
+
+
+class TestModularity(object):
+    """Unit tests for the :func:`modularity` function."""
+
+    def test_barbell(self):
+        G = barbell_graph(3, 0)
+        # Each community has 3 of the 7 edges inside and a degree of 7.
+        assert_almost_equal(6 / 7 - 2 * (7 / 14) ** 2,
+                            modularity(G, [{0, 1, 2}, {3, 4, 5}]))
+        assert_almost_equal(0, modularity(G, [set(G)]))
+        assert_almost_equal(6 / 7 - 2 * 2 * (7 / 14) ** 2,
+                            modularity(G, [{0, 1, 2}, {3, 4, 5}],
+                                       resolution=2))
+
+    def test_weight(self):
+        G = nx.Graph()
+        G.add_edge(0, 1, weight=3)
+        G.add_edge(1, 2, weight=1)
+        G.add_edge(2, 3, weight=3)
+        partition = [{0, 1}, {2, 3}]
+        assert_almost_equal(6 / 7 - 2 * (7 / 14) ** 2,
+                            modularity(G, partition))
+        assert_almost_equal(2 / 3 - 2 * (3 / 6) ** 2,
+                            modularity(G, partition, weight=None))
+
+    def test_multigraph_and_self_loops(self):
+        G = nx.MultiGraph([(0, 1), (0, 1), (1, 1), (2, 3)])
+        H = nx.Graph()
+        H.add_edge(0, 1, weight=2)
+        H.add_edge(1, 1, weight=1)
+        H.add_edge(2, 3, weight=1)
+        partition = [{0, 1}, {2, 3}]
+        assert_almost_equal(modularity(H, partition),
+                            modularity(G, partition))
+        assert_almost_equal(1 - (6 / 8) ** 2 - (2 / 8) ** 2,
+                            modularity(G, partition))
+
+    def test_directed(self):
+        G = nx.DiGraph([(0, 1), (1, 2), (2, 0), (3, 4), (4, 3), (2, 3)])
+        # out- and in-degrees of the blocks are (3, 3) and (3, 3).
+        assert_almost_equal(5 / 6 - 2 * 9 / 36,
+                            modularity(G, [{0, 1, 2}, {3, 4}]))
+
+    def test_invalid_partition(self):
+        G = barbell_graph(3, 0)
+        assert_raises(nx.NetworkXError, modularity, G, [{0, 1, 2}, {3, 4}])
+        assert_raises(nx.NetworkXError, modularity, G,
+                      [{0, 1, 2}, {2, 3, 4, 5}])
+
+
+def test_is_partition():
+    G = nx.path_graph(4)
+    assert_true(is_partition(G, [{0, 1}, {2, 3}]))
+    assert_true(is_partition(G, [[0, 1, 1], [2, 3]]))
+    assert_false(is_partition(G, [{0, 1}, {1, 2, 3}]))
+    assert_false(is_partition(G, [{0, 1}, {2}]))
+    assert_false(is_partition(G, [{0, 1}, {2, 3, 4}]))
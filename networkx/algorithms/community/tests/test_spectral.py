@@ -0,0 +1,65 @@
+"""Unit tests for the :mod:`networkx.algorithms.community.spectral`
+module.
+
+"""
+from nose import SkipTest
+from nose.tools import assert_equal, assert_raises, assert_true
+
+import networkx as nx
+
+
+def assert_partition_equal(x, y):
+    assert_equal(set(map(frozenset, x)), set(map(frozenset, y)))
+
+
+class TestSpectralBisection(object):
+
+    @classmethod
+    def setupClass(cls):
+        try:
+            import numpy
+            import scipy.sparse
+        except ImportError:
+            raise SkipTest('SciPy not available.')
+
+    def test_bisection(self):
+        G = nx.barbell_graph(3, 0)
+        for method in ('multilevel', 'lanczos'):
+            C = nx.spectral_bisection(G, method=method)
+            assert_partition_equal(C, [{0, 1, 2}, {3, 4, 5}])
+
+    def test_disconnected(self):
+        G = nx.Graph()
+        nx.add_path(G, range(4))
+        nx.add_path(G, range(4, 10))
+        A, B = nx.spectral_bisection(G)
+        assert_equal((len(A), len(B)), (5, 5))
+        assert_true({0, 1, 2, 3} <= A or {0, 1, 2, 3} <= B)
+
+    def test_large_grid(self):
+        # The grid is cut along its short side.
+        G = nx.grid_2d_graph(40, 10)
+        A, B = nx.spectral_bisection(G)
+        assert_partition_equal((A, B), [
+            set((i, j) for i in range(20) for j in range(10)),
+            set((i, j) for i in range(20, 40) for j in range(10))])
+
+    def test_recursive(self):
+        G = nx.path_graph(20)
+        blocks = nx.recursive_spectral_bisection(G, 4)
+        assert_partition_equal(blocks, [set(range(0, 5)), set(range(5, 10)),
+                                        set(range(10, 15)),
+                                        set(range(15, 20))])
+        blocks = nx.recursive_spectral_bisection(G, 3)
+        assert_equal(sorted(map(len, blocks)), [6, 7, 7])
+        assert_equal(set.union(*blocks), set(G))
+        for block in blocks:
+            assert_true(nx.is_connected(G.subgraph(block)))
+        assert_partition_equal(nx.recursive_spectral_bisection(G, 1),
+                               [set(G)])
+        assert_equal(len(nx.recursive_spectral_bisection(G, 20)), 20)
+
+    def test_invalid_k(self):
+        G = nx.path_graph(5)
+        assert_raises(nx.NetworkXError, nx.recursive_spectral_bisection, G, 0)
+        assert_raises(nx.NetworkXError, nx.recursive_spectral_bisection, G, 6)
@@ -4,3 +4,4 @@ from networkx.algorithms.components.weakly_connected import *
 from networkx.algorithms.components.attracting import *
 from networkx.algorithms.components.biconnected import *
 from networkx.algorithms.components.semiconnected import *
+from networkx.algorithms.components.dynamic import *
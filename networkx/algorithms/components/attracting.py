@@ -121,8 +121,9 @@ def attracting_component_subgraphs(G, copy=True):
         A list of node-induced subgraphs of the attracting components of `G`.
 
     copy : bool
-        If copy is True, graph, node, and edge attributes are copied to the 
-        subgraphs.
+        If copy is True, graph, node, and edge attributes are copied to the
+        subgraphs.  Otherwise each component is a read-only view of `G`
+        sharing its attributes.
 
     See Also
     --------
@@ -135,4 +136,4 @@ def attracting_component_subgraphs(G, copy=True):
         if copy:
             yield G.subgraph(ac).copy()
         else:
-            yield G.subgraph(ac)
+            yield nx.induced_subgraph_view(G, ac)
@@ -271,6 +271,10 @@ def biconnected_component_subgraphs(G, copy=True):
     G : NetworkX Graph
         An undirected graph.
 
+    copy : bool (default=True)
+        If True make a copy of the graph attributes.  Otherwise each
+        component is a read-only view of `G` sharing its attributes.
+
     Returns
     -------
     graphs : generator
@@ -343,7 +347,7 @@ def biconnected_component_subgraphs(G, copy=True):
         if copy:
             yield G.subgraph(comp_nodes).copy()
         else:
-            yield G.subgraph(comp_nodes)
+            yield nx.induced_subgraph_view(G, comp_nodes)
 
 
 @not_implemented_for('directed')
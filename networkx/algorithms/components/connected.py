@@ -79,7 +79,8 @@ def connected_component_subgraphs(G, copy=True):
        An undirected graph.
 
     copy: bool (default=True)
-      If True make a copy of the graph attributes
+      If True make a copy of the graph attributes.  Otherwise each
+      component is a read-only view of `G` sharing its attributes.
 
     Returns
     -------
@@ -111,7 +112,7 @@ def connected_component_subgraphs(G, copy=True):
         if copy:
             yield G.subgraph(c).copy()
         else:
-            yield G.subgraph(c)
+            yield nx.induced_subgraph_view(G, c)
 
 
 def number_connected_components(G):
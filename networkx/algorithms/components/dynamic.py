@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+"""
+Connected components maintained under graph updates.
+"""
+#    Copyright (C) 2016 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+import networkx as nx
+from networkx.algorithms.components.connected import _plain_bfs
+from networkx.utils.union_find import UnionFind
+
+__all__ = ['DynamicComponents']
+
+# The graph methods intercepted by DynamicComponents.  The other
+# methods modifying graphs, such as add_weighted_edges_from or
+# nx.add_path, are implemented with these ones.
+_HOOKS = ('add_node', 'add_nodes_from', 'add_edge', 'add_edges_from',
+          'remove_node', 'remove_nodes_from', 'remove_edge',
+          'remove_edges_from', 'clear')
+
+
+class DynamicComponents(object):
+    """Connected components of a graph kept up to date as it changes.
+
+    The tracker replaces the methods adding and removing nodes and edges
+    of the graph `G` by wrappers that update a union-find structure of
+    its components.  Adding nodes and edges costs a union-find
+    operation, so that component queries take nearly constant time
+    instead of a breadth-first search of the graph.  Removing edges or
+    nodes, which union-find structures cannot handle, triggers a search
+    limited to the affected component.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+       An undirected graph.  Changes made to `G` through its methods, or
+       through functions using them such as :func:`add_path`, are
+       tracked until :meth:`detach` is called.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+       If `G` is directed.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(3)
+    >>> components = nx.DynamicComponents(G)
+    >>> G.add_edge(10, 11)
+    >>> components.number_connected_components()
+    2
+    >>> components.connected(0, 10)
+    False
+    >>> G.add_edge(2, 10)
+    >>> components.is_connected()
+    True
+    >>> G.remove_edge(1, 2)
+    >>> sorted(components.node_connected_component(2))
+    [2, 10, 11]
+
+    Notes
+    -----
+    Changes made to the graph without calling its methods, for instance
+    by modifying ``G.adj`` directly, are not seen by the tracker.
+
+    See Also
+    --------
+    connected_components
+    networkx.utils.union_find.UnionFind
+    """
+
+    def __init__(self, G):
+        if G.is_directed():
+            raise nx.NetworkXNotImplemented('not implemented for '
+                                            'directed type')
+        self.graph = G
+        self._uf = UnionFind()
+        self._members = {}
+        for component in nx.connected_components(G):
+            self._add_component(component)
+        self._originals = {}
+        for name in _HOOKS:
+            self._originals[name] = (G.__dict__.get(name), getattr(G, name))
+            setattr(G, name, getattr(self, '_' + name))
+
+    def detach(self):
+        """Stop tracking the changes of the graph.
+
+        The original methods of the graph are restored.
+        """
+        G = self.graph
+        for name, (attribute, method) in self._originals.items():
+            if attribute is None:
+                del G.__dict__[name]
+            else:
+                setattr(G, name, attribute)
+        self._originals = {}
+
+    def connected(self, u, v):
+        """Return True if nodes `u` and `v` are in the same component.
+
+        Raises
+        ------
+        NetworkXError
+           If `u` or `v` is not in the graph.
+        """
+        return self._find(u) == self._find(v)
+
+    def node_connected_component(self, n):
+        """Return the set of nodes in the component containing node `n`.
+
+        Raises
+        ------
+        NetworkXError
+           If `n` is not in the graph.
+        """
+        return set(self._members[self._find(n)])
+
+    def connected_components(self):
+        """Generate the connected components of the graph as sets of nodes.
+        """
+        for members in list(self._members.values()):
+            yield set(members)
+
+    def number_connected_components(self):
+        """Return the number of connected components of the graph."""
+        return len(self._members)
+
+    def is_connected(self):
+        """Return True if the graph is connected.
+
+        Raises
+        ------
+        NetworkXPointlessConcept
+           If the graph is the null graph.
+        """
+        if len(self.graph) == 0:
+            raise nx.NetworkXPointlessConcept('Connectivity is undefined '
+                                              'for the null graph.')
+        return len(self._members) == 1
+
+    def _find(self, n):
+        if n not in self._uf.parents:
+            raise nx.NetworkXError("The node %s is not in the graph." % (n,))
+        return self._uf[n]
+
+    def _add_component(self, component):
+        """Record `component`, a set of nodes, as a component."""
+        uf = self._uf
+        root = next(iter(component))
+        for n in component:
+            uf.parents[n] = root
+        uf.weights[root] = len(component)
+        self._members[root] = component
+
+    def _new_node(self, n):
+        if n not in self._uf.parents:
+            self._add_component(set([n]))
+
+    def _union(self, u, v):
+        uf = self._uf
+        self._new_node(u)
+        self._new_node(v)
+        ru = uf[u]
+        rv = uf[v]
+        if ru != rv:
+            uf.union(ru, rv)
+            # union keeps the root of the largest set
+            root = uf[ru]
+            other = rv if root == ru else ru
+            self._members[root].update(self._members.pop(other))
+
+    def _split(self, roots):
+        """Recompute the components of the nodes of the sets named by
+        `roots` after removals.
+        """
+        G = self.graph
+        uf = self._uf
+        for root in roots:
+            members = self._members.pop(root)
+            for n in members:
+                del uf.parents[n]
+                uf.weights.pop(n, None)
+            members = set(n for n in members if n in G)
+            while members:
+                component = set(_plain_bfs(G, next(iter(members))))
+                self._add_component(component)
+                members -= component
+
+    def _split_edge(self, u, v):
+        """Update the components after the removal of edge `(u, v)`."""
+        G = self.graph
+        if u in G[v]:  # multigraphs may keep a parallel edge
+            return
+        root = self._uf[u]
+        component = set()
+        for n in _plain_bfs(G, u):
+            if n == v:
+                return
+            component.add(n)
+        members = self._members.pop(root)
+        members -= component
+        self._add_component(component)
+        self._add_component(members)
+
+    def _add_node(self, n, attr_dict=None, **attr):
+        self._originals['add_node'][1](n, attr_dict, **attr)
+        self._new_node(n)
+
+    def _add_nodes_from(self, nodes, **attr):
+        nodes = list(nodes)
+        self._originals['add_nodes_from'][1](nodes, **attr)
+        G = self.graph
+        for n in nodes:
+            # nodes can be given as (node, attribute dict) tuples
+            self._new_node(n if n in G else n[0])
+
+    def _add_edge(self, u, v, *args, **attr):
+        self._originals['add_edge'][1](u, v, *args, **attr)
+        self._union(u, v)
+
+    def _add_edges_from(self, ebunch, *args, **attr):
+        ebunch = list(ebunch)
+        self._originals['add_edges_from'][1](ebunch, *args, **attr)
+        for e in ebunch:
+            self._union(e[0], e[1])
+
+    def _remove_node(self, n):
+        self._originals['remove_node'][1](n)
+        self._split([self._uf[n]])
+
+    def _remove_nodes_from(self, nodes):
+        G = self.graph
+        nodes = [n for n in nodes if n in G]
+        self._originals['remove_nodes_from'][1](nodes)
+        self._split(set(self._uf[n] for n in nodes))
+
+    def _remove_edge(self, u, v, *args, **kwds):
+        # Multigraphs take the key of the edge, possibly by name.
+        self._originals['remove_edge'][1](u, v, *args, **kwds)
+        self._split_edge(u, v)
+
+    def _remove_edges_from(self, ebunch):
+        G = self.graph
+        ebunch = [e for e in ebunch if e[0] in G and e[1] in G]
+        self._originals['remove_edges_from'][1](ebunch)
+        for e in ebunch:
+            self._split_edge(e[0], e[1])
+
+    def _clear(self):
+        self._originals['clear'][1]()
+        self._uf = UnionFind()
+        self._members = {}
@@ -165,8 +165,7 @@ def kosaraju_strongly_connected_components(G, source=None):
     Uses Kosaraju's algorithm.
 
     """
-    with nx.utils.reversed(G):
-        post = list(nx.dfs_postorder_nodes(G, source=source))
+    post = list(nx.dfs_postorder_nodes(nx.reverse_view(G), source=source))
 
     seen = set()
     while post:
@@ -277,7 +276,8 @@ def strongly_connected_component_subgraphs(G, copy=True):
 
     copy : boolean, optional
         if copy is True, Graph, node, and edge attributes are copied to
-        the subgraphs.
+        the subgraphs.  Otherwise each component is a read-only view of
+        `G` sharing its attributes.
 
     Returns
     -------
@@ -309,7 +309,7 @@ def strongly_connected_component_subgraphs(G, copy=True):
         if copy:
             yield G.subgraph(comp).copy()
         else:
-            yield G.subgraph(comp)
+            yield nx.induced_subgraph_view(G, comp)
 
 
 @not_implemented_for('undirected')
@@ -0,0 +1,94 @@
+from nose.tools import assert_equal, assert_false, assert_raises, assert_true
+
+import networkx as nx
+
+
+class TestDynamicComponents(object):
+
+    def setUp(self):
+        self.G = nx.Graph()
+        nx.add_path(self.G, [0, 1, 2, 3])
+        self.G.add_edge(10, 11)
+        self.C = nx.DynamicComponents(self.G)
+
+    def check(self):
+        expected = sorted(map(sorted, nx.connected_components(self.G)))
+        assert_equal(sorted(map(sorted, self.C.connected_components())),
+                     expected)
+        assert_equal(self.C.number_connected_components(), len(expected))
+        for n in self.G:
+            assert_equal(self.C.node_connected_component(n),
+                         nx.node_connected_component(self.G, n))
+
+    def test_additions(self):
+        G, C = self.G, self.C
+        self.check()
+        G.add_node(20)
+        G.add_nodes_from([21, (22, {'color': 'red'})])
+        self.check()
+        assert_equal(C.number_connected_components(), 5)
+        G.add_edge(3, 10)
+        G.add_weighted_edges_from([(20, 21, 1.0), (21, 22, 2.0)])
+        self.check()
+        assert_true(C.connected(0, 11))
+        assert_false(C.connected(0, 20))
+        nx.add_path(G, [11, 30, 20])
+        self.check()
+        assert_true(C.is_connected())
+
+    def test_removals(self):
+        G, C = self.G, self.C
+        G.add_edge(3, 0)
+        G.remove_edge(1, 2)
+        self.check()
+        assert_true(C.connected(1, 2))
+        G.remove_edge(0, 3)
+        self.check()
+        assert_false(C.connected(1, 2))
+        G.remove_node(11)
+        self.check()
+        G.add_edge(2, 2)
+        G.remove_edges_from([(2, 2), (2, 3), (5, 6)])
+        self.check()
+        G.remove_nodes_from([0, 10, 42])
+        self.check()
+        G.clear()
+        assert_equal(C.number_connected_components(), 0)
+        assert_raises(nx.NetworkXPointlessConcept, C.is_connected)
+        G.add_edge('a', 'b')
+        self.check()
+
+    def test_multigraph(self):
+        G = nx.MultiGraph([(0, 1), (0, 1), (1, 2)])
+        C = nx.DynamicComponents(G)
+        G.remove_edge(0, 1)
+        assert_true(C.connected(0, 2))
+        G.remove_edge(0, 1)
+        assert_false(C.connected(0, 2))
+
+    def test_multigraph_keys(self):
+        G = nx.MultiGraph()
+        G.add_edge(0, 1, key='a')
+        G.add_edge(0, 1, key='b')
+        G.add_edge(1, 2)
+        C = nx.DynamicComponents(G)
+        G.remove_edge(0, 1, key='b')
+        assert_true(C.connected(0, 2))
+        assert_equal(list(G[0][1]), ['a'])
+        G.remove_edge(0, 1, 'a')
+        assert_false(C.connected(0, 2))
+
+    def test_detach(self):
+        G, C = self.G, self.C
+        C.detach()
+        assert_equal(G.add_edge, nx.Graph.add_edge.__get__(G))
+        G.add_edge(3, 10)
+        assert_false(C.connected(3, 10))
+
+    def test_errors(self):
+        assert_raises(nx.NetworkXError, self.C.node_connected_component, 42)
+        assert_raises(nx.NetworkXError, self.C.connected, 0, 42)
+        assert_raises(nx.NetworkXNotImplemented, nx.DynamicComponents,
+                      nx.DiGraph())
+        assert_raises(nx.NetworkXError, self.G.remove_edge, 0, 3)
+        self.check()
@@ -113,7 +113,7 @@ def k_components(G, flow_func=None):
         comp = set(component)
         if len(comp) > 1:
             k_components[1].append(comp)
-    bicomponents = list(nx.biconnected_component_subgraphs(G))
+    bicomponents = list(nx.biconnected_component_subgraphs(G, copy=False))
     for bicomponent in bicomponents:
         bicomp = set(bicomponent)
         # avoid considering dyads as bicomponents
@@ -132,7 +132,7 @@ def k_components(G, flow_func=None):
             (parent_k, partition) = stack[-1]
             try:
                 nodes = next(partition)
-                C = B.subgraph(nodes)
+                C = nx.induced_subgraph_view(B, nodes)
                 this_k = nx.node_connectivity(C, flow_func=flow_func)
                 if this_k > parent_k and this_k > 2:
                     k_components[this_k].append(set(C.nodes()))
@@ -182,7 +182,7 @@ def _generate_partition(G, cuts, k):
     components = []
     nodes = ({n for n, d in G.degree() if d > k} -
              {n for cut in cuts for n in cut})
-    H = G.subgraph(nodes)
+    H = nx.induced_subgraph_view(G, nodes)
     for cc in nx.connected_components(H):
         component = set(cc)
         for cut in cuts:
@@ -1,4 +1,5 @@
 from networkx.algorithms.isomorphism.isomorph import *
 from networkx.algorithms.isomorphism.vf2userfunc import *
 from networkx.algorithms.isomorphism.matchhelpers import *
+from networkx.algorithms.isomorphism.multipattern import *
 
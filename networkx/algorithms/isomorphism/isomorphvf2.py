@@ -41,8 +41,8 @@ True
 
 GM.mapping stores the isomorphism mapping from G1 to G2.
 
->>> GM.mapping
-{0: 0, 1: 1, 2: 2, 3: 3}
+>>> sorted(GM.mapping.items())
+[(0, 0), (1, 1), (2, 2), (3, 3)]
 
 
 Suppose G1 and G2 are isomorphic directed graphs
@@ -56,8 +56,8 @@ True
 
 DiGM.mapping stores the isomorphism mapping from G1 to G2.
 
->>> DiGM.mapping
-{0: 0, 1: 1, 2: 2, 3: 3}
+>>> sorted(DiGM.mapping.items())
+[(0, 0), (1, 1), (2, 2), (3, 3)]
 
 
 
@@ -112,6 +112,10 @@ References
       pp. 149-159, 2001.
       http://amalfi.dis.unina.it/graph/db/papers/vf-algorithm.pdf
 
+[3]   Alpar Juttner and Peter Madarasi, "VF2++ -- An improved subgraph
+      isomorphism algorithm", Discrete Applied Mathematics, vol. 242,
+      pp. 69-81, 2018.
+
 See Also
 --------
 syntactic_feasibliity(), semantic_feasibility()
@@ -120,6 +124,8 @@ Notes
 -----
 Modified to handle undirected graphs.
 Modified to handle multiple edges.
+Modified to match the nodes of G2 in the order of VF2++ [3], and to
+search without recursion.
 
 
 In general, this problem is NP-Complete.
@@ -137,6 +143,9 @@ In general, this problem is NP-Complete.
 #    James P. Crutchfield, principal investigator.
 #    Complexity Sciences Center and Physics Department, UC Davis.
 
+import bisect
+import heapq
+import itertools
 import sys
 import networkx as nx
 
@@ -170,12 +179,9 @@ class GraphMatcher(object):
         self.G1_nodes = set(G1.nodes())
         self.G2_nodes = set(G2.nodes())
 
-        # Set recursion limit.
+        # The matching is not recursive anymore, this is only kept for
+        # reset_recursion_limit().
         self.old_recursion_limit = sys.getrecursionlimit()
-        expected_max_recursion_level = len(self.G2)
-        if self.old_recursion_limit < 1.5 * expected_max_recursion_level:
-            # Give some breathing room.
-            sys.setrecursionlimit(int(1.5 * expected_max_recursion_level))
 
         # Declare that we will be searching for a graph-graph isomorphism.
         self.test = 'graph'
@@ -184,48 +190,107 @@ class GraphMatcher(object):
         self.initialize()
 
     def reset_recursion_limit(self):
-        """Restores the recursion limit."""
-        ### TODO:
-        ###     Currently, we use recursion and set the recursion level higher.
-        ###     It would be nice to restore the level, but because the
-        ###     (Di)GraphMatcher classes make use of cyclic references, garbage
-        ###     collection will never happen when we define __del__() to
-        ###     restore the recursion level. The result is a memory leak.
-        ###     So for now, we do not automatically restore the recursion level,
-        ###     and instead provide a method to do this manually. Eventually,
-        ###     we should turn this into a non-recursive implementation.
+        """Restores the recursion limit.
+
+        Earlier versions raised the recursion limit of the interpreter
+        to match large graphs.  Matching is now done with an explicit
+        stack, so that this method is only kept for backward
+        compatibility.
+        """
         sys.setrecursionlimit(self.old_recursion_limit)
 
-    def candidate_pairs_iter(self):
-        """Iterator over candidate pairs of nodes in G1 and G2."""
+    def node_order(self):
+        """Returns the order in which the nodes of G2 are matched.
 
-        # All computations are done using the current state!
+        Following VF2++ [1]_, the nodes of each connected component are
+        visited in breadth-first order from the node having the fewest
+        candidates in G1, the nodes of G1 of same degree (or of larger
+        degree for subgraph isomorphisms), ties being broken by largest
+        degree.  Within each level, the next node is the one with the most
+        neighbors already ordered, ties being broken by largest degree,
+        so that the most constrained nodes are matched first.  Also returns
+        a dict mapping each node to its parent in the search, a previously
+        ordered neighbor, or None for the first node of a component.
+
+        References
+        ----------
+        .. [1] Alpar Juttner and Peter Madarasi, "VF2++ -- An improved
+           subgraph isomorphism algorithm", Discrete Applied Mathematics,
+           vol. 242, pp. 69-81, 2018.
+        """
+        G2 = self.G2
+        degree = dict(G2.degree())
+        candidates = self._candidate_counter()
+        order = []
+        parent = {}
+        for root in sorted(G2, key=lambda n: (candidates(n), -degree[n])):
+            if root in parent:
+                continue
+            parent[root] = None
+            level = [root]
+            while level:
+                # Number of ordered neighbors of the nodes of the level.
+                connections = dict.fromkeys(level, 0)
+                seq = itertools.count()
+                heap = [(0, -degree[n], next(seq), n) for n in level]
+                heapq.heapify(heap)
+                next_level = []
+                while heap:
+                    c, _, _, node = heapq.heappop(heap)
+                    if node not in connections or -c != connections[node]:
+                        continue  # already ordered, or outdated entry
+                    del connections[node]
+                    order.append(node)
+                    for neighbor in self._G2_neighbors(node):
+                        if neighbor in connections:
+                            connections[neighbor] += 1
+                            heapq.heappush(heap, (-connections[neighbor],
+                                                  -degree[neighbor],
+                                                  next(seq), neighbor))
+                        elif neighbor not in parent:
+                            parent[neighbor] = node
+                            next_level.append(neighbor)
+                level = next_level
+        return order, parent
+
+    def _candidate_counter(self):
+        """Returns a function giving, for a node of G2, the number of nodes
+        of G1 it could be matched with, as estimated from the degrees.
+        """
+        G1_degrees = sorted(d for n, d in self.G1.degree())
+        degree = self.G2.degree
+        if self.test == 'graph':
+            return lambda n: (bisect.bisect_right(G1_degrees, degree(n)) -
+                              bisect.bisect_left(G1_degrees, degree(n)))
+        return lambda n: (len(G1_degrees) -
+                          bisect.bisect_left(G1_degrees, degree(n)))
 
-        G1_nodes = self.G1_nodes
-        G2_nodes = self.G2_nodes
+    def _G2_neighbors(self, node):
+        return self.G2[node]
 
-        # First we compute the inout-terminal sets.
-        T1_inout = [node for node in G1_nodes if (node in self.inout_1) and (node not in self.core_1)]
-        T2_inout = [node for node in G2_nodes if (node in self.inout_2) and (node not in self.core_2)]
+    def candidate_pairs_iter(self):
+        """Iterator over candidate pairs of nodes in G1 and G2."""
 
-        # If T1_inout and T2_inout are both nonempty.
-        # P(s) = T1_inout x {min T2_inout}
-        if T1_inout and T2_inout:
-            for node in T1_inout:
-                yield node, min(T2_inout)
+        # All computations are done using the current state!
 
+        # The nodes of G2 are matched in the order of G2_order, so that the
+        # next node of G2 is the first one not in the mapping.  It is
+        # either in T2_inout, as its parent is in the mapping, or the first
+        # node of a new component of G2, in which case T2_inout is empty.
+        G2_node = self.G2_order[len(self.core_2)]
+        parent = self.G2_parent[G2_node]
+        if parent is not None:
+            # P(s) = T1_inout x {G2_node}, restricted to the neighbors of
+            # the node matched with the parent of G2_node: the others
+            # cannot satisfy R_neighbor.
+            for G1_node in self.G1[self.core_2[parent]]:
+                if G1_node not in self.core_1:
+                    yield G1_node, G2_node
         else:
-            # If T1_inout and T2_inout were both empty....
-            # P(s) = (N_1 - M_1) x {min (N_2 - M_2)}
-            ##if not (T1_inout or T2_inout):       # as suggested by  [2], incorrect
-            if 1:                                  # as inferred from [1], correct
-                # First we determine the candidate node for G2
-                other_node = min(G2_nodes - set(self.core_2))
-                for node in self.G1:
-                    if node not in self.core_1:
-                        yield node, other_node
-
-        # For all other cases, we don't have any candidate pairs.
+            # P(s) = (N_1 - M_1) x {G2_node}
+            for G1_node in self.G1:
+                if G1_node not in self.core_1:
+                    yield G1_node, G2_node
 
     def initialize(self):
         """Reinitializes the state of the algorithm.
@@ -253,6 +318,8 @@ class GraphMatcher(object):
         self.inout_2 = {}
         # Practically, these sets simply store the nodes in the subgraph.
 
+        self.G2_order, self.G2_parent = self.node_order()
+
         self.state = GMState(self)
 
         # Provide a convienient way to access the isomorphism mapping.
@@ -290,10 +357,13 @@ class GraphMatcher(object):
     def match(self):
         """Extends the isomorphism mapping.
 
-        This function is called recursively to determine if a complete
-        isomorphism can be found between G1 and G2.  It cleans up the class
-        variables after each recursive call. If an isomorphism is found,
-        we yield the mapping.
+        This function explores the search tree depth first to determine
+        if a complete isomorphism can be found between G1 and G2.  The
+        candidate pairs of each level are kept on an explicit stack, so
+        that the depth of the search is not bounded by the recursion limit
+        of the interpreter, and the class variables are cleaned up each
+        time a level is left. If an isomorphism is found, we yield the
+        mapping.
 
         """
         if len(self.core_1) == len(self.G2):
@@ -301,17 +371,30 @@ class GraphMatcher(object):
             self.mapping = self.core_1.copy()
             # The mapping is complete.
             yield self.mapping
-        else:
-            for G1_node, G2_node in self.candidate_pairs_iter():
+            return
+        # Each level holds its candidate pairs and the state to restore
+        # when they are exhausted.
+        stack = [(self.candidate_pairs_iter(), None)]
+        while stack:
+            candidates, state = stack[-1]
+            for G1_node, G2_node in candidates:
                 if self.syntactic_feasibility(G1_node, G2_node):
                     if self.semantic_feasibility(G1_node, G2_node):
-                        # Recursive call, adding the feasible state.
+                        # Go one level deeper, adding the feasible state.
                         newstate = self.state.__class__(self, G1_node, G2_node)
-                        for mapping in self.match():
-                            yield mapping
-
-                        # restore data structures
-                        newstate.restore()
+                        if len(self.core_1) == len(self.G2):
+                            self.mapping = self.core_1.copy()
+                            yield self.mapping
+                            newstate.restore()
+                        else:
+                            stack.append((self.candidate_pairs_iter(),
+                                          newstate))
+                            break
+            else:
+                # restore data structures
+                stack.pop()
+                if state is not None:
+                    state.restore()
 
     def semantic_feasibility(self, G1_node, G2_node):
         """Returns True if adding (G1_node, G2_node) is symantically feasible.
@@ -497,51 +580,31 @@ class DiGraphMatcher(GraphMatcher):
         """
         super(DiGraphMatcher, self).__init__(G1, G2)
 
+    def _G2_neighbors(self, node):
+        return itertools.chain(self.G2.succ[node], self.G2.pred[node])
+
     def candidate_pairs_iter(self):
         """Iterator over candidate pairs of nodes in G1 and G2."""
 
         # All computations are done using the current state!
 
-        G1_nodes = self.G1_nodes
-        G2_nodes = self.G2_nodes
-
-        # First we compute the out-terminal sets.
-        T1_out = [node for node in G1_nodes if (node in self.out_1) and (node not in self.core_1)]
-        T2_out = [node for node in G2_nodes if (node in self.out_2) and (node not in self.core_2)]
-
-        # If T1_out and T2_out are both nonempty.
-        # P(s) = T1_out x {min T2_out}
-        if T1_out and T2_out:
-            node_2 = min(T2_out)
-            for node_1 in T1_out:
-                yield node_1, node_2
-
-        # If T1_out and T2_out were both empty....
-        # We compute the in-terminal sets.
-
-        ##elif not (T1_out or T2_out):   # as suggested by [2], incorrect
-        else:                            # as suggested by [1], correct
-            T1_in = [node for node in G1_nodes if (node in self.in_1) and (node not in self.core_1)]
-            T2_in = [node for node in G2_nodes if (node in self.in_2) and (node not in self.core_2)]
-
-            # If T1_in and T2_in are both nonempty.
-            # P(s) = T1_out x {min T2_out}
-            if T1_in and T2_in:
-                node_2 = min(T2_in)
-                for node_1 in T1_in:
-                    yield node_1, node_2
-
-            # If all terminal sets are empty...
-            # P(s) = (N_1 - M_1) x {min (N_2 - M_2)}
-
-            ##elif not (T1_in or T2_in):   # as suggested by  [2], incorrect
-            else:                          # as inferred from [1], correct
-                node_2 = min(G2_nodes - set(self.core_2))
-                for node_1 in G1_nodes:
-                    if node_1 not in self.core_1:
-                        yield node_1, node_2
-
-        # For all other cases, we don't have any candidate pairs.
+        # See GraphMatcher.candidate_pairs_iter().  G2_node is in T2_out if
+        # its parent is a predecessor, else in T2_in.
+        G2_node = self.G2_order[len(self.core_2)]
+        parent = self.G2_parent[G2_node]
+        if parent is not None:
+            if parent in self.G2.pred[G2_node]:
+                # P(s) = T1_out x {G2_node}
+                G1_nodes = self.G1.succ[self.core_2[parent]]
+            else:
+                # P(s) = T1_in x {G2_node}
+                G1_nodes = self.G1.pred[self.core_2[parent]]
+        else:
+            # P(s) = (N_1 - M_1) x {G2_node}
+            G1_nodes = self.G1
+        for G1_node in G1_nodes:
+            if G1_node not in self.core_1:
+                yield G1_node, G2_node
 
     def initialize(self):
         """Reinitializes the state of the algorithm.
@@ -572,6 +635,8 @@ class DiGraphMatcher(GraphMatcher):
         self.out_1 = {}
         self.out_2 = {}
 
+        self.G2_order, self.G2_parent = self.node_order()
+
         self.state = DiGMState(self)
 
         # Provide a convienient way to access the isomorphism mapping.
@@ -797,6 +862,9 @@ class GMState(object):
         self.G1_node = None
         self.G2_node = None
         self.depth = len(GM.core_1)
+        # The nodes added to inout_1 and inout_2 by this state.
+        self.new_nodes_1 = []
+        self.new_nodes_2 = []
 
         if G1_node is None or G2_node is None:
             # Then we reset the class variables
@@ -819,29 +887,17 @@ class GMState(object):
             # We will add only if it is not in there already!
             self.depth = len(GM.core_1)
 
-            # First we add the new nodes...
-            if G1_node not in GM.inout_1:
-                GM.inout_1[G1_node] = self.depth
-            if G2_node not in GM.inout_2:
-                    GM.inout_2[G2_node] = self.depth
-
-            # Now we add every other node...
-
-            # Updates for T_1^{inout}
-            new_nodes = set([])
-            for node in GM.core_1:
-                new_nodes.update([neighbor for neighbor in GM.G1[node] if neighbor not in GM.core_1])
-            for node in new_nodes:
+            # Updates for T_1^{inout} and T_2^{inout}.  Only the new nodes
+            # and their neighbors can be added: the neighbors of the nodes
+            # already in the mapping were added when they were mapped.
+            for node in itertools.chain([G1_node], GM.G1[G1_node]):
                 if node not in GM.inout_1:
                     GM.inout_1[node] = self.depth
-
-            # Updates for T_2^{inout}
-            new_nodes = set([])
-            for node in GM.core_2:
-                new_nodes.update([neighbor for neighbor in GM.G2[node] if neighbor not in GM.core_2])
-            for node in new_nodes:
+                    self.new_nodes_1.append(node)
+            for node in itertools.chain([G2_node], GM.G2[G2_node]):
                 if node not in GM.inout_2:
                     GM.inout_2[node] = self.depth
+                    self.new_nodes_2.append(node)
 
     def restore(self):
         """Deletes the GMState object and restores the class variables."""
@@ -853,10 +909,10 @@ class GMState(object):
 
         # Now we revert the other two vectors.
         # Thus, we delete all entries which have this depth level.
-        for vector in (self.GM.inout_1, self.GM.inout_2):
-            for node in list(vector.keys()):
-                if vector[node] == self.depth:
-                    del vector[node]
+        for node in self.new_nodes_1:
+            del self.GM.inout_1[node]
+        for node in self.new_nodes_2:
+            del self.GM.inout_2[node]
 
 
 class DiGMState(object):
@@ -881,6 +937,8 @@ class DiGMState(object):
         self.G1_node = None
         self.G2_node = None
         self.depth = len(GM.core_1)
+        # The (vector, node) entries added by this state.
+        self.new_entries = []
 
         if G1_node is None or G2_node is None:
             # Then we reset the class variables
@@ -905,47 +963,19 @@ class DiGMState(object):
             # We will add only if it is not in there already!
             self.depth = len(GM.core_1)
 
-            # First we add the new nodes...
-            for vector in (GM.in_1, GM.out_1):
-                if G1_node not in vector:
-                    vector[G1_node] = self.depth
-            for vector in (GM.in_2, GM.out_2):
-                if G2_node not in vector:
-                    vector[G2_node] = self.depth
-
-            # Now we add every other node...
-
-            # Updates for T_1^{in}
-            new_nodes = set([])
-            for node in GM.core_1:
-                new_nodes.update([predecessor for predecessor in GM.G1.predecessors(node) if predecessor not in GM.core_1])
-            for node in new_nodes:
-                if node not in GM.in_1:
-                    GM.in_1[node] = self.depth
-
-            # Updates for T_2^{in}
-            new_nodes = set([])
-            for node in GM.core_2:
-                new_nodes.update([predecessor for predecessor in GM.G2.predecessors(node) if predecessor not in GM.core_2])
-            for node in new_nodes:
-                if node not in GM.in_2:
-                    GM.in_2[node] = self.depth
-
-            # Updates for T_1^{out}
-            new_nodes = set([])
-            for node in GM.core_1:
-                new_nodes.update([successor for successor in GM.G1.successors(node) if successor not in GM.core_1])
-            for node in new_nodes:
-                if node not in GM.out_1:
-                    GM.out_1[node] = self.depth
-
-            # Updates for T_2^{out}
-            new_nodes = set([])
-            for node in GM.core_2:
-                new_nodes.update([successor for successor in GM.G2.successors(node) if successor not in GM.core_2])
-            for node in new_nodes:
-                if node not in GM.out_2:
-                    GM.out_2[node] = self.depth
+            # Updates for T_1^{in}, T_2^{in}, T_1^{out} and T_2^{out}.
+            # Only the new nodes and their neighbors can be added: the
+            # neighbors of the nodes already in the mapping were added when
+            # they were mapped.
+            chain = itertools.chain
+            for vector, nodes in ((GM.in_1, chain([G1_node], GM.G1.pred[G1_node])),
+                                  (GM.in_2, chain([G2_node], GM.G2.pred[G2_node])),
+                                  (GM.out_1, chain([G1_node], GM.G1[G1_node])),
+                                  (GM.out_2, chain([G2_node], GM.G2[G2_node]))):
+                for node in nodes:
+                    if node not in vector:
+                        vector[node] = self.depth
+                        self.new_entries.append((vector, node))
 
     def restore(self):
         """Deletes the DiGMState object and restores the class variables."""
@@ -958,8 +988,5 @@ class DiGMState(object):
 
         # Now we revert the other four vectors.
         # Thus, we delete all entries which have this depth level.
-        for vector in (self.GM.in_1, self.GM.in_2, self.GM.out_1, self.GM.out_2):
-            for node in list(vector.keys()):
-                if vector[node] == self.depth:
-                    del vector[node]
-
+        for vector, node in self.new_entries:
+            del vector[node]
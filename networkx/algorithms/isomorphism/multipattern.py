@@ -0,0 +1,358 @@
+"""
+*******************************
+Matching many patterns at once
+*******************************
+
+Search one host graph for many small pattern graphs, such as motifs.
+
+A :class:`GraphMatcher` built for each pattern starts from scratch: it
+considers every node of the host graph as a candidate for the first node
+of the pattern and compares node attributes with a user function.
+:class:`MultiPatternMatcher` instead indexes the host graph once, by node
+label, degree and neighborhood, so that the candidates of each pattern
+node are found in the index and the search of each pattern only visits
+the part of the host graph that can hold it.
+
+As for :class:`GraphMatcher`, the matches are node-induced subgraph
+isomorphisms: mappings from the nodes of a subgraph of the host graph to
+the nodes of the pattern.
+"""
+#    Copyright (C) 2016 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+import bisect
+from collections import Counter
+
+import networkx as nx
+from networkx.utils import map_sources
+from . import vf2userfunc
+from .matchhelpers import categorical_edge_match, categorical_multiedge_match
+
+__all__ = ['MultiPatternMatcher']
+
+
+def _signature(G, n, node_label, edge_label, neighbors):
+    """Return the labels of the edges joining `n` to its `neighbors` and
+    of these neighbors, as a Counter of (edge label, node label) pairs.
+    """
+    labels = Counter()
+    for nbr, data in neighbors.items():
+        node = G.node[nbr].get(node_label) if node_label is not None else None
+        if edge_label is None or G.is_multigraph():
+            labels[(None, node)] += 1
+        else:
+            labels[(data.get(edge_label), node)] += 1
+    return labels
+
+
+class _NodeIndex(object):
+    """Label, degrees and neighborhood of the nodes of a graph."""
+
+    def __init__(self, G, node_label, edge_label):
+        self.label = {}
+        self.degree = dict(G.degree())
+        if G.is_directed():
+            self.in_degree = dict(G.in_degree())
+            self.out_degree = dict(G.out_degree())
+        # Signatures of the successors and predecessors of each node.
+        self.succ = {}
+        self.pred = {}
+        # Degrees of the neighbors of each node, in decreasing order.
+        self.neighbor_degrees = {}
+        for n in G:
+            if node_label is not None:
+                self.label[n] = G.node[n].get(node_label)
+            else:
+                self.label[n] = None
+            self.succ[n] = _signature(G, n, node_label, edge_label, G.adj[n])
+            if G.is_directed():
+                self.pred[n] = _signature(G, n, node_label, edge_label,
+                                          G.pred[n])
+                neighbors = set(G.succ[n]) | set(G.pred[n])
+            else:
+                neighbors = G.adj[n]
+            self.neighbor_degrees[n] = sorted(
+                (self.degree[v] for v in neighbors), reverse=True)
+
+
+def _dominates(big, small):
+    """Return True if each key of the Counter `small` is at least as
+    frequent in the Counter `big`."""
+    for key, count in small.items():
+        if big[key] < count:
+            return False
+    return True
+
+
+class _IndexedMatcherMixin(object):
+    """Candidate generation of the matchers used by MultiPatternMatcher.
+
+    The nodes of G1 (the host graph) compatible with each node of G2 (the
+    pattern) are looked up in the index of the host graph instead of
+    being all tried.
+    """
+
+    def __init__(self, matcher, pattern_index, P, edge_match):
+        self.matcher = matcher
+        self.pattern_index = pattern_index
+        # Node labels are compared by _compatible().
+        super(_IndexedMatcherMixin, self).__init__(matcher.G, P,
+                                                   edge_match=edge_match)
+
+    def _candidate_counter(self):
+        return lambda n: self.matcher._count(self.pattern_index, n)
+
+    def _compatible(self, G1_node, G2_node):
+        return self.matcher._compatible(G1_node, self.pattern_index, G2_node)
+
+    def candidate_pairs_iter(self):
+        """Iterator over candidate pairs of nodes in G1 and G2."""
+        G2_node = self.G2_order[len(self.core_2)]
+        parent = self.G2_parent[G2_node]
+        if parent is None:
+            G1_nodes = self.matcher._candidates(self.pattern_index, G2_node)
+        elif not self.G2.is_directed() or parent in self.G2.pred[G2_node]:
+            G1_nodes = self.G1[self.core_2[parent]]
+        else:
+            G1_nodes = self.G1.pred[self.core_2[parent]]
+        core_1 = self.core_1
+        for G1_node in G1_nodes:
+            if G1_node not in core_1 and self._compatible(G1_node, G2_node):
+                yield G1_node, G2_node
+
+
+class _IndexedGraphMatcher(_IndexedMatcherMixin, vf2userfunc.GraphMatcher):
+    pass
+
+
+class _IndexedDiGraphMatcher(_IndexedMatcherMixin,
+                             vf2userfunc.DiGraphMatcher):
+    pass
+
+
+def _count_chunk(matcher, patterns):
+    return [sum(1 for m in matcher.subgraph_isomorphisms_iter(P))
+            for P in patterns]
+
+
+class MultiPatternMatcher(object):
+    """Search a host graph for many pattern graphs.
+
+    The host graph is indexed once, and the index is shared by the
+    searches of all the patterns.  The nodes of a pattern can only be
+    matched with the nodes of the host graph that have the same label, at
+    least the same degree (in- and out-degrees for directed graphs), at
+    least as many neighbors of each label, and neighbors of large enough
+    degrees.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+       The host graph.  The patterns must be of the same type: directed
+       if `G` is directed, and multigraphs if `G` is a multigraph.
+
+    node_label : hashable, optional (default=None)
+       The node attribute holding the label of nodes.  Nodes are only
+       matched with nodes having the same label, nodes without this
+       attribute having the label None.  If None, node attributes are
+       ignored.
+
+    edge_label : hashable, optional (default=None)
+       The edge attribute holding the label of edges.  Edges are only
+       matched with edges having the same label, as with
+       :func:`categorical_edge_match`.  If None, edge attributes are
+       ignored.
+
+    Examples
+    --------
+    Count the triangles and the paths of length 2 of a graph.  Each
+    occurrence of a pattern is found once per automorphism of the
+    pattern:
+
+    >>> from networkx.algorithms import isomorphism
+    >>> G = nx.complete_graph(4)
+    >>> G.add_edge(3, 4)
+    >>> matcher = isomorphism.MultiPatternMatcher(G)
+    >>> matcher.count_subgraph_isomorphisms([nx.cycle_graph(3),
+    ...                                      nx.path_graph(3)])
+    [24, 6]
+
+    With labels:
+
+    >>> G = nx.Graph([(0, 1), (1, 2), (2, 0), (2, 3)])
+    >>> nx.set_node_attributes(G, 'color', {0: 'red', 1: 'red',
+    ...                                     2: 'blue', 3: 'red'})
+    >>> P = nx.Graph([('a', 'b')])
+    >>> nx.set_node_attributes(P, 'color', {'a': 'blue', 'b': 'red'})
+    >>> matcher = isomorphism.MultiPatternMatcher(G, node_label='color')
+    >>> sorted(sorted(m.items()) for m in matcher.subgraph_isomorphisms_iter(P))
+    [[(0, 'b'), (2, 'a')], [(1, 'b'), (2, 'a')], [(2, 'a'), (3, 'b')]]
+
+    Notes
+    -----
+    The index is rebuilt when `G` is changed through its methods.
+
+    Matches are node-induced subgraph isomorphisms, as found by
+    :meth:`GraphMatcher.subgraph_isomorphisms_iter`.
+
+    See Also
+    --------
+    GraphMatcher
+    DiGraphMatcher
+    """
+
+    def __init__(self, G, node_label=None, edge_label=None):
+        self.G = G
+        self.node_label = node_label
+        self.edge_label = edge_label
+        self._version = None
+        self._build()
+
+    def _build(self):
+        """Index the nodes of the host graph."""
+        G = self.G
+        self._index = _NodeIndex(G, self.node_label, self.edge_label)
+        # The nodes of each label, by decreasing degree, and the opposite
+        # of their degrees, for bisection.
+        buckets = {}
+        for n, label in self._index.label.items():
+            buckets.setdefault(label, []).append(n)
+        self._buckets = {}
+        degree = self._index.degree
+        for label, nodes in buckets.items():
+            nodes.sort(key=lambda n: -degree[n])
+            self._buckets[label] = (nodes, [-degree[n] for n in nodes])
+        self._version = G._version
+
+    def _check_version(self):
+        if self._version != self.G._version:
+            self._build()
+
+    def _count(self, pattern_index, n):
+        """Return the number of nodes of the host graph having the label of
+        the pattern node `n` and at least its degree."""
+        bucket = self._buckets.get(pattern_index.label[n])
+        if bucket is None:
+            return 0
+        return bisect.bisect_right(bucket[1], -pattern_index.degree[n])
+
+    def _candidates(self, pattern_index, n):
+        """Iterator over the nodes of the host graph that can be matched
+        with the pattern node `n`."""
+        count = self._count(pattern_index, n)
+        if count:
+            nodes = self._buckets[pattern_index.label[n]][0]
+            for i in range(count):
+                yield nodes[i]
+
+    def _compatible(self, u, pattern_index, n):
+        """Return True if the host node `u` can be matched with the pattern
+        node `n`."""
+        index = self._index
+        if (index.label[u] != pattern_index.label[n] or
+                index.degree[u] < pattern_index.degree[n]):
+            return False
+        if self.G.is_directed():
+            if (index.in_degree[u] < pattern_index.in_degree[n] or
+                    index.out_degree[u] < pattern_index.out_degree[n]):
+                return False
+            if not _dominates(index.pred[u], pattern_index.pred[n]):
+                return False
+        if not _dominates(index.succ[u], pattern_index.succ[n]):
+            return False
+        # The neighbors of n are matched with distinct neighbors of u of
+        # larger degrees.
+        for du, dn in zip(index.neighbor_degrees[u],
+                          pattern_index.neighbor_degrees[n]):
+            if du < dn:
+                return False
+        return True
+
+    def _matcher(self, P):
+        """Return a GraphMatcher searching the host graph for `P`."""
+        G = self.G
+        if (P.is_directed() != G.is_directed() or
+                P.is_multigraph() != G.is_multigraph()):
+            raise nx.NetworkXError('The pattern and the host graph must be '
+                                   'of the same type.')
+        self._check_version()
+        edge_match = None
+        if self.edge_label is not None:
+            if G.is_multigraph():
+                edge_match = categorical_multiedge_match(self.edge_label,
+                                                         None)
+            else:
+                edge_match = categorical_edge_match(self.edge_label, None)
+        if G.is_directed():
+            cls = _IndexedDiGraphMatcher
+        else:
+            cls = _IndexedGraphMatcher
+        pattern_index = _NodeIndex(P, self.node_label, self.edge_label)
+        return cls(self, pattern_index, P, edge_match)
+
+    def candidates(self, P):
+        """Return the nodes of the host graph that can be matched with each
+        node of the pattern `P`, according to the index.
+
+        Parameters
+        ----------
+        P : NetworkX graph
+           A pattern graph.
+
+        Returns
+        -------
+        candidates : dict
+           A dict keyed by the nodes of `P` of the lists of their
+           candidates.
+        """
+        GM = self._matcher(P)
+        return dict((n, [u for u in self._candidates(GM.pattern_index, n)
+                         if self._compatible(u, GM.pattern_index, n)])
+                    for n in P)
+
+    def subgraph_isomorphisms_iter(self, P):
+        """Generator over isomorphisms between subgraphs of the host graph
+        and the pattern `P`.
+
+        The mappings are dicts keyed by nodes of the host graph, as for
+        :meth:`GraphMatcher.subgraph_isomorphisms_iter`.
+        """
+        GM = self._matcher(P)
+        for mapping in GM.subgraph_isomorphisms_iter():
+            yield mapping
+
+    def subgraph_is_isomorphic(self, P):
+        """Returns True if a subgraph of the host graph is isomorphic to
+        the pattern `P`."""
+        for mapping in self.subgraph_isomorphisms_iter(P):
+            return True
+        return False
+
+    def count_subgraph_isomorphisms(self, patterns, n_jobs=None):
+        """Returns the number of subgraph isomorphisms of each pattern.
+
+        Parameters
+        ----------
+        patterns : iterable of NetworkX graphs
+           The pattern graphs.
+
+        n_jobs : int or None, optional (default=None)
+           The number of worker processes searching the patterns, see
+           :func:`networkx.utils.effective_n_jobs`.  The host graph and its
+           index are sent once to each worker process.
+
+        Returns
+        -------
+        counts : list
+           The number of isomorphisms between subgraphs of the host graph
+           and each pattern, in the order of `patterns`.  An occurrence of
+           a pattern is counted once per automorphism of the pattern.
+        """
+        self._check_version()
+        counts = []
+        for chunk in map_sources(_count_chunk, self, patterns, n_jobs):
+            counts.extend(chunk)
+        return counts
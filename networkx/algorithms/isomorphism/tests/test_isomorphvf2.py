@@ -228,3 +228,38 @@ def test_multiple():
 #            assert_true(m['B'] == 'B')
 #            assert_true('C' not in m)
 
+
+def test_deep_graphs():
+    # The search is deeper than the default recursion limit.
+    import sys
+    limit = sys.getrecursionlimit()
+    n = 3 * limit
+    G1 = nx.path_graph(n)
+    G2 = nx.relabel_nodes(G1, lambda x: n - 1 - x)
+    assert_true(iso.GraphMatcher(G1, G2).is_isomorphic())
+    G1 = nx.path_graph(n, create_using=nx.DiGraph())
+    G2 = nx.relabel_nodes(G1, lambda x: -x)
+    dgm = iso.DiGraphMatcher(G1, G2)
+    assert_true(dgm.is_isomorphic())
+    assert_equal(dgm.mapping, dict((i, -i) for i in range(n)))
+    assert_true(dgm.subgraph_is_isomorphic())
+    assert_equal(sys.getrecursionlimit(), limit)
+
+def test_node_order():
+    G = nx.Graph([(0, 1), (1, 2), (2, 3), (3, 1), (4, 5)])
+    G.add_node(6)
+    gm = iso.GraphMatcher(G, G)
+    order, parent = gm.node_order()
+    assert_equal(sorted(order), list(range(7)))
+    # Components start at the node of rarest degree and every other node
+    # follows its parent, one of its neighbors.
+    assert_equal(order[0], 1)
+    for n in order:
+        if parent[n] is None:
+            assert_true(all(order.index(m) > order.index(n) for m in G[n]))
+        else:
+            assert_true(parent[n] in G[n])
+            assert_true(order.index(parent[n]) < order.index(n))
+    assert_equal(sum(1 for n in order if parent[n] is None), 3)
+    # 2 and 3, both adjacent to 1, come before 0.
+    assert_equal(order[1:4], [2, 3, 0])
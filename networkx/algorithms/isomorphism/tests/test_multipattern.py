@@ -0,0 +1,85 @@
+from nose.tools import assert_equal, assert_false, assert_raises, assert_true
+
+import networkx as nx
+from networkx.algorithms import isomorphism as iso
+
+
+def mappings(matches):
+    return sorted(sorted(m.items(), key=repr) for m in matches)
+
+
+class TestMultiPatternMatcher(object):
+
+    def setUp(self):
+        G = nx.Graph([(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 5)])
+        colors = {0: 'red', 1: 'red', 2: 'blue', 3: 'red', 4: 'blue', 5: 'red'}
+        nx.set_node_attributes(G, 'color', colors)
+        self.G = G
+
+    def test_unlabeled(self):
+        matcher = iso.MultiPatternMatcher(self.G)
+        patterns = [nx.cycle_graph(3), nx.path_graph(3), nx.star_graph(3),
+                    nx.complete_graph(4)]
+        counts = [sum(1 for m in
+                      iso.GraphMatcher(self.G, P).subgraph_isomorphisms_iter())
+                  for P in patterns]
+        assert_equal(matcher.count_subgraph_isomorphisms(patterns), counts)
+        assert_equal(counts[0], 6)
+        assert_equal(counts[3], 0)
+        assert_true(matcher.subgraph_is_isomorphic(nx.path_graph(4)))
+        assert_false(matcher.subgraph_is_isomorphic(nx.complete_graph(4)))
+
+    def test_node_label(self):
+        P = nx.path_graph(3)
+        nx.set_node_attributes(P, 'color', {0: 'red', 1: 'blue', 2: 'red'})
+        matcher = iso.MultiPatternMatcher(self.G, node_label='color')
+        nm = iso.categorical_node_match('color', None)
+        expected = iso.GraphMatcher(self.G, P, node_match=nm)
+        assert_equal(mappings(matcher.subgraph_isomorphisms_iter(P)),
+                     mappings(expected.subgraph_isomorphisms_iter()))
+        assert_equal(len(list(matcher.subgraph_isomorphisms_iter(P))), 6)
+        # Node 1, blue with two red neighbors, can only be 2 or 4.
+        candidates = matcher.candidates(P)
+        assert_equal(sorted(candidates[1]), [2, 4])
+        assert_equal(sorted(candidates[0]), [0, 1, 3, 5])
+
+    def test_edge_label(self):
+        G = nx.DiGraph()
+        G.add_edge(0, 1, kind='a')
+        G.add_edge(1, 2, kind='b')
+        G.add_edge(2, 3, kind='a')
+        P = nx.DiGraph()
+        P.add_edge('x', 'y', kind='a')
+        matcher = iso.MultiPatternMatcher(G, edge_label='kind')
+        assert_equal(mappings(matcher.subgraph_isomorphisms_iter(P)),
+                     [[(0, 'x'), (1, 'y')], [(2, 'x'), (3, 'y')]])
+        # Node 1 has no outgoing edge of kind 'a'.
+        assert_equal(sorted(matcher.candidates(P)['x']), [0, 2])
+
+    def test_multigraph(self):
+        G = nx.MultiGraph([(0, 1), (0, 1), (1, 2), (2, 2)])
+        P = nx.MultiGraph([('a', 'b'), ('a', 'b')])
+        matcher = iso.MultiPatternMatcher(G)
+        assert_equal(mappings(matcher.subgraph_isomorphisms_iter(P)),
+                     [[(0, 'a'), (1, 'b')], [(0, 'b'), (1, 'a')]])
+
+    def test_host_changes(self):
+        matcher = iso.MultiPatternMatcher(self.G)
+        K4 = nx.complete_graph(4)
+        assert_false(matcher.subgraph_is_isomorphic(K4))
+        self.G.add_edges_from([(0, 3), (1, 3)])
+        assert_true(matcher.subgraph_is_isomorphic(K4))
+
+    def test_pattern_type(self):
+        matcher = iso.MultiPatternMatcher(self.G)
+        assert_raises(nx.NetworkXError, matcher.candidates, nx.DiGraph())
+        assert_raises(nx.NetworkXError, matcher.count_subgraph_isomorphisms,
+                      [nx.MultiGraph([(0, 1)])])
+
+    def test_n_jobs(self):
+        G = nx.gnm_random_graph(50, 150, seed=1)
+        patterns = [nx.cycle_graph(3), nx.path_graph(3), nx.star_graph(3)]
+        matcher = iso.MultiPatternMatcher(G)
+        assert_equal(matcher.count_subgraph_isomorphisms(patterns * 2,
+                                                         n_jobs=2),
+                     matcher.count_subgraph_isomorphisms(patterns) * 2)
@@ -11,7 +11,9 @@ from networkx.exception import NetworkXError
 from networkx.utils import not_implemented_for
 __author__ = """\n""".join(["Aric Hagberg <aric.hagberg@gmail.com>",
                             "Brandon Liu <brandon.k.liu@gmail.com"])
-__all__ = ['pagerank', 'pagerank_numpy', 'pagerank_scipy', 'google_matrix']
+__all__ = ['pagerank', 'pagerank_numpy', 'pagerank_scipy',
+           'pagerank_scipy_batch', 'pagerank_transition_matrix',
+           'google_matrix']
 
 
 @not_implemented_for('multigraph')
@@ -343,7 +345,7 @@ def pagerank_numpy(G, alpha=0.85, personalization=None, weight='weight',
 
 def pagerank_scipy(G, alpha=0.85, personalization=None,
                    max_iter=100, tol=1.0e-6, weight='weight',
-                   dangling=None):
+                   dangling=None, nstart=None, transition=None):
     """Return the PageRank of the nodes in the graph.
 
     PageRank computes a ranking of the nodes in the graph G based on
@@ -382,6 +384,15 @@ def pagerank_scipy(G, alpha=0.85, personalization=None,
       matrix (see notes under google_matrix). It may be common to have the
       dangling dict to be the same as the personalization dict.
 
+    nstart : dictionary, optional
+      Starting value of PageRank iteration for each node.
+
+    transition : SciPy sparse matrix, optional
+      The transition matrix of `G` returned by
+      :func:`pagerank_transition_matrix` for the nodes in the order of
+      ``list(G)``.  Passing it avoids building it again when PageRank is
+      computed several times on the same graph.
+
     Returns
     -------
     pagerank : dictionary
@@ -403,7 +414,7 @@ def pagerank_scipy(G, alpha=0.85, personalization=None,
 
     See Also
     --------
-    pagerank, pagerank_numpy, google_matrix
+    pagerank, pagerank_numpy, pagerank_scipy_batch, google_matrix
 
     References
     ----------
@@ -414,60 +425,256 @@ def pagerank_scipy(G, alpha=0.85, personalization=None,
        The PageRank citation ranking: Bringing order to the Web. 1999
        http://dbpubs.stanford.edu:8090/pub/showDoc.Fulltext?lang=en&doc=1999-66&format=pdf
     """
-    import scipy.sparse
-
     N = len(G)
     if N == 0:
         return {}
 
     nodelist = list(G)
+    if personalization is not None:
+        missing = set(nodelist) - set(personalization)
+        if missing:
+            raise NetworkXError('Personalization vector dictionary '
+                                'must have a value for every node. '
+                                'Missing nodes %s' % missing)
+        personalization = [personalization]
+    x = pagerank_scipy_batch(G, alpha=alpha, personalization=personalization,
+                             max_iter=max_iter, tol=tol, nstart=nstart,
+                             weight=weight, dangling=dangling,
+                             nodelist=nodelist, transition=transition)
+    return dict(zip(nodelist, map(float, x[:, 0])))
+
+
+def pagerank_transition_matrix(G, nodelist=None, weight='weight'):
+    """Return the transition matrix of the random walk used by PageRank.
+
+    The entry ``M[i, j]`` is the probability for the walk to move from
+    the node ``nodelist[i]`` to the node ``nodelist[j]``, proportional to
+    the weight of the edge between them.  The rows of dangling nodes,
+    the nodes without out-edges, are zero.
+
+    The matrix can be computed once and passed to
+    :func:`pagerank_scipy` or :func:`pagerank_scipy_batch` to avoid
+    building it again for each call.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph.  Undirected graphs will be converted to a directed
+      graph with two directed edges for each undirected edge.
+
+    nodelist : list, optional
+      The rows and columns are ordered according to the nodes in
+      `nodelist`.  If `nodelist` is None, then the ordering is produced
+      by ``G.nodes()``.
+
+    weight : key, optional
+      Edge data key to use as weight.  If None weights are set to 1.
+
+    Returns
+    -------
+    M : SciPy sparse matrix
+      The row-stochastic transition matrix in CSR format.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph([(0, 1), (0, 2), (1, 2)])
+    >>> M = nx.pagerank_transition_matrix(G)
+    >>> print(M.toarray())
+    [[0.  0.5 0.5]
+     [0.  0.  1. ]
+     [0.  0.  0. ]]
+
+    See Also
+    --------
+    pagerank_scipy, pagerank_scipy_batch
+    """
+    import numpy as np
+    import scipy.sparse
+
     M = nx.to_scipy_sparse_matrix(G, nodelist=nodelist, weight=weight,
                                   dtype=float)
-    S = scipy.array(M.sum(axis=1)).flatten()
+    S = np.asarray(M.sum(axis=1)).flatten()
     S[S != 0] = 1.0 / S[S != 0]
-    Q = scipy.sparse.spdiags(S.T, 0, *M.shape, format='csr')
-    M = Q * M
+    Q = scipy.sparse.spdiags(S, 0, *M.shape, format='csr')
+    return Q.dot(M).tocsr()
 
-    # initial vector
-    x = scipy.repeat(1.0 / N, N)
 
-    # Personalization vector
-    if personalization is None:
-        p = scipy.repeat(1.0 / N, N)
+def _node_vectors(vectors, nodelist, name):
+    """Return `vectors` as the columns of an array in `nodelist` order.
+
+    `vectors` is either a sequence of dictionaries keyed by node, in
+    which case missing nodes get a value of zero and keys that are not in
+    `nodelist` are ignored, or an array-like of shape (N,) or (N, k).
+    Each column is normalized to sum to one.
+    """
+    import numpy as np
+    N = len(nodelist)
+    if len(vectors) and isinstance(vectors[0], dict):
+        index = dict(zip(nodelist, range(N)))
+        X = np.zeros((N, len(vectors)))
+        for j, vector in enumerate(vectors):
+            for n, value in vector.items():
+                if n in index:
+                    X[index[n], j] = value
     else:
-        missing = set(nodelist) - set(personalization)
-        if missing:
-            raise NetworkXError('Personalization vector dictionary '
-                                'must have a value for every node. '
-                                'Missing nodes %s' % missing)
-        p = scipy.array([personalization[n] for n in nodelist],
-                        dtype=float)
-        p = p / p.sum()
+        X = np.array(vectors, dtype=float)
+        if X.ndim == 1:
+            X = X[:, np.newaxis]
+        if X.ndim != 2 or X.shape[0] != N:
+            raise NetworkXError('%s must have one row per node.' % name)
+    S = X.sum(axis=0)
+    if (S == 0).any():
+        raise NetworkXError('%s vectors cannot sum to zero.' % name)
+    return X / S
+
+
+def pagerank_scipy_batch(G, alpha=0.85, personalization=None,
+                         max_iter=100, tol=1.0e-6, nstart=None,
+                         weight='weight', dangling=None, nodelist=None,
+                         transition=None):
+    """Return the PageRank of the nodes for several personalizations at once.
+
+    The PageRank vectors of all the personalization vectors are computed
+    together by a power iteration where each step multiplies the sparse
+    transition matrix by the dense matrix holding the current vectors.
+    Vectors that have converged are no longer updated.
 
-    # Dangling nodes
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph.  Undirected graphs will be converted to a directed
+      graph with two directed edges for each undirected edge.
+
+    alpha : float, optional
+      Damping parameter for PageRank, default=0.85.
+
+    personalization : list of dicts or array-like, optional
+      The personalization vectors, either as a list of dictionaries keyed
+      by node, where missing nodes get a personalization value of zero,
+      or as an array of shape (N, k) whose columns are the vectors and
+      whose rows follow `nodelist`.  By default, a single uniform
+      personalization vector is used.
+
+    max_iter : integer, optional
+      Maximum number of iterations in power method eigenvalue solver.
+
+    tol : float, optional
+      Error tolerance used to check convergence in power method solver.
+
+    nstart : array-like, optional
+      Starting vectors of the power iteration, of shape (N,) or (N, k),
+      typically the result of a previous call on a slightly different
+      graph.  The default is the uniform vector.
+
+    weight : key, optional
+      Edge data key to use as weight.  If None weights are set to 1.
+
+    dangling: dict, optional
+      The outedges to be assigned to any "dangling" nodes, i.e., nodes
+      without any outedges, see :func:`pagerank`.  By default, dangling
+      nodes are given outedges according to each personalization vector.
+
+    nodelist : list, optional
+      The order of the nodes in the rows of the arrays.  If `nodelist`
+      is None, then the ordering is produced by ``G.nodes()``.
+
+    transition : SciPy sparse matrix, optional
+      The transition matrix of `G` for the nodes in `nodelist` returned
+      by :func:`pagerank_transition_matrix`.  Computing it once saves
+      time when PageRank is computed repeatedly on the same graph.
+
+    Returns
+    -------
+    pagerank : NumPy array
+      An array of shape (N, k) whose column j is the PageRank vector of
+      the j-th personalization vector, with rows ordered as `nodelist`.
+
+    Raises
+    ------
+    NetworkXError
+      If the power iteration fails to converge within `max_iter`
+      iterations for some vector, or if the input vectors are invalid.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph(nx.path_graph(4))
+    >>> M = nx.pagerank_transition_matrix(G)
+    >>> seeds = [{0: 1}, {3: 1}, {0: 1, 3: 1}]
+    >>> pr = nx.pagerank_scipy_batch(G, personalization=seeds, transition=M)
+    >>> pr.shape
+    (4, 3)
+
+    The result of a previous computation can be used as starting point
+    after a small change of the graph:
+
+    >>> G.add_edge(3, 0)
+    >>> M = nx.pagerank_transition_matrix(G)
+    >>> pr = nx.pagerank_scipy_batch(G, personalization=seeds, nstart=pr,
+    ...                              transition=M)
+
+    See Also
+    --------
+    pagerank_scipy, pagerank_transition_matrix
+    """
+    import numpy as np
+
+    if nodelist is None:
+        nodelist = list(G)
+    N = len(nodelist)
+    if N == 0:
+        return np.zeros((0, 0 if personalization is None
+                         else len(personalization)))
+    if transition is None:
+        M = pagerank_transition_matrix(G, nodelist=nodelist, weight=weight)
+    else:
+        M = transition
+        if M.shape != (N, N):
+            raise NetworkXError('The transition matrix must have one row '
+                                'and one column per node.')
+    # The iteration computes x * M for each vector x, that is M.T * X.
+    MT = M.T.tocsr()
+
+    if personalization is None:
+        P = np.repeat(1.0 / N, N)[:, np.newaxis]
+    else:
+        P = _node_vectors(personalization, nodelist, 'Personalization')
+    k = P.shape[1]
+    if nstart is None:
+        X = np.repeat(1.0 / N, N * k).reshape(N, k)
+    else:
+        if isinstance(nstart, dict):
+            nstart = [nstart]
+        X = _node_vectors(nstart, nodelist, 'Starting')
+        if X.shape[1] == 1:
+            X = np.repeat(X, k, axis=1)
+        elif X.shape[1] != k:
+            raise NetworkXError('There must be one starting vector per '
+                                'personalization vector.')
     if dangling is None:
-        dangling_weights = p
+        D = None
     else:
         missing = set(nodelist) - set(dangling)
         if missing:
             raise NetworkXError('Dangling node dictionary '
                                 'must have a value for every node. '
                                 'Missing nodes %s' % missing)
-        # Convert the dangling dictionary into an array in nodelist order
-        dangling_weights = scipy.array([dangling[n] for n in nodelist],
-                                       dtype=float)
-        dangling_weights /= dangling_weights.sum()
-    is_dangling = scipy.where(S == 0)[0]
+        D = _node_vectors([dangling], nodelist, 'Dangling')
+    is_dangling = np.where(np.asarray(M.sum(axis=1)).flatten() == 0)[0]
 
-    # power iteration: make up to max_iter iterations
+    # power iteration on the vectors which have not converged yet
+    active = np.arange(k)
     for _ in range(max_iter):
-        xlast = x
-        x = alpha * (x * M + sum(x[is_dangling]) * dangling_weights) + \
-            (1 - alpha) * p
+        Xa = X[:, active]
+        Pa = P[:, active]
+        danglesum = Xa[is_dangling].sum(axis=0)
+        Xn = alpha * (MT.dot(Xa) + (Pa if D is None else D) * danglesum) + \
+            (1 - alpha) * Pa
         # check convergence, l1 norm
-        err = scipy.absolute(x - xlast).sum()
-        if err < N * tol:
-            return dict(zip(nodelist, map(float, x)))
+        err = np.absolute(Xn - Xa).sum(axis=0)
+        X[:, active] = Xn
+        active = active[err >= N * tol]
+        if len(active) == 0:
+            return X
     raise NetworkXError('pagerank_scipy: power iteration failed to converge '
                         'in %d iterations.' % max_iter)
 
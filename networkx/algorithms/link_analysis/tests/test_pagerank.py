@@ -132,8 +132,9 @@ class TestPageRankScipy(TestPageRank):
 
     @classmethod
     def setupClass(cls):
-        global scipy
+        global numpy, scipy
         try:
+            import numpy
             import scipy
         except ImportError:
             raise SkipTest('SciPy not available.')
@@ -155,6 +156,73 @@ class TestPageRankScipy(TestPageRank):
         for n in self.G:
             assert_almost_equal(pr[n], self.G.dangling_pagerank[n], places=4)
 
+    def test_scipy_pagerank_extra_keys(self):
+        # Keys of nodes that are not in the graph are ignored.
+        G = self.G
+        personalize = dict((n, n) for n in G)
+        dangling = dict(self.dangling_edges)
+        p = networkx.pagerank_scipy(G, personalization=personalize,
+                                    dangling=dangling)
+        personalize[99] = 1
+        dangling[99] = 1
+        q = networkx.pagerank_scipy(G, personalization=personalize,
+                                    dangling=dangling)
+        for n in G:
+            assert_almost_equal(p[n], q[n])
+        pr = networkx.pagerank_scipy_batch(G, personalization=[personalize],
+                                           dangling=dangling)
+        for i, n in enumerate(G):
+            assert_almost_equal(pr[i, 0], p[n], places=4)
+
     def test_empty_scipy(self):
         G = networkx.Graph()
         assert_equal(networkx.pagerank_scipy(G), {})
+
+    def test_scipy_pagerank_batch(self):
+        G = self.G
+        nodelist = list(G)
+        seeds = [{1: 1}, {4: 1, 6: 2}, dict((n, 1) for n in G)]
+        M = networkx.pagerank_transition_matrix(G, nodelist=nodelist)
+        pr = networkx.pagerank_scipy_batch(G, alpha=0.9, tol=1.e-08,
+                                           personalization=seeds,
+                                           transition=M)
+        assert_equal(pr.shape, (6, 3))
+        for j, seed in enumerate(seeds):
+            personalize = dict((n, seed.get(n, 0)) for n in G)
+            p = networkx.pagerank(G, alpha=0.9, tol=1.e-08,
+                                  personalization=personalize)
+            for i, n in enumerate(nodelist):
+                assert_almost_equal(pr[i, j], p[n], places=6)
+        # warm start from the previous result converges immediately
+        pr2 = networkx.pagerank_scipy_batch(G, alpha=0.9, tol=1.e-08,
+                                            personalization=seeds,
+                                            nstart=pr, transition=M,
+                                            max_iter=1)
+        assert_true(numpy.allclose(pr, pr2))
+        # array personalization with one column per vector
+        P = numpy.array([[seed.get(n, 0) for seed in seeds]
+                         for n in nodelist])
+        pr3 = networkx.pagerank_scipy_batch(G, alpha=0.9, tol=1.e-08,
+                                            personalization=P)
+        assert_true(numpy.allclose(pr, pr3))
+        p = networkx.pagerank_scipy(G, alpha=0.9, tol=1.e-08, transition=M)
+        q = networkx.pagerank(G, alpha=0.9, tol=1.e-08)
+        for n in G:
+            assert_almost_equal(p[n], q[n], places=6)
+
+    def test_scipy_pagerank_batch_errors(self):
+        G = self.G
+        assert_raises(networkx.NetworkXError, networkx.pagerank_scipy_batch,
+                      G, personalization=[{7: 1}])
+        assert_raises(networkx.NetworkXError, networkx.pagerank_scipy_batch,
+                      G, personalization=[{1: 0}])
+        assert_raises(networkx.NetworkXError, networkx.pagerank_scipy_batch,
+                      G, personalization=numpy.ones((3, 2)))
+        assert_raises(networkx.NetworkXError, networkx.pagerank_scipy_batch,
+                      G, transition=networkx.pagerank_transition_matrix(
+                          networkx.path_graph(3)))
+        assert_raises(networkx.NetworkXError, networkx.pagerank_scipy_batch,
+                      G, personalization=[{1: 1}, {2: 1}],
+                      nstart=numpy.ones((6, 3)))
+        assert_equal(networkx.pagerank_scipy_batch(
+            networkx.DiGraph()).shape, (0, 0))
@@ -15,7 +15,10 @@ __all__ = ['resource_allocation_index',
            'preferential_attachment',
            'cn_soundarajan_hopcroft',
            'ra_index_soundarajan_hopcroft',
-           'within_inter_cluster']
+           'within_inter_cluster',
+           'link_prediction_scores',
+           'non_edge_scores',
+           'top_k_links']
 
 
 def _apply_prediction(G, func, ebunch=None):
@@ -497,3 +500,316 @@ def _community(G, u, community):
         return node_u[community]
     except KeyError:
         raise nx.NetworkXAlgorithmError('No community information')
+
+
+_BATCH_METHODS = ('resource_allocation', 'jaccard', 'adamic_adar',
+                  'preferential_attachment')
+
+
+def _link_matrices(G, nodelist, method):
+    """Return the adjacency matrix of `G` without self loops, in the
+    order of `nodelist`, the number of neighbors of each node, its degree
+    and whether it has a self loop.
+    """
+    import numpy as np
+    import scipy.sparse as sp
+    if method not in _BATCH_METHODS:
+        raise nx.NetworkXError('Unknown link prediction method: %r'
+                               % (method,))
+    if nodelist is None:
+        nodelist = list(G)
+    elif len(nodelist) != len(G):
+        raise nx.NetworkXError('nodelist must contain every node of G')
+    A = nx.to_scipy_sparse_matrix(G, nodelist=nodelist, weight=None,
+                                  format='csr')
+    loops = A.diagonal() != 0
+    # |Gamma(u)| counts u itself if it has a self loop, as the degree
+    # does twice.
+    size = np.diff(A.indptr)
+    degree = size + loops
+    if loops.any():
+        A = (A - sp.diags(A.diagonal())).tocsr()
+        A.eliminate_zeros()
+    return A, size, degree, loops
+
+
+def _neighbor_weights(method, degree):
+    """Return the weight of each node as a common neighbor."""
+    import numpy as np
+    with np.errstate(divide='ignore'):
+        if method == 'resource_allocation':
+            return 1 / degree
+        return 1 / np.log(degree)
+
+
+def _pair_scores(A, size, degree, loops, method, u, v):
+    """Return the scores of the pairs of nodes at positions `u` and `v`."""
+    import numpy as np
+    if method == 'preferential_attachment':
+        return (degree[u] * degree[v]).astype(float)
+    # Rows of the common neighbors of each pair, u and v excluded.
+    common = A[u].multiply(A[v])
+    if method != 'jaccard':
+        return np.asarray(common.dot(_neighbor_weights(method, degree)),
+                          dtype=float).ravel()
+    common = np.asarray(common.sum(axis=1), dtype=float).ravel()
+    # The union of the neighborhoods also holds u and v.
+    intersection = common
+    if loops.any():
+        adjacent = np.asarray(A[u, v]).ravel()
+        both = loops[u].astype(np.int64) + loops[v]
+        intersection = common + adjacent * both
+    union = np.where(u == v, size[u], size[u] + size[v] - intersection)
+    scores = np.zeros(len(u))
+    np.divide(common, union, out=scores, where=union > 0)
+    return scores
+
+
+def _block_scores(A, size, degree, method, rows):
+    """Return the dense matrix of the scores of the nodes at positions
+    `rows` with all the nodes, valid for pairs of distinct non-adjacent
+    nodes.
+    """
+    import numpy as np
+    import scipy.sparse as sp
+    if method == 'preferential_attachment':
+        return np.outer(degree[rows], degree).astype(float)
+    if method == 'jaccard':
+        common = (A[rows] * A).toarray()
+        union = size[rows][:, np.newaxis] + size - common
+        scores = np.zeros(common.shape)
+        np.divide(common, union, out=scores, where=union > 0)
+        return scores
+    W = sp.diags(_neighbor_weights(method, degree))
+    return (A[rows] * W * A).toarray()
+
+
+@not_implemented_for('directed')
+@not_implemented_for('multigraph')
+def link_prediction_scores(G, u, v, method='resource_allocation',
+                           nodelist=None, chunksize=2 ** 20):
+    """Return the link prediction scores of pairs of nodes as an array.
+
+    This is the batch counterpart of :func:`resource_allocation_index`,
+    :func:`jaccard_coefficient`, :func:`adamic_adar_index` and
+    :func:`preferential_attachment`: the pairs are given as two arrays of
+    node positions and the scores are computed with sparse matrix
+    products, without a Python tuple per pair.
+
+    Parameters
+    ----------
+    G : graph
+        A NetworkX undirected graph.
+
+    u, v : array_like of integers
+        The positions in `nodelist` of the two nodes of each pair.
+
+    method : string, optional (default='resource_allocation')
+        One of 'resource_allocation', 'jaccard', 'adamic_adar' and
+        'preferential_attachment'.
+
+    nodelist : list, optional
+        The order of the nodes of `G`.  If None, the order is given by
+        ``G.nodes()``.
+
+    chunksize : int, optional
+        The number of pairs scored at once.
+
+    Returns
+    -------
+    scores : NumPy array
+        The score of each pair ``(nodelist[u[i]], nodelist[v[i]])``.
+
+    Raises
+    ------
+    NetworkXError
+        If `method` is unknown or if `nodelist` does not contain every
+        node of `G`.
+
+    Examples
+    --------
+    >>> G = nx.complete_graph(5)
+    >>> scores = nx.link_prediction_scores(G, [0, 2], [1, 3])
+    >>> print(['%.2f' % p for p in scores])
+    ['0.75', '0.75']
+    >>> scores = nx.link_prediction_scores(G, [0, 2], [1, 3], 'jaccard')
+    >>> print(['%.2f' % p for p in scores])
+    ['0.60', '0.60']
+
+    See Also
+    --------
+    non_edge_scores, top_k_links
+    """
+    import numpy as np
+    A, size, degree, loops = _link_matrices(G, nodelist, method)
+    u = np.asarray(u, dtype=np.intp).ravel()
+    v = np.asarray(v, dtype=np.intp).ravel()
+    if len(u) != len(v):
+        raise ValueError('u and v must have the same length')
+    scores = np.empty(len(u))
+    for i in range(0, len(u), chunksize):
+        scores[i:i + chunksize] = _pair_scores(A, size, degree, loops, method,
+                                               u[i:i + chunksize],
+                                               v[i:i + chunksize])
+    return scores
+
+
+@not_implemented_for('directed')
+@not_implemented_for('multigraph')
+def non_edge_scores(G, method='resource_allocation', nodelist=None,
+                    chunksize=2 ** 20):
+    """Generate the link prediction scores of all the non-edges of `G`
+    in chunks of arrays.
+
+    The non-edges are the pairs of distinct non-adjacent nodes, each
+    found once, as in :func:`non_edges`.
+
+    Parameters
+    ----------
+    G : graph
+        A NetworkX undirected graph.
+
+    method : string, optional (default='resource_allocation')
+        One of 'resource_allocation', 'jaccard', 'adamic_adar' and
+        'preferential_attachment'.
+
+    nodelist : list, optional
+        The order of the nodes of `G`.  If None, the order is given by
+        ``G.nodes()``.
+
+    chunksize : int, optional
+        The number of pairs of nodes, edges or not, considered at once.
+        The memory used is about 24 bytes per pair.
+
+    Returns
+    -------
+    chunks : iterator
+        An iterator of triples ``(u, v, scores)`` of NumPy arrays: the
+        positions in `nodelist` of the two nodes of each non-edge, with
+        ``u < v``, and their scores.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> for u, v, scores in nx.non_edge_scores(G, 'preferential_attachment'):
+    ...     print(list(zip(u.tolist(), v.tolist(), scores.tolist())))
+    [(0, 2, 2.0), (0, 3, 1.0), (1, 3, 2.0)]
+
+    See Also
+    --------
+    link_prediction_scores, top_k_links
+    """
+    import numpy as np
+    A, size, degree, loops = _link_matrices(G, nodelist, method)
+    n = A.shape[0]
+    step = max(1, chunksize // max(n, 1))
+    positions = np.arange(n)
+    for start in range(0, n, step):
+        rows = positions[start:start + step]
+        scores = _block_scores(A, size, degree, method, rows)
+        mask = positions > rows[:, np.newaxis]
+        mask &= A[rows].toarray() == 0
+        i, j = np.nonzero(mask)
+        if len(i):
+            yield rows[i], j, scores[i, j]
+
+
+@not_implemented_for('directed')
+@not_implemented_for('multigraph')
+def top_k_links(G, k, method='resource_allocation', sources=None,
+                nodelist=None, chunksize=2 ** 20):
+    """Return the `k` best scored non-neighbors of each source node.
+
+    Parameters
+    ----------
+    G : graph
+        A NetworkX undirected graph.
+
+    k : int
+        The number of non-neighbors to return for each source node.
+
+    method : string, optional (default='resource_allocation')
+        One of 'resource_allocation', 'jaccard', 'adamic_adar' and
+        'preferential_attachment'.
+
+    sources : array_like of integers, optional
+        The positions in `nodelist` of the source nodes.  If None, all
+        the nodes are sources.
+
+    nodelist : list, optional
+        The order of the nodes of `G`.  If None, the order is given by
+        ``G.nodes()``.
+
+    chunksize : int, optional
+        The number of pairs of nodes considered at once.
+
+    Returns
+    -------
+    targets, scores : NumPy arrays
+        Two arrays with a row per source node and ``min(k, len(G))``
+        columns: the positions in `nodelist` of the best scored
+        non-neighbors of each source node, by decreasing score with
+        ties broken arbitrarily, and their scores.  Rows of sources with
+        fewer non-neighbors are padded with -1 targets and -inf scores.
+
+    Raises
+    ------
+    ValueError
+        If `k` is not positive.
+
+    Examples
+    --------
+    >>> G = nx.star_graph(3)
+    >>> G.add_edge(3, 4)
+    >>> targets, scores = nx.top_k_links(G, 1, sources=[0, 4])
+    >>> targets.tolist(), scores.tolist()
+    ([[4], [0]], [[0.5], [0.5]])
+
+    See Also
+    --------
+    link_prediction_scores, non_edge_scores
+    """
+    import numpy as np
+    if k < 1:
+        raise ValueError('k must be positive')
+    A, size, degree, loops = _link_matrices(G, nodelist, method)
+    n = A.shape[0]
+    if sources is None:
+        sources = np.arange(n)
+    else:
+        sources = np.asarray(sources, dtype=np.intp).ravel()
+    k = min(k, n)
+    targets = np.empty((len(sources), k), dtype=np.intp)
+    best = np.empty((len(sources), k))
+    step = max(1, chunksize // max(n, 1))
+    for start in range(0, len(sources), step):
+        rows = sources[start:start + step]
+        scores = _block_scores(A, size, degree, method, rows)
+        scores[A[rows].toarray() != 0] = -np.inf
+        index = np.arange(len(rows))
+        scores[index, rows] = -np.inf
+        if k < n:
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            top = np.tile(np.arange(n), (len(rows), 1))
+        top_scores = scores[index[:, np.newaxis], top]
+        order = np.argsort(-top_scores, axis=1, kind='mergesort')
+        top = top[index[:, np.newaxis], order]
+        top_scores = top_scores[index[:, np.newaxis], order]
+        top[top_scores == -np.inf] = -1
+        targets[start:start + step] = top
+        best[start:start + step] = top_scores
+    return targets, best
+
+
+# fixture for nose tests
+def setup_module(module):
+    from nose import SkipTest
+    try:
+        import numpy
+    except:
+        raise SkipTest("NumPy not available")
+    try:
+        import scipy
+    except:
+        raise SkipTest("SciPy not available")
@@ -4,3 +4,6 @@ from networkx.algorithms.shortest_paths.weighted import *
 from networkx.algorithms.shortest_paths.astar import *
 from networkx.algorithms.shortest_paths.dense import *
 
+from networkx.algorithms.shortest_paths.disk import *
+from networkx.algorithms.shortest_paths.landmarks import *
+from networkx.algorithms.shortest_paths.contraction import *
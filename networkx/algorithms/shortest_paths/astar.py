@@ -21,7 +21,8 @@ __all__ = ['astar_path', 'astar_path_length']
 
 
 @not_implemented_for('multigraph')
-def astar_path(G, source, target, heuristic=None, weight='weight'):
+def astar_path(G, source, target, heuristic=None, weight='weight',
+               heap=None):
     """Return a list of nodes in a shortest path between source and target
     using the A* ("A-star") algorithm.
 
@@ -45,6 +46,15 @@ def astar_path(G, source, target, heuristic=None, weight='weight'):
     weight: string, optional (default='weight')
        Edge data key corresponding to the edge weight.
 
+    heap : callable, optional (default=None)
+       The priority queue holding the nodes to explore: a subclass of
+       :class:`~networkx.utils.heaps.MinHeap`, such as
+       :class:`~networkx.utils.heaps.DaryHeap`, or any function returning
+       an empty one.  By default a :mod:`heapq` list is used, to which a
+       new entry is pushed whenever a shorter path to a node is found.
+       Heaps supporting decrease-key keep a single entry per node
+       instead.
+
     Raises
     ------
     NetworkXNoPath
@@ -74,6 +84,9 @@ def astar_path(G, source, target, heuristic=None, weight='weight'):
         def heuristic(u, v):
             return 0
 
+    if heap is not None:
+        return _astar_path_heap(G, source, target, heuristic, weight, heap())
+
     push = heappush
     pop = heappop
 
@@ -130,7 +143,53 @@ def astar_path(G, source, target, heuristic=None, weight='weight'):
     raise nx.NetworkXNoPath("Node %s not reachable from %s" % (source, target))
 
 
-def astar_path_length(G, source, target, heuristic=None, weight='weight'):
+def _astar_path_heap(G, source, target, heuristic, weight, queue):
+    """Return a shortest path from source to target found with the A*
+    algorithm, using `queue`, a :class:`MinHeap`, as priority queue.
+
+    The queue maps each enqueued node to its priority, which is decreased
+    in place when a shorter path to the node is found.
+    """
+    queue.insert(source, 0)
+    # Maps enqueued nodes to distance of discovered paths, the computed
+    # heuristics to target and the parent closest to the source.
+    enqueued = {source: (0, 0, None)}
+    # Maps explored nodes to parent closest to the source.
+    explored = {}
+
+    while queue:
+        curnode, _ = queue.pop()
+        dist, _, parent = enqueued[curnode]
+
+        if curnode == target:
+            path = [curnode]
+            node = parent
+            while node is not None:
+                path.append(node)
+                node = explored[node]
+            path.reverse()
+            return path
+
+        explored[curnode] = parent
+
+        for neighbor, w in G[curnode].items():
+            if neighbor in explored:
+                continue
+            ncost = dist + w.get(weight, 1)
+            if neighbor in enqueued:
+                qcost, h, _ = enqueued[neighbor]
+                if qcost <= ncost:
+                    continue
+            else:
+                h = heuristic(neighbor, target)
+            enqueued[neighbor] = ncost, h, curnode
+            queue.insert(neighbor, ncost + h)
+
+    raise nx.NetworkXNoPath("Node %s not reachable from %s" % (source, target))
+
+
+def astar_path_length(G, source, target, heuristic=None, weight='weight',
+                      heap=None):
     """Return the length of the shortest path between source and target using
     the A* ("A-star") algorithm.
 
@@ -149,6 +208,13 @@ def astar_path_length(G, source, target, heuristic=None, weight='weight'):
        from the a node to the target.  The function takes
        two nodes arguments and must return a number.
 
+    weight: string, optional (default='weight')
+       Edge data key corresponding to the edge weight.
+
+    heap : callable, optional (default=None)
+       The priority queue holding the nodes to explore, see
+       :func:`astar_path`.
+
     Raises
     ------
     NetworkXNoPath
@@ -159,5 +225,5 @@ def astar_path_length(G, source, target, heuristic=None, weight='weight'):
     astar_path
 
     """
-    path = astar_path(G, source, target, heuristic, weight)
+    path = astar_path(G, source, target, heuristic, weight, heap)
     return sum(G[u][v].get(weight, 1) for u, v in zip(path[:-1], path[1:]))
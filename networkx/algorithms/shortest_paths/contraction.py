@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+#    Copyright (C) 2016 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+"""
+Shortest paths with contraction hierarchies.
+
+A contraction hierarchy [1]_ is an index answering many shortest path
+queries in a graph that does not change.  The nodes are removed
+("contracted") one at a time, and each time the shortest paths through
+the removed node are preserved by shortcut edges between its neighbors.
+A query is a bidirectional search that only follows edges toward nodes
+contracted later, so that it explores a tiny part of the graph.
+
+References
+----------
+.. [1] Robert Geisberger, Peter Sanders, Dominik Schultes and Daniel
+   Delling.  Contraction hierarchies: Faster and simpler hierarchical
+   routing in road networks.  In: Experimental Algorithms (WEA 2008),
+   Lecture Notes in Computer Science 5038, pp. 319--333, 2008.
+"""
+from heapq import heappush, heappop
+
+import networkx as nx
+from networkx.algorithms.shortest_paths.weighted import _compile_adjacency
+
+__all__ = ['ContractionHierarchy']
+
+INF = float('inf')
+
+
+def _compress(edges):
+    """Returns the compressed adjacency of a list of dicts of edges."""
+    offsets = [0]
+    targets = []
+    costs = []
+    for nbrs in edges:
+        for u, cost in nbrs.items():
+            targets.append(u)
+            costs.append(cost)
+        offsets.append(len(targets))
+    return offsets, targets, costs
+
+
+class ContractionHierarchy(object):
+    """Answers shortest path queries with a contraction hierarchy.
+
+    The nodes are contracted in the order of their edge difference: the
+    number of shortcuts needed to remove a node minus the number of its
+    edges, plus the number of its neighbors already contracted, which
+    spreads the contractions across the graph.  A shortcut from `u` to
+    `w` is only added when a local search from `u`, the witness search,
+    does not find a path at most as short avoiding the contracted node.
+
+    Queries are bidirectional searches of Dijkstra's algorithm on the
+    edges going up the hierarchy, and the shortcuts of the path found are
+    unpacked into the edges of the graph.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    weight : string or function, optional (default='weight')
+       The edge attribute holding the length of edges, or a function
+       returning the length of an edge, as for :func:`dijkstra_path`.
+       Edges without this attribute have length 1.  Lengths must be
+       nonnegative.
+
+    witness_limit : int, optional (default=500)
+       The maximum number of nodes settled by each witness search.
+       Lower values build the hierarchy faster, with more shortcuts.
+
+    Raises
+    ------
+    ValueError
+       If an edge has a negative length.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph()
+    >>> G.add_weighted_edges_from([(0, 1, 2), (1, 2, 2), (0, 2, 5),
+    ...                            (2, 3, 1), (3, 0, 1)])
+    >>> ch = nx.ContractionHierarchy(G)
+    >>> ch.shortest_path(0, 3)
+    [0, 1, 2, 3]
+    >>> ch.shortest_path_length(0, 3)
+    5
+
+    The hierarchy holds no reference to the graph and can be saved with
+    :mod:`pickle`, to be built once and loaded by other processes:
+
+    >>> import pickle
+    >>> ch = pickle.loads(pickle.dumps(ch))
+    >>> ch.shortest_path_length(3, 2)
+    5
+
+    Notes
+    -----
+    The hierarchy is a snapshot of `G`: it is not updated when `G`
+    changes.
+
+    See Also
+    --------
+    LandmarkIndex
+    bidirectional_dijkstra
+
+    References
+    ----------
+    .. [1] Robert Geisberger, Peter Sanders, Dominik Schultes and Daniel
+       Delling.  Contraction hierarchies: Faster and simpler hierarchical
+       routing in road networks.  In: Experimental Algorithms (WEA 2008),
+       Lecture Notes in Computer Science 5038, pp. 319--333, 2008.
+    """
+
+    def __init__(self, G, weight='weight', witness_limit=500):
+        nodes, index, offsets, targets, costs = _compile_adjacency(G, weight)
+        if any(cost < 0 for cost in costs):
+            raise ValueError('The edges of G must have nonnegative lengths.')
+        self._nodes = nodes
+        self._index = index
+        self.witness_limit = witness_limit
+        n = len(nodes)
+        out_edges = [{} for v in range(n)]
+        in_edges = [{} for v in range(n)]
+        for v in range(n):
+            for i in range(offsets[v], offsets[v + 1]):
+                u = targets[i]
+                if u != v and costs[i] < out_edges[v].get(u, INF):
+                    out_edges[v][u] = costs[i]
+                    in_edges[u][v] = costs[i]
+        # The node contracted in the middle of each shortcut.
+        self._middle = {}
+        self._contract(out_edges, in_edges)
+
+    def _witness_search(self, out_edges, source, avoid, targets, limit):
+        """Returns the distances from `source` up to `limit` in the graph
+        of the nodes not contracted yet, without the node `avoid`.  The
+        search stops when the distances of all the `targets` are known."""
+        dist = {source: 0}
+        done = set()
+        fringe = [(0, source)]
+        remaining = len(targets)
+        while fringe and len(done) < self.witness_limit:
+            d, v = heappop(fringe)
+            if v in done:
+                continue
+            if d > limit:
+                break
+            done.add(v)
+            if v in targets:
+                remaining -= 1
+                if not remaining:
+                    break
+            for u, cost in out_edges[v].items():
+                du = d + cost
+                if u != avoid and du < dist.get(u, INF):
+                    dist[u] = du
+                    heappush(fringe, (du, u))
+        return dist
+
+    def _shortcuts(self, out_edges, in_edges, v):
+        """Returns the shortcuts needed to contract `v`."""
+        shortcuts = []
+        if not out_edges[v]:
+            return shortcuts
+        max_out = max(out_edges[v].values())
+        targets = out_edges[v]
+        for u, a in in_edges[v].items():
+            dist = self._witness_search(out_edges, u, v, targets,
+                                        a + max_out)
+            for w, b in out_edges[v].items():
+                if w != u and dist.get(w, INF) > a + b:
+                    shortcuts.append((u, w, a + b))
+        return shortcuts
+
+    def _priority(self, out_edges, in_edges, v, contracted):
+        """Returns the priority of `v`, lower priorities being contracted
+        first, and the shortcuts needed to contract `v`."""
+        shortcuts = self._shortcuts(out_edges, in_edges, v)
+        degree = len(out_edges[v]) + len(in_edges[v])
+        return len(shortcuts) - degree + contracted[v], shortcuts
+
+    def _contract(self, out_edges, in_edges):
+        """Contracts all the nodes and builds the upward graphs."""
+        n = len(self._nodes)
+        contracted = [0] * n  # number of contracted neighbors
+        queue = [(self._priority(out_edges, in_edges, v, contracted)[0], v)
+                 for v in range(n)]
+        queue.sort()
+        # The edges of the graph and the shortcuts, kept when the
+        # contracted nodes are removed from out_edges and in_edges.
+        up = [{} for v in range(n)]
+        down = [{} for v in range(n)]
+        while queue:
+            _, v = heappop(queue)
+            # Lazy updates: contract v only if its priority is still the
+            # lowest.
+            p, shortcuts = self._priority(out_edges, in_edges, v,
+                                          contracted)
+            if queue and p > queue[0][0]:
+                heappush(queue, (p, v))
+                continue
+            for u, w, cost in shortcuts:
+                if cost < out_edges[u].get(w, INF):
+                    out_edges[u][w] = cost
+                    in_edges[w][u] = cost
+                    self._middle[u, w] = v
+            # v is removed and its edges are kept in the upward graphs,
+            # the nodes still in the graph being contracted later.
+            for w, cost in out_edges[v].items():
+                up[v][w] = cost
+                del in_edges[w][v]
+                contracted[w] += 1
+            for u, cost in in_edges[v].items():
+                down[v][u] = cost
+                del out_edges[u][v]
+                contracted[u] += 1
+            out_edges[v] = {}
+            in_edges[v] = {}
+        self._up = _compress(up)
+        self._down = _compress(down)
+
+    def _search(self, source, target):
+        """Returns the length of a shortest path from `source` to `target`
+        and the list of the node positions of the path."""
+        try:
+            s = self._index[source]
+            t = self._index[target]
+        except KeyError:
+            raise nx.NetworkXError('Nodes %s and %s must be in the graph.'
+                                   % (source, target))
+        if s == t:
+            return 0, [s]
+        dists = [{s: 0}, {t: 0}]
+        parents = [{s: None}, {t: None}]
+        done = [set(), set()]
+        fringes = [[(0, s)], [(0, t)]]
+        graphs = [self._up, self._down]
+        best = INF
+        meet = None
+        d = 1
+        while fringes[0] or fringes[1]:
+            # Alternate between the directions still searching.
+            if fringes[1 - d]:
+                d = 1 - d
+            dv, v = heappop(fringes[d])
+            if dv >= best:
+                # No shorter path is found in this direction.
+                fringes[d] = []
+                continue
+            if v in done[d]:
+                continue
+            done[d].add(v)
+            dist, parent, other = dists[d], parents[d], dists[1 - d]
+            offsets, targets, costs = graphs[d]
+            for i in range(offsets[v], offsets[v + 1]):
+                u = targets[i]
+                du = dv + costs[i]
+                if du < dist.get(u, INF):
+                    dist[u] = du
+                    parent[u] = v
+                    heappush(fringes[d], (du, u))
+                    if u in other and du + other[u] < best:
+                        best = du + other[u]
+                        meet = u
+        if meet is None:
+            raise nx.NetworkXNoPath('Node %s not reachable from %s'
+                                    % (target, source))
+        path = []
+        v = meet
+        while v is not None:
+            path.append(v)
+            v = parents[0][v]
+        path.reverse()
+        v = parents[1][meet]
+        while v is not None:
+            path.append(v)
+            v = parents[1][v]
+        return best, self._unpack(path)
+
+    def _unpack(self, path):
+        """Replaces the shortcuts of `path` by the edges they stand for."""
+        middle = self._middle
+        unpacked = [path[0]]
+        stack = list(zip(path[:-1], path[1:]))[::-1]
+        while stack:
+            u, w = stack.pop()
+            v = middle.get((u, w))
+            if v is None:
+                unpacked.append(w)
+            else:
+                stack.append((v, w))
+                stack.append((u, v))
+        return unpacked
+
+    def shortest_path(self, source, target):
+        """Returns a shortest path from `source` to `target`.
+
+        Parameters
+        ----------
+        source, target : nodes
+
+        Returns
+        -------
+        path : list
+           The nodes of a shortest path from `source` to `target`.
+
+        Raises
+        ------
+        NetworkXNoPath
+           If no path exists between `source` and `target`.
+        """
+        nodes = self._nodes
+        return [nodes[v] for v in self._search(source, target)[1]]
+
+    def shortest_path_length(self, source, target):
+        """Returns the length of a shortest path from `source` to
+        `target`.
+
+        Parameters
+        ----------
+        source, target : nodes
+
+        Returns
+        -------
+        length : number
+
+        Raises
+        ------
+        NetworkXNoPath
+           If no path exists between `source` and `target`.
+        """
+        return self._search(source, target)[0]
+
+    def number_of_shortcuts(self):
+        """Returns the number of shortcuts added to the graph."""
+        return len(self._middle)
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+#    Copyright (C) 2016 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+"""
+Shortest path lengths between all nodes stored on disk.
+
+The matrix of the shortest path lengths of a graph with `n` nodes has
+`n^2` entries and does not fit in memory for large graphs.  The functions
+of this module write it to a NumPy ``.npy`` file, by blocks of source
+nodes, and read it back as a memory-mapped array.  The computation can be
+interrupted and resumed, and split between processes or machines sharing
+the file by giving each of them a range of source nodes.
+"""
+import os
+
+import networkx as nx
+from networkx.utils import map_sources
+from networkx.algorithms.shortest_paths.weighted import _compile_adjacency
+
+__all__ = ['write_shortest_path_lengths', 'read_shortest_path_lengths']
+
+
+def _done_filename(filename):
+    """Returns the name of the file flagging the computed rows."""
+    return filename + '.done.npy'
+
+
+def _unreachable(dtype):
+    """Returns the value standing for an infinite length in `dtype`."""
+    import numpy as np
+    if np.issubdtype(dtype, np.floating):
+        return np.inf
+    return np.iinfo(dtype).max
+
+
+def _open_files(filename, n, dtype):
+    """Opens, and creates if needed, the files of the lengths matrix."""
+    from numpy.lib.format import open_memmap
+    done_filename = _done_filename(filename)
+    if not os.path.exists(filename):
+        lengths = open_memmap(filename, mode='w+', dtype=dtype, shape=(n, n))
+        done = open_memmap(done_filename, mode='w+', dtype='uint8',
+                           shape=(n,))
+        return lengths, done
+    lengths = open_memmap(filename, mode='r+')
+    done = open_memmap(done_filename, mode='r+')
+    if lengths.shape != (n, n) or done.shape != (n,):
+        raise nx.NetworkXError('%s holds the lengths of a graph with %d '
+                               'nodes, not %d' % (filename, len(done), n))
+    if lengths.dtype != dtype:
+        raise nx.NetworkXError('%s holds lengths of type %s, not %s'
+                               % (filename, lengths.dtype, dtype))
+    return lengths, done
+
+
+def _write_blocks(A, blocks, filename, unweighted):
+    """Computes the rows of the lengths matrix for `blocks` of sources and
+    writes them to `filename`."""
+    import numpy as np
+    from scipy.sparse.csgraph import dijkstra
+    from numpy.lib.format import open_memmap
+    lengths = open_memmap(filename, mode='r+')
+    done = open_memmap(_done_filename(filename), mode='r+')
+    unreachable = _unreachable(lengths.dtype)
+    for block in blocks:
+        dist = dijkstra(A, directed=True, indices=block,
+                        unweighted=unweighted)
+        infinite = np.isinf(dist)
+        if unreachable is not np.inf:
+            dist[infinite] = 0
+            if dist.max(initial=0) >= unreachable:
+                raise ValueError('Lengths do not fit in %s' % lengths.dtype)
+            if not unweighted and (dist != np.floor(dist)).any():
+                raise ValueError('Fractional lengths do not fit in %s'
+                                 % lengths.dtype)
+            dist[infinite] = unreachable
+        lengths[block] = dist
+        # The rows are flagged once they are written to the file, so that
+        # an interrupted computation is resumed from the last block.
+        lengths.flush()
+        done[block] = 1
+        done.flush()
+
+
+def write_shortest_path_lengths(G, filename, weight=None, dtype=None,
+                                nodelist=None, sources=None, block_size=256,
+                                n_jobs=None):
+    """Writes the shortest path lengths between all nodes to a file.
+
+    The lengths are computed by blocks of `block_size` source nodes, with
+    breadth-first searches or Dijkstra's algorithm, and each block is
+    written to the NumPy ``.npy`` file `filename` holding the `n` by `n`
+    matrix of the lengths, where `n` is the number of nodes.  Only a
+    block of rows is kept in memory.
+
+    The rows already computed are flagged in a second file, named after
+    `filename` with the suffix ``'.done.npy'``, and are skipped when the
+    function is called again with the same `filename`.  So an interrupted
+    computation is resumed by calling the function again, and the
+    computation can be shared by processes or machines having access to
+    the same file by giving them distinct `sources`.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    filename : string
+       The name of the ``.npy`` file.  It is created if it does not exist.
+
+    weight : string or function, optional (default=None)
+       If None, every edge has length 1.  Otherwise, the edge attribute
+       holding the length of edges, or a function returning the length of
+       an edge, as for :func:`dijkstra_path`.  Lengths must be
+       nonnegative.
+
+    dtype : NumPy data-type, optional
+       The type of the lengths in the file.  By default, ``uint16`` if
+       `weight` is None and ``float32`` otherwise.  Small integer types
+       such as ``uint8`` make smaller files for graphs of small diameter.
+
+    nodelist : list, optional
+       The order of the rows and columns of the matrix.  If None, the
+       order is given by ``G.nodes()``.
+
+    sources : iterable of integers, optional
+       The positions in `nodelist` of the source nodes whose rows are
+       computed.  If None, all the rows are computed.
+
+    block_size : int, optional (default=256)
+       The number of source nodes whose lengths are computed at once.
+       The memory used is about ``8 * block_size * n`` bytes.
+
+    n_jobs : int, optional (default=None)
+       The number of worker processes computing blocks in parallel.
+       None and 1 mean no parallelism and -1 means one process per CPU.
+
+    Returns
+    -------
+    lengths : NumPy memmap
+       The matrix of the lengths, read-only, as returned by
+       :func:`read_shortest_path_lengths`.
+
+    Raises
+    ------
+    NetworkXError
+       If `filename` exists and holds a matrix of another shape or type,
+       or if `nodelist` does not contain every node of `G`.
+
+    ValueError
+       If a length does not fit in `dtype`, because it is too large or
+       because it is not an integer and `dtype` is an integer type.
+
+    Examples
+    --------
+    >>> import os, tempfile
+    >>> filename = os.path.join(tempfile.mkdtemp(), 'lengths.npy')
+    >>> G = nx.path_graph(4)
+    >>> lengths = nx.write_shortest_path_lengths(G, filename, dtype='uint8')
+    >>> lengths.tolist()
+    [[0, 1, 2, 3], [1, 0, 1, 2], [2, 1, 0, 1], [3, 2, 1, 0]]
+
+    The rows of the first two nodes, then the others:
+
+    >>> filename = os.path.join(tempfile.mkdtemp(), 'lengths.npy')
+    >>> lengths = nx.write_shortest_path_lengths(G, filename, sources=[0, 1])
+    >>> lengths, done = nx.read_shortest_path_lengths(filename)
+    >>> done.tolist()
+    [True, True, False, False]
+    >>> lengths = nx.write_shortest_path_lengths(G, filename)
+    >>> lengths[3].tolist()
+    [3, 2, 1, 0]
+
+    Notes
+    -----
+    Unreachable nodes are at an infinite length, which is stored as
+    ``inf`` for floating point types and as the largest value of the
+    type for integer types.
+
+    When the computation is shared between processes, the files must be
+    created before they start, for instance by calling this function with
+    an empty list of `sources`.
+
+    This function requires SciPy.
+
+    See Also
+    --------
+    read_shortest_path_lengths
+    all_pairs_shortest_path_length
+    floyd_warshall_numpy
+    """
+    import numpy as np
+    import scipy.sparse as sp
+    if dtype is None:
+        dtype = 'uint16' if weight is None else 'float32'
+    dtype = np.dtype(dtype)
+    if weight is None:
+        compiled = _compile_adjacency(G, lambda u, v, d: 1)
+    else:
+        compiled = _compile_adjacency(G, weight)
+    nodes, index, offsets, targets, costs = compiled
+    n = len(nodes)
+    A = sp.csr_matrix((np.asarray(costs, dtype=float), np.asarray(targets),
+                       np.asarray(offsets)), shape=(n, n))
+    if nodelist is not None:
+        if len(nodelist) != n or set(nodelist) != set(index):
+            raise nx.NetworkXError('nodelist must contain every node of G')
+        order = np.array([index[v] for v in nodelist], dtype=np.intp)
+        A = A[order][:, order]
+    lengths, done = _open_files(filename, n, dtype)
+    if sources is None:
+        sources = np.arange(n)
+    else:
+        sources = np.asarray(list(sources), dtype=np.intp)
+    todo = sources[done[sources] == 0]
+    del lengths, done
+    blocks = [todo[i:i + block_size] for i in range(0, len(todo), block_size)]
+    for _ in map_sources(_write_blocks, A, blocks, n_jobs,
+                         args=(filename, weight is None), chunksize=1):
+        pass
+    return read_shortest_path_lengths(filename)[0]
+
+
+def read_shortest_path_lengths(filename, mmap_mode='r'):
+    """Reads the shortest path lengths written by
+    :func:`write_shortest_path_lengths`.
+
+    Parameters
+    ----------
+    filename : string
+       The name of the ``.npy`` file.
+
+    mmap_mode : string, optional (default='r')
+       The mode of the memory map, as for :func:`numpy.load`.
+
+    Returns
+    -------
+    lengths : NumPy memmap
+       The matrix of the lengths.  The rows not computed yet hold zeros.
+
+    done : NumPy array
+       A boolean array, True for the computed rows.
+    """
+    import numpy as np
+    lengths = np.load(filename, mmap_mode=mmap_mode)
+    done = np.load(_done_filename(filename)) != 0
+    return lengths, done
+
+
+# fixture for nose tests
+def setup_module(module):
+    from nose import SkipTest
+    try:
+        import numpy
+    except:
+        raise SkipTest("NumPy not available")
+    try:
+        import scipy
+    except:
+        raise SkipTest("SciPy not available")
@@ -118,15 +118,16 @@ def shortest_path(G, source=None, target=None, weight=None):
                 paths = nx.all_pairs_dijkstra_path(G, weight=weight)
         else:
             # Find paths from all nodes co-accessible to the target.
-            with nx.utils.reversed(G):
-                if weight is None:
-                    paths = nx.single_source_shortest_path(G, target)
-                else:
-                    paths = nx.single_source_dijkstra_path(G, target,
-                                                           weight=weight)
-                # Now flip the paths so they go from a source to the target.
-                for target in paths:
-                    paths[target] = list(reversed(paths[target]))
+            if G.is_directed():
+                G = nx.reverse_view(G)
+            if weight is None:
+                paths = nx.single_source_shortest_path(G, target)
+            else:
+                paths = nx.single_source_dijkstra_path(G, target,
+                                                       weight=weight)
+            # Now flip the paths so they go from a source to the target.
+            for target in paths:
+                paths[target] = list(reversed(paths[target]))
 
     else:
         if target is None:
@@ -234,15 +235,14 @@ def shortest_path_length(G, source=None, target=None, weight=None):
                 paths = nx.all_pairs_dijkstra_path_length(G, weight=weight)
         else:
             # Find paths from all nodes co-accessible to the target.
-            with nx.utils.reversed(G):
-                if weight is None:
-                    # We need to exhaust the iterator as Graph needs
-                    # to be reversed.
-                    path_length = nx.single_source_shortest_path_length
-                    paths = list(path_length(G, target))
-                else:
-                    path_length = nx.single_source_dijkstra_path_length
-                    paths = path_length(G, target, weight=weight)
+            if G.is_directed():
+                G = nx.reverse_view(G)
+            if weight is None:
+                path_length = nx.single_source_shortest_path_length
+                paths = list(path_length(G, target))
+            else:
+                path_length = nx.single_source_dijkstra_path_length
+                paths = path_length(G, target, weight=weight)
     else:
         if target is None:
             # Find paths to all nodes accessible from the source.
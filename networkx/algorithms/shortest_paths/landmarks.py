@@ -0,0 +1,420 @@
+# -*- coding: utf-8 -*-
+#    Copyright (C) 2016 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+"""
+Point-to-point shortest paths with landmarks (ALT).
+
+The ALT algorithm [1]_ answers many shortest path queries in the same
+graph.  The distances from and to a few nodes, the landmarks, are
+computed once.  By the triangle inequality they give lower bounds on the
+distance between any two nodes, which direct a bidirectional A* search
+toward its goal, so that it explores a small part of the graph.
+
+References
+----------
+.. [1] Andrew V. Goldberg and Chris Harrelson.
+   Computing the shortest path: A* search meets graph theory.
+   In: Proceedings of the 16th annual ACM-SIAM Symposium on Discrete
+   Algorithms (SODA), pp. 156--165, 2005.
+"""
+from array import array
+from heapq import heappush, heappop
+import random
+
+import networkx as nx
+from networkx.algorithms.shortest_paths.weighted import _compile_adjacency
+
+__all__ = ['LandmarkIndex']
+
+INF = float('inf')
+
+
+def _reverse_adjacency(n, offsets, targets, costs):
+    """Returns the compressed adjacency of the reverse graph."""
+    in_edges = [[] for v in range(n)]
+    for u in range(n):
+        for i in range(offsets[u], offsets[u + 1]):
+            in_edges[targets[i]].append((u, costs[i]))
+    r_offsets = [0]
+    r_targets = []
+    r_costs = []
+    for edges in in_edges:
+        for u, cost in edges:
+            r_targets.append(u)
+            r_costs.append(cost)
+        r_offsets.append(len(r_targets))
+    return r_offsets, r_targets, r_costs
+
+
+def _distances(adjacency, n, source):
+    """Returns the list of the distances from `source` to every node, and
+    the list of the settled nodes in the order of their distances, with
+    the list of their parents in the shortest path tree.
+    """
+    offsets, targets, costs = adjacency
+    dist = [INF] * n
+    parent = [-1] * n
+    settled = []
+    done = [False] * n
+    dist[source] = 0
+    fringe = [(0, source)]
+    while fringe:
+        d, v = heappop(fringe)
+        if done[v]:
+            continue
+        done[v] = True
+        settled.append(v)
+        for i in range(offsets[v], offsets[v + 1]):
+            u = targets[i]
+            du = d + costs[i]
+            if du < dist[u]:
+                dist[u] = du
+                parent[u] = v
+                heappush(fringe, (du, u))
+    return dist, settled, parent
+
+
+class LandmarkIndex(object):
+    """Answers shortest path queries with landmarks and bidirectional A*.
+
+    The distances between a few landmark nodes and all the nodes of the
+    graph are computed when the index is built.  For nodes `u`, `v` and a
+    landmark `l`, the triangle inequality gives the lower bounds
+    ``d(u, v) >= d(u, l) - d(v, l)`` and ``d(u, v) >= d(l, v) - d(l, u)``
+    on the length of a shortest path from `u` to `v`.  Queries run a
+    bidirectional A* search directed by these bounds, using for each
+    query the landmarks giving the best bound between its source and its
+    target [1]_.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    landmarks : int or iterable of nodes, optional (default=16)
+       The number of landmarks to choose, or the landmarks themselves.
+
+    weight : string or function, optional (default='weight')
+       The edge attribute holding the length of edges, or a function
+       returning the length of an edge, as for :func:`dijkstra_path`.
+       Edges without this attribute have length 1.  Lengths must be
+       nonnegative.
+
+    strategy : string, optional (default='avoid')
+       How the landmarks are chosen.  With 'farthest', each new landmark
+       is the node farthest from the landmarks already chosen.  With
+       'avoid', it is a leaf of the shortest path tree of a random node,
+       in a subtree whose nodes get poor lower bounds from the landmarks
+       already chosen [1]_.  With 'random', the landmarks are random
+       nodes.
+
+    active : int, optional (default=4)
+       The number of landmarks used by each query.
+
+    seed : integer, optional
+       Seed of the random choices of nodes.
+
+    Raises
+    ------
+    ValueError
+       If an edge has a negative length or if `strategy` is unknown.
+
+    Examples
+    --------
+    >>> G = nx.grid_2d_graph(10, 10)
+    >>> index = nx.LandmarkIndex(G, landmarks=4, seed=1)
+    >>> index.shortest_path_length((0, 0), (9, 9))
+    18
+    >>> path = index.shortest_path((0, 0), (0, 3))
+    >>> path
+    [(0, 0), (0, 1), (0, 2), (0, 3)]
+
+    Notes
+    -----
+    The landmarks are chosen again, and their distances computed again,
+    when `G` is changed through its methods.
+
+    Building the index takes the time of two runs of Dijkstra's
+    algorithm per landmark and the memory of two arrays of floats per
+    landmark, holding the distances from and to the landmark.
+
+    See Also
+    --------
+    bidirectional_dijkstra
+    astar_path
+
+    References
+    ----------
+    .. [1] Andrew V. Goldberg and Chris Harrelson.
+       Computing the shortest path: A* search meets graph theory.
+       In: Proceedings of the 16th annual ACM-SIAM Symposium on Discrete
+       Algorithms (SODA), pp. 156--165, 2005.
+    """
+
+    def __init__(self, G, landmarks=16, weight='weight', strategy='avoid',
+                 active=4, seed=None):
+        if strategy not in ('avoid', 'farthest', 'random'):
+            raise ValueError('Unknown landmark strategy: %r' % (strategy,))
+        self.G = G
+        self.weight = weight
+        self.strategy = strategy
+        self.active = active
+        self._landmarks = landmarks
+        self._random = random.Random(seed)
+        self._version = None
+        self._build()
+
+    def _build(self):
+        """Compiles the graph and computes the landmark distances."""
+        G = self.G
+        nodes, index, offsets, targets, costs = _compile_adjacency(
+            G, self.weight)
+        if any(cost < 0 for cost in costs):
+            raise ValueError('The edges of G must have nonnegative lengths.')
+        n = len(nodes)
+        self._nodes = nodes
+        self._index = index
+        self._n = n
+        self._succ = (offsets, targets, costs)
+        if G.is_directed():
+            self._pred = _reverse_adjacency(n, offsets, targets, costs)
+        else:
+            self._pred = self._succ
+        # Distances from and to each landmark, indexed by node positions.
+        self._from = []
+        self._to = []
+        self.landmarks = []
+        if isinstance(self._landmarks, int):
+            self._choose_landmarks(min(self._landmarks, n))
+        else:
+            for v in self._landmarks:
+                self._add_landmark(index[v])
+        self._version = G._version
+
+    def _add_landmark(self, l):
+        """Computes the distances from and to the node at position `l`."""
+        self.landmarks.append(self._nodes[l])
+        self._from.append(array('d', _distances(self._succ, self._n, l)[0]))
+        if self._pred is self._succ:
+            self._to.append(self._from[-1])
+        else:
+            self._to.append(array('d',
+                                  _distances(self._pred, self._n, l)[0]))
+
+    def _bound(self, u, v, landmarks):
+        """Returns a lower bound on the distance from `u` to `v`."""
+        bound = 0
+        for i in landmarks:
+            to, frm = self._to[i], self._from[i]
+            if to[u] < INF and to[v] < INF:
+                bound = max(bound, to[u] - to[v])
+            if frm[u] < INF and frm[v] < INF:
+                bound = max(bound, frm[v] - frm[u])
+        return bound
+
+    def _choose_landmarks(self, k):
+        """Chooses `k` landmarks with the strategy of the index."""
+        n = self._n
+        rng = self._random
+        if self.strategy == 'random':
+            for l in rng.sample(range(n), k):
+                self._add_landmark(l)
+            return
+        chosen = set()
+        if self.strategy == 'farthest':
+            # The distance of each node to the nearest landmark, starting
+            # from a random node which is not a landmark.
+            nearest = _distances(self._succ, n, rng.randrange(n))[0]
+            for i in range(k):
+                l = max(range(n), key=nearest.__getitem__)
+                if l in chosen:
+                    l = rng.choice([v for v in range(n) if v not in chosen])
+                chosen.add(l)
+                self._add_landmark(l)
+                nearest = list(map(min, nearest, self._from[-1],
+                                   self._to[-1]))
+            return
+        for i in range(k):
+            l = self._avoid(chosen)
+            chosen.add(l)
+            self._add_landmark(l)
+
+    def _avoid(self, chosen):
+        """Returns a new landmark chosen with the 'avoid' strategy."""
+        n = self._n
+        rng = self._random
+        r = rng.randrange(n)
+        dist, settled, parent = _distances(self._succ, n, r)
+        landmarks = range(len(self.landmarks))
+        # The weight of a node is the gap between its distance from r and
+        # the lower bound given by the landmarks.  The size of a node is
+        # the total weight of its subtree, or zero if the subtree holds a
+        # landmark.
+        size = [0] * n
+        blocked = [False] * n
+        for v in reversed(settled):
+            if v in chosen:
+                blocked[v] = True
+            size[v] += dist[v] - self._bound(r, v, landmarks)
+            p = parent[v]
+            if p >= 0:
+                size[p] += size[v]
+                blocked[p] = blocked[p] or blocked[v]
+        children = [[] for v in range(n)]
+        for v in settled:
+            if parent[v] >= 0 and not blocked[v]:
+                children[parent[v]].append(v)
+        v = r
+        while children[v]:
+            v = max(children[v], key=size.__getitem__)
+        if v in chosen:
+            v = rng.choice([u for u in range(n) if u not in chosen])
+        return v
+
+    def _check_version(self):
+        if self._version != self.G._version:
+            self._build()
+
+    def _search(self, source, target):
+        """Returns the length of a shortest path from `source` to `target`
+        and the node positions of the path."""
+        self._check_version()
+        try:
+            s = self._index[source]
+            t = self._index[target]
+        except KeyError:
+            raise nx.NetworkXError('Nodes %s and %s must be in the graph.'
+                                   % (source, target))
+        if s == t:
+            return 0, [s]
+        # The active landmarks are those giving the best bounds on the
+        # distance from s to t.
+        scores = []
+        for i in range(len(self.landmarks)):
+            to, frm = self._to[i], self._from[i]
+            if max(to[s], to[t], frm[s], frm[t]) < INF:
+                scores.append((max(to[s] - to[t], frm[t] - frm[s]), i))
+        scores.sort(reverse=True)
+        active = []
+        for score, i in scores[:self.active]:
+            to, frm = self._to[i], self._from[i]
+            active.append((to, frm, to[s], frm[s], to[t], frm[t]))
+
+        # The potential of a node is the average of the lower bound on
+        # its distance to t and of the opposite of the lower bound on its
+        # distance from s, which is consistent in both directions.
+        potential = {}
+
+        def p(v):
+            if v in potential:
+                return potential[v]
+            to_t = from_s = 0
+            for to, frm, to_s, frm_s, to_tt, frm_t in active:
+                to_v, frm_v = to[v], frm[v]
+                to_t = max(to_t, to_v - to_tt, frm_t - frm_v)
+                from_s = max(from_s, frm_v - frm_s, to_s - to_v)
+            if to_t == INF or from_s == INF:
+                # v is not on a path from s to t.
+                potential[v] = None
+            else:
+                potential[v] = (to_t - from_s) / 2
+            return potential[v]
+
+        dists = [{s: 0}, {t: 0}]
+        parents = [{s: None}, {t: None}]
+        done = [set(), set()]
+        fringes = [[(p(s), s)], [(-p(t), t)]]
+        adjacency = [self._succ, self._pred]
+        signs = [1, -1]
+        best = INF
+        meet = None
+        while fringes[0] and fringes[1]:
+            if fringes[0][0][0] + fringes[1][0][0] >= best:
+                break
+            # Expand the direction of smaller key.
+            d = 0 if fringes[0][0][0] <= fringes[1][0][0] else 1
+            _, v = heappop(fringes[d])
+            if v in done[d]:
+                continue
+            done[d].add(v)
+            dist, parent, fringe, other = (dists[d], parents[d], fringes[d],
+                                           dists[1 - d])
+            sign = signs[d]
+            offsets, targets, costs = adjacency[d]
+            dv = dist[v]
+            for i in range(offsets[v], offsets[v + 1]):
+                u = targets[i]
+                du = dv + costs[i]
+                if u in dist and du >= dist[u]:
+                    continue
+                dist[u] = du
+                parent[u] = v
+                if u in other and du + other[u] < best:
+                    best = du + other[u]
+                    meet = u
+                pu = p(u)
+                if pu is not None:
+                    heappush(fringe, (du + sign * pu, u))
+        if meet is None:
+            raise nx.NetworkXNoPath('Node %s not reachable from %s'
+                                    % (target, source))
+        path = []
+        v = meet
+        while v is not None:
+            path.append(v)
+            v = parents[0][v]
+        path.reverse()
+        v = parents[1][meet]
+        while v is not None:
+            path.append(v)
+            v = parents[1][v]
+        return best, path
+
+    def shortest_path(self, source, target):
+        """Returns a shortest path from `source` to `target`.
+
+        Parameters
+        ----------
+        source, target : nodes
+
+        Returns
+        -------
+        path : list
+           The nodes of a shortest path from `source` to `target`.
+
+        Raises
+        ------
+        NetworkXNoPath
+           If no path exists between `source` and `target`.
+        """
+        nodes = self._nodes
+        return [nodes[v] for v in self._search(source, target)[1]]
+
+    def shortest_path_length(self, source, target):
+        """Returns the length of a shortest path from `source` to
+        `target`.
+
+        Parameters
+        ----------
+        source, target : nodes
+
+        Returns
+        -------
+        length : number
+
+        Raises
+        ------
+        NetworkXNoPath
+           If no path exists between `source` and `target`.
+        """
+        return self._search(source, target)[0]
+
+    def lower_bound(self, source, target):
+        """Returns the lower bound on the distance from `source` to
+        `target` given by all the landmarks."""
+        self._check_version()
+        return self._bound(self._index[source], self._index[target],
+                           range(len(self.landmarks)))
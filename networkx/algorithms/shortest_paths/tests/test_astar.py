@@ -100,6 +100,26 @@ class TestAStar:
         assert_equal(nx.astar_path(G, 's', 'v'), ['s', 'u', 'v'])
         assert_equal(nx.astar_path_length(G, 's', 'v'), 2)
 
+    def test_heap(self):
+        heaps = (nx.utils.DaryHeap, nx.utils.BinaryHeap, nx.utils.PairingHeap)
+        for heap in heaps:
+            assert_equal(nx.astar_path(self.XG, 's', 'v', heap=heap),
+                         ['s', 'x', 'u', 'v'])
+            assert_equal(nx.astar_path_length(self.XG, 's', 'v', heap=heap), 9)
+            assert_raises(nx.NetworkXNoPath, nx.astar_path, self.XG, 's',
+                          'moon', heap=heap)
+        G = nx.grid_2d_graph(6, 6)
+        for u, v in G.edges():
+            G[u][v]['weight'] = 1 + (u[0] * v[1]) % 3
+        for heap in heaps:
+            for target in G:
+                path = nx.astar_path(G, (0, 0), target, dist, heap=heap)
+                assert_equal(path[0], (0, 0))
+                assert_equal(path[-1], target)
+                assert_equal(
+                    sum(G[u][v]['weight'] for u, v in pairwise(path)),
+                    nx.dijkstra_path_length(G, (0, 0), target))
+
     @raises(nx.NetworkXNoPath)
     def test_astar_nopath(self):
         nx.astar_path(self.XG, 's', 'moon')
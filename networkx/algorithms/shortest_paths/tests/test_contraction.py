@@ -0,0 +1,81 @@
+import pickle
+import random
+
+from nose.tools import assert_equal, assert_raises
+
+import networkx as nx
+
+
+def check_hierarchy(G, ch, pairs, weight='weight'):
+    for s, t in pairs:
+        try:
+            expected = nx.dijkstra_path_length(G, s, t, weight=weight)
+        except nx.NetworkXNoPath:
+            assert_raises(nx.NetworkXNoPath, ch.shortest_path_length, s, t)
+            assert_raises(nx.NetworkXNoPath, ch.shortest_path, s, t)
+            continue
+        assert_equal(ch.shortest_path_length(s, t), expected)
+        path = ch.shortest_path(s, t)
+        assert_equal((path[0], path[-1]), (s, t))
+        assert_equal(sum(G[u][v].get(weight, 1)
+                         for u, v in zip(path[:-1], path[1:])), expected)
+
+
+class TestContractionHierarchy(object):
+
+    def setUp(self):
+        rng = random.Random(1)
+        self.G = nx.gnm_random_graph(80, 200, seed=3)
+        self.D = nx.gnm_random_graph(80, 240, seed=3, directed=True)
+        for G in (self.G, self.D):
+            for u, v in G.edges():
+                G[u][v]['weight'] = rng.randint(0, 9)
+        self.pairs = [(rng.randrange(80), rng.randrange(80))
+                      for i in range(200)]
+
+    def test_graph(self):
+        ch = nx.ContractionHierarchy(self.G)
+        check_hierarchy(self.G, ch, self.pairs)
+
+    def test_digraph(self):
+        ch = nx.ContractionHierarchy(self.D)
+        check_hierarchy(self.D, ch, self.pairs)
+
+    def test_witness_limit(self):
+        # Witness searches settling a single node add more shortcuts,
+        # which does not change the paths found.
+        ch = nx.ContractionHierarchy(self.D, witness_limit=1)
+        check_hierarchy(self.D, ch, self.pairs)
+
+    def test_shortcuts_unpacked(self):
+        G = nx.path_graph(20)
+        ch = nx.ContractionHierarchy(G)
+        assert_equal(ch.shortest_path(0, 19), list(range(20)))
+        assert_equal(ch.shortest_path(19, 0), list(range(19, -1, -1)))
+        assert_equal(ch.shortest_path_length(3, 3), 0)
+        assert_equal(ch.shortest_path(3, 3), [3])
+
+    def test_pickle(self):
+        ch = pickle.loads(pickle.dumps(nx.ContractionHierarchy(self.D)))
+        check_hierarchy(self.D, ch, self.pairs)
+
+    def test_multigraph_weight_function(self):
+        G = nx.MultiDiGraph()
+        G.add_edge('a', 'b', length=5)
+        G.add_edge('a', 'b', length=1)
+        G.add_edge('b', 'c', length=1)
+        G.add_edge('a', 'c', length=3)
+        G.add_edge('c', 'c', length=0)
+        ch = nx.ContractionHierarchy(G, weight='length')
+        assert_equal(ch.shortest_path('a', 'c'), ['a', 'b', 'c'])
+        assert_equal(ch.shortest_path_length('a', 'c'), 2)
+        assert_raises(nx.NetworkXNoPath, ch.shortest_path, 'c', 'a')
+        ch = nx.ContractionHierarchy(G, weight=lambda u, v, d: 1)
+        assert_equal(ch.shortest_path_length('a', 'c'), 1)
+
+    def test_errors(self):
+        G = nx.path_graph(3)
+        G[0][1]['weight'] = -1
+        assert_raises(ValueError, nx.ContractionHierarchy, G)
+        ch = nx.ContractionHierarchy(nx.path_graph(3))
+        assert_raises(nx.NetworkXError, ch.shortest_path, 0, 5)
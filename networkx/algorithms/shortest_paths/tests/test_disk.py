@@ -0,0 +1,110 @@
+import os
+import shutil
+import tempfile
+
+from nose import SkipTest
+from nose.tools import assert_equal, assert_raises, assert_true
+
+import networkx as nx
+
+
+class TestShortestPathLengthsOnDisk(object):
+    @classmethod
+    def setupClass(cls):
+        global np
+        try:
+            import numpy as np
+            import scipy
+        except ImportError:
+            raise SkipTest('SciPy not available.')
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.dir, 'lengths.npy')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def expected(self, G, nodelist, length, unreachable):
+        index = dict((v, i) for i, v in enumerate(nodelist))
+        M = np.empty((len(G), len(G)))
+        M.fill(unreachable)
+        for u, lengths in length(G):
+            for v, d in lengths.items():
+                M[index[u], index[v]] = d
+        return M
+
+    def test_unweighted(self):
+        G = nx.gnm_random_graph(50, 60, seed=2, directed=True)
+        G = nx.relabel_nodes(G, dict((n, 'n%d' % n) for n in G))
+        nodelist = sorted(G, reverse=True)
+        lengths = nx.write_shortest_path_lengths(G, self.filename,
+                                                 dtype='uint8',
+                                                 nodelist=nodelist,
+                                                 block_size=7)
+        assert_equal(lengths.dtype, np.uint8)
+        np.testing.assert_equal(
+            lengths, self.expected(G, nodelist,
+                                   nx.all_pairs_shortest_path_length, 255))
+
+    def test_weighted(self):
+        G = nx.MultiGraph()
+        G.add_edge(0, 1, weight=3)
+        G.add_edge(0, 1, weight=0.5)
+        G.add_edge(1, 2, weight=0)
+        G.add_edge(2, 3, weight=2.5)
+        G.add_node(4)
+        lengths = nx.write_shortest_path_lengths(G, self.filename,
+                                                 weight='weight')
+        assert_equal(lengths.dtype, np.float32)
+        np.testing.assert_equal(
+            lengths, self.expected(G, list(G),
+                                   nx.all_pairs_dijkstra_path_length, np.inf))
+
+    def test_resume(self):
+        G = nx.cycle_graph(20)
+        expected = self.expected(G, list(G),
+                                 nx.all_pairs_shortest_path_length, 0)
+        nx.write_shortest_path_lengths(G, self.filename, sources=[])
+        lengths, done = nx.read_shortest_path_lengths(self.filename)
+        assert_true(not done.any())
+        for start in range(0, 20, 5):
+            nx.write_shortest_path_lengths(G, self.filename,
+                                           sources=range(start, start + 5),
+                                           block_size=2)
+        lengths, done = nx.read_shortest_path_lengths(self.filename)
+        assert_true(done.all())
+        np.testing.assert_equal(lengths, expected)
+        # Computed rows are not computed again.
+        G.add_edge(0, 10)
+        lengths = nx.write_shortest_path_lengths(G, self.filename)
+        np.testing.assert_equal(lengths, expected)
+
+    def test_n_jobs(self):
+        G = nx.grid_2d_graph(6, 6)
+        lengths = nx.write_shortest_path_lengths(G, self.filename,
+                                                 block_size=4, n_jobs=2)
+        np.testing.assert_equal(
+            lengths, self.expected(G, list(G),
+                                   nx.all_pairs_shortest_path_length, 0))
+
+    def test_errors(self):
+        G = nx.path_graph(300)
+        assert_raises(ValueError, nx.write_shortest_path_lengths, G,
+                      self.filename, dtype='uint8')
+        assert_raises(nx.NetworkXError, nx.write_shortest_path_lengths,
+                      nx.path_graph(3), self.filename)
+        assert_raises(nx.NetworkXError, nx.write_shortest_path_lengths, G,
+                      self.filename, dtype='uint16')
+        assert_raises(nx.NetworkXError, nx.write_shortest_path_lengths,
+                      nx.path_graph(3), self.filename + '2',
+                      nodelist=[0, 1, 5])
+        H = nx.path_graph(3)
+        H.add_edge(0, 1, weight=2.5)
+        assert_raises(ValueError, nx.write_shortest_path_lengths, H,
+                      self.filename + '3', weight='weight', dtype='uint16')
+        H[0][1]['weight'] = 2
+        lengths = nx.write_shortest_path_lengths(H, self.filename + '4',
+                                                 weight='weight',
+                                                 dtype='uint16')
+        assert_equal(lengths.tolist(), [[0, 2, 3], [2, 0, 1], [3, 1, 0]])
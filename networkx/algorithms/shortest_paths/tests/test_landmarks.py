@@ -0,0 +1,93 @@
+import random
+
+from nose.tools import assert_equal, assert_raises, assert_true
+
+import networkx as nx
+
+
+def check_index(G, index, pairs, weight='weight'):
+    for s, t in pairs:
+        try:
+            expected = nx.dijkstra_path_length(G, s, t, weight=weight)
+        except nx.NetworkXNoPath:
+            assert_raises(nx.NetworkXNoPath, index.shortest_path_length, s, t)
+            assert_raises(nx.NetworkXNoPath, index.shortest_path, s, t)
+            continue
+        assert_equal(index.shortest_path_length(s, t), expected)
+        path = index.shortest_path(s, t)
+        assert_equal((path[0], path[-1]), (s, t))
+        assert_equal(sum(G[u][v].get(weight, 1)
+                         for u, v in zip(path[:-1], path[1:])), expected)
+        assert_true(index.lower_bound(s, t) <= expected)
+
+
+class TestLandmarkIndex(object):
+
+    def setUp(self):
+        rng = random.Random(1)
+        self.G = nx.gnm_random_graph(80, 200, seed=3)
+        self.D = nx.gnm_random_graph(80, 240, seed=3, directed=True)
+        for G in (self.G, self.D):
+            for u, v in G.edges():
+                G[u][v]['weight'] = rng.randint(0, 9)
+        self.pairs = [(rng.randrange(80), rng.randrange(80))
+                      for i in range(100)]
+
+    def test_strategies(self):
+        for strategy in ('avoid', 'farthest', 'random'):
+            for G in (self.G, self.D):
+                index = nx.LandmarkIndex(G, landmarks=5, strategy=strategy,
+                                         seed=2)
+                assert_equal(len(index.landmarks), 5)
+                assert_equal(len(set(index.landmarks)), 5)
+                check_index(G, index, self.pairs)
+
+    def test_given_landmarks(self):
+        index = nx.LandmarkIndex(self.D, landmarks=[0, 10], active=1)
+        assert_equal(index.landmarks, [0, 10])
+        check_index(self.D, index, self.pairs)
+
+    def test_no_landmarks(self):
+        index = nx.LandmarkIndex(self.G, landmarks=0)
+        check_index(self.G, index, self.pairs)
+
+    def test_disconnected(self):
+        G = nx.Graph([(0, 1), (1, 2), (2, 3), (4, 5), (5, 6)])
+        G.add_node(7)
+        index = nx.LandmarkIndex(G, landmarks=3, strategy='farthest', seed=1)
+        # A landmark is chosen in each component.
+        components = set(frozenset(nx.node_connected_component(G, l))
+                         for l in index.landmarks)
+        assert_equal(len(components), 3)
+        check_index(G, index, [(u, v) for u in G for v in G])
+
+    def test_weight_function(self):
+        G = nx.MultiGraph()
+        G.add_edge('a', 'b', length=5)
+        G.add_edge('a', 'b', length=1)
+        G.add_edge('b', 'c', length=1)
+        G.add_edge('a', 'c', length=3)
+        index = nx.LandmarkIndex(G, landmarks=2, weight='length', seed=1)
+        assert_equal(index.shortest_path('a', 'c'), ['a', 'b', 'c'])
+        assert_equal(index.shortest_path_length('a', 'c'), 2)
+
+        def hop(u, v, d):
+            return 1
+        index = nx.LandmarkIndex(G, landmarks=2, weight=hop, seed=1)
+        assert_equal(index.shortest_path_length('a', 'c'), 1)
+
+    def test_graph_changes(self):
+        G = nx.path_graph(10)
+        index = nx.LandmarkIndex(G, landmarks=2, seed=1)
+        assert_equal(index.shortest_path_length(0, 9), 9)
+        G.add_edge(0, 9)
+        assert_equal(index.shortest_path_length(0, 9), 1)
+        assert_equal(index.shortest_path(0, 0), [0])
+
+    def test_errors(self):
+        G = nx.path_graph(3)
+        assert_raises(ValueError, nx.LandmarkIndex, G, strategy='unknown')
+        G[0][1]['weight'] = -1
+        assert_raises(ValueError, nx.LandmarkIndex, G)
+        index = nx.LandmarkIndex(nx.path_graph(3), landmarks=1)
+        assert_raises(nx.NetworkXError, index.shortest_path, 0, 5)
@@ -65,6 +65,8 @@ class TestUnweightedPath:
         assert_equal(l[0],{0:0,1:1,2:2,3:3,4:3,5:2,6:1})
         l = dict(nx.all_pairs_shortest_path_length(self.grid))
         assert_equal(l[1][16],6)
+        assert_equal(dict(nx.all_pairs_shortest_path_length(self.grid,
+                                                            n_jobs=2)), l)
 
     def test_predecessor(self):
         G=nx.path_graph(4)
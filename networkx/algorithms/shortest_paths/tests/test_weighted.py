@@ -237,6 +237,156 @@ class TestWeightedPath(WeightedTestBase):
         assert_equal(paths[2], [0, 2])
 
 
+class TestCompiledDijkstra(WeightedTestBase):
+    """Unit tests for the ``method='csr'`` variants of the Dijkstra
+    functions, which must give the same results as ``method='dict'``.
+
+    """
+
+    def graphs(self):
+        return [self.grid, self.cycle, self.directed_cycle, self.XG,
+                self.MXG, self.XG2, self.XG3, self.XG4, self.MXG4, self.G]
+
+    def test_single_source(self):
+        for G in self.graphs():
+            for s in G:
+                assert_equal(nx.single_source_dijkstra(G, s, method='csr'),
+                             nx.single_source_dijkstra(G, s))
+                assert_equal(
+                    dict(nx.single_source_dijkstra_path_length(
+                        G, s, cutoff=3, method='csr')),
+                    dict(nx.single_source_dijkstra_path_length(G, s,
+                                                               cutoff=3)))
+        assert_equal(nx.single_source_dijkstra(self.XG, 's', 'y',
+                                               method='csr'),
+                     nx.single_source_dijkstra(self.XG, 's', 'y'))
+
+    def test_all_pairs(self):
+        for G in self.graphs():
+            assert_equal(nx.all_pairs_dijkstra_path(G, method='csr'),
+                         nx.all_pairs_dijkstra_path(G))
+            assert_equal(
+                dict(nx.all_pairs_dijkstra_path_length(G, method='csr')),
+                dict(nx.all_pairs_dijkstra_path_length(G)))
+
+    def test_n_jobs(self):
+        for G in (self.grid, self.XG, self.MXG4):
+            for method in ('dict', 'csr'):
+                assert_equal(nx.all_pairs_dijkstra_path(G, method=method,
+                                                        n_jobs=2),
+                             nx.all_pairs_dijkstra_path(G))
+                assert_equal(
+                    dict(nx.all_pairs_dijkstra_path_length(G, method=method,
+                                                           n_jobs=2)),
+                    dict(nx.all_pairs_dijkstra_path_length(G)))
+
+    def test_csr_graph(self):
+        G = self.XG.copy()
+        G.add_edge('s', 'z', weight=2.5)
+        for H in (nx.CSRDiGraph(G), nx.CSRDiGraph(G).reverse()):
+            assert_equal(
+                dict(nx.all_pairs_dijkstra_path_length(H, method='csr')),
+                dict(nx.all_pairs_dijkstra_path_length(H)))
+
+    def test_weight_function(self):
+        weight = lambda u, v, d: None if 'x' in (u, v) else d['weight']
+        assert_equal(nx.single_source_dijkstra(self.XG, 's', weight=weight,
+                                               method='csr'),
+                     nx.single_source_dijkstra(self.XG, 's', weight=weight))
+
+    @raises(ValueError)
+    def test_negative_weights(self):
+        G = nx.DiGraph()
+        G.add_weighted_edges_from([(0, 1, 2), (0, 2, 3), (2, 1, -2)])
+        nx.single_source_dijkstra_path_length(G, 0, method='csr')
+
+    @raises(ValueError)
+    def test_invalid_method(self):
+        nx.single_source_dijkstra(self.XG, 's', method='foo')
+
+
+class TestDijkstraHeap(WeightedTestBase):
+    """Unit tests for the Dijkstra functions with a ``heap``, which
+    must give the same results as with the default :mod:`heapq` list.
+
+    """
+
+    def graphs(self):
+        return [self.grid, self.cycle, self.directed_cycle, self.XG,
+                self.MXG, self.XG2, self.XG3, self.XG4, self.MXG4, self.G]
+
+    def test_single_source(self):
+        for heap in (nx.utils.DaryHeap, nx.utils.BinaryHeap):
+            for G in self.graphs():
+                for s in G:
+                    for method in ('dict', 'csr'):
+                        length, path = nx.single_source_dijkstra(
+                            G, s, method=method, heap=heap)
+                        assert_equal(length, nx.single_source_dijkstra(G, s)[0])
+                        for t in path:
+                            validate_path(G, s, t, length[t], path[t])
+
+    def test_dary_heap_ties(self):
+        # Ties between nodes are broken as with the default heapq list.
+        for G in self.graphs():
+            for s in G:
+                for method in ('dict', 'csr'):
+                    assert_equal(nx.single_source_dijkstra(
+                                     G, s, cutoff=3, method=method,
+                                     heap=nx.utils.DaryHeap),
+                                 nx.single_source_dijkstra(G, s, cutoff=3))
+            assert_equal(nx.all_pairs_dijkstra_path(G,
+                                                    heap=nx.utils.DaryHeap),
+                         nx.all_pairs_dijkstra_path(G))
+
+    def test_predecessor(self):
+        for G in self.graphs():
+            for s in G:
+                pred, dist = nx.dijkstra_predecessor_and_distance(
+                    G, s, heap=nx.utils.PairingHeap)
+                expected = nx.dijkstra_predecessor_and_distance(G, s)
+                assert_equal(dist, expected[1])
+                assert_equal(dict((n, sorted(p)) for n, p in pred.items()),
+                             dict((n, sorted(p)) for n, p in
+                                  expected[0].items()))
+
+    def test_path(self):
+        heap = nx.utils.DaryHeap
+        assert_equal(nx.dijkstra_path(self.XG, 's', 'v', heap=heap),
+                     ['s', 'x', 'u', 'v'])
+        assert_equal(nx.dijkstra_path_length(self.XG, 's', 'v', heap=heap), 9)
+        assert_raises(nx.NetworkXNoPath, nx.dijkstra_path, self.XG, 's', 'z',
+                      heap=heap)
+
+    def test_bidirectional_dijkstra(self):
+        for heap in (nx.utils.DaryHeap, nx.utils.PairingHeap):
+            for G in self.graphs():
+                for s in G:
+                    for t in G:
+                        try:
+                            expected = nx.dijkstra_path_length(G, s, t)
+                        except nx.NetworkXNoPath:
+                            assert_raises(nx.NetworkXNoPath,
+                                          nx.bidirectional_dijkstra, G, s, t,
+                                          heap=heap)
+                            continue
+                        length, path = nx.bidirectional_dijkstra(G, s, t,
+                                                                 heap=heap)
+                        validate_length_path(G, s, t, expected, length, path)
+
+    def test_heap_factory(self):
+        heap = lambda: nx.utils.DaryHeap(d=2)
+        assert_equal(dict(nx.single_source_dijkstra_path_length(self.XG, 's',
+                                                                heap=heap)),
+                     dict(nx.single_source_dijkstra_path_length(self.XG, 's')))
+
+    @raises(ValueError)
+    def test_negative_weights(self):
+        G = nx.DiGraph()
+        G.add_weighted_edges_from([(0, 1, 2), (0, 2, 3), (2, 1, -2)])
+        nx.single_source_dijkstra_path_length(G, 0, heap=nx.utils.DaryHeap)
+
+
 class TestDijkstraPathLength(object):
     """Unit tests for the :func:`networkx.dijkstra_path_length`
     function.
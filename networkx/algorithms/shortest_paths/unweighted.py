@@ -19,6 +19,7 @@ __all__ = ['bidirectional_shortest_path',
 
 
 import networkx as nx
+from networkx.utils import map_sources
 
 def single_source_shortest_path_length(G,source,cutoff=None):
     """Compute the shortest path lengths from source to all reachable nodes.
@@ -65,7 +66,7 @@ def single_source_shortest_path_length(G,source,cutoff=None):
     del seen
 
 
-def all_pairs_shortest_path_length(G, cutoff=None):
+def all_pairs_shortest_path_length(G, cutoff=None, n_jobs=None):
     """Computes the shortest path lengths between all nodes in `G`.
 
     Parameters
@@ -76,6 +77,10 @@ def all_pairs_shortest_path_length(G, cutoff=None):
         Depth at which to stop the search. Only paths of length at most
         `cutoff` are returned.
 
+    n_jobs : int, optional (default=None)
+        The number of worker processes running the searches in parallel.
+        None and 1 mean no parallelism and -1 means one process per CPU.
+
     Returns
     -------
     lengths : iterator
@@ -94,10 +99,21 @@ def all_pairs_shortest_path_length(G, cutoff=None):
     {0: 1, 1: 0, 2: 1, 3: 2, 4: 3}
 
     """
+    if n_jobs is None:
+        length = single_source_shortest_path_length
+        for n in G:
+            yield (n, dict(length(G, n, cutoff=cutoff)))
+    else:
+        for lengths in map_sources(_sources_shortest_path_length, G, G,
+                                   n_jobs, args=(cutoff,)):
+            for item in lengths:
+                yield item
+
+
+def _sources_shortest_path_length(G, sources, cutoff):
+    """Returns a list of (source, lengths) pairs for `sources`."""
     length = single_source_shortest_path_length
-    # TODO This can be trivially parallelized.
-    for n in G:
-        yield (n, dict(length(G, n, cutoff=cutoff)))
+    return [(n, dict(length(G, n, cutoff=cutoff))) for n in sources]
 
 
 def bidirectional_shortest_path(G,source,target):
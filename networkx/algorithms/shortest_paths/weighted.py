@@ -12,13 +12,26 @@
 #           Niels van Adrichem <n.l.m.vanadrichem@tudelft.nl>
 """
 Shortest path algorithms for weighed graphs.
+
+The Dijkstra functions of this module take a `heap` argument, the
+priority queue holding the fringe of the search: a subclass of
+:class:`~networkx.utils.heaps.MinHeap`, such as
+:class:`~networkx.utils.heaps.DaryHeap`, or any function returning an
+empty one.  By default the fringe is a :mod:`heapq` list to which a new
+entry is pushed whenever the distance of a node decreases, stale entries
+being skipped when they are popped.  Heaps supporting decrease-key keep a
+single entry per node instead, which saves time and memory on dense
+graphs.
 """
 
+from array import array
 from collections import deque
 from heapq import heappush, heappop
 from itertools import count
+from numbers import Integral
 import networkx as nx
 from networkx.utils import generate_unique_node
+from networkx.utils import map_sources
 import warnings as _warnings
 
 
@@ -83,7 +96,7 @@ def _weight_function(G, weight):
         return lambda u, v, d: min(attr.get(weight, 1) for attr in d.values())
     return lambda u, v, data: data.get(weight, 1)
 
-def dijkstra_path(G, source, target, weight='weight'):
+def dijkstra_path(G, source, target, weight='weight', heap=None):
     """Returns the shortest weighted path from source to target in G.
 
     Uses Dijkstra's Method to compute the shortest weighted path
@@ -112,6 +125,9 @@ def dijkstra_path(G, source, target, weight='weight'):
        dictionary of edge attributes for that edge. The function must
        return a number.
 
+    heap : callable, optional (default=None)
+       The priority queue of the search, see the module documentation.
+
     Returns
     -------
     path : list
@@ -142,7 +158,7 @@ def dijkstra_path(G, source, target, weight='weight'):
     bidirectional_dijkstra(), bellman_ford_path()
     """
     (length, path) = single_source_dijkstra(G, source, target=target,
-                                            weight=weight)
+                                            weight=weight, heap=heap)
     try:
         return path[target]
     except KeyError:
@@ -150,7 +166,7 @@ def dijkstra_path(G, source, target, weight='weight'):
             "node %s not reachable from %s" % (source, target))
 
 
-def dijkstra_path_length(G, source, target, weight='weight'):
+def dijkstra_path_length(G, source, target, weight='weight', heap=None):
     """Returns the shortest weighted path length in G from source to target.
 
     Uses Dijkstra's Method to compute the shortest weighted path length
@@ -179,6 +195,9 @@ def dijkstra_path_length(G, source, target, weight='weight'):
        dictionary of edge attributes for that edge. The function must
        return a number.
 
+    heap : callable, optional (default=None)
+       The priority queue of the search, see the module documentation.
+
     Returns
     -------
     length : number
@@ -212,7 +231,7 @@ def dijkstra_path_length(G, source, target, weight='weight'):
     if source == target:
         return 0
     weight = _weight_function(G, weight)
-    length = _dijkstra(G, source, weight, target=target)
+    length = _dijkstra(G, source, weight, target=target, heap=heap)
     try:
         return length[target]
     except KeyError:
@@ -220,7 +239,8 @@ def dijkstra_path_length(G, source, target, weight='weight'):
             "node %s not reachable from %s" % (source, target))
 
 
-def single_source_dijkstra_path(G, source, cutoff=None, weight='weight'):
+def single_source_dijkstra_path(G, source, cutoff=None, weight='weight',
+                                method='dict', heap=None):
     """Find shortest weighted paths in G from a source node.
 
     Compute shortest path between source and all other reachable
@@ -249,6 +269,16 @@ def single_source_dijkstra_path(G, source, cutoff=None, weight='weight'):
        dictionary of edge attributes for that edge. The function must
        return a number.
 
+    method : string, optional (default='dict')
+       The implementation of Dijkstra's algorithm to use. With ``'dict'``
+       the search walks the adjacency dicts of `G` and calls the weight
+       function for every edge it relaxes. With ``'csr'`` the graph is
+       first compiled into integer-indexed arrays of neighbors and edge
+       weights and the search runs over those arrays.
+
+    heap : callable, optional (default=None)
+       The priority queue of the search, see the module documentation.
+
     Returns
     -------
     paths : dictionary
@@ -276,12 +306,13 @@ def single_source_dijkstra_path(G, source, cutoff=None, weight='weight'):
 
     """
     (length, path) = single_source_dijkstra(
-        G, source, cutoff=cutoff, weight=weight)
+        G, source, cutoff=cutoff, weight=weight, method=method, heap=heap)
     return path
 
 
 def single_source_dijkstra_path_length(G, source, cutoff=None,
-                                       weight='weight'):
+                                       weight='weight', method='dict',
+                                       heap=None):
     """Find shortest weighted path lengths in G from a source node.
 
     Compute the shortest path length between source and all other
@@ -310,6 +341,16 @@ def single_source_dijkstra_path_length(G, source, cutoff=None,
        dictionary of edge attributes for that edge. The function must
        return a number.
 
+    method : string, optional (default='dict')
+       The implementation of Dijkstra's algorithm to use. With ``'dict'``
+       the search walks the adjacency dicts of `G` and calls the weight
+       function for every edge it relaxes. With ``'csr'`` the graph is
+       first compiled into integer-indexed arrays of neighbors and edge
+       weights and the search runs over those arrays.
+
+    heap : callable, optional (default=None)
+       The priority queue of the search, see the module documentation.
+
     Returns
     -------
     length : iterator
@@ -338,12 +379,12 @@ def single_source_dijkstra_path_length(G, source, cutoff=None,
     single_source_dijkstra(), single_source_bellman_ford_path_length()
 
     """
-    weight = _weight_function(G, weight)
-    return iter(_dijkstra(G, source, weight, cutoff=cutoff).items())
+    dijkstra = _dijkstra_method(G, weight, method, heap)
+    return iter(dijkstra(source, cutoff=cutoff).items())
 
 
 def single_source_dijkstra(G, source, target=None, cutoff=None,
-                           weight='weight'):
+                           weight='weight', method='dict', heap=None):
     """Find shortest weighted paths and lengths from a source node.
 
     Compute the shortest path length between source and all other
@@ -378,6 +419,16 @@ def single_source_dijkstra(G, source, target=None, cutoff=None,
        dictionary of edge attributes for that edge. The function must
        return a number.
 
+    method : string, optional (default='dict')
+       The implementation of Dijkstra's algorithm to use. With ``'dict'``
+       the search walks the adjacency dicts of `G` and calls the weight
+       function for every edge it relaxes. With ``'csr'`` the graph is
+       first compiled into integer-indexed arrays of neighbors and edge
+       weights and the search runs over those arrays.
+
+    heap : callable, optional (default=None)
+       The priority queue of the search, see the module documentation.
+
     Returns
     -------
     distance,path : dictionaries
@@ -421,14 +472,14 @@ def single_source_dijkstra(G, source, target=None, cutoff=None,
     """
     if source == target:
         return ({source: 0}, {source: [source]})
-    weight = _weight_function(G, weight)
+    dijkstra = _dijkstra_method(G, weight, method, heap)
     paths = {source: [source]}  # dictionary of paths
-    return (_dijkstra(G, source, weight, paths=paths, cutoff=cutoff,
-                      target=target), paths)
+    return (dijkstra(source, paths=paths, cutoff=cutoff, target=target),
+            paths)
 
 
 def _dijkstra(G, source, weight, pred=None, paths=None, cutoff=None,
-              target=None):
+              target=None, heap=None):
     """Uses Dijkstra's algorithm to find shortest weighted paths
 
     Parameters
@@ -455,6 +506,10 @@ def _dijkstra(G, source, weight, pred=None, paths=None, cutoff=None,
     cutoff : integer or float, optional
         Depth to stop the search. Only return paths with length <= cutoff.
 
+    heap : callable, optional (default=None)
+        Function returning an empty :class:`~networkx.utils.heaps.MinHeap`
+        to hold the fringe.  If None, a :mod:`heapq` list is used.
+
     Returns
     -------
     distance : dictionary
@@ -467,6 +522,9 @@ def _dijkstra(G, source, weight, pred=None, paths=None, cutoff=None,
     as arguments. No need to explicitly return pred or paths.
     """
     G_succ = G.succ if G.is_directed() else G.adj
+    if heap is not None:
+        return _dijkstra_heap(G_succ, source, weight, heap(), pred, paths,
+                              cutoff, target)
 
     push = heappush
     pop = heappop
@@ -512,7 +570,250 @@ def _dijkstra(G, source, weight, pred=None, paths=None, cutoff=None,
     return dist
 
 
-def dijkstra_predecessor_and_distance(G, source, cutoff=None, weight='weight'):
+def _dijkstra_heap(G_succ, source, weight, fringe, pred, paths, cutoff,
+                   target):
+    """Uses Dijkstra's algorithm with `fringe`, a :class:`MinHeap`.
+
+    This is the counterpart of :func:`_dijkstra` for heaps supporting
+    decrease-key: the fringe holds a single entry per node, whose
+    distance is decreased in place when a shorter path is found.
+
+    """
+    dist = {}  # dictionary of final distances
+    fringe.insert(source, 0)
+    while fringe:
+        v, d = fringe.pop()
+        dist[v] = d
+        if v == target:
+            break
+        for u, e in G_succ[v].items():
+            cost = weight(v, u, e)
+            if cost is None:
+                continue
+            vu_dist = d + cost
+            if cutoff is not None:
+                if vu_dist > cutoff:
+                    continue
+            if u in dist:
+                if vu_dist < dist[u]:
+                    raise ValueError('Contradictory paths found:',
+                                     'negative weights?')
+            elif fringe.insert(u, vu_dist):
+                if paths is not None:
+                    paths[u] = paths[v] + [u]
+                if pred is not None:
+                    pred[u] = [v]
+            elif vu_dist == fringe.get(u):
+                if pred is not None:
+                    pred[u].append(v)
+    return dist
+
+
+def _compile_adjacency(G, weight):
+    """Returns an integer-indexed compressed adjacency of `G`.
+
+    Nodes are numbered in the order ``list(G)``.  The (out-)neighbors of
+    the node numbered `i` are ``targets[offsets[i]:offsets[i + 1]]`` and
+    the weights of the corresponding edges are at the same positions in
+    ``costs``.  Edges hidden by the weight function are left out.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    weight : string or function
+        Edge weight, as accepted by :func:`_weight_function`.
+
+    Returns
+    -------
+    nodes, index, offsets, targets, costs : tuple
+        The list of nodes, a dict mapping each node to its position, and
+        the three arrays of the compressed adjacency.
+
+    """
+    if not callable(weight) and isinstance(G, nx.CSRGraph):
+        compiled = _compile_csr_graph(G, weight)
+        if compiled is not None:
+            return compiled
+    weight = _weight_function(G, weight)
+    G_succ = G.succ if G.is_directed() else G.adj
+    nodes = list(G)
+    index = {n: i for i, n in enumerate(nodes)}
+    offsets = [0]
+    targets = []
+    costs = []
+    for u in nodes:
+        for v, e in G_succ[u].items():
+            cost = weight(u, v, e)
+            if cost is None:
+                continue
+            targets.append(index[v])
+            costs.append(cost)
+        offsets.append(len(targets))
+    typecode = 'l' if len(targets) < 2 ** 31 else 'q'
+    return (nodes, index, array(typecode, offsets), array(typecode, targets),
+            _cost_array(costs))
+
+
+def _compile_csr_graph(G, weight):
+    """Returns the compiled adjacency of a :class:`CSRGraph` `G`.
+
+    The neighbor arrays of `G` are used as they are, so that only the
+    array of edge weights is built.  Returns None if some edge has a
+    weight of None, in which case the adjacency must be compiled edge by
+    edge.
+
+    """
+    adj = G.adj
+    size = len(adj._indices)
+    column = G._columns.get(weight)
+    if column is None:
+        costs = array('l', [1]) * size
+    elif isinstance(column, array) and adj._slots is None:
+        costs = column
+    else:
+        slots = range(size) if adj._slots is None else adj._slots
+        if not isinstance(column, dict):
+            costs = [column[s] for s in slots]
+        else:
+            costs = [column.get(s, 1) for s in slots]
+            if any(cost is None for cost in costs):
+                return None
+        costs = _cost_array(costs)
+    return G._nodes, G._index, adj._indptr, adj._indices, costs
+
+
+def _cost_array(costs):
+    """Returns a typed array holding `costs` if their type allows it."""
+    if all(isinstance(c, float) for c in costs):
+        return array('d', costs)
+    if all(isinstance(c, Integral) and not isinstance(c, bool) and
+           -2 ** 63 < c < 2 ** 63 for c in costs):
+        try:
+            return array('q', costs)
+        except (ValueError, OverflowError):
+            pass
+    return costs
+
+
+def _dijkstra_compiled(compiled, source, pred=None, paths=None, cutoff=None,
+                       target=None, heap=None):
+    """Uses Dijkstra's algorithm on a compiled adjacency.
+
+    This is the counterpart of :func:`_dijkstra` for the arrays returned
+    by :func:`_compile_adjacency`.  Neighbors are visited in the same
+    order and ties are broken in the same way, so that the returned
+    distances and the optional `pred` and `paths` dictionaries are the
+    same as those computed by :func:`_dijkstra`.
+
+    """
+    nodes, index, offsets, targets, costs = compiled
+    s = index[source]
+    t = index.get(target, -1) if target is not None else -1
+    if heap is not None:
+        return _dijkstra_compiled_heap(compiled, s, t, heap(), pred, paths,
+                                       cutoff)
+    n = len(nodes)
+    push = heappush
+    pop = heappop
+    dist = [None] * n  # final distances
+    seen = [None] * n  # tentative distances
+    settled = []
+    seen[s] = 0
+    c = count()
+    fringe = [(0, next(c), s)]
+    while fringe:
+        (d, _, v) = pop(fringe)
+        if dist[v] is not None:
+            continue  # already searched this node.
+        dist[v] = d
+        settled.append(v)
+        if v == t:
+            break
+        lo, hi = offsets[v], offsets[v + 1]
+        for u, cost in zip(targets[lo:hi], costs[lo:hi]):
+            vu_dist = d + cost
+            if cutoff is not None:
+                if vu_dist > cutoff:
+                    continue
+            if dist[u] is not None:
+                if vu_dist < dist[u]:
+                    raise ValueError('Contradictory paths found:',
+                                     'negative weights?')
+            elif seen[u] is None or vu_dist < seen[u]:
+                seen[u] = vu_dist
+                push(fringe, (vu_dist, next(c), u))
+                if paths is not None:
+                    paths[nodes[u]] = paths[nodes[v]] + [nodes[u]]
+                if pred is not None:
+                    pred[nodes[u]] = [nodes[v]]
+            elif vu_dist == seen[u]:
+                if pred is not None:
+                    pred[nodes[u]].append(nodes[v])
+    return {nodes[v]: dist[v] for v in settled}
+
+
+def _dijkstra_compiled_heap(compiled, s, t, fringe, pred, paths, cutoff):
+    """Uses Dijkstra's algorithm with `fringe`, a :class:`MinHeap`, on a
+    compiled adjacency.
+
+    See :func:`_dijkstra_compiled` and :func:`_dijkstra_heap`.
+
+    """
+    nodes, index, offsets, targets, costs = compiled
+    dist = [None] * len(nodes)  # final distances
+    settled = []
+    fringe.insert(s, 0)
+    while fringe:
+        v, d = fringe.pop()
+        dist[v] = d
+        settled.append(v)
+        if v == t:
+            break
+        lo, hi = offsets[v], offsets[v + 1]
+        for u, cost in zip(targets[lo:hi], costs[lo:hi]):
+            vu_dist = d + cost
+            if cutoff is not None:
+                if vu_dist > cutoff:
+                    continue
+            if dist[u] is not None:
+                if vu_dist < dist[u]:
+                    raise ValueError('Contradictory paths found:',
+                                     'negative weights?')
+            elif fringe.insert(u, vu_dist):
+                if paths is not None:
+                    paths[nodes[u]] = paths[nodes[v]] + [nodes[u]]
+                if pred is not None:
+                    pred[nodes[u]] = [nodes[v]]
+            elif vu_dist == fringe.get(u):
+                if pred is not None:
+                    pred[nodes[u]].append(nodes[v])
+    return {nodes[v]: dist[v] for v in settled}
+
+
+def _dijkstra_method(G, weight, method, heap=None):
+    """Returns a function that runs Dijkstra's algorithm from a source.
+
+    The returned function accepts the source node and the optional
+    `pred`, `paths`, `cutoff` and `target` keyword arguments of
+    :func:`_dijkstra`, and returns the dictionary of distances.  For the
+    ``'csr'`` method the graph is compiled once, when this function is
+    called.  The fringe of the searches is a `heap` if it is not None.
+
+    """
+    if method == 'dict':
+        weight = _weight_function(G, weight)
+        return lambda source, **kwds: _dijkstra(G, source, weight,
+                                                heap=heap, **kwds)
+    if method == 'csr':
+        compiled = _compile_adjacency(G, weight)
+        return lambda source, **kwds: _dijkstra_compiled(compiled, source,
+                                                         heap=heap, **kwds)
+    raise ValueError('{} is not a valid choice for a method.'.format(method))
+
+
+def dijkstra_predecessor_and_distance(G, source, cutoff=None, weight='weight',
+                                      heap=None):
     """Compute weighted shortest path length and predecessors.
 
     Uses Dijkstra's Method to obtain the shortest weighted paths
@@ -542,6 +843,9 @@ def dijkstra_predecessor_and_distance(G, source, cutoff=None, weight='weight'):
        dictionary of edge attributes for that edge. The function must
        return a number.
 
+    heap : callable, optional (default=None)
+       The priority queue of the search, see the module documentation.
+
     Returns
     -------
     pred, distance : dictionaries
@@ -559,9 +863,11 @@ def dijkstra_predecessor_and_distance(G, source, cutoff=None, weight='weight'):
 
     weight = _weight_function(G, weight)
     pred = {source: []}  # dictionary of predecessors
-    return (pred, _dijkstra(G, source, weight, pred=pred, cutoff=cutoff))
+    return (pred, _dijkstra(G, source, weight, pred=pred, cutoff=cutoff,
+                            heap=heap))
 
-def all_pairs_dijkstra_path_length(G, cutoff=None, weight='weight'):
+def all_pairs_dijkstra_path_length(G, cutoff=None, weight='weight',
+                                   method='dict', n_jobs=None, heap=None):
     """Compute shortest path lengths between all nodes in a weighted graph.
 
     Parameters
@@ -584,6 +890,24 @@ def all_pairs_dijkstra_path_length(G, cutoff=None, weight='weight'):
        dictionary of edge attributes for that edge. The function must
        return a number.
 
+    method : string, optional (default='dict')
+       The implementation of Dijkstra's algorithm to use. With ``'dict'``
+       the search walks the adjacency dicts of `G` and calls the weight
+       function for every edge it relaxes. With ``'csr'`` the graph is
+       first compiled into integer-indexed arrays of neighbors and edge
+       weights and the search runs over those arrays. The graph is
+       compiled once and the arrays are shared by the searches from
+       all sources.
+
+    n_jobs : int, optional (default=None)
+       The number of worker processes running the searches in parallel.
+       None and 1 mean no parallelism and -1 means one process per CPU.
+       With more than one job, `weight` must be picklable, so it should
+       be an attribute name or a module level function.
+
+    heap : callable, optional (default=None)
+       The priority queue of the search, see the module documentation.
+
     Returns
     -------
     distance : iterator
@@ -606,12 +930,19 @@ def all_pairs_dijkstra_path_length(G, cutoff=None, weight='weight'):
 
     The dictionary returned only has keys for reachable node pairs.
     """
-    length = single_source_dijkstra_path_length
-    for n in G:
-        yield (n, dict(length(G, n, cutoff=cutoff, weight=weight)))
+    if n_jobs is None:
+        dijkstra = _dijkstra_method(G, weight, method, heap)
+        for n in G:
+            yield (n, dijkstra(n, cutoff=cutoff))
+    else:
+        for lengths in map_sources(_sources_dijkstra_path_length, G, G,
+                                   n_jobs, args=(cutoff, weight, method, heap)):
+            for item in lengths:
+                yield item
 
 
-def all_pairs_dijkstra_path(G, cutoff=None, weight='weight'):
+def all_pairs_dijkstra_path(G, cutoff=None, weight='weight', method='dict',
+                            n_jobs=None, heap=None):
     """Compute shortest paths between all nodes in a weighted graph.
 
     Parameters
@@ -634,6 +965,24 @@ def all_pairs_dijkstra_path(G, cutoff=None, weight='weight'):
        dictionary of edge attributes for that edge. The function must
        return a number.
 
+    method : string, optional (default='dict')
+       The implementation of Dijkstra's algorithm to use. With ``'dict'``
+       the search walks the adjacency dicts of `G` and calls the weight
+       function for every edge it relaxes. With ``'csr'`` the graph is
+       first compiled into integer-indexed arrays of neighbors and edge
+       weights and the search runs over those arrays. The graph is
+       compiled once and the arrays are shared by the searches from
+       all sources.
+
+    n_jobs : int, optional (default=None)
+       The number of worker processes running the searches in parallel.
+       None and 1 mean no parallelism and -1 means one process per CPU.
+       With more than one job, `weight` must be picklable, so it should
+       be an attribute name or a module level function.
+
+    heap : callable, optional (default=None)
+       The priority queue of the search, see the module documentation.
+
     Returns
     -------
     distance : dictionary
@@ -656,9 +1005,31 @@ def all_pairs_dijkstra_path(G, cutoff=None, weight='weight'):
     floyd_warshall(), all_pairs_bellman_ford_path()
 
     """
-    path = single_source_dijkstra_path
-    # TODO This can be trivially parallelized.
-    return {n: path(G, n, cutoff=cutoff, weight=weight) for n in G}
+    if n_jobs is None:
+        return dict(_sources_dijkstra_path(G, G, cutoff, weight, method,
+                                           heap))
+    paths = {}
+    for chunk in map_sources(_sources_dijkstra_path, G, G, n_jobs,
+                             args=(cutoff, weight, method, heap)):
+        paths.update(chunk)
+    return paths
+
+
+def _sources_dijkstra_path_length(G, sources, cutoff, weight, method, heap):
+    """Returns a list of (source, distances) pairs for `sources`."""
+    dijkstra = _dijkstra_method(G, weight, method, heap)
+    return [(n, dijkstra(n, cutoff=cutoff)) for n in sources]
+
+
+def _sources_dijkstra_path(G, sources, cutoff, weight, method, heap):
+    """Returns a list of (source, paths) pairs for `sources`."""
+    dijkstra = _dijkstra_method(G, weight, method, heap)
+    result = []
+    for n in sources:
+        paths = {n: [n]}
+        dijkstra(n, paths=paths, cutoff=cutoff)
+        result.append((n, paths))
+    return result
 
 def bellman_ford(G, source, weight='weight'):
 
@@ -1435,7 +1806,7 @@ def negative_edge_cycle(G, weight='weight'):
     return False
 
 
-def bidirectional_dijkstra(G, source, target, weight='weight'):
+def bidirectional_dijkstra(G, source, target, weight='weight', heap=None):
     """Dijkstra's algorithm for shortest paths using bidirectional search.
 
     Parameters
@@ -1461,6 +1832,9 @@ def bidirectional_dijkstra(G, source, target, weight='weight'):
        dictionary of edge attributes for that edge. The function must
        return a number.
 
+    heap : callable, optional (default=None)
+       The priority queue of the search, see the module documentation.
+
     Returns
     -------
     length : number
@@ -1510,18 +1884,33 @@ def bidirectional_dijkstra(G, source, target, weight='weight'):
     """
     if source == target:
         return (0, [source])
-    push = heappush
-    pop = heappop
+    if heap is None:
+        c = count()
+
+        def push(fringe, node, dist):
+            heappush(fringe, (dist, next(c), node))
+
+        def pop(fringe):
+            (dist, _, node) = heappop(fringe)
+            return node, dist
+
+        fringe = [[], []]              # heap of (distance, node) tuples
+                                       # for choosing next node to expand
+    else:
+        def push(fringe, node, dist):
+            fringe.insert(node, dist)
+
+        def pop(fringe):
+            return fringe.pop()
+
+        fringe = [heap(), heap()]
     # Init:  [Forward, Backward]
     dists = [{}, {}]                   # dictionary of final distances
     paths = [{source: [source]}, {target: [target]}]  # dictionary of paths
-    fringe = [[], []]                  # heap of (distance, node) tuples
-                                       # for choosing next node to expand
     seen = [{source: 0}, {target: 0}]  # dict of distances to seen nodes
-    c = count()
     # initialize fringe heap
-    push(fringe[0], (0, next(c), source))
-    push(fringe[1], (0, next(c), target))
+    push(fringe[0], source, 0)
+    push(fringe[1], target, 0)
     # neighs for extracting correct neighbor information
     if G.is_directed():
         neighs = [G.successors, G.predecessors]
@@ -1536,7 +1925,7 @@ def bidirectional_dijkstra(G, source, target, weight='weight'):
         # dir == 0 is forward direction and dir == 1 is back
         dir = 1 - dir
         # extract closest to expand
-        (dist, _, v) = pop(fringe[dir])
+        (v, dist) = pop(fringe[dir])
         if v in dists[dir]:
             # Shortest path to v has already been found
             continue
@@ -1570,7 +1959,7 @@ def bidirectional_dijkstra(G, source, target, weight='weight'):
             elif w not in seen[dir] or vwLength < seen[dir][w]:
                 # relaxing
                 seen[dir][w] = vwLength
-                push(fringe[dir], (vwLength, next(c), w))
+                push(fringe[dir], w, vwLength)
                 paths[dir][w] = paths[dir][v] + [w]
                 if w in seen[0] and w in seen[1]:
                     # see if this path is better than than the already
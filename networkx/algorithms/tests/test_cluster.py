@@ -34,6 +34,21 @@ class TestTriangles:
         assert_equal(list(nx.triangles(G).values()),[5, 3, 3, 5, 5])
         assert_equal(nx.triangles(G,1),3)
 
+    def test_self_loops(self):
+        G = nx.complete_graph(4)
+        G.add_edges_from([(0, 0), (1, 1)])
+        assert_equal(nx.triangles(G), {0: 3, 1: 3, 2: 3, 3: 3})
+        assert_equal(nx.triangles(G, 0), 3)
+
+    def test_random(self):
+        # The forward algorithm agrees with the count at each node.
+        G = nx.gnm_random_graph(60, 400, seed=3)
+        G = nx.relabel_nodes(G, dict((n, str(n)) for n in G))
+        expected = dict((n, nx.triangles(G, n)) for n in G)
+        assert_equal(nx.triangles(G), expected)
+        assert_equal(nx.triangles(G, n_jobs=2), expected)
+        assert_equal(nx.triangles(G, list(G)), expected)
+
 
 class TestWeightedClustering:
 
@@ -130,6 +145,15 @@ class TestTransitivity:
         G.remove_edge(1,2)
         assert_equal(nx.transitivity(G),0.875)
 
+    def test_n_jobs(self):
+        G = nx.gnm_random_graph(40, 200, seed=1)
+        assert_almost_equal(nx.transitivity(G, n_jobs=2), nx.transitivity(G))
+
+    def test_directed(self):
+        # Triangles of directed graphs are counted over successors.
+        G = nx.DiGraph([(0, 1), (1, 2), (0, 2), (2, 0), (1, 0)])
+        assert_equal(nx.transitivity(G), 0.75)
+
     # def test_clustering_transitivity(self):
     #     # check that weighted average of clustering is transitivity
     #     G = nx.complete_graph(5)
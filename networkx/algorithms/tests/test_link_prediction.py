@@ -1,6 +1,7 @@
 import math
 
 from functools import partial
+from nose import SkipTest
 from nose.tools import *
 
 import networkx as nx
@@ -601,3 +602,111 @@ class TestWithinInterCluster():
         G.node[2]['community'] = 0
         G.node[3]['community'] = 0
         self.test(G, None, [(0, 3, 1 / self.delta), (1, 2, 0), (1, 3, 0)])
+
+
+class TestBatchScores(object):
+    @classmethod
+    def setupClass(cls):
+        global np
+        try:
+            import numpy as np
+            import scipy
+        except ImportError:
+            raise SkipTest('SciPy not available.')
+
+    def setUp(self):
+        G = nx.gnm_random_graph(30, 80, seed=5)
+        G.add_edges_from([(0, 0), (3, 3), (0, 3), (0, 7)])
+        self.G = nx.relabel_nodes(G, dict((n, 'n%d' % n) for n in G))
+        self.nodelist = list(self.G)
+        self.index = dict((n, i) for i, n in enumerate(self.nodelist))
+        self.funcs = {'resource_allocation': nx.resource_allocation_index,
+                      'jaccard': nx.jaccard_coefficient,
+                      'adamic_adar': nx.adamic_adar_index,
+                      'preferential_attachment': nx.preferential_attachment}
+
+    def test_pairs(self):
+        pairs = list(self.G.edges()) + list(nx.non_edges(self.G))
+        pairs += [('n0', 'n0'), ('n1', 'n1'), ('n3', 'n3')]
+        for method, func in self.funcs.items():
+            if method == 'adamic_adar':
+                # Nodes of degree 1 are common neighbors of a node and
+                # itself, with an infinite weight.
+                pairs = [(u, v) for u, v in pairs if u != v]
+            u = [self.index[a] for a, b in pairs]
+            v = [self.index[b] for a, b in pairs]
+            scores = nx.link_prediction_scores(self.G, u, v, method,
+                                               chunksize=100)
+            expected = [p for a, b, p in func(self.G, pairs)]
+            np.testing.assert_allclose(scores, expected)
+
+    def test_non_edges(self):
+        for method, func in self.funcs.items():
+            result = {}
+            for u, v, scores in nx.non_edge_scores(self.G, method,
+                                                   chunksize=100):
+                assert_true(np.all(u < v))
+                for a, b, p in zip(u, v, scores):
+                    result[self.nodelist[a], self.nodelist[b]] = p
+            expected = func(self.G)
+            count = 0
+            for a, b, p in expected:
+                count += 1
+                if (a, b) not in result:
+                    a, b = b, a
+                assert_almost_equal(result[a, b], p)
+            assert_equal(len(result), count)
+
+    def test_top_k(self):
+        sources = [0, 3, 7, 10]
+        for method, func in self.funcs.items():
+            targets, scores = nx.top_k_links(self.G, 3, method, sources,
+                                             chunksize=50)
+            assert_equal(targets.shape, (4, 3))
+            for s, row, row_scores in zip(sources, targets, scores):
+                u = self.nodelist[s]
+                expected = sorted((p for a, b, p in
+                                   func(self.G, ((u, v) for v in self.G
+                                                 if v != u and
+                                                 v not in self.G[u]))),
+                                  reverse=True)
+                np.testing.assert_allclose(row_scores, expected[:3])
+                for t, p in zip(row, row_scores):
+                    v = self.nodelist[t]
+                    assert_false(v in self.G[u] or v == u)
+                    assert_almost_equal(p, next(func(self.G, [(u, v)]))[2])
+
+    def test_adjacent_self_loops(self):
+        G = nx.Graph([(0, 1), (0, 0), (1, 1), (0, 4), (1, 4), (0, 3)])
+        scores = nx.link_prediction_scores(G, [0], [1], 'jaccard')
+        assert_almost_equal(scores[0], 0.25)
+        expected = next(nx.jaccard_coefficient(G, [(0, 1)]))[2]
+        assert_almost_equal(scores[0], expected)
+
+    def test_top_k_padding(self):
+        G = nx.complete_graph(4)
+        G.remove_edge(0, 1)
+        targets, scores = nx.top_k_links(G, 10, 'jaccard')
+        assert_equal(targets.tolist(), [[1, -1, -1, -1], [0, -1, -1, -1],
+                                        [-1] * 4, [-1] * 4])
+        assert_equal(scores[0, 0], 1.0)
+        assert_true(np.all(np.isneginf(scores[2])))
+
+    def test_nodelist(self):
+        G = nx.path_graph(4)
+        # Positions 0 and 2 are nodes 0 and 1.
+        nodelist = [0, 2, 1, 3]
+        scores = nx.link_prediction_scores(G, [0], [2], 'jaccard',
+                                           nodelist=nodelist)
+        assert_equal(scores.tolist(), [0.0])
+        assert_raises(nx.NetworkXError, nx.link_prediction_scores, G, [0],
+                      [1], nodelist=[0, 1])
+
+    def test_errors(self):
+        G = nx.path_graph(4)
+        assert_raises(nx.NetworkXError, nx.link_prediction_scores, G, [0],
+                      [1], 'unknown')
+        assert_raises(ValueError, nx.link_prediction_scores, G, [0], [1, 2])
+        assert_raises(ValueError, nx.top_k_links, G, 0)
+        assert_raises(nx.NetworkXNotImplemented, nx.top_k_links,
+                      nx.DiGraph(G), 1)
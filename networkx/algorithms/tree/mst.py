@@ -17,6 +17,7 @@ __all__ = [
 ]
 
 from heapq import heappop, heappush
+from functools import partial
 from itertools import count
 
 import networkx as nx
@@ -57,37 +58,59 @@ def kruskal_mst_edges(G, minimum, weight='weight', keys=True, data=True):
                 subtrees.union(u, v)
 
 
-def prim_mst_edges(G, minimum, weight='weight', keys=True, data=True):
+def prim_mst_edges(G, minimum, weight='weight', keys=True, data=True,
+                   heap=None):
     is_multigraph = G.is_multigraph()
-    push = heappush
-    pop = heappop
-
-    nodes = list(G)
-    c = count()
-
     sign = 1
     if not minimum:
         sign = -1
 
-    while nodes:
-        u = nodes.pop(0)
+    if heap is None:
+        edges = _prim_lazy_edges(G, sign, weight)
+    else:
+        edges = _prim_heap_edges(G, sign, weight, heap)
+    for u, v, k in edges:
+        # Multigraphs need to handle edge keys in addition to edge data.
+        if is_multigraph and keys:
+            if data:
+                yield u, v, k, G[u][v]
+            else:
+                yield u, v, k
+        else:
+            if data:
+                yield u, v, G[u][v]
+            else:
+                yield u, v
+
+
+def _prim_lazy_edges(G, sign, weight):
+    """Generate the (u, v, key) edges found by Prim's algorithm, with a
+    heapq frontier holding every edge leaving the tree.
+
+    Edge keys are None if `G` is not a multigraph.
+    """
+    is_multigraph = G.is_multigraph()
+    push = heappush
+    pop = heappop
+    c = count()
+    visited = set()
+
+    for root in G:
+        if root in visited:
+            continue
         frontier = []
-        visited = [u]
+        visited.add(root)
         if is_multigraph:
-            for u, v, k, d in G.edges(u, keys=True, data=True):
+            for u, v, k, d in G.edges(root, keys=True, data=True):
                 push(frontier, (d.get(weight, 1) * sign, next(c), u, v, k))
         else:
-            for u, v, d in G.edges(u, data=True):
-                push(frontier, (d.get(weight, 1) * sign, next(c), u, v))
+            for u, v, d in G.edges(root, data=True):
+                push(frontier, (d.get(weight, 1) * sign, next(c), u, v, None))
         while frontier:
-            if is_multigraph:
-                W, _, u, v, k = pop(frontier)
-            else:
-                W, _, u, v = pop(frontier)
+            W, _, u, v, k = pop(frontier)
             if v in visited:
                 continue
-            visited.append(v)
-            nodes.remove(v)
+            visited.add(v)
             if is_multigraph:
                 for _, w, k2, d2 in G.edges(v, keys=True, data=True):
                     if w in visited:
@@ -99,18 +122,46 @@ def prim_mst_edges(G, minimum, weight='weight', keys=True, data=True):
                     if w in visited:
                         continue
                     new_weight = d2.get(weight, 1) * sign
-                    push(frontier, (new_weight, next(c), v, w))
-            # Multigraphs need to handle edge keys in addition to edge data.
-            if is_multigraph and keys:
-                if data:
-                    yield u, v, k, G[u][v]
-                else:
-                    yield u, v, k
+                    push(frontier, (new_weight, next(c), v, w, None))
+            yield u, v, k
+
+
+def _prim_heap_edges(G, sign, weight, heap):
+    """Generate the (u, v, key) edges found by Prim's algorithm, with a
+    :class:`~networkx.utils.heaps.MinHeap` frontier holding the lightest
+    edge from the tree to each node.
+
+    Edge keys are None if `G` is not a multigraph.
+    """
+    is_multigraph = G.is_multigraph()
+    visited = set()
+
+    for v in G:
+        if v in visited:
+            continue
+        frontier = heap()
+        # Maps the nodes in the frontier to their lightest edge.
+        best = {}
+        visited.add(v)
+        while True:
+            if is_multigraph:
+                for _, w, k, d in G.edges(v, keys=True, data=True):
+                    if w in visited:
+                        continue
+                    if frontier.insert(w, d.get(weight, 1) * sign):
+                        best[w] = (v, k)
             else:
-                if data:
-                    yield u, v, G[u][v]
-                else:
-                    yield u, v
+                for w, d in G.adj[v].items():
+                    if w in visited:
+                        continue
+                    if frontier.insert(w, d.get(weight, 1) * sign):
+                        best[w] = (v, None)
+            if not frontier:
+                break
+            v, _ = frontier.pop()
+            visited.add(v)
+            u, k = best.pop(v)
+            yield u, v, k
 
 ALGORITHMS = {
     'kruskal': kruskal_mst_edges,
@@ -118,20 +169,29 @@ ALGORITHMS = {
 }
 
 
-@not_implemented_for('directed')
-def _spanning_edges(G, minimum, algorithm='kruskal', weight='weight',
-                    keys=True, data=True):
+def _algorithm(algorithm, heap):
+    """Return the spanning edges function of `algorithm`, using `heap`."""
     try:
         algo = ALGORITHMS[algorithm]
     except KeyError:
         msg = '{} is not a valid choice for an algorithm.'.format(algorithm)
         raise ValueError(msg)
+    if heap is not None:
+        if algo is not prim_mst_edges:
+            raise ValueError("heap can only be used with Prim's algorithm.")
+        algo = partial(prim_mst_edges, heap=heap)
+    return algo
 
+
+@not_implemented_for('directed')
+def _spanning_edges(G, minimum, algorithm='kruskal', weight='weight',
+                    keys=True, data=True, heap=None):
+    algo = _algorithm(algorithm, heap)
     return algo(G, minimum=minimum, weight=weight, keys=keys, data=data)
 
 
 def minimum_spanning_edges(G, algorithm='kruskal', weight='weight', keys=True,
-                           data=True):
+                           data=True, heap=None):
     """Generate edges in a minimum spanning forest of an undirected
     weighted graph.
 
@@ -159,6 +219,14 @@ def minimum_spanning_edges(G, algorithm='kruskal', weight='weight', keys=True,
     data : bool, optional
        If True yield the edge data along with the edge.
 
+    heap : callable, optional
+       The priority queue of Prim's algorithm: a subclass of
+       :class:`~networkx.utils.heaps.MinHeap`, such as
+       :class:`~networkx.utils.heaps.DaryHeap`, or any function returning
+       an empty one.  It then holds the lightest edge to each node
+       adjacent to the tree, instead of every edge leaving the tree as
+       the default :mod:`heapq` list does.  Only valid with 'prim'.
+
     Returns
     -------
     edges : iterator
@@ -209,10 +277,11 @@ def minimum_spanning_edges(G, algorithm='kruskal', weight='weight', keys=True,
     http://www.ics.uci.edu/~eppstein/PADS/
     """
     return _spanning_edges(G, minimum=True, algorithm=algorithm,
-                           weight=weight, keys=keys, data=data)
+                           weight=weight, keys=keys, data=data, heap=heap)
 
 
-def maximum_spanning_edges(G, algorithm='kruskal', weight='weight', data=True):
+def maximum_spanning_edges(G, algorithm='kruskal', weight='weight', data=True,
+                           heap=None):
     """Generate edges in a maximum spanning forest of an undirected
     weighted graph.
 
@@ -240,6 +309,14 @@ def maximum_spanning_edges(G, algorithm='kruskal', weight='weight', data=True):
     data : bool, optional
        If True yield the edge data along with the edge.
 
+    heap : callable, optional
+       The priority queue of Prim's algorithm: a subclass of
+       :class:`~networkx.utils.heaps.MinHeap`, such as
+       :class:`~networkx.utils.heaps.DaryHeap`, or any function returning
+       an empty one.  It then holds the lightest edge to each node
+       adjacent to the tree, instead of every edge leaving the tree as
+       the default :mod:`heapq` list does.  Only valid with 'prim'.
+
     Returns
     -------
     edges : iterator
@@ -288,16 +365,13 @@ def maximum_spanning_edges(G, algorithm='kruskal', weight='weight', data=True):
     http://www.ics.uci.edu/~eppstein/PADS/
     """
     return _spanning_edges(G, minimum=False, algorithm=algorithm,
-                           weight=weight, data=data)
+                           weight=weight, data=data, heap=heap)
 
 
 @not_implemented_for('directed')
-def _optimum_spanning_tree(G, algorithm, minimum, weight='weight'):
-    try:
-        algo = ALGORITHMS[algorithm]
-    except KeyError:
-        msg = '{} is not a valid choice for an algorithm.'.format(algorithm)
-        raise ValueError(msg)
+def _optimum_spanning_tree(G, algorithm, minimum, weight='weight',
+                           heap=None):
+    algo = _algorithm(algorithm, heap)
 
     # When creating the spanning tree, we can ignore the key used to
     # identify multigraph edges, since a tree is guaranteed to have no
@@ -317,7 +391,7 @@ def _optimum_spanning_tree(G, algorithm, minimum, weight='weight'):
     return T
 
 
-def minimum_spanning_tree(G, weight='weight', algorithm='kruskal'):
+def minimum_spanning_tree(G, weight='weight', algorithm='kruskal', heap=None):
     """Returns a minimum spanning tree or forest on an undirected graph `G`.
 
     Parameters
@@ -333,6 +407,14 @@ def minimum_spanning_tree(G, weight='weight', algorithm='kruskal'):
         The algorithm to use when finding a minimum spanning tree. Valid
         choices are 'kruskal' or 'prim'.
 
+    heap : callable, optional
+        The priority queue of Prim's algorithm: a subclass of
+        :class:`~networkx.utils.heaps.MinHeap`, such as
+        :class:`~networkx.utils.heaps.DaryHeap`, or any function returning
+        an empty one.  It then holds the lightest edge to each node
+        adjacent to the tree, instead of every edge leaving the tree as
+        the default :mod:`heapq` list does.  Only valid with 'prim'.
+
 
     Returns
     -------
@@ -359,10 +441,10 @@ def minimum_spanning_tree(G, weight='weight', algorithm='kruskal'):
 
     """
     return _optimum_spanning_tree(G, algorithm=algorithm, minimum=True,
-                                  weight=weight)
+                                  weight=weight, heap=heap)
 
 
-def maximum_spanning_tree(G, weight='weight', algorithm='kruskal'):
+def maximum_spanning_tree(G, weight='weight', algorithm='kruskal', heap=None):
     """Returns a maximum spanning tree or forest on an undirected graph `G`.
 
     Parameters
@@ -378,6 +460,14 @@ def maximum_spanning_tree(G, weight='weight', algorithm='kruskal'):
         The algorithm to use when finding a minimum spanning tree. Valid
         choices are 'kruskal' or 'prim'.
 
+    heap : callable, optional
+        The priority queue of Prim's algorithm: a subclass of
+        :class:`~networkx.utils.heaps.MinHeap`, such as
+        :class:`~networkx.utils.heaps.DaryHeap`, or any function returning
+        an empty one.  It then holds the lightest edge to each node
+        adjacent to the tree, instead of every edge leaving the tree as
+        the default :mod:`heapq` list does.  Only valid with 'prim'.
+
 
     Returns
     -------
@@ -404,4 +494,4 @@ def maximum_spanning_tree(G, weight='weight', algorithm='kruskal'):
 
     """
     return _optimum_spanning_tree(G, algorithm=algorithm, minimum=False,
-                                  weight=weight)
+                                  weight=weight, heap=heap)
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 from nose.tools import *
 import networkx as nx
+from networkx.algorithms.tree.mst import prim_mst_edges
 
 
 class TestMST:
@@ -242,6 +243,35 @@ class TestMST:
         assert_equal(sorted(T.edges()), [(1, 2), (1, 3)])
         assert_equal(sorted(T.nodes()), [1, 2, 3, 13])
 
+    def test_prim_heap(self):
+        for heap in (nx.utils.DaryHeap, nx.utils.BinaryHeap,
+                     nx.utils.PairingHeap):
+            edgelist = sorted((min(u, v), max(u, v), d) for u, v, d in
+                              nx.minimum_spanning_edges(self.G,
+                                                        algorithm='prim',
+                                                        heap=heap))
+            assert_equal(edgelist, self.minimum_spanning_edgelist)
+            T = nx.maximum_spanning_tree(self.G, algorithm='prim', heap=heap)
+            assert_equal(sorted((min(u, v), max(u, v)) for u, v in T.edges()),
+                         [(u, v) for u, v, d in self.maximum_spanning_edgelist])
+
+    def test_prim_dary_heap_order(self):
+        # Ties are broken as with the default heapq list.
+        G = nx.disjoint_union(nx.grid_2d_graph(5, 5), nx.cycle_graph(4))
+        G.add_edge(0, 3, weight=2)
+        M = nx.MultiGraph(G)
+        M.add_edge(1, 2, weight=0)
+        for H in (G, M):
+            for minimum in (True, False):
+                assert_equal(
+                    list(prim_mst_edges(H, minimum, data=False,
+                                           heap=nx.utils.DaryHeap)),
+                    list(prim_mst_edges(H, minimum, data=False)))
+
+    @raises(ValueError)
+    def test_kruskal_heap(self):
+        nx.minimum_spanning_tree(self.G, heap=nx.utils.DaryHeap)
+
     @raises(ValueError)
     def test_wrong_value(self):
         nx.minimum_spanning_tree(self.G, algorithm='random')
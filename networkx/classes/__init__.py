@@ -3,5 +3,7 @@ from .digraph import DiGraph
 from .multigraph import MultiGraph
 from .multidigraph import MultiDiGraph
 from .ordered import *
+from .csrgraph import *
+from .graphviews import *
 
 from .function import *
@@ -0,0 +1,576 @@
+"""Compact, read-only graph classes backed by compressed sparse rows.
+
+:class:`CSRGraph` and :class:`CSRDiGraph` hold the structure of an existing
+graph in flat integer arrays instead of a dict-of-dicts-of-dicts.  Nodes
+are kept in a single list and numbered by position, the neighbors of each
+node are stored as a sorted slice of an index array delimited by an
+offset array, and edge attributes are stored column-wise, one column per
+attribute name.
+
+The usual read API (``G[n]``, ``G.adj``, ``G.edges()``, ``G.degree()``,
+``G.neighbors()``, ...) is available through lightweight views so that
+algorithms that only read graphs run unchanged on these classes.
+"""
+#    Copyright (C) 2016 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+from array import array
+from bisect import bisect_left
+from copy import deepcopy
+from numbers import Integral
+try:
+    from collections.abc import ItemsView, Mapping
+except ImportError:  # Python 2.7
+    from collections import ItemsView, Mapping
+
+import networkx as nx
+from networkx.classes.graph import Graph
+from networkx.classes.digraph import DiGraph
+from networkx.classes.function import frozen as _frozen
+
+__all__ = ['CSRGraph', 'CSRDiGraph']
+
+
+def _index_typecode(maxval):
+    """Return the smallest signed array typecode able to hold `maxval`."""
+    for code in ('i', 'l', 'q'):
+        try:
+            itemsize = array(code).itemsize
+        except ValueError:  # 'q' is not available on Python 2
+            continue
+        if maxval < 2 ** (8 * itemsize - 1):
+            return code
+    raise nx.NetworkXError('Graph is too large for a CSR representation.')
+
+
+def _make_column(values, size):
+    """Return a compact column for the attribute values keyed by slot.
+
+    Attributes present on every edge and holding only floats (or only
+    integers) are stored in a typed :class:`array.array`.  Any other
+    attribute is stored as a dict keyed by slot, so that edges without
+    the attribute cost nothing.
+    """
+    if len(values) == size and size > 0:
+        vals = values.values()
+        if all(isinstance(v, float) for v in vals):
+            return array('d', (values[s] for s in range(size)))
+        if all(isinstance(v, Integral) and not isinstance(v, bool)
+               for v in vals):
+            try:
+                code = _index_typecode(max(abs(v) for v in vals) + 1)
+            except nx.NetworkXError:
+                return values
+            return array(code, (values[s] for s in range(size)))
+    return values
+
+
+def _compress(nodes, index, adj):
+    """Return offset and index arrays plus edge columns for `adj`.
+
+    The neighbors of each row are sorted by node position.
+    """
+    size = sum(len(adj[u]) for u in nodes)
+    code = _index_typecode(max(size, len(nodes)))
+    indptr = array(code, [0])
+    indices = array(code)
+    raw = {}
+    slot = 0
+    for u in nodes:
+        row = sorted(adj[u].items(), key=lambda item: index[item[0]])
+        for v, data in row:
+            indices.append(index[v])
+            for key, value in data.items():
+                raw.setdefault(key, {})[slot] = value
+            slot += 1
+        indptr.append(slot)
+    columns = dict((key, _make_column(values, size))
+                   for key, values in raw.items())
+    return indptr, indices, columns
+
+
+def _transpose(indptr, indices):
+    """Return the offset, index and slot arrays of the transposed rows."""
+    n = len(indptr) - 1
+    code = indptr.typecode
+    counts = [0] * (n + 1)
+    for v in indices:
+        counts[v + 1] += 1
+    for i in range(n):
+        counts[i + 1] += counts[i]
+    tindptr = array(code, counts)
+    position = counts[:-1]
+    tindices = array(code, [0]) * len(indices)
+    slots = array(code, [0]) * len(indices)
+    for u in range(n):
+        for s in range(indptr[u], indptr[u + 1]):
+            v = indices[s]
+            p = position[v]
+            tindices[p] = u
+            slots[p] = s
+            position[v] = p + 1
+    return tindptr, tindices, slots
+
+
+class _CSREdgeData(Mapping):
+    """Read-only view of the attributes of a single edge."""
+    __slots__ = ('_columns', '_slot')
+
+    def __init__(self, columns, slot):
+        self._columns = columns
+        self._slot = slot
+
+    def __getitem__(self, key):
+        return self._columns[key][self._slot]
+
+    def __iter__(self):
+        slot = self._slot
+        return (key for key, col in self._columns.items()
+                if not isinstance(col, dict) or slot in col)
+
+    def __len__(self):
+        return sum(1 for key in self)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def copy(self):
+        return dict(self)
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return deepcopy(dict(self), memo)
+
+
+class _CSRNeighborItems(ItemsView):
+    def __iter__(self):
+        return self._mapping._iter_items()
+
+
+class _CSRNeighbors(Mapping):
+    """Read-only view of the neighbors of a node and their edge data."""
+    __slots__ = ('_adj', '_start', '_stop')
+
+    def __init__(self, adj, start, stop):
+        self._adj = adj
+        self._start = start
+        self._stop = stop
+
+    def _find(self, n):
+        adj = self._adj
+        i = adj._graph._index[n]
+        indices = adj._indices
+        s = bisect_left(indices, i, self._start, self._stop)
+        if s < self._stop and indices[s] == i:
+            return s
+        raise KeyError(n)
+
+    def _edge_slot(self, s):
+        slots = self._adj._slots
+        return s if slots is None else slots[s]
+
+    def __getitem__(self, n):
+        s = self._find(n)
+        return _CSREdgeData(self._adj._graph._columns, self._edge_slot(s))
+
+    def __contains__(self, n):
+        try:
+            self._find(n)
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def __iter__(self):
+        nodes = self._adj._graph._nodes
+        indices = self._adj._indices
+        return (nodes[indices[s]] for s in range(self._start, self._stop))
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def _iter_items(self):
+        nodes = self._adj._graph._nodes
+        columns = self._adj._graph._columns
+        indices = self._adj._indices
+        for s in range(self._start, self._stop):
+            yield nodes[indices[s]], _CSREdgeData(columns, self._edge_slot(s))
+
+    def items(self):
+        return _CSRNeighborItems(self)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+class _CSRAdjacency(Mapping):
+    """Read-only view of an adjacency structure stored as CSR arrays.
+
+    `slots` maps positions in `indices` to the columns holding the edge
+    attributes; ``None`` means positions and column slots coincide.
+    """
+
+    def __init__(self, graph, indptr, indices, slots=None):
+        self._graph = graph
+        self._indptr = indptr
+        self._indices = indices
+        self._slots = slots
+
+    def __getitem__(self, n):
+        i = self._graph._index[n]
+        return _CSRNeighbors(self, self._indptr[i], self._indptr[i + 1])
+
+    def __contains__(self, n):
+        try:
+            return n in self._graph._index
+        except TypeError:
+            return False
+
+    def __iter__(self):
+        return iter(self._graph._nodes)
+
+    def __len__(self):
+        return len(self._graph._nodes)
+
+    def __repr__(self):
+        return repr(dict((n, dict(nbrs)) for n, nbrs in self.items()))
+
+
+class _CSRNodeData(Mapping):
+    """Read-only view of node attributes.
+
+    Only nodes holding attributes are stored.  Other nodes report a new
+    empty dict.
+    """
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def __getitem__(self, n):
+        graph = self._graph
+        try:
+            return graph._node_data[n]
+        except KeyError:
+            if n in graph._index:
+                return {}
+            raise
+
+    def __contains__(self, n):
+        try:
+            return n in self._graph._index
+        except TypeError:
+            return False
+
+    def __iter__(self):
+        return iter(self._graph._nodes)
+
+    def __len__(self):
+        return len(self._graph._nodes)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def __deepcopy__(self, memo):
+        return deepcopy(dict(self.items()), memo)
+
+
+class CSRGraph(Graph):
+    """An immutable undirected graph stored in compressed sparse rows.
+
+    A CSRGraph is built from any input accepted by :class:`Graph`,
+    usually an existing graph.  Nodes are numbered in iteration order of
+    the input graph and the adjacency is kept in two integer arrays: the
+    neighbors of the node numbered ``i`` are ``indices[indptr[i]:indptr[i + 1]]``.
+    Numeric edge attributes present on all edges are kept in typed arrays
+    parallel to ``indices``, which makes the memory used per edge a small
+    fraction of that used by :class:`Graph`.
+
+    Parameters
+    ----------
+    data : input graph
+        Data to initialize graph.  If data=None (default) an empty
+        graph is created.  The data can be any format accepted by
+        :class:`Graph`, typically another NetworkX graph.
+
+    attr : keyword arguments, optional (default= no attributes)
+        Attributes to add to graph as key=value pairs.
+
+    See Also
+    --------
+    CSRDiGraph
+    Graph
+    freeze
+
+    Notes
+    -----
+    The graph cannot be modified: methods adding or removing nodes and
+    edges raise :exc:`NetworkXError`.  ``G[u]``, ``G.adj`` and
+    ``G[u][v]`` return read-only views instead of dicts.  Assigning to an
+    edge attribute view is not possible; to change a graph convert it
+    back with ``nx.Graph(G)``.
+
+    Multigraphs are not supported.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> G.add_edge(1, 2, weight=3.0)
+    >>> H = nx.CSRGraph(G)
+    >>> sorted(H[1])
+    [0, 2]
+    >>> H[1][2]['weight']
+    3.0
+    >>> list(H.degree())
+    [(0, 1), (1, 2), (2, 2), (3, 1)]
+    >>> nx.shortest_path(H, 0, 3)
+    [0, 1, 2, 3]
+    >>> try:
+    ...     H.add_edge(0, 3)
+    ... except nx.NetworkXError as e:
+    ...     print(str(e))
+    Frozen graph can't be modified
+    """
+    frozen = True
+
+    def __init__(self, data=None, **attr):
+        if data is None:
+            data = self._source_class()()
+        elif not (hasattr(data, 'adj') and hasattr(data, 'node')):
+            data = self._source_class()(data)
+        if data.is_multigraph():
+            raise nx.NetworkXError('CSR graphs do not support multigraphs.')
+        self.graph = dict(getattr(data, 'graph', {}))
+        self.graph.update(attr)
+        self._nodes = list(data)
+        self._index = dict((n, i) for i, n in enumerate(self._nodes))
+        self._node_data = dict((n, dd.copy())
+                               for n, dd in data.node.items() if dd)
+        self.node = _CSRNodeData(self)
+        self._build(data)
+        self.edge = self.adj
+
+    @classmethod
+    def _from_arrays(cls, nodes, indptr, indices, columns, number_of_edges,
+                     node_data=None, graph=None, pred=None):
+        """Return a graph wrapping existing CSR arrays without copying them.
+
+        The arrays can be any integer sequences supporting indexing and
+        slicing, such as :class:`array.array` or memory-mapped NumPy
+        arrays.  `pred` holds the predecessor offset, index and slot
+        arrays of a :class:`CSRDiGraph`.
+        """
+        G = cls.__new__(cls)
+        G.graph = {} if graph is None else graph
+        G._nodes = list(nodes)
+        G._index = dict((n, i) for i, n in enumerate(G._nodes))
+        G._node_data = {} if node_data is None else node_data
+        G.node = _CSRNodeData(G)
+        G._columns = columns
+        G.adj = G.edge = _CSRAdjacency(G, indptr, indices)
+        if pred is not None:
+            G.succ = G.adj
+            G.pred = _CSRAdjacency(G, *pred)
+        G._number_of_edges = number_of_edges
+        return G
+
+    def _source_class(self):
+        return nx.Graph
+
+    def _build(self, data):
+        indptr, indices, self._columns = _compress(self._nodes, self._index,
+                                                   data.adj)
+        self.adj = _CSRAdjacency(self, indptr, indices)
+        loops = sum(1 for u in self._nodes if u in self.adj[u])
+        self._number_of_edges = (len(indices) + loops) // 2
+
+    def __contains__(self, n):
+        try:
+            return n in self._index
+        except TypeError:
+            return False
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    add_node = _frozen
+    add_nodes_from = _frozen
+    remove_node = _frozen
+    remove_nodes_from = _frozen
+    add_edge = _frozen
+    add_edges_from = _frozen
+    add_weighted_edges_from = _frozen
+    remove_edge = _frozen
+    remove_edges_from = _frozen
+    clear = _frozen
+
+    def number_of_edges(self, u=None, v=None):
+        if u is None:
+            return self._number_of_edges
+        return super(CSRGraph, self).number_of_edges(u, v)
+
+    number_of_edges.__doc__ = Graph.number_of_edges.__doc__
+
+    def index(self, n):
+        """Return the position of node `n` in the CSR arrays.
+
+        Raises
+        ------
+        NetworkXError
+            If the node `n` is not in the graph.
+        """
+        try:
+            return self._index[n]
+        except (KeyError, TypeError):
+            raise nx.NetworkXError("The node %s is not in the graph." % (n,))
+
+    def fresh_copy(self):
+        """Return a new empty mutable graph of the matching class."""
+        return self._source_class()()
+
+    def to_graph(self):
+        """Return a mutable dict-of-dicts copy of the graph."""
+        H = self._source_class()(self)
+        H.graph = deepcopy(self.graph)
+        return H
+
+    def subgraph(self, nbunch):
+        """Return the subgraph induced on nodes in nbunch.
+
+        The induced subgraph is a new compact graph of the same class with
+        copies of the node and edge attributes.  The graph attribute dict
+        is shared with this graph.
+        """
+        bunch = set(self.nbunch_iter(nbunch))
+        H = self.fresh_copy()
+        H.add_nodes_from((n, self.node[n]) for n in self._nodes if n in bunch)
+        H.add_edges_from((u, v, d) for u, v, d in self.edges(bunch, data=True)
+                         if v in bunch)
+        H = self.__class__(H)
+        H.graph = self.graph
+        return H
+
+    def edge_subgraph(self, edges):
+        """Return the subgraph induced by the specified edges.
+
+        The induced subgraph is a new compact graph of the same class with
+        copies of the node and edge attributes.  The graph attribute dict
+        is shared with this graph.
+        """
+        H = self.fresh_copy()
+        adj = self.adj
+        for u, v in edges:
+            if u in adj and v in adj[u]:
+                H.add_node(u, self.node[u])
+                H.add_node(v, self.node[v])
+                H.add_edge(u, v, dict(adj[u][v]))
+        H = self.__class__(H)
+        H.graph = self.graph
+        return H
+
+    def to_directed(self):
+        """Return a directed compact representation of the graph.
+
+        See :meth:`Graph.to_directed`.
+        """
+        return CSRDiGraph(Graph.to_directed(self))
+
+    def to_undirected(self):
+        """Return an undirected copy of the graph.
+
+        See :meth:`Graph.to_undirected`.
+        """
+        return deepcopy(self)
+
+
+class CSRDiGraph(CSRGraph, DiGraph):
+    """An immutable directed graph stored in compressed sparse rows.
+
+    Successors and predecessors are both stored as CSR arrays.  Edge
+    attributes are kept once, in columns parallel to the successor
+    arrays, and the predecessor arrays refer to them.
+
+    Parameters
+    ----------
+    data : input graph
+        Data to initialize graph.  If data=None (default) an empty
+        graph is created.  The data can be any format accepted by
+        :class:`DiGraph`, typically another NetworkX graph.
+
+    attr : keyword arguments, optional (default= no attributes)
+        Attributes to add to graph as key=value pairs.
+
+    See Also
+    --------
+    CSRGraph
+    DiGraph
+
+    Examples
+    --------
+    >>> G = nx.DiGraph([(0, 1), (1, 2), (2, 0)])
+    >>> H = nx.CSRDiGraph(G)
+    >>> list(H.successors(0)), list(H.predecessors(0))
+    ([1], [2])
+    >>> sorted(H.reverse().edges())
+    [(0, 2), (1, 0), (2, 1)]
+    """
+
+    def _source_class(self):
+        return nx.DiGraph
+
+    def _build(self, data):
+        indptr, indices, self._columns = _compress(self._nodes, self._index,
+                                                   data.succ)
+        self.succ = self.adj = _CSRAdjacency(self, indptr, indices)
+        self.pred = _CSRAdjacency(self, *_transpose(indptr, indices))
+        self._number_of_edges = len(indices)
+
+    def reverse(self, copy=True):
+        """Return the reverse of the graph.
+
+        The reversed graph shares the CSR arrays and the edge attribute
+        columns of this graph, so it is built in constant time.
+
+        Parameters
+        ----------
+        copy : bool optional (default=True)
+            Must be True: CSR graphs cannot be reversed in place.
+
+        Raises
+        ------
+        NetworkXError
+            If `copy` is False.
+        """
+        if not copy:
+            _frozen()
+        H = self.__class__.__new__(self.__class__)
+        H.__dict__.update(self.__dict__)
+        H.graph = deepcopy(self.graph)
+        H.graph['name'] = "Reverse of (%s)" % self.name
+        H._node_data = deepcopy(self._node_data)
+        H.node = _CSRNodeData(H)
+        succ, pred = self.succ, self.pred
+        H.succ = H.adj = H.edge = _CSRAdjacency(H, pred._indptr,
+                                               pred._indices, pred._slots)
+        H.pred = _CSRAdjacency(H, succ._indptr, succ._indices, succ._slots)
+        return H
+
+    def to_directed(self):
+        """Return a copy of the graph.
+
+        See :meth:`DiGraph.to_directed`.
+        """
+        return deepcopy(self)
+
+    def to_undirected(self, reciprocal=False):
+        """Return an undirected compact representation of the graph.
+
+        See :meth:`DiGraph.to_undirected`.
+        """
+        return CSRGraph(DiGraph.to_undirected(self, reciprocal=reciprocal))
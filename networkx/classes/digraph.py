@@ -352,6 +352,7 @@ class DiGraph(Graph):
             self.node[n] = attr_dict
         else: # update attr even if node already exists
             self.node[n].update(attr_dict)
+        self._version += 1
 
 
     def add_nodes_from(self, nodes, **attr):
@@ -399,29 +400,33 @@ class DiGraph(Graph):
         11
 
         """
-        for n in nodes:
-            # keep all this inside try/except because
-            # CPython throws TypeError on n not in self.succ,
-            # while pre-2.7.5 ironpython throws on self.succ[n] 
-            try:
-                if n not in self.succ:
-                    self.succ[n] = self.adjlist_dict_factory()
-                    self.pred[n] = self.adjlist_dict_factory()
-                    self.node[n] = attr.copy()
-                else:
-                    self.node[n].update(attr)
-            except TypeError:
-                nn,ndict = n
-                if nn not in self.succ:
-                    self.succ[nn] = self.adjlist_dict_factory()
-                    self.pred[nn] = self.adjlist_dict_factory()
-                    newdict = attr.copy()
-                    newdict.update(ndict)
-                    self.node[nn] = newdict
-                else:
-                    olddict = self.node[nn]
-                    olddict.update(attr)
-                    olddict.update(ndict)
+        try:
+            for n in nodes:
+                # keep all this inside try/except because
+                # CPython throws TypeError on n not in self.succ,
+                # while pre-2.7.5 ironpython throws on self.succ[n] 
+                try:
+                    if n not in self.succ:
+                        self.succ[n] = self.adjlist_dict_factory()
+                        self.pred[n] = self.adjlist_dict_factory()
+                        self.node[n] = attr.copy()
+                    else:
+                        self.node[n].update(attr)
+                except TypeError:
+                    nn,ndict = n
+                    if nn not in self.succ:
+                        self.succ[nn] = self.adjlist_dict_factory()
+                        self.pred[nn] = self.adjlist_dict_factory()
+                        newdict = attr.copy()
+                        newdict.update(ndict)
+                        self.node[nn] = newdict
+                    else:
+                        olddict = self.node[nn]
+                        olddict.update(attr)
+                        olddict.update(ndict)
+        finally:
+            # The items before a failing one are already applied.
+            self._version += 1
 
     def remove_node(self, n):
         """Remove node n.
@@ -464,6 +469,7 @@ class DiGraph(Graph):
         for u in self.pred[n]:
             del self.succ[u][n] # remove all edges n-u in digraph
         del self.pred[n]          # remove node from pred
+        self._version += 1
 
 
     def remove_nodes_from(self, nbunch):
@@ -491,18 +497,22 @@ class DiGraph(Graph):
         []
 
         """
-        for n in nbunch:
-            try:
-                succs=self.succ[n]
-                del self.node[n]
-                for u in succs:
-                    del self.pred[u][n] # remove all edges n-u in digraph
-                del self.succ[n]          # now remove node
-                for u in self.pred[n]:
-                    del self.succ[u][n] # remove all edges n-u in digraph
-                del self.pred[n]          # now remove node
-            except KeyError:
-                pass # silent failure on remove
+        try:
+            for n in nbunch:
+                try:
+                    succs=self.succ[n]
+                    del self.node[n]
+                    for u in succs:
+                        del self.pred[u][n] # remove all edges n-u in digraph
+                    del self.succ[n]          # now remove node
+                    for u in self.pred[n]:
+                        del self.succ[u][n] # remove all edges n-u in digraph
+                    del self.pred[n]          # now remove node
+                except KeyError:
+                    pass # silent failure on remove
+        finally:
+            # The items before a failing one are already applied.
+            self._version += 1
 
 
     def add_edge(self, u, v, attr_dict=None, **attr):
@@ -576,6 +586,7 @@ class DiGraph(Graph):
         datadict.update(attr_dict)
         self.succ[u][v]=datadict
         self.pred[v][u]=datadict
+        self._version += 1
 
     def add_edges_from(self, ebunch, attr_dict=None, **attr):
         """Add all the edges in ebunch.
@@ -628,30 +639,33 @@ class DiGraph(Graph):
                 raise NetworkXError(\
                     "The attr_dict argument must be a dict.")
         # process ebunch
-        for e in ebunch:
-            ne = len(e)
-            if ne==3:
-                u,v,dd = e
-                assert hasattr(dd,"update")
-            elif ne==2:
-                u,v = e
-                dd = {}
-            else:
-                raise NetworkXError(\
-                    "Edge tuple %s must be a 2-tuple or 3-tuple."%(e,))
-            if u not in self.succ:
-                self.succ[u] = self.adjlist_dict_factory()
-                self.pred[u] = self.adjlist_dict_factory()
-                self.node[u] = {}
-            if v not in self.succ:
-                self.succ[v] = self.adjlist_dict_factory()
-                self.pred[v] = self.adjlist_dict_factory()
-                self.node[v] = {}
-            datadict=self.adj[u].get(v,self.edge_attr_dict_factory())
-            datadict.update(attr_dict)
-            datadict.update(dd)
-            self.succ[u][v] = datadict
-            self.pred[v][u] = datadict
+        try:
+            for e in ebunch:
+                ne = len(e)
+                if ne==3:
+                    u,v,dd = e
+                elif ne==2:
+                    u,v = e
+                    dd = {}
+                else:
+                    raise NetworkXError(\
+                        "Edge tuple %s must be a 2-tuple or 3-tuple."%(e,))
+                if u not in self.succ:
+                    self.succ[u] = self.adjlist_dict_factory()
+                    self.pred[u] = self.adjlist_dict_factory()
+                    self.node[u] = {}
+                if v not in self.succ:
+                    self.succ[v] = self.adjlist_dict_factory()
+                    self.pred[v] = self.adjlist_dict_factory()
+                    self.node[v] = {}
+                datadict=self.adj[u].get(v,self.edge_attr_dict_factory())
+                datadict.update(attr_dict)
+                datadict.update(dd)
+                self.succ[u][v] = datadict
+                self.pred[v][u] = datadict
+        finally:
+            # The items before a failing one are already applied.
+            self._version += 1
 
 
     def remove_edge(self, u, v):
@@ -686,6 +700,7 @@ class DiGraph(Graph):
             del self.pred[v][u]
         except KeyError:
             raise NetworkXError("The edge %s-%s not in graph."%(u,v))
+        self._version += 1
 
 
     def remove_edges_from(self, ebunch):
@@ -714,11 +729,15 @@ class DiGraph(Graph):
         >>> ebunch=[(1,2),(2,3)]
         >>> G.remove_edges_from(ebunch)
         """
-        for e in ebunch:
-            (u,v)=e[:2]  # ignore edge data
-            if u in self.succ and v in self.succ[u]:
-                del self.succ[u][v]
-                del self.pred[v][u]
+        try:
+            for e in ebunch:
+                (u,v)=e[:2]  # ignore edge data
+                if u in self.succ and v in self.succ[u]:
+                    del self.succ[u][v]
+                    del self.pred[v][u]
+        finally:
+            # The items before a failing one are already applied.
+            self._version += 1
 
 
     def has_successor(self, u, v):
@@ -1084,6 +1103,7 @@ class DiGraph(Graph):
         self.pred.clear()
         self.node.clear()
         self.graph.clear()
+        self._version += 1
 
 
     def is_multigraph(self):
@@ -1205,7 +1225,8 @@ class DiGraph(Graph):
             the original graph (this changes the original graph).
         """
         if copy:
-            H = self.__class__(name="Reverse of (%s)"%self.name)
+            H = self.fresh_copy()
+            H.name = "Reverse of (%s)" % self.name
             H.add_nodes_from(self)
             H.add_edges_from( (v,u,deepcopy(d)) for u,v,d
                               in self.edges(data=True) )
@@ -1214,6 +1235,7 @@ class DiGraph(Graph):
         else:
             self.pred,self.succ=self.succ,self.pred
             self.adj=self.succ
+            self._version += 1
             H=self
         return H
 
@@ -1258,7 +1280,7 @@ class DiGraph(Graph):
         """
         bunch = self.nbunch_iter(nbunch)
         # create new graph and copy subgraph into it
-        H = self.__class__()
+        H = self.fresh_copy()
         # copy node and attribute dictionaries
         for n in bunch:
             H.node[n]=self.node[n]
@@ -1326,7 +1348,7 @@ class DiGraph(Graph):
         [(0, 1), (3, 4)]
 
         """
-        H = self.__class__()
+        H = self.fresh_copy()
         succ = self.succ
         # Filter out edges that don't correspond to nodes in the graph.
         edges = ((u, v) for u, v in edges if u in succ and v in succ[u])
@@ -1339,10 +1361,10 @@ class DiGraph(Graph):
                 H.node[v] = self.node[v]
             # Create an entry in the successors and predecessors
             # dictionary for the nodes u and v if they don't exist yet.
-            if u not in H.succ:
-                H.succ[u] = H.adjlist_dict_factory()
-            if v not in H.pred:
-                H.pred[v] = H.adjlist_dict_factory()
+            for n in (u, v):
+                if n not in H.succ:
+                    H.succ[n] = H.adjlist_dict_factory()
+                    H.pred[n] = H.adjlist_dict_factory()
             # Copy the edge attributes.
             H.edge[u][v] = self.edge[u][v]
             H.pred[v][u] = self.pred[v][u]
@@ -317,7 +317,7 @@ def create_empty_copy(G, with_data=True):
     empty_graph
 
     """
-    H = G.__class__()
+    H = G.fresh_copy()
     H.add_nodes_from(G.nodes(data=with_data))
     if with_data:
         H.graph.update(G.graph)
@@ -257,6 +257,11 @@ class Graph(object):
     adjlist_dict_factory = dict
     edge_attr_dict_factory = dict
 
+    # Number of changes made to the graph through its methods. Data derived
+    # from a graph, such as the matrices cached by `cache_matrices`, is up
+    # to date as long as the version of the graph does not change.
+    _version = 0
+
     def __init__(self, data=None, **attr):
         """Initialize a graph with edges, name, graph attributes.
 
@@ -462,6 +467,7 @@ class Graph(object):
             self.node[n] = attr_dict
         else:  # update attr even if node already exists
             self.node[n].update(attr_dict)
+        self._version += 1
 
     def add_nodes_from(self, nodes, **attr):
         """Add multiple nodes.
@@ -508,27 +514,31 @@ class Graph(object):
         11
 
         """
-        for n in nodes:
-            # keep all this inside try/except because
-            # CPython throws TypeError on n not in self.node,
-            # while pre-2.7.5 ironpython throws on self.adj[n]
-            try:
-                if n not in self.node:
-                    self.adj[n] = self.adjlist_dict_factory()
-                    self.node[n] = attr.copy()
-                else:
-                    self.node[n].update(attr)
-            except TypeError:
-                nn, ndict = n
-                if nn not in self.node:
-                    self.adj[nn] = self.adjlist_dict_factory()
-                    newdict = attr.copy()
-                    newdict.update(ndict)
-                    self.node[nn] = newdict
-                else:
-                    olddict = self.node[nn]
-                    olddict.update(attr)
-                    olddict.update(ndict)
+        try:
+            for n in nodes:
+                # keep all this inside try/except because
+                # CPython throws TypeError on n not in self.node,
+                # while pre-2.7.5 ironpython throws on self.adj[n]
+                try:
+                    if n not in self.node:
+                        self.adj[n] = self.adjlist_dict_factory()
+                        self.node[n] = attr.copy()
+                    else:
+                        self.node[n].update(attr)
+                except TypeError:
+                    nn, ndict = n
+                    if nn not in self.node:
+                        self.adj[nn] = self.adjlist_dict_factory()
+                        newdict = attr.copy()
+                        newdict.update(ndict)
+                        self.node[nn] = newdict
+                    else:
+                        olddict = self.node[nn]
+                        olddict.update(attr)
+                        olddict.update(ndict)
+        finally:
+            # The items before a failing one are already applied.
+            self._version += 1
 
     def remove_node(self, n):
         """Remove node n.
@@ -569,6 +579,7 @@ class Graph(object):
         for u in nbrs:
             del adj[u][n]   # remove all edges n-u in graph
         del adj[n]          # now remove node
+        self._version += 1
 
     def remove_nodes_from(self, nodes):
         """Remove multiple nodes.
@@ -596,14 +607,18 @@ class Graph(object):
 
         """
         adj = self.adj
-        for n in nodes:
-            try:
-                del self.node[n]
-                for u in list(adj[n].keys()):   # keys() handles self-loops
-                    del adj[u][n]  # (allows mutation of dict in loop)
-                del adj[n]
-            except KeyError:
-                pass
+        try:
+            for n in nodes:
+                try:
+                    del self.node[n]
+                    for u in list(adj[n].keys()):   # keys() handles self-loops
+                        del adj[u][n]  # (allows mutation of dict in loop)
+                    del adj[n]
+                except KeyError:
+                    pass
+        finally:
+            # The items before a failing one are already applied.
+            self._version += 1
 
     def nodes(self, data=False, default=None):
         """Returns an iterator over the nodes.
@@ -809,6 +824,7 @@ class Graph(object):
         datadict.update(attr_dict)
         self.adj[u][v] = datadict
         self.adj[v][u] = datadict
+        self._version += 1
 
     def add_edges_from(self, ebunch, attr_dict=None, **attr):
         """Add all the edges in ebunch.
@@ -861,27 +877,31 @@ class Graph(object):
                 raise NetworkXError(
                     "The attr_dict argument must be a dictionary.")
         # process ebunch
-        for e in ebunch:
-            ne = len(e)
-            if ne == 3:
-                u, v, dd = e
-            elif ne == 2:
-                u, v = e
-                dd = {}  # doesnt need edge_attr_dict_factory
-            else:
-                raise NetworkXError(
-                    "Edge tuple %s must be a 2-tuple or 3-tuple." % (e,))
-            if u not in self.node:
-                self.adj[u] = self.adjlist_dict_factory()
-                self.node[u] = {}
-            if v not in self.node:
-                self.adj[v] = self.adjlist_dict_factory()
-                self.node[v] = {}
-            datadict = self.adj[u].get(v, self.edge_attr_dict_factory())
-            datadict.update(attr_dict)
-            datadict.update(dd)
-            self.adj[u][v] = datadict
-            self.adj[v][u] = datadict
+        try:
+            for e in ebunch:
+                ne = len(e)
+                if ne == 3:
+                    u, v, dd = e
+                elif ne == 2:
+                    u, v = e
+                    dd = {}  # doesnt need edge_attr_dict_factory
+                else:
+                    raise NetworkXError(
+                        "Edge tuple %s must be a 2-tuple or 3-tuple." % (e,))
+                if u not in self.node:
+                    self.adj[u] = self.adjlist_dict_factory()
+                    self.node[u] = {}
+                if v not in self.node:
+                    self.adj[v] = self.adjlist_dict_factory()
+                    self.node[v] = {}
+                datadict = self.adj[u].get(v, self.edge_attr_dict_factory())
+                datadict.update(attr_dict)
+                datadict.update(dd)
+                self.adj[u][v] = datadict
+                self.adj[v][u] = datadict
+        finally:
+            # The items before a failing one are already applied.
+            self._version += 1
 
     def add_weighted_edges_from(self, ebunch, weight='weight', **attr):
         """Add all the edges in ebunch as weighted edges with specified
@@ -949,6 +969,7 @@ class Graph(object):
                 del self.adj[v][u]
         except KeyError:
             raise NetworkXError("The edge %s-%s is not in the graph" % (u, v))
+        self._version += 1
 
     def remove_edges_from(self, ebunch):
         """Remove all edges specified in ebunch.
@@ -977,12 +998,16 @@ class Graph(object):
         >>> G.remove_edges_from(ebunch)
         """
         adj = self.adj
-        for e in ebunch:
-            u, v = e[:2]  # ignore edge data if present
-            if u in adj and v in adj[u]:
-                del adj[u][v]
-                if u != v:  # self loop needs only one entry removed
-                    del adj[v][u]
+        try:
+            for e in ebunch:
+                u, v = e[:2]  # ignore edge data if present
+                if u in adj and v in adj[u]:
+                    del adj[u][v]
+                    if u != v:  # self loop needs only one entry removed
+                        del adj[v][u]
+        finally:
+            # The items before a failing one are already applied.
+            self._version += 1
 
     def has_edge(self, u, v):
         """Return True if the edge (u,v) is in the graph.
@@ -1288,6 +1313,25 @@ class Graph(object):
         self.adj.clear()
         self.node.clear()
         self.graph.clear()
+        self._version += 1
+
+    def fresh_copy(self):
+        """Return a new empty graph of the same class as this graph.
+
+        Methods building new graphs from this one, such as
+        :meth:`subgraph` and :meth:`edge_subgraph`, start from this
+        empty graph.  Read-only graph views return an empty graph of the
+        class of the graph they look at, so that these methods return
+        graphs that can be modified.
+
+        Examples
+        --------
+        >>> G = nx.path_graph(4, create_using=nx.DiGraph())
+        >>> H = G.fresh_copy()
+        >>> type(H).__name__, len(H)
+        ('DiGraph', 0)
+        """
+        return self.__class__()
 
     def copy(self, with_data=True):
         """Return a copy of the graph.
@@ -1490,7 +1534,7 @@ class Graph(object):
         """
         bunch = self.nbunch_iter(nbunch)
         # create new graph and copy subgraph into it
-        H = self.__class__()
+        H = self.fresh_copy()
         # copy node and attribute dictionaries
         for n in bunch:
             H.node[n] = self.node[n]
@@ -1555,7 +1599,7 @@ class Graph(object):
         [(0, 1), (3, 4)]
 
         """
-        H = self.__class__()
+        H = self.fresh_copy()
         adj = self.adj
         # Filter out edges that don't correspond to nodes in the graph.
         edges = ((u, v) for u, v in edges if u in adj and v in adj[u])
@@ -0,0 +1,639 @@
+"""Read-only views of subgraphs and reversed graphs.
+
+A view looks at the adjacency of another graph instead of copying it, so
+that it is built in constant time and uses constant memory.  Subgraph
+views filter the nodes and edges of the graph they look at with two
+functions, `filter_node(n)` and `filter_edge(u, v)` (`filter_edge(u, v,
+key)` for multigraphs), each returning True for the nodes and edges kept.
+Reverse views swap the successors and predecessors of a directed graph.
+
+Views follow the changes of the graph they look at.  Adding or removing
+nodes or edges of a view raises :exc:`NetworkXError`, while node, edge
+and graph attributes are shared with the original graph.  Use
+:meth:`~Graph.copy` to get a graph that can be modified.
+"""
+#    Copyright (C) 2016 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+from copy import deepcopy
+try:
+    from collections.abc import ItemsView, Mapping
+except ImportError:  # Python 2.7
+    from collections import ItemsView, Mapping
+
+import networkx as nx
+from networkx.classes.graph import Graph
+from networkx.classes.digraph import DiGraph
+from networkx.classes.multigraph import MultiGraph
+from networkx.classes.multidigraph import MultiDiGraph
+from networkx.classes.function import frozen as _frozen
+
+__all__ = ['SubGraphView', 'SubDiGraphView', 'SubMultiGraphView',
+           'SubMultiDiGraphView', 'ReverseView', 'MultiReverseView',
+           'subgraph_view', 'induced_subgraph_view', 'edge_subgraph_view',
+           'reverse_view', 'no_filter', 'show_nodes', 'hide_nodes',
+           'show_edges', 'hide_edges']
+
+
+def no_filter(*items):
+    """Filter keeping all nodes or edges."""
+    return True
+
+
+class show_nodes(object):
+    """Node filter keeping the nodes in `nodes`.
+
+    Views iterate over `nodes` instead of over all the nodes of the graph
+    they look at, so that a view of a few nodes of a large graph is fast.
+    """
+
+    def __init__(self, nodes):
+        self.nodes = set(nodes)
+
+    def __call__(self, n):
+        return n in self.nodes
+
+
+class hide_nodes(object):
+    """Node filter removing the nodes in `nodes`."""
+
+    def __init__(self, nodes):
+        self.nodes = set(nodes)
+
+    def __call__(self, n):
+        return n not in self.nodes
+
+
+class show_edges(object):
+    """Edge filter keeping the edges in `edges`.
+
+    The edges are pairs ``(u, v)``, or triples ``(u, v, key)`` for
+    multigraphs.  Unless `directed` is True both orientations of each
+    edge are kept.
+    """
+
+    def __init__(self, edges, directed=False):
+        self.edges = set(tuple(e) for e in edges)
+        if not directed:
+            self.edges.update([(e[1], e[0]) + e[2:] for e in self.edges])
+
+    def __call__(self, *edge):
+        return edge in self.edges
+
+
+class hide_edges(show_edges):
+    """Edge filter removing the edges in `edges`.
+
+    The edges are given as for :class:`show_edges`.
+    """
+
+    def __call__(self, *edge):
+        return edge not in self.edges
+
+
+class _reverse_filter(object):
+    """Edge filter applying `filter_edge` to reversed edges."""
+
+    def __init__(self, filter_edge):
+        self.filter_edge = filter_edge
+
+    def __call__(self, u, v, *key):
+        return self.filter_edge(v, u, *key)
+
+
+def _reverse(filter_edge):
+    if filter_edge is no_filter:
+        return filter_edge
+    return _reverse_filter(filter_edge)
+
+
+class _FilterItems(ItemsView):
+    def __iter__(self):
+        return self._mapping._iter_items()
+
+
+class _FilterNodes(Mapping):
+    """Base class of the mappings keyed by the nodes kept by a filter."""
+
+    def __init__(self, data, filter_node):
+        self._data = data
+        self._filter_node = filter_node
+
+    def __contains__(self, n):
+        return n in self._data and self._filter_node(n)
+
+    def __iter__(self):
+        data = self._data
+        if isinstance(self._filter_node, show_nodes):
+            return (n for n in self._filter_node.nodes if n in data)
+        return (n for n in data if self._filter_node(n))
+
+    def __len__(self):
+        return sum(1 for n in self)
+
+    def _iter_items(self):
+        return ((n, self[n]) for n in self)
+
+    def items(self):
+        return _FilterItems(self)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def __deepcopy__(self, memo):
+        return deepcopy(dict(self.items()), memo)
+
+
+class _FilterNodeData(_FilterNodes):
+    """Read-only view of the attributes of the nodes kept by a filter."""
+
+    def __getitem__(self, n):
+        if self._filter_node(n):
+            return self._data[n]
+        raise KeyError(n)
+
+
+class _FilterAdjacency(_FilterNodes):
+    """Read-only view of an adjacency filtered by node and edge filters."""
+
+    def __init__(self, adj, filter_node, filter_edge):
+        super(_FilterAdjacency, self).__init__(adj, filter_node)
+        self._filter_edge = filter_edge
+
+    def __getitem__(self, n):
+        if self._filter_node(n):
+            return _FilterNeighbors(self._data[n], n, self._filter_node,
+                                    self._filter_edge)
+        raise KeyError(n)
+
+
+class _FilterNeighbors(Mapping):
+    """Read-only view of the neighbors of `u` and their edge data."""
+    __slots__ = ('_nbrs', '_u', '_filter_node', '_filter_edge')
+
+    def __init__(self, nbrs, u, filter_node, filter_edge):
+        self._nbrs = nbrs
+        self._u = u
+        self._filter_node = filter_node
+        self._filter_edge = filter_edge
+
+    def __getitem__(self, v):
+        data = self._nbrs[v]
+        if self._filter_node(v) and self._filter_edge(self._u, v):
+            return data
+        raise KeyError(v)
+
+    def __contains__(self, v):
+        return (v in self._nbrs and self._filter_node(v) and
+                self._filter_edge(self._u, v))
+
+    def __iter__(self):
+        u, filter_node, filter_edge = self._u, self._filter_node, \
+            self._filter_edge
+        return (v for v in self._nbrs if filter_node(v) and filter_edge(u, v))
+
+    def __len__(self):
+        return sum(1 for v in self)
+
+    def _iter_items(self):
+        u, filter_node, filter_edge = self._u, self._filter_node, \
+            self._filter_edge
+        return ((v, d) for v, d in self._nbrs.items()
+                if filter_node(v) and filter_edge(u, v))
+
+    def items(self):
+        return _FilterItems(self)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+class _FilterMultiAdjacency(_FilterAdjacency):
+    """Read-only view of a multigraph adjacency filtered by node and edge
+    filters."""
+
+    def __getitem__(self, n):
+        if self._filter_node(n):
+            return _FilterMultiNeighbors(self._data[n], n, self._filter_node,
+                                         self._filter_edge)
+        raise KeyError(n)
+
+
+class _FilterMultiNeighbors(_FilterNeighbors):
+    """Read-only view of the neighbors of `u` and their edge key dicts.
+
+    Neighbors joined to `u` by no edge kept by the filter are hidden.
+    """
+    __slots__ = ()
+
+    def __getitem__(self, v):
+        keys = _FilterKeys(self._nbrs[v], self._u, v, self._filter_edge)
+        if self._filter_node(v) and keys:
+            return keys
+        raise KeyError(v)
+
+    def __contains__(self, v):
+        try:
+            self[v]
+        except KeyError:
+            return False
+        return True
+
+    def _iter_items(self):
+        u, filter_node, filter_edge = self._u, self._filter_node, \
+            self._filter_edge
+        for v, keydict in self._nbrs.items():
+            if filter_node(v):
+                keys = _FilterKeys(keydict, u, v, filter_edge)
+                if keys:
+                    yield v, keys
+
+    def __iter__(self):
+        return (v for v, keys in self._iter_items())
+
+
+class _FilterKeys(Mapping):
+    """Read-only view of the edges joining `u` to `v` in a multigraph."""
+    __slots__ = ('_keydict', '_u', '_v', '_filter_edge')
+
+    def __init__(self, keydict, u, v, filter_edge):
+        self._keydict = keydict
+        self._u = u
+        self._v = v
+        self._filter_edge = filter_edge
+
+    def __getitem__(self, key):
+        data = self._keydict[key]
+        if self._filter_edge(self._u, self._v, key):
+            return data
+        raise KeyError(key)
+
+    def __iter__(self):
+        u, v, filter_edge = self._u, self._v, self._filter_edge
+        return (k for k in self._keydict if filter_edge(u, v, k))
+
+    def __len__(self):
+        return sum(1 for k in self)
+
+    def __bool__(self):
+        for k in self:
+            return True
+        return False
+
+    __nonzero__ = __bool__
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def copy(self):
+        return dict(self.items())
+
+
+class _GraphView(object):
+    """Methods shared by all the graph views.
+
+    The view looks at the graph stored in ``_graph``.
+    """
+    frozen = True
+
+    add_node = _frozen
+    add_nodes_from = _frozen
+    remove_node = _frozen
+    remove_nodes_from = _frozen
+    add_edge = _frozen
+    add_edges_from = _frozen
+    add_weighted_edges_from = _frozen
+    remove_edge = _frozen
+    remove_edges_from = _frozen
+    clear = _frozen
+
+    @property
+    def _version(self):
+        return self._graph._version
+
+    def fresh_copy(self):
+        return self._graph.fresh_copy()
+
+    fresh_copy.__doc__ = Graph.fresh_copy.__doc__
+
+    def copy(self, with_data=True):
+        """Return a copy of the view as a graph that can be modified.
+
+        Parameters
+        ----------
+        with_data : bool, optional (default=True)
+            If True, the copy holds deep copies of the graph, node and
+            edge attributes.  Otherwise it shares them with the view.
+
+        Returns
+        -------
+        G : graph
+            A graph of the class of the graph the view looks at.
+        """
+        H = self.subgraph(self)
+        if with_data:
+            return deepcopy(H)
+        return H
+
+
+class _DiGraphView(_GraphView):
+    """Methods shared by the directed graph views."""
+
+    def reverse(self, copy=True):
+        """Return a copy of the view with its edges reversed.
+
+        Views cannot be reversed in place: use :func:`reverse_view` to
+        get a reversed view.
+        """
+        if not copy:
+            _frozen()
+        return super(_DiGraphView, self).reverse(copy=True)
+
+
+class SubGraphView(_GraphView, Graph):
+    """A read-only view of the nodes and edges of a graph kept by filters.
+
+    Parameters
+    ----------
+    G : Graph
+        The graph to look at.
+
+    filter_node : function, optional
+        A function of a node returning True for the nodes kept in the
+        view.  All nodes are kept by default.
+
+    filter_edge : function, optional
+        A function of the two ends of an edge returning True for the
+        edges kept in the view.  It must return the same value for both
+        orientations of the edge.  All edges between the kept nodes are
+        kept by default.
+
+    See Also
+    --------
+    subgraph_view
+    """
+
+    def __init__(self, G, filter_node=no_filter, filter_edge=no_filter):
+        self._graph = G
+        self.graph = G.graph
+        self.node = _FilterNodeData(G.node, filter_node)
+        self.adj = self.edge = _FilterAdjacency(G.adj, filter_node,
+                                                filter_edge)
+
+
+class SubDiGraphView(_DiGraphView, DiGraph):
+    """A read-only view of the nodes and edges of a directed graph kept by
+    filters.
+
+    See :class:`SubGraphView`.  `filter_edge` is called with the edges in
+    their direction in `G`.
+    """
+
+    def __init__(self, G, filter_node=no_filter, filter_edge=no_filter):
+        self._graph = G
+        self.graph = G.graph
+        self.node = _FilterNodeData(G.node, filter_node)
+        self.succ = self.adj = self.edge = _FilterAdjacency(
+            G.succ, filter_node, filter_edge)
+        self.pred = _FilterAdjacency(G.pred, filter_node,
+                                     _reverse(filter_edge))
+
+
+class SubMultiGraphView(_GraphView, MultiGraph):
+    """A read-only view of the nodes and edges of a multigraph kept by
+    filters.
+
+    See :class:`SubGraphView`.  `filter_edge` is called with the two ends
+    and the key of each edge.
+    """
+
+    def __init__(self, G, filter_node=no_filter, filter_edge=no_filter):
+        self._graph = G
+        self.graph = G.graph
+        self.node = _FilterNodeData(G.node, filter_node)
+        self.adj = self.edge = _FilterMultiAdjacency(G.adj, filter_node,
+                                                     filter_edge)
+
+
+class SubMultiDiGraphView(_DiGraphView, MultiDiGraph):
+    """A read-only view of the nodes and edges of a directed multigraph kept
+    by filters.
+
+    See :class:`SubGraphView`.  `filter_edge` is called with the two ends,
+    in their direction in `G`, and the key of each edge.
+    """
+
+    def __init__(self, G, filter_node=no_filter, filter_edge=no_filter):
+        self._graph = G
+        self.graph = G.graph
+        self.node = _FilterNodeData(G.node, filter_node)
+        self.succ = self.adj = self.edge = _FilterMultiAdjacency(
+            G.succ, filter_node, filter_edge)
+        self.pred = _FilterMultiAdjacency(G.pred, filter_node,
+                                          _reverse(filter_edge))
+
+
+class ReverseView(_DiGraphView, DiGraph):
+    """A read-only view of a directed graph with its edges reversed.
+
+    The successors of the view are the predecessors of `G` and the other
+    way around.  The node attribute dict is the one of `G`.
+
+    See Also
+    --------
+    reverse_view
+    """
+
+    def __init__(self, G):
+        self._graph = G
+        self.graph = G.graph
+        self.node = G.node
+        self.succ = self.adj = self.edge = G.pred
+        self.pred = G.succ
+
+
+class MultiReverseView(_DiGraphView, MultiDiGraph):
+    """A read-only view of a directed multigraph with its edges reversed.
+
+    See :class:`ReverseView`.
+    """
+
+    def __init__(self, G):
+        self._graph = G
+        self.graph = G.graph
+        self.node = G.node
+        self.succ = self.adj = self.edge = G.pred
+        self.pred = G.succ
+
+
+def subgraph_view(G, filter_node=no_filter, filter_edge=no_filter):
+    """Return a read-only view of the nodes and edges of `G` kept by
+    filters.
+
+    The view is built in constant time and filters the adjacency of `G`
+    when it is read.  It follows the changes of `G`, and shares its
+    graph, node and edge attributes.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    filter_node : function, optional
+        A function of a node returning True for the nodes kept in the
+        view.  All nodes are kept by default.  Use :class:`show_nodes`
+        to keep a few nodes of a large graph.
+
+    filter_edge : function, optional
+        A function of the two ends of an edge, plus the edge key for
+        multigraphs, returning True for the edges kept in the view.  For
+        undirected graphs it must return the same value for both
+        orientations of the edge.  All edges between the kept nodes are
+        kept by default.
+
+    Returns
+    -------
+    H : graph view
+        A read-only graph of the same kind as `G`: a
+        :class:`SubGraphView`, :class:`SubDiGraphView`,
+        :class:`SubMultiGraphView` or :class:`SubMultiDiGraphView`.
+
+    See Also
+    --------
+    induced_subgraph_view
+    edge_subgraph_view
+
+    Examples
+    --------
+    >>> G = nx.path_graph(6)
+    >>> H = nx.subgraph_view(G, filter_node=lambda n: n != 2)
+    >>> sorted(H.edges())
+    [(0, 1), (3, 4), (4, 5)]
+    >>> H = nx.subgraph_view(G, filter_edge=lambda u, v: u + v > 4)
+    >>> sorted(H.edges())
+    [(2, 3), (3, 4), (4, 5)]
+
+    The view follows the changes of the graph:
+
+    >>> G.add_edge(5, 6)
+    >>> sorted(H.edges())
+    [(2, 3), (3, 4), (4, 5), (5, 6)]
+    >>> try:
+    ...     H.add_edge(0, 5)
+    ... except nx.NetworkXError as e:
+    ...     print(str(e))
+    Frozen graph can't be modified
+    """
+    if G.is_multigraph():
+        if G.is_directed():
+            return SubMultiDiGraphView(G, filter_node, filter_edge)
+        return SubMultiGraphView(G, filter_node, filter_edge)
+    if G.is_directed():
+        return SubDiGraphView(G, filter_node, filter_edge)
+    return SubGraphView(G, filter_node, filter_edge)
+
+
+def induced_subgraph_view(G, nbunch):
+    """Return a read-only view of the subgraph of `G` induced on the nodes
+    in `nbunch`.
+
+    This is the view counterpart of :meth:`Graph.subgraph`: it takes
+    time proportional to the number of nodes in `nbunch` and does not
+    copy the edges.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    nbunch : node, container of nodes or None
+        The nodes kept in the view.  Nodes not in `G` are ignored.
+
+    Returns
+    -------
+    H : graph view
+        See :func:`subgraph_view`.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> H = nx.induced_subgraph_view(G, [0, 1, 2])
+    >>> sorted(H.edges())
+    [(0, 1), (1, 2)]
+    """
+    return subgraph_view(G, filter_node=show_nodes(G.nbunch_iter(nbunch)))
+
+
+def edge_subgraph_view(G, edges):
+    """Return a read-only view of the subgraph of `G` induced by `edges`.
+
+    This is the view counterpart of :meth:`Graph.edge_subgraph`.  The
+    view holds the edges in `edges` and the nodes incident to them.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    edges : iterable
+        Edges of `G`, as pairs ``(u, v)``, or triples ``(u, v, key)``
+        for multigraphs.  Edges not in `G` are ignored.
+
+    Returns
+    -------
+    H : graph view
+        See :func:`subgraph_view`.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(5)
+    >>> H = nx.edge_subgraph_view(G, [(0, 1), (3, 4)])
+    >>> sorted(H.nodes())
+    [0, 1, 3, 4]
+    >>> sorted(H.edges())
+    [(0, 1), (3, 4)]
+    """
+    edges = [e for e in edges if G.has_edge(*e)]
+    nodes = set(e[0] for e in edges)
+    nodes.update(e[1] for e in edges)
+    return subgraph_view(G, filter_node=show_nodes(nodes),
+                         filter_edge=show_edges(edges, G.is_directed()))
+
+
+def reverse_view(G):
+    """Return a read-only view of the directed graph `G` with its edges
+    reversed.
+
+    Unlike :meth:`DiGraph.reverse` the view is built in constant time and
+    does not change `G`.
+
+    Parameters
+    ----------
+    G : directed graph
+
+    Returns
+    -------
+    H : graph view
+        A :class:`ReverseView`, or a :class:`MultiReverseView` if `G` is
+        a multigraph.
+
+    Raises
+    ------
+    NetworkXError
+        If `G` is undirected.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph([(0, 1), (1, 2)])
+    >>> H = nx.reverse_view(G)
+    >>> sorted(H.edges())
+    [(1, 0), (2, 1)]
+    >>> list(nx.dfs_preorder_nodes(H, 2))
+    [2, 1, 0]
+    """
+    if not G.is_directed():
+        raise nx.NetworkXError('reverse_view is not defined for undirected '
+                               'graphs.')
+    if G.is_multigraph():
+        return MultiReverseView(G)
+    return ReverseView(G)
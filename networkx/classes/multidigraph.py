@@ -344,6 +344,7 @@ class MultiDiGraph(MultiGraph,DiGraph):
             keydict[key] = datadict
             self.succ[u][v] = keydict
             self.pred[v][u] = keydict
+        self._version += 1
 
     def remove_edge(self, u, v, key=None):
         """Remove an edge between u and v.
@@ -406,6 +407,7 @@ class MultiDiGraph(MultiGraph,DiGraph):
             # remove the key entries if last edge
             del self.succ[u][v]
             del self.pred[v][u]
+        self._version += 1
 
     def edges(self, nbunch=None, data=False, keys=False, default=None):
         """Return an iterator over the edges.
@@ -901,7 +903,7 @@ class MultiDiGraph(MultiGraph,DiGraph):
         """
         bunch = self.nbunch_iter(nbunch)
         # create new graph and copy subgraph into it
-        H = self.__class__()
+        H = self.fresh_copy()
         # copy node and attribute dictionaries
         for n in bunch:
             H.node[n] = self.node[n]
@@ -981,7 +983,7 @@ class MultiDiGraph(MultiGraph,DiGraph):
             [(0, 1, 0, {'good': True}), (1, 2, 1, {'good': True})]
 
         """
-        H = self.__class__()
+        H = self.fresh_copy()
         succ = self.succ
         # Filter out edges that don't correspond to nodes in the graph.
         def is_in_graph(u, v, k):
@@ -996,10 +998,10 @@ class MultiDiGraph(MultiGraph,DiGraph):
                 H.node[v] = self.node[v]
             # Create an entry in the successors and predecessors
             # dictionary for the nodes u and v if they don't exist yet.
-            if u not in H.succ:
-                H.succ[u] = H.adjlist_dict_factory()
-            if v not in H.pred:
-                H.pred[v] = H.adjlist_dict_factory()
+            for n in (u, v):
+                if n not in H.succ:
+                    H.succ[n] = H.adjlist_dict_factory()
+                    H.pred[n] = H.adjlist_dict_factory()
             # Create an entry in the edge dictionary for the edges (u,
             # v) and (v, u) if the don't exist yet.
             if v not in H.succ[u]:
@@ -1026,7 +1028,8 @@ class MultiDiGraph(MultiGraph,DiGraph):
             the original graph (this changes the original graph).
         """
         if copy:
-            H = self.__class__(name="Reverse of (%s)"%self.name)
+            H = self.fresh_copy()
+            H.name = "Reverse of (%s)" % self.name
             H.add_nodes_from(self)
             H.add_edges_from((v, u, k, deepcopy(d)) for u, v, k, d
                               in self.edges(keys=True, data=True))
@@ -1035,5 +1038,6 @@ class MultiDiGraph(MultiGraph,DiGraph):
         else:
             self.pred, self.succ = self.succ, self.pred
             self.adj = self.succ
+            self._version += 1
             H = self
         return H
@@ -343,6 +343,7 @@ class MultiGraph(Graph):
             keydict[key] = datadict
             self.adj[u][v] = keydict
             self.adj[v][u] = keydict
+        self._version += 1
 
     def add_edges_from(self, ebunch, attr_dict=None, **attr):
         """Add all the edges in ebunch.
@@ -417,6 +418,7 @@ class MultiGraph(Graph):
             ddd.update(attr_dict)
             ddd.update(dd)
             self.add_edge(u, v, key, ddd)
+        self._version += 1
 
     def remove_edge(self, u, v, key=None):
         """Remove an edge between u and v.
@@ -481,6 +483,7 @@ class MultiGraph(Graph):
             del self.adj[u][v]
             if u!=v:  # check for selfloop
                 del self.adj[v][u]
+        self._version += 1
 
     def remove_edges_from(self, ebunch):
         """Remove all edges specified in ebunch.
@@ -525,6 +528,7 @@ class MultiGraph(Graph):
                 self.remove_edge(*e[:3])
             except NetworkXError:
                 pass
+        self._version += 1
 
     def has_edge(self, u, v, key=None):
         """Return True if the graph has an edge between nodes u and v.
@@ -1001,7 +1005,7 @@ class MultiGraph(Graph):
         """
         bunch = self.nbunch_iter(nbunch)
         # create new graph and copy subgraph into it
-        H = self.__class__()
+        H = self.fresh_copy()
         # copy node and attribute dictionaries
         for n in bunch:
             H.node[n] = self.node[n]
@@ -1076,7 +1080,7 @@ class MultiGraph(Graph):
             [(0, 1, 0, {'good': True}), (1, 2, 1, {'good': True})]
 
         """
-        H = self.__class__()
+        H = self.fresh_copy()
         adj = self.adj
         # Filter out edges that don't correspond to nodes in the graph.
         def is_in_graph(u, v, k):
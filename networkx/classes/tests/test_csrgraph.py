@@ -0,0 +1,163 @@
+from copy import deepcopy
+import pickle
+
+from nose.tools import assert_equal
+from nose.tools import assert_false
+from nose.tools import assert_raises
+from nose.tools import assert_true
+
+import networkx as nx
+
+
+class TestCSRGraph(object):
+
+    def setUp(self):
+        G = nx.Graph(name='test')
+        G.add_edge(0, 1, weight=2.5)
+        G.add_edge(1, 2, weight=1.0, color='red')
+        G.add_edge(2, 0, weight=3.0)
+        G.add_edge(2, 2, weight=0.5)
+        G.add_node(3, size=7)
+        self.G = G
+        self.H = nx.CSRGraph(G)
+
+    def test_read_api(self):
+        G, H = self.G, self.H
+        assert_equal(list(H), list(G))
+        assert_equal(len(H), 4)
+        assert_true(1 in H)
+        assert_false(4 in H)
+        assert_false({} in H)
+        assert_equal(sorted(H.neighbors(2)), [0, 1, 2])
+        assert_equal(sorted(H[2]), [0, 1, 2])
+        assert_equal(sorted(H.adj), [0, 1, 2, 3])
+        assert_equal(H.number_of_edges(), 4)
+        assert_equal(H.number_of_edges(0, 1), 1)
+        assert_equal(H.size(weight='weight'), 7.0)
+        assert_equal(dict(H.degree()), dict(G.degree()))
+        assert_equal(dict(H.degree(weight='weight')),
+                     dict(G.degree(weight='weight')))
+        assert_equal(H.number_of_selfloops(), 1)
+        assert_raises(nx.NetworkXError, H.neighbors, 4)
+        assert_equal(H.name, 'test')
+
+    def test_edge_data(self):
+        G, H = self.G, self.H
+        assert_equal(sorted(H.edges(data=True)), sorted(G.edges(data=True)))
+        assert_equal(H[1][2], {'weight': 1.0, 'color': 'red'})
+        assert_equal(H[0][1], {'weight': 2.5})
+        assert_equal(H[0][1].get('color', 'blue'), 'blue')
+        assert_equal(H.get_edge_data(0, 3, default=0), 0)
+        assert_true(H.has_edge(2, 2))
+        assert_false(H.has_edge(0, 3))
+        assert_equal(H.node[3], {'size': 7})
+        assert_equal(H.node[0], {})
+
+    def test_frozen(self):
+        H = self.H
+        assert_true(nx.is_frozen(H))
+        assert_raises(nx.NetworkXError, H.add_node, 5)
+        assert_raises(nx.NetworkXError, H.add_edge, 0, 3)
+        assert_raises(nx.NetworkXError, H.remove_node, 0)
+        assert_raises(nx.NetworkXError, H.remove_edge, 0, 1)
+        assert_raises(nx.NetworkXError, H.clear)
+
+    def test_algorithms(self):
+        G = nx.karate_club_graph()
+        for u, v in G.edges():
+            G[u][v]['weight'] = u + v
+        H = nx.CSRGraph(G)
+        assert_equal(nx.betweenness_centrality(H, weight='weight'),
+                     nx.betweenness_centrality(G, weight='weight'))
+        assert_equal(dict(nx.shortest_path_length(H, 0, weight='weight')),
+                     dict(nx.shortest_path_length(G, 0, weight='weight')))
+        assert_equal(nx.triangles(H), nx.triangles(G))
+        assert_true(nx.is_isomorphic(H, G))
+
+    def test_copies(self):
+        G, H = self.G, self.H
+        for K in (deepcopy(H), H.copy(), pickle.loads(pickle.dumps(H))):
+            assert_equal(sorted(K.edges(data=True)),
+                         sorted(G.edges(data=True)))
+        K = nx.Graph(H)
+        assert_equal(sorted(K.edges(data=True)), sorted(G.edges(data=True)))
+        assert_equal(K.node[3], {'size': 7})
+        K.add_edge(0, 3)
+        assert_false(H.has_edge(0, 3))
+        K = H.to_graph()
+        assert_equal(type(K), nx.Graph)
+        assert_equal(sorted(K.edges()), sorted(G.edges()))
+
+    def test_subgraph(self):
+        H = self.H
+        S = H.subgraph([0, 1, 3])
+        assert_equal(type(S), nx.CSRGraph)
+        assert_equal(sorted(S), [0, 1, 3])
+        assert_equal(list(S.edges(data=True)), [(0, 1, {'weight': 2.5})])
+        S = H.edge_subgraph([(1, 2), (2, 2)])
+        assert_equal(sorted(S.edges()), [(1, 2), (2, 2)])
+        assert_equal(S[1][2]['color'], 'red')
+
+    def test_to_directed(self):
+        D = self.H.to_directed()
+        assert_equal(type(D), nx.CSRDiGraph)
+        assert_equal(D.number_of_edges(), 7)
+        assert_equal(D[2][1], {'weight': 1.0, 'color': 'red'})
+
+    def test_empty(self):
+        H = nx.CSRGraph()
+        assert_equal(len(H), 0)
+        assert_equal(list(H.edges()), [])
+        H = nx.CSRGraph([(0, 1), (1, 2)])
+        assert_equal(sorted(H.edges()), [(0, 1), (1, 2)])
+
+    def test_multigraph(self):
+        assert_raises(nx.NetworkXError, nx.CSRGraph, nx.MultiGraph())
+
+
+class TestCSRDiGraph(object):
+
+    def setUp(self):
+        G = nx.DiGraph()
+        G.add_edge('a', 'b', weight=1)
+        G.add_edge('b', 'c', weight=2)
+        G.add_edge('c', 'a', weight=3, label='back')
+        G.add_edge('a', 'c', weight=4)
+        self.G = G
+        self.H = nx.CSRDiGraph(G)
+
+    def test_read_api(self):
+        G, H = self.G, self.H
+        assert_true(H.is_directed())
+        assert_equal(sorted(H.edges(data=True)), sorted(G.edges(data=True)))
+        assert_equal(sorted(H.successors('a')), ['b', 'c'])
+        assert_equal(sorted(H.predecessors('c')), ['a', 'b'])
+        assert_equal(dict(H.in_degree()), dict(G.in_degree()))
+        assert_equal(dict(H.out_degree(weight='weight')),
+                     dict(G.out_degree(weight='weight')))
+        assert_equal(H.pred['a']['c'], {'weight': 3, 'label': 'back'})
+        assert_equal(sorted(H.in_edges('a', data=True)),
+                     sorted(G.in_edges('a', data=True)))
+        assert_equal(H.number_of_edges(), 4)
+
+    def test_reverse(self):
+        G, H = self.G, self.H
+        R = H.reverse()
+        assert_equal(sorted(R.edges(data=True)),
+                     sorted(G.reverse().edges(data=True)))
+        assert_equal(sorted(H.edges()), sorted(G.edges()))
+        assert_raises(nx.NetworkXError, H.reverse, copy=False)
+        assert_equal(sorted(H.edges()), sorted(G.edges()))
+
+    def test_algorithms(self):
+        G, H = self.G, self.H
+        assert_equal(nx.pagerank(H), nx.pagerank(G))
+        assert_equal(nx.dijkstra_path(H, 'b', 'a'), ['b', 'c', 'a'])
+        assert_equal(sorted(map(sorted, nx.strongly_connected_components(H))),
+                     [['a', 'b', 'c']])
+
+    def test_to_undirected(self):
+        U = self.H.to_undirected()
+        assert_equal(type(U), nx.CSRGraph)
+        assert_equal(sorted(map(sorted, U.edges())),
+                     [['a', 'b'], ['a', 'c'], ['b', 'c']])
@@ -574,6 +574,44 @@ class TestGraph(BaseAttrGraphTester):
         G.clear()
         assert_equal(G.adj,{})
 
+    def test_version(self):
+        G = self.Graph()
+        versions = [G._version]
+        G.add_node(0)
+        versions.append(G._version)
+        G.add_nodes_from([1, 2])
+        versions.append(G._version)
+        G.add_edge(0, 1)
+        versions.append(G._version)
+        G.add_edges_from([(1, 2), (2, 0)])
+        versions.append(G._version)
+        G.remove_edge(0, 1)
+        versions.append(G._version)
+        G.remove_edges_from([(1, 2)])
+        versions.append(G._version)
+        G.remove_node(0)
+        versions.append(G._version)
+        G.remove_nodes_from([1])
+        versions.append(G._version)
+        G.clear()
+        versions.append(G._version)
+        assert_equal(len(set(versions)), len(versions))
+        assert_equal(self.Graph()._version, 0)
+
+    def test_version_errors(self):
+        G = self.Graph()
+        G.add_edge(0, 1)
+        version = G._version
+        assert_raises(networkx.NetworkXError, G.remove_edge, 5, 6)
+        assert_raises(networkx.NetworkXError, G.remove_node, 9)
+        assert_raises(networkx.NetworkXError, G.add_edge, 1, 2, attr_dict=1)
+        assert_equal(G._version, version)
+        # Edges added before a failing one change the version.
+        assert_raises(networkx.NetworkXError, G.add_edges_from,
+                      [(2, 3), (4,)])
+        assert_true(G.has_edge(2, 3))
+        assert_true(G._version != version)
+
     def test_edges_data(self):
         G=self.K3
         assert_equal(sorted(G.edges(data=True)),[(0,1,{}),(0,2,{}),(1,2,{})])
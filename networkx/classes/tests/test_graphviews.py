@@ -0,0 +1,193 @@
+from copy import deepcopy
+import pickle
+
+from nose.tools import (assert_equal, assert_false, assert_raises,
+                        assert_true)
+
+import networkx as nx
+
+
+def adjacency(adj, multigraph):
+    if multigraph:
+        return dict((u, dict((v, dict(keys)) for v, keys in nbrs.items()))
+                    for u, nbrs in adj.items())
+    return dict((u, dict(nbrs)) for u, nbrs in adj.items())
+
+
+def assert_same_graph(H, G):
+    multigraph = G.is_multigraph()
+    assert_equal(dict(H.nodes(data=True)), dict(G.nodes(data=True)))
+    assert_equal(adjacency(H.adj, multigraph), adjacency(G.adj, multigraph))
+    if G.is_directed():
+        assert_equal(adjacency(H.pred, multigraph),
+                     adjacency(G.pred, multigraph))
+        assert_equal(dict(H.in_degree()), dict(G.in_degree()))
+    assert_equal(H.number_of_edges(), G.number_of_edges())
+    assert_equal(len(H), len(G))
+    assert_equal(dict(H.degree()), dict(G.degree()))
+
+
+class TestSubGraphView(object):
+    graph_class = nx.Graph
+
+    def setUp(self):
+        G = nx.gnm_random_graph(30, 80, seed=5, directed=True)
+        self.G = self.graph_class()
+        for u, v in G.edges():
+            self.G.add_edge(u, v, weight=u + v)
+            if self.G.is_multigraph() and (u + v) % 3 == 0:
+                self.G.add_edge(u, v, weight=100)
+        for n in self.G:
+            self.G.node[n]['even'] = n % 2 == 0
+        self.G.graph['name'] = 'test'
+
+    def edges(self, G):
+        if G.is_multigraph():
+            return G.edges(keys=True)
+        return G.edges()
+
+    def test_induced_subgraph(self):
+        nodes = list(range(0, 30, 3)) + ['missing']
+        H = nx.induced_subgraph_view(self.G, nodes)
+        assert_same_graph(H, self.G.subgraph(nodes))
+        assert_true(3 in H)
+        assert_false(4 in H)
+        assert_false(4 in H.adj)
+        assert_raises(KeyError, H.__getitem__, 4)
+
+    def test_node_filter(self):
+        H = nx.subgraph_view(self.G, filter_node=lambda n: n % 2 == 0)
+        assert_same_graph(H, self.G.subgraph(range(0, 30, 2)))
+        H = nx.subgraph_view(self.G, filter_node=nx.hide_nodes([0, 1]))
+        assert_same_graph(H, self.G.subgraph(range(2, 30)))
+
+    def test_edge_filter(self):
+        if self.G.is_multigraph():
+            def filter_edge(u, v, k):
+                return self.G[u][v][k]['weight'] > 20
+        else:
+            def filter_edge(u, v):
+                return self.G[u][v]['weight'] > 20
+        H = nx.subgraph_view(self.G, filter_edge=filter_edge)
+        expected = self.G.copy()
+        expected.remove_edges_from([e for e in self.edges(self.G)
+                                    if not filter_edge(*e)])
+        assert_same_graph(H, expected)
+
+    def test_edge_subgraph(self):
+        edges = list(self.edges(self.G))[::4]
+        missing = (100, 101, 0)[:len(edges[0])]
+        H = nx.edge_subgraph_view(self.G, edges + [missing])
+        assert_same_graph(H, self.G.edge_subgraph(edges))
+        hidden = nx.subgraph_view(self.G, filter_edge=nx.hide_edges(
+            edges, self.G.is_directed()))
+        assert_equal(hidden.number_of_edges(),
+                     self.G.number_of_edges() - len(edges))
+
+    def test_nested_views(self):
+        H = nx.induced_subgraph_view(self.G, range(20))
+        K = nx.induced_subgraph_view(H, range(10, 30))
+        assert_same_graph(K, self.G.subgraph(range(10, 20)))
+
+    def test_follows_graph(self):
+        H = nx.subgraph_view(self.G, filter_node=lambda n: n in (0, 1, 100))
+        version = H._version
+        assert_false(100 in H)
+        self.G.add_edge(0, 100)
+        assert_true(100 in H)
+        assert_true(H.has_edge(0, 100))
+        assert_true(H._version > version)
+
+    def test_read_only(self):
+        H = nx.subgraph_view(self.G)
+        assert_true(nx.is_frozen(H))
+        assert_raises(nx.NetworkXError, H.add_node, 100)
+        assert_raises(nx.NetworkXError, H.add_edge, 0, 1)
+        assert_raises(nx.NetworkXError, H.remove_node, 0)
+        assert_raises(nx.NetworkXError, H.clear)
+        if H.is_directed():
+            assert_raises(nx.NetworkXError, H.reverse, copy=False)
+
+    def test_shared_attributes(self):
+        H = nx.induced_subgraph_view(self.G, [0, 1, 2])
+        H.node[0]['even'] = 'changed'
+        assert_equal(self.G.node[0]['even'], 'changed')
+        H.graph['name'] = 'view'
+        assert_equal(self.G.name, 'view')
+
+    def test_copy(self):
+        nodes = range(0, 30, 2)
+        H = nx.induced_subgraph_view(self.G, nodes)
+        expected = self.G.subgraph(nodes)
+        for C in (H.copy(), H.copy(with_data=False), H.subgraph(H),
+                  deepcopy(H.copy())):
+            assert_equal(type(C), type(self.G))
+            assert_same_graph(C, expected)
+            C.add_edge(100, 101)
+            assert_false(100 in self.G)
+        C = H.copy()
+        C.node[0]['even'] = 'changed'
+        assert_true(self.G.node[0]['even'])
+        C = H.copy(with_data=False)
+        C.node[0]['even'] = 'changed'
+        assert_equal(self.G.node[0]['even'], 'changed')
+
+    def test_graph_constructor(self):
+        H = nx.induced_subgraph_view(self.G, range(10))
+        C = self.graph_class(H)
+        assert_same_graph(C, self.G.subgraph(range(10)))
+
+    def test_pickle(self):
+        H = nx.induced_subgraph_view(self.G, range(10))
+        assert_same_graph(pickle.loads(pickle.dumps(H)), H)
+
+    def test_algorithms(self):
+        H = nx.induced_subgraph_view(self.G, range(15))
+        S = self.G.subgraph(range(15))
+        assert_equal(dict(nx.single_source_dijkstra_path_length(H, 0)),
+                     dict(nx.single_source_dijkstra_path_length(S, 0)))
+        assert_equal(sorted(nx.bfs_edges(H, 0)), sorted(nx.bfs_edges(S, 0)))
+
+
+class TestSubDiGraphView(TestSubGraphView):
+    graph_class = nx.DiGraph
+
+
+class TestSubMultiGraphView(TestSubGraphView):
+    graph_class = nx.MultiGraph
+
+
+class TestSubMultiDiGraphView(TestSubGraphView):
+    graph_class = nx.MultiDiGraph
+
+
+class TestReverseView(object):
+
+    def setUp(self):
+        self.G = nx.gnm_random_graph(30, 80, seed=5, directed=True)
+        for u, v in self.G.edges():
+            self.G[u][v]['weight'] = u - v
+        self.M = nx.MultiDiGraph(self.G)
+        self.M.add_edge(0, 1, weight=7)
+
+    def test_reverse(self):
+        for G in (self.G, self.M):
+            H = nx.reverse_view(G)
+            assert_same_graph(H, G.reverse())
+            assert_equal(type(H.copy()), type(G))
+            assert_same_graph(nx.reverse_view(H), G)
+            assert_same_graph(H.reverse(), G)
+
+    def test_follows_graph(self):
+        H = nx.reverse_view(self.G)
+        self.G.add_edge(100, 101)
+        assert_true(H.has_edge(101, 100))
+        assert_false(H.has_edge(100, 101))
+        assert_raises(nx.NetworkXError, H.add_edge, 1, 2)
+
+    def test_subgraph_of_reverse(self):
+        H = nx.induced_subgraph_view(nx.reverse_view(self.G), range(10))
+        assert_same_graph(H, self.G.subgraph(range(10)).reverse())
+
+    def test_undirected(self):
+        assert_raises(nx.NetworkXError, nx.reverse_view, nx.path_graph(3))
@@ -26,8 +26,10 @@ nx_agraph, nx_pydot
 #    Pieter Swart <swart@lanl.gov>
 #    All rights reserved.
 #    BSD license.
+from collections import OrderedDict
 import warnings
 import itertools
+from operator import methodcaller
 import networkx as nx
 from networkx.convert import _prep_create_using
 from networkx.utils import not_implemented_for
@@ -37,7 +39,8 @@ __author__ = """\n""".join(['Aric Hagberg <aric.hagberg@gmail.com>',
 __all__ = ['from_numpy_matrix', 'to_numpy_matrix',
            'from_pandas_dataframe', 'to_pandas_dataframe',
            'to_numpy_recarray',
-           'from_scipy_sparse_matrix', 'to_scipy_sparse_matrix']
+           'from_scipy_sparse_matrix', 'to_scipy_sparse_matrix',
+           'cache_matrices']
 
 def to_pandas_dataframe(G, nodelist=None, dtype=None, order=None, 
                         multigraph_weight=sum, weight='weight', nonedge=0.0):
@@ -609,6 +612,97 @@ def to_numpy_recarray(G, nodelist=None, dtype=None, order=None):
     return M.view(np.recarray)
 
 
+class _MatrixCache(object):
+    """Least recently used cache of the matrices exported from a graph.
+
+    The cache is emptied as soon as the version of the graph changes.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.version = None
+        self.matrices = OrderedDict()
+
+    def get(self, G, key, build):
+        """Return a copy of the matrix stored under `key`, calling `build`
+        to compute it if it is not in the cache.
+        """
+        if self.version != G._version:
+            self.matrices.clear()
+            self.version = G._version
+        try:
+            M = self.matrices.pop(key)
+        except KeyError:
+            M = build()
+        self.matrices[key] = M
+        while len(self.matrices) > self.maxsize:
+            self.matrices.popitem(last=False)
+        return M.copy()
+
+    # Copies of the graph get their own, empty, cache.
+    def __deepcopy__(self, memo):
+        return _MatrixCache(self.maxsize)
+
+    def __reduce__(self):
+        return (_MatrixCache, (self.maxsize,))
+
+
+def cache_matrices(G, maxsize=8):
+    """Cache the sparse matrices computed from the graph `G`.
+
+    Once called, :func:`to_scipy_sparse_matrix`, :func:`laplacian_matrix`
+    and :func:`normalized_laplacian_matrix` keep the matrices they compute
+    from `G`, so that algorithms repeatedly exporting the same unchanged
+    graph, such as :func:`pagerank_scipy`, :func:`hits_scipy`,
+    :func:`algebraic_connectivity` or the current-flow centralities, only
+    pay the conversion cost once.
+
+    Parameters
+    ----------
+    G : graph
+       A NetworkX graph.
+
+    maxsize : int, optional (default=8)
+       The maximum number of matrices kept.  When the cache is full the
+       least recently used matrix is discarded.  If 0, caching is
+       disabled.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> nx.cache_matrices(G)
+    >>> A = nx.to_scipy_sparse_matrix(G)  # computed
+    >>> B = nx.to_scipy_sparse_matrix(G)  # copied from the cache
+    >>> G.add_edge(0, 3)
+    >>> C = nx.to_scipy_sparse_matrix(G)  # computed again
+    >>> print(C.nnz)
+    8
+
+    Notes
+    -----
+    The cache is keyed on the arguments of the matrix functions and is
+    emptied whenever the graph is changed through its methods, such as
+    :meth:`add_edge` or :meth:`remove_node`.  Changes made directly to
+    the attribute dictionaries, for instance ``G[0][1]['weight'] = 2``,
+    are not seen: call :func:`cache_matrices` again after such changes
+    to empty the cache.
+
+    The cached matrices are not returned but copied, so that the results
+    can be modified freely.
+    """
+    if maxsize < 0:
+        raise ValueError('maxsize must be a nonnegative integer.')
+    G._matrix_cache = _MatrixCache(maxsize) if maxsize else None
+
+
+def _cached_matrix(G, key, build):
+    """Return ``build()``, from the matrix cache of `G` if it has one."""
+    cache = getattr(G, '_matrix_cache', None)
+    if cache is None:
+        return build()
+    return cache.get(G, key, build)
+
+
 def to_scipy_sparse_matrix(G, nodelist=None, dtype=None,
                            weight='weight', format='csr'):
     """Return the graph adjacency matrix as a SciPy sparse matrix.
@@ -654,6 +748,9 @@ def to_scipy_sparse_matrix(G, nodelist=None, dtype=None,
     Uses coo_matrix format. To convert to other formats specify the
     format= keyword.
 
+    After a call to :func:`cache_matrices`, the matrices of `G` are
+    only computed again when `G` changes.
+
     The convention used for self-loop edges in graphs is to assign the
     diagonal matrix entry value to the weight attribute of the edge
     (or the number 1 if the edge has no weight attribute).  If the
@@ -687,6 +784,14 @@ def to_scipy_sparse_matrix(G, nodelist=None, dtype=None,
     .. [1] Scipy Dev. References, "Sparse Matrices",
        http://docs.scipy.org/doc/scipy/reference/sparse.html
     """
+    key = ('adjacency', None if nodelist is None else tuple(nodelist),
+           dtype, weight, format)
+    return _cached_matrix(G, key, lambda: _to_scipy_sparse_matrix(
+        G, nodelist, dtype, weight, format))
+
+
+def _to_scipy_sparse_matrix(G, nodelist, dtype, weight, format):
+    import numpy as np
     from scipy import sparse
     if nodelist is None:
         nodelist = list(G)
@@ -699,31 +804,39 @@ def to_scipy_sparse_matrix(G, nodelist=None, dtype=None,
         raise nx.NetworkXError(msg)
 
     index = dict(zip(nodelist,range(nlen)))
-    if G.number_of_edges() == 0:
-        row,col,data=[],[],[]
+    # The matrix is built in compressed sparse row format, row i holding
+    # the neighbors (successors) of nodelist[i].  The neighbors of
+    # undirected graphs list every edge in both directions and self-loops
+    # once, so that the matrix needs no symmetrizing.
+    adj = G.adj
+    rows = [adj[u] if u in adj else {} for u in nodelist]
+    if nlen != len(G) or not all(u in adj for u in nodelist):
+        # Only keep the edges of the subgraph induced by nodelist.
+        rows = [dict((v, d) for v, d in nbrs.items() if v in index)
+                for nbrs in rows]
+    indptr = np.zeros(nlen + 1, dtype=np.intp)
+    np.cumsum([len(nbrs) for nbrs in rows], out=indptr[1:])
+    nnz = int(indptr[-1])
+    chain = itertools.chain.from_iterable
+    indices = np.fromiter(map(index.__getitem__, chain(rows)), np.intp, nnz)
+    if G.is_multigraph():
+        # For multiple edges the matrix values are the sums of the weights.
+        weights = (sum(d.get(weight, 1) for d in keydict.values())
+                   for nbrs in rows for keydict in nbrs.values())
+    elif weight is not None:
+        weights = map(methodcaller('get', weight, 1),
+                      chain(nbrs.values() for nbrs in rows))
     else:
-        row,col,data = zip(*((index[u],index[v],d.get(weight,1))
-                             for u,v,d in G.edges(nodelist, data=True)
-                             if u in index and v in index))
-    if G.is_directed():
-        M = sparse.coo_matrix((data,(row,col)),
-                              shape=(nlen,nlen), dtype=dtype)
+        weights = None
+    if weights is None:
+        data = np.ones(nnz, dtype=int if dtype is None else dtype)
+    elif dtype is None:
+        # Let NumPy find a type holding all the weights.
+        data = np.array(list(weights))
     else:
-        # symmetrize matrix
-        d = data + data
-        r = row + col
-        c = col + row
-        # selfloop entries get double counted when symmetrizing
-        # so we subtract the data on the diagonal
-        selfloops = list(G.selfloop_edges(data=True))
-        if selfloops:
-            diag_index,diag_data = zip(*((index[u],-d.get(weight,1))
-                                         for u,v,d in selfloops
-                                         if u in index and v in index))
-            d += diag_data
-            r += diag_index
-            c += diag_index
-        M = sparse.coo_matrix((d, (r, c)), shape=(nlen,nlen), dtype=dtype)
+        data = np.fromiter(weights, dtype, nnz)
+    M = sparse.csr_matrix((data, indices, indptr), shape=(nlen, nlen))
+    M.sort_indices()
     try:
         return M.asformat(format)
     except AttributeError:
@@ -735,11 +848,11 @@ def _csr_gen_triples(A):
     an iterable of weighted edge triples.
 
     """
+    import numpy as np
     nrows = A.shape[0]
     data, indices, indptr = A.data, A.indices, A.indptr
-    for i in range(nrows):
-        for j in range(indptr[i], indptr[i+1]):
-            yield i, indices[j], data[j]
+    rows = np.repeat(np.arange(nrows), np.diff(indptr))
+    return zip(rows.tolist(), indices.tolist(), data.tolist())
 
 
 def _csc_gen_triples(A):
@@ -747,11 +860,11 @@ def _csc_gen_triples(A):
     an iterable of weighted edge triples.
 
     """
+    import numpy as np
     ncols = A.shape[1]
     data, indices, indptr = A.data, A.indices, A.indptr
-    for i in range(ncols):
-        for j in range(indptr[i], indptr[i+1]):
-            yield indices[j], i, data[j]
+    cols = np.repeat(np.arange(ncols), np.diff(indptr))
+    return zip(indices.tolist(), cols.tolist(), data.tolist())
 
 
 def _coo_gen_triples(A):
@@ -760,7 +873,7 @@ def _coo_gen_triples(A):
 
     """
     row, col, data = A.row, A.col, A.data
-    return zip(row, col, data)
+    return zip(row.tolist(), col.tolist(), data.tolist())
 
 
 def _dok_gen_triples(A):
@@ -789,6 +902,25 @@ def _generate_weighted_edges(A):
     return _coo_gen_triples(A.tocoo())
 
 
+def _add_weighted_edges(G, triples, edge_attribute):
+    """Add the weighted edges of the (u, v, w) `triples` to the graph `G`.
+
+    `G` is not a multigraph and holds the nodes of the triples.  The
+    neighbor dictionaries are filled directly instead of adding the edges
+    one by one.  As with ``add_weighted_edges_from``, the last of several
+    triples of the same edge sets its weight.
+    """
+    new_edge_data = G.edge_attr_dict_factory
+    succ = G.adj
+    pred = G.pred if G.is_directed() else G.adj
+    for u, v, w in triples:
+        datadict = new_edge_data()
+        datadict[edge_attribute] = w
+        succ[u][v] = datadict
+        pred[v][u] = datadict
+    G._version += 1
+
+
 def from_scipy_sparse_matrix(A, parallel_edges=False, create_using=None,
                              edge_attribute='weight'):
     """Creates a new graph from an adjacency matrix given as a SciPy sparse
@@ -864,6 +996,9 @@ def from_scipy_sparse_matrix(A, parallel_edges=False, create_using=None,
     # Create an iterable over (u, v, w) triples and for each triple, add an
     # edge from u to v with weight w.
     triples = _generate_weighted_edges(A)
+    if not G.is_multigraph():
+        _add_weighted_edges(G, triples, edge_attribute)
+        return G
     # If the entries in the adjacency matrix are integers, the graph is a
     # multigraph, and parallel_edges is True, then create parallel edges, each
     # with weight 1, for each entry in the adjacency matrix. Otherwise, create
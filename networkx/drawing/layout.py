@@ -218,7 +218,10 @@ def fruchterman_reingold_layout(G,dim=2,k=None,
                                 iterations=50,
                                 weight='weight',
                                 scale=1.0,
-                                center=None):
+                                center=None,
+                                method=None,
+                                theta=1.0,
+                                multilevel=True):
     """Position nodes using Fruchterman-Reingold force-directed algorithm.
 
     Parameters
@@ -255,6 +258,30 @@ def fruchterman_reingold_layout(G,dim=2,k=None,
     center : array-like or None
        Coordinate pair around which to center the layout.
 
+    method : None or 'barnes_hut' optional (default=None)
+       If None, the forces between all pairs of nodes are computed,
+       with a dense matrix for graphs of less than 500 nodes and row by
+       row with a sparse matrix otherwise.  If 'barnes_hut', the
+       repulsive forces are approximated with a quadtree (an octree in
+       three dimensions, in general a tree of cells with 2**dim children)
+       and the attractive forces are computed over the array of edges.
+       Each iteration then takes O(n log n + m) time and memory, which
+       lays out graphs of hundreds of thousands of nodes.  SciPy is
+       required.
+
+    theta : float  optional (default=1.0)
+       Opening criterion of the Barnes-Hut approximation: the nodes of a
+       cell of width w at distance d of a node are replaced by their
+       centroid when w / d < theta.  Smaller values are more accurate
+       and slower.  Only used if method='barnes_hut'.
+
+    multilevel : bool  optional (default=True)
+       If True and neither `pos` nor `fixed` is given, the graph is
+       coarsened by repeatedly merging matched neighbors; the coarsest
+       graph is laid out first and each layout is the initial placement
+       of the next finer graph, with `iterations` iterations at each
+       level.  Only used if method='barnes_hut'.
+
     Returns
     -------
     dict :
@@ -267,6 +294,13 @@ def fruchterman_reingold_layout(G,dim=2,k=None,
 
     # The same using longer function name
     >>> pos=nx.fruchterman_reingold_layout(G)
+
+    Large graphs are laid out with the Barnes-Hut approximation:
+
+    >>> G = nx.grid_2d_graph(30, 30)
+    >>> pos = nx.spring_layout(G, method='barnes_hut')
+    >>> len(pos)
+    900
     """
     import numpy as np
 
@@ -292,6 +326,20 @@ def fruchterman_reingold_layout(G,dim=2,k=None,
     if len(G) == 1:
         return {G.nodes()[0]: center}
 
+    if method == 'barnes_hut':
+        A = nx.to_scipy_sparse_matrix(G, weight=weight, dtype='f')
+        if k is None and fixed is not None:
+           # We must adjust k by domain size for layouts that are not near 1x1
+           k = dom_size / np.sqrt(len(G))
+        pos = _barnes_hut_fruchterman_reingold(A, dim, k, pos_arr, fixed,
+                                               iterations, theta, multilevel)
+        if fixed is None:
+            pos = _rescale_layout(pos, scale=scale) + center
+        return dict(zip(G, pos))
+    elif method is not None:
+        raise ValueError("Unknown method %r: use None or 'barnes_hut'."
+                         % (method,))
+
     try:
         # Sparse matrix
         if len(G) < 500:  # sparse solver for large graphs
@@ -452,6 +500,243 @@ def _sparse_fruchterman_reingold(A, dim=2, k=None, pos=None, fixed=None,
     return pos
 
 
+def _barnes_hut_fruchterman_reingold(A, dim=2, k=None, pos=None, fixed=None,
+                                     iterations=50, theta=1.0,
+                                     multilevel=True):
+    # Position nodes in the sparse adjacency matrix A using
+    # Fruchterman-Reingold with Barnes-Hut repulsive forces.
+    # Entry point for NetworkX graph is fruchterman_reingold_layout()
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("_barnes_hut_fruchterman_reingold() requires numpy: http://scipy.org/ ")
+    try:
+        from scipy.sparse import coo_matrix, csr_matrix
+    except ImportError:
+        raise ImportError("_barnes_hut_fruchterman_reingold() requires scipy: http://scipy.org/ ")
+    try:
+        nnodes, _ = A.shape
+    except AttributeError:
+        raise nx.NetworkXError(
+            "fruchterman_reingold() takes an adjacency matrix as input")
+    A = csr_matrix(A, dtype=float)
+    if k is None:
+        k = np.sqrt(1.0 / nnodes)
+
+    if pos is not None:
+        pos = np.array(pos, dtype=float)
+        t = 0.1 * (pos.max(axis=0) - pos.min(axis=0)).max()
+        return _barnes_hut_iterations(A, pos, k, t, fixed, iterations, theta)
+
+    # Coarser and coarser graphs, each node of a graph being the group
+    # of nodes of the previous graph given by groups.
+    graphs = [A]
+    groups = []
+    while multilevel and fixed is None and graphs[-1].shape[0] > 50:
+        group, ncoarse = _match_neighbors(graphs[-1])
+        if ncoarse > 0.75 * graphs[-1].shape[0]:
+            break
+        n = graphs[-1].shape[0]
+        P = coo_matrix((np.ones(n), (np.arange(n), group)),
+                       shape=(n, ncoarse)).tocsr()
+        C = (P.T * graphs[-1] * P).tocoo()
+        offdiag = C.row != C.col
+        graphs.append(csr_matrix((C.data[offdiag],
+                                  (C.row[offdiag], C.col[offdiag])),
+                                 shape=C.shape))
+        groups.append(group)
+
+    # The coarse graphs are laid out with the same area per node.
+    n = graphs[-1].shape[0]
+    pos = np.random.random((n, dim))
+    t = 0.1
+    for level in range(len(graphs) - 1, -1, -1):
+        klevel = k * np.sqrt(float(nnodes) / graphs[level].shape[0])
+        if level < len(graphs) - 1:
+            # Place the nodes of each group around the position of the
+            # group, and let them move by about the length of a coarse
+            # edge.
+            t = k * np.sqrt(float(nnodes) / graphs[level + 1].shape[0])
+            pos = pos[groups[level]]
+            pos += (np.random.random(pos.shape) - 0.5) * klevel
+        pos = _barnes_hut_iterations(graphs[level], pos, klevel, t, fixed,
+                                     iterations, theta)
+    return pos
+
+
+def _match_neighbors(A):
+    # Return the group of each node and the number of groups of a
+    # coarsening of the sparse matrix A.  Neighbors proposing to each
+    # other are matched, for a few rounds, and the nodes left unmatched
+    # join the group of their proposed neighbor when it is matched.
+    import numpy as np
+    n = A.shape[0]
+    S = abs(A) + abs(A.T)
+    indptr, indices = S.indptr, S.indices
+    nodes = np.arange(n)
+    group = nodes.copy()
+    matched = np.zeros(n, dtype=bool)
+    proposal = nodes.copy()
+    for attempt in range(3):
+        # each unmatched node proposes to a random neighbor
+        free = np.flatnonzero(~matched & (np.diff(indptr) > 0))
+        if len(free) == 0:
+            break
+        deg = indptr[free + 1] - indptr[free]
+        proposal[free] = indices[indptr[free] +
+                                 (np.random.random(len(free)) * deg)
+                                 .astype(indptr.dtype)]
+        target = proposal[free]
+        mutual = ((proposal[target] == free) & ~matched[target] &
+                  (target != free))
+        u, v = free[mutual], target[mutual]
+        group[u] = np.minimum(u, v)
+        matched[u] = True
+    free = np.flatnonzero(~matched & (np.diff(indptr) > 0))
+    joins = matched[proposal[free]]
+    group[free[joins]] = group[proposal[free[joins]]]
+    _, group = np.unique(group, return_inverse=True)
+    return group, group.max() + 1
+
+
+def _barnes_hut_iterations(A, pos, k, t, fixed, iterations, theta):
+    # Run iterations of Fruchterman-Reingold on positions pos, with
+    # initial temperature t.  The displacement of each node is limited
+    # by the temperature, which decreases linearly.
+    import numpy as np
+    nnodes, dim = pos.shape
+    A = A.tocoo()
+    u, v, w = A.row, A.col, A.data
+    dt = t / float(iterations + 1)
+    min_distance = 0.01 * k
+    for iteration in range(iterations):
+        displacement = _barnes_hut_repulsion(pos, k, theta, min_distance)
+        # attractive forces along the edges
+        delta = pos[u] - pos[v]
+        distance = np.sqrt((delta ** 2).sum(axis=1))
+        distance = np.maximum(distance, min_distance)
+        force = delta * (w * distance / k)[:, None]
+        for i in range(dim):
+            displacement[:, i] -= np.bincount(u, weights=force[:, i],
+                                              minlength=nnodes)
+        length = np.sqrt((displacement ** 2).sum(axis=1))
+        step = np.minimum(length, t) / np.where(length > 0, length, 1.0)
+        delta_pos = displacement * step[:, None]
+        if fixed is not None:
+            # don't change positions of fixed nodes
+            delta_pos[fixed] = 0.0
+        pos += delta_pos
+        # cool temperature
+        t -= dt
+    return pos
+
+
+def _barnes_hut_repulsion(pos, k, theta, min_distance, chunksize=8192):
+    # Return the Fruchterman-Reingold repulsive forces k*k/d between the
+    # nodes at positions pos, approximated with a Barnes-Hut tree.
+    #
+    # The nodes are sorted along a Morton (Z-order) curve so that the
+    # nodes of each cell of the tree are contiguous: the cells of each
+    # level are the runs of nodes sharing a prefix of their Morton key.
+    # The tree is then traversed for many nodes at once, keeping arrays
+    # of (node, cell) pairs still to be examined.
+    import numpy as np
+    nnodes, dim = pos.shape
+    lower = pos.min(axis=0)
+    width = (pos.max(axis=0) - lower).max()
+    if width == 0:
+        width = 1.0
+    depth = min(20, 62 // dim)
+    q = ((pos - lower) * ((2 ** depth) / width)).astype(np.int64)
+    np.clip(q, 0, 2 ** depth - 1, out=q)
+    keys = np.zeros(nnodes, dtype=np.int64)
+    for b in range(depth):
+        for i in range(dim):
+            keys |= ((q[:, i] >> b) & 1) << (b * dim + i)
+    order = np.argsort(keys, kind='mergesort')
+    keys = keys[order]
+    spos = pos[order]
+
+    # Cells of the tree, level by level.  Nodes of cell c are the sorted
+    # nodes start[c] to end[c] - 1, and its children are the cells
+    # first[c] to first[c] + nchildren[c] - 1.
+    starts = [np.zeros(1, dtype=np.intp)]
+    ends = [np.array([nnodes], dtype=np.intp)]
+    levels = [np.zeros(1, dtype=np.intp)]
+    firsts = []
+    nchildren = []
+    ncells = 1
+    for level in range(1, depth + 1):
+        parent_start, parent_end = starts[-1], ends[-1]
+        split = parent_end - parent_start > 1
+        if not split.any():
+            break
+        # positions of the nodes of the cells split at this level
+        mark = np.zeros(nnodes + 1, dtype=np.intp)
+        mark[parent_start[split]] += 1
+        mark[parent_end[split]] -= 1
+        inside = np.cumsum(mark[:-1]) > 0
+        prefix = keys >> (dim * (depth - level))
+        change = np.ones(nnodes, dtype=bool)
+        change[1:] = prefix[1:] != prefix[:-1]
+        run_start = np.flatnonzero(change)
+        run_end = np.append(run_start[1:], nnodes)
+        keep = inside[run_start]
+        start, end = run_start[keep], run_end[keep]
+        parent = np.searchsorted(parent_start, start, side='right') - 1
+        count = np.bincount(parent, minlength=len(parent_start))
+        firsts.append(ncells + np.cumsum(count) - count)
+        nchildren.append(count)
+        starts.append(start)
+        ends.append(end)
+        levels.append(np.empty(len(start), dtype=np.intp))
+        levels[-1].fill(level)
+        ncells += len(start)
+    firsts.append(np.zeros(len(starts[-1]), dtype=np.intp))
+    nchildren.append(np.zeros(len(starts[-1]), dtype=np.intp))
+    start = np.concatenate(starts)
+    end = np.concatenate(ends)
+    first = np.concatenate(firsts)
+    nchild = np.concatenate(nchildren)
+    mass = (end - start).astype(float)
+    cumpos = np.zeros((nnodes + 1, dim))
+    np.cumsum(spos, axis=0, out=cumpos[1:])
+    centroid = (cumpos[end] - cumpos[start]) / mass[:, None]
+    width2 = (width / 2.0 ** np.concatenate(levels)) ** 2
+
+    displacement = np.zeros((nnodes, dim))
+    for chunk in range(0, nnodes, chunksize):
+        size = min(chunksize, nnodes - chunk)
+        node = np.arange(chunk, chunk + size)
+        cell = np.zeros(size, dtype=np.intp)
+        while len(node):
+            delta = spos[node] - centroid[cell]
+            distance2 = (delta ** 2).sum(axis=1)
+            inside = (start[cell] <= node) & (node < end[cell])
+            leaf = nchild[cell] == 0
+            # cells far enough, and single nodes, act as one body
+            accept = ~inside & (leaf | (width2[cell] < theta ** 2 *
+                                        distance2))
+            distance2 = np.maximum(distance2[accept], min_distance ** 2)
+            force = delta[accept] * (k * k * mass[cell[accept]] /
+                                     distance2)[:, None]
+            index = node[accept] - chunk
+            for i in range(dim):
+                displacement[chunk:chunk + size, i] += np.bincount(
+                    index, weights=force[:, i], minlength=size)
+            # open the other cells
+            expand = ~accept & ~leaf
+            node, cell = node[expand], cell[expand]
+            count = nchild[cell]
+            offset = np.arange(count.sum()) - np.repeat(np.cumsum(count) -
+                                                        count, count)
+            node = np.repeat(node, count)
+            cell = np.repeat(first[cell], count) + offset
+    result = np.empty_like(displacement)
+    result[order] = displacement
+    return result
+
+
 def spectral_layout(G, dim=2, weight='weight', scale=1, center=None):
     """Position nodes using the eigenvectors of the graph Laplacian.
 
@@ -487,8 +772,10 @@ def spectral_layout(G, dim=2, weight='weight', scale=1, center=None):
     Directed graphs will be considered as undirected graphs when
     positioning the nodes.
 
-    For larger graphs (>500 nodes) this will use the SciPy sparse
-    eigenvalue solver (ARPACK).
+    For larger graphs (>500 nodes) this will use a multilevel sparse
+    eigenvalue solver: the eigenvectors of coarser and coarser graphs,
+    obtained by merging matched neighbors, are refined with the SciPy
+    LOBPCG solver.
     """
     # handle some special cases that break the eigensolvers
     import numpy as np
@@ -552,18 +839,14 @@ def _spectral(A, dim=2):
 
 def _sparse_spectral(A,dim=2):
     # Input adjacency matrix A
-    # Uses sparse eigenvalue solver from scipy
-    # Could use multilevel methods here, see Koren "On spectral graph drawing"
+    # Uses the multilevel sparse eigenvalue solver of algebraic_connectivity,
+    # see Koren "On spectral graph drawing"
     try:
         import numpy as np
         from scipy.sparse import spdiags
     except ImportError:
         raise ImportError("_sparse_spectral() requires scipy & numpy: http://scipy.org/ ")
-    try:
-        from scipy.sparse.linalg.eigen import eigsh
-    except ImportError:
-        # scipy <0.9.0 names eigsh differently
-        from scipy.sparse.linalg import eigen_symmetric as eigsh
+    from networkx.linalg.algebraicconnectivity import _multilevel_eigenvectors
     try:
         nnodes,_=A.shape
     except AttributeError:
@@ -575,13 +858,9 @@ def _sparse_spectral(A,dim=2):
     D=spdiags(data,0,nnodes,nnodes)
     L=D-A
 
-    k=dim+1
-    # number of Lanczos vectors for ARPACK solver.What is the right scaling?
-    ncv=max(2*k+1,int(np.sqrt(nnodes)))
-    # return smallest k eigenvalues and eigenvectors
-    eigenvalues,eigenvectors=eigsh(L,k,which='SM',ncv=ncv)
-    index=np.argsort(eigenvalues)[1:k] # 0 index is zero eigenvalue
-    return np.real(eigenvectors[:,index])
+    # smallest dim eigenvectors orthogonal to the constant eigenvector
+    eigenvalues,eigenvectors=_multilevel_eigenvectors(L,dim,False,1e-4)
+    return np.real(eigenvectors)
 
 
 def _rescale_layout(pos,scale=1):
@@ -1,7 +1,7 @@
 """Unit tests for layout functions."""
 import sys
 from nose import SkipTest
-from nose.tools import assert_equal
+from nose.tools import assert_equal, assert_raises
 import networkx as nx
 
 
@@ -64,3 +64,58 @@ class TestLayout(object):
         G = nx.path_graph(3)
         vpos = nx.shell_layout(G, [[0], [1,2]])
         assert(vpos[0].any() == False)
+
+    def test_barnes_hut(self):
+        try:
+            import scipy
+        except ImportError:
+            raise SkipTest('scipy not available.')
+        G = self.bigG
+        for dim in (2, 3):
+            vpos = nx.spring_layout(G, dim=dim, method='barnes_hut',
+                                    iterations=10)
+            assert_equal(len(vpos), len(G))
+            assert_equal(vpos[(0, 0)].shape, (dim,))
+            assert(numpy.isfinite(list(vpos.values())).all())
+        vpos = nx.spring_layout(G, method='barnes_hut', multilevel=False,
+                                iterations=10, theta=0.5)
+        assert_equal(len(vpos), len(G))
+        pos = nx.circular_layout(G)
+        vpos = nx.spring_layout(G, pos=pos, fixed=[(0, 0)],
+                                method='barnes_hut', iterations=10)
+        assert_equal(tuple(vpos[(0, 0)]), tuple(pos[(0, 0)]))
+        vpos = nx.spring_layout(self.Gs, method='barnes_hut')
+        assert_equal(len(vpos), 6)
+
+    def test_barnes_hut_repulsion(self):
+        try:
+            import scipy
+        except ImportError:
+            raise SkipTest('scipy not available.')
+        # With theta=0 no cell is approximated and the forces are exact.
+        numpy.random.seed(1)
+        pos = numpy.random.random((200, 2))
+        k = 0.1
+        delta = pos[:, numpy.newaxis, :] - pos[numpy.newaxis, :, :]
+        distance2 = (delta ** 2).sum(axis=2)
+        numpy.fill_diagonal(distance2, 1)
+        expected = (delta * (k * k / distance2)[:, :, numpy.newaxis]).sum(1)
+        repulsion = nx.drawing.layout._barnes_hut_repulsion
+        force = repulsion(pos, k, 0.0, 1e-6)
+        assert(numpy.allclose(force, expected))
+        force = repulsion(pos, k, 0.0, 1e-6, chunksize=7)
+        assert(numpy.allclose(force, expected))
+
+    def test_sparse_spectral_collapsing_graphs(self):
+        try:
+            import scipy
+        except ImportError:
+            raise SkipTest('scipy not available.')
+        # Larger than 500 nodes, and collapsed to a few nodes by matchings.
+        for G in (nx.star_graph(700), nx.complete_graph(600)):
+            pos = nx.spectral_layout(G)
+            points = set(tuple(numpy.round(p, 8)) for p in pos.values())
+            assert_equal(len(points), len(G))
+
+    def test_unknown_method(self):
+        assert_raises(ValueError, nx.spring_layout, self.Gi, method='exact')
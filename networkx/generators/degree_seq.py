@@ -15,6 +15,8 @@ import random
 
 import networkx as nx
 from networkx.utils import random_weighted_sample
+from .vectorized import (_check_engine, _default_rng, configuration_edges,
+                         edges_to_graph)
 
 __author__ = "\n".join(['Aric Hagberg <aric.hagberg@gmail.com>',
                         'Pieter Swart <swart@lanl.gov>',
@@ -32,7 +34,8 @@ __all__ = ['configuration_model',
            'random_degree_sequence_graph']
 
 
-def configuration_model(deg_sequence,create_using=None,seed=None):
+def configuration_model(deg_sequence, create_using=None, seed=None,
+                        engine='python', output='graph'):
     """Return a random graph with the given degree sequence.
 
     The configuration model generates a random pseudograph (graph with
@@ -45,8 +48,17 @@ def configuration_model(deg_sequence,create_using=None,seed=None):
         Each list entry corresponds to the degree of a node.
     create_using : graph, optional (default MultiGraph)
        Return graph of this type. The instance will be cleared.
-    seed : hashable object, optional
-        Seed for random number generator.
+    seed : hashable object or numpy.random.Generator, optional
+        Seed for random number generator.  NumPy random generators are only
+        accepted by the 'numpy' engine.
+    engine : 'python' or 'numpy', optional (default='python')
+        The 'numpy' engine shuffles the stubs with NumPy and adds the edges
+        to the graph in bulk.
+    output : 'graph', 'edges' or 'csr', optional (default='graph')
+        Return a graph, a NumPy array holding one edge per row or a compact
+        :class:`CSRGraph`, without building dictionaries for the edges.
+        The 'csr' output requires `create_using` to be a :class:`Graph`.
+        The 'edges' and 'csr' outputs require the 'numpy' engine.
 
     Returns
     -------
@@ -116,6 +128,15 @@ def configuration_model(deg_sequence,create_using=None,seed=None):
     elif create_using.is_directed():
         raise nx.NetworkXError("Directed Graph not supported")
 
+    if _check_engine(engine, output):
+        G = nx.empty_graph(0, create_using)
+        edges = configuration_edges(_default_rng(seed), deg_sequence)
+        G = edges_to_graph(G, len(deg_sequence), edges, output)
+        if output != 'edges':
+            G.name = "configuration_model %d nodes %d edges" % (
+                G.order(), G.number_of_edges())
+        return G
+
     if not seed is None:
         random.seed(seed)
 
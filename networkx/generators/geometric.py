@@ -26,6 +26,8 @@ import random
 import sys
 import networkx as nx
 from networkx.utils import nodes_or_number
+from .vectorized import (_check_engine, _default_rng, edges_to_graph,
+                         geometric_edges)
 
 #---------------------------------------------------------------------------
 #  Random Geometric Graphs
@@ -33,7 +35,8 @@ from networkx.utils import nodes_or_number
 
 
 @nodes_or_number(0)
-def random_geometric_graph(n, radius, dim=2, pos=None):
+def random_geometric_graph(n, radius, dim=2, pos=None, seed=None,
+                           engine='python', output='graph'):
     """Returns a random geometric graph in the unit cube.
 
     The random geometric graph model places `n` nodes uniformly at random in
@@ -50,6 +53,17 @@ def random_geometric_graph(n, radius, dim=2, pos=None):
         Dimension of graph
     pos : dict, optional
         A dictionary keyed by node with node positions as values.
+    seed : int or numpy.random.Generator, optional
+        Seed for random number generator (default=None).  NumPy random
+        generators are only accepted by the 'numpy' engine.
+    engine : 'python' or 'numpy', optional (default='python')
+        The 'numpy' engine draws the positions with NumPy, finds the edges
+        with a k-d tree from SciPy and adds them to the graph in bulk.
+    output : 'graph', 'edges' or 'csr', optional (default='graph')
+        Return a graph, a NumPy array holding one edge per row or a compact
+        :class:`CSRGraph`, without building dictionaries for the edges.
+        The edges are given by the positions of their nodes in the list of
+        nodes.  The 'edges' and 'csr' outputs require the 'numpy' engine.
 
     Returns
     -------
@@ -66,8 +80,8 @@ def random_geometric_graph(n, radius, dim=2, pos=None):
     -----
     This algorithm currently only supports Euclidean distance.
 
-    This uses an `O(n^2)` algorithm to build the graph.  A faster algorithm
-    is possible using k-d trees.
+    The 'python' engine uses an `O(n^2)` algorithm to build the graph.  The
+    'numpy' engine uses a k-d tree instead.
 
     The `pos` keyword argument can be used to specify node positions so you
     can create an arbitrary distribution and domain for positions.
@@ -88,6 +102,24 @@ def random_geometric_graph(n, radius, dim=2, pos=None):
     n_name, nodes = n
     G = nx.Graph()
     G.name = "Random Geometric Graph"
+    if _check_engine(engine, output):
+        import numpy as np
+        nodes = list(nodes)
+        if pos is None:
+            pos = _default_rng(seed).random((len(nodes), dim))
+            points = pos
+            pos = dict(zip(nodes, pos.tolist()))
+        else:
+            points = np.array([pos[v] for v in nodes], dtype=float)
+        edges = geometric_edges(points, radius)
+        if output == 'edges':
+            return edges
+        node_data = dict((v, {'pos': pos[v]}) for v in nodes)
+        labels = None if nodes == list(range(len(nodes))) else nodes
+        return edges_to_graph(G, len(nodes), edges, output, nodes=labels,
+                              node_data=node_data)
+    if seed is not None:
+        random.seed(seed)
     G.add_nodes_from(nodes)
     if pos is None:
         # random positions
@@ -17,6 +17,9 @@ import random
 import networkx as nx
 from .classic import empty_graph, path_graph, complete_graph
 from .degree_seq import degree_sequence_tree
+from .vectorized import (_check_engine, _default_rng, barabasi_albert_edges,
+                         edges_to_graph, gnm_edges, gnp_edges,
+                         watts_strogatz_edges)
 from collections import defaultdict
 __author__ = "\n".join(['Aric Hagberg (hagberg@lanl.gov)',
                         'Pieter Swart (swart@lanl.gov)',
@@ -46,7 +49,8 @@ __all__ = ['fast_gnp_random_graph',
 #-------------------------------------------------------------------------
 
 
-def fast_gnp_random_graph(n, p, seed=None, directed=False):
+def fast_gnp_random_graph(n, p, seed=None, directed=False, engine='python',
+                          output='graph'):
     """Returns a `G_{n,p}` random graph, also known as an Erdős-Rényi graph or
     a binomial graph.
 
@@ -56,10 +60,20 @@ def fast_gnp_random_graph(n, p, seed=None, directed=False):
         The number of nodes.
     p : float
         Probability for edge creation.
-    seed : int, optional
-        Seed for random number generator (default=None).
+    seed : int or numpy.random.Generator, optional
+        Seed for random number generator (default=None).  NumPy random
+        generators are only accepted by the 'numpy' engine.
     directed : bool, optional (default=False)
         If True, this function returns a directed graph.
+    engine : 'python' or 'numpy', optional (default='python')
+        The 'numpy' engine draws the edges in batches with NumPy and adds
+        them to the graph in bulk, which is much faster for large graphs.
+        It uses a NumPy random generator, so a seed does not give the same
+        graph as with the 'python' engine.
+    output : 'graph', 'edges' or 'csr', optional (default='graph')
+        Return a graph, a NumPy array holding one edge per row or a compact
+        :class:`CSRGraph`, without building dictionaries for the edges.
+        The 'edges' and 'csr' outputs require the 'numpy' engine.
 
     Notes
     -----
@@ -71,6 +85,9 @@ def fast_gnp_random_graph(n, p, seed=None, directed=False):
     :func:`gnp_random_graph` when `p` is small and the expected number of edges
     is small (that is, the graph is sparse).
 
+    The 'numpy' engine draws the geometrically distributed gaps between
+    consecutive edges in batches.
+
     See Also
     --------
     gnp_random_graph
@@ -81,6 +98,12 @@ def fast_gnp_random_graph(n, p, seed=None, directed=False):
        "Efficient generation of large random networks",
        Phys. Rev. E, 71, 036113, 2005.
     """
+    if _check_engine(engine, output):
+        G = nx.DiGraph() if directed else nx.Graph()
+        G.name = "fast_gnp_random_graph(%s,%s)" % (n, p)
+        edges = gnp_edges(_default_rng(seed), n, p, directed)
+        return edges_to_graph(G, n, edges, output)
+
     G = empty_graph(n)
     G.name="fast_gnp_random_graph(%s,%s)"%(n,p)
 
@@ -248,7 +271,8 @@ def dense_gnm_random_graph(n, m, seed=None):
             u+=1
             v=u+1
 
-def gnm_random_graph(n, m, seed=None, directed=False):
+def gnm_random_graph(n, m, seed=None, directed=False, engine='python',
+                     output='graph'):
     """Returns a `G_{n,m}` random graph.
 
     In the `G_{n,m}` model, a graph is chosen uniformly at random from the set
@@ -263,16 +287,32 @@ def gnm_random_graph(n, m, seed=None, directed=False):
         The number of nodes.
     m : int
         The number of edges.
-    seed : int, optional
-        Seed for random number generator (default=None).
+    seed : int or numpy.random.Generator, optional
+        Seed for random number generator (default=None).  NumPy random
+        generators are only accepted by the 'numpy' engine.
     directed : bool, optional (default=False)
         If True return a directed graph
+    engine : 'python' or 'numpy', optional (default='python')
+        The 'numpy' engine draws the edges in batches with NumPy and adds
+        them to the graph in bulk, which is much faster for large graphs.
+        It uses a NumPy random generator, so a seed does not give the same
+        graph as with the 'python' engine.
+    output : 'graph', 'edges' or 'csr', optional (default='graph')
+        Return a graph, a NumPy array holding one edge per row or a compact
+        :class:`CSRGraph`, without building dictionaries for the edges.
+        The 'edges' and 'csr' outputs require the 'numpy' engine.
 
     See also
     --------
     dense_gnm_random_graph
 
     """
+    if _check_engine(engine, output):
+        G = nx.DiGraph() if directed else nx.Graph()
+        G.name = "gnm_random_graph(%s,%s)" % (n, m)
+        edges = gnm_edges(_default_rng(seed), n, m, directed)
+        return edges_to_graph(G, n, edges, output)
+
     if directed:
         G=nx.DiGraph()
     else:
@@ -371,7 +411,8 @@ def newman_watts_strogatz_graph(n, k, p, seed=None):
     return G
 
 
-def watts_strogatz_graph(n, k, p, seed=None):
+def watts_strogatz_graph(n, k, p, seed=None, engine='python',
+                         output='graph'):
     """Return a Watts–Strogatz small-world graph.
 
     Parameters
@@ -383,8 +424,18 @@ def watts_strogatz_graph(n, k, p, seed=None):
         topology.
     p : float
         The probability of rewiring each edge
-    seed : int, optional
-        Seed for random number generator (default=None)
+    seed : int or numpy.random.Generator, optional
+        Seed for random number generator (default=None).  NumPy random
+        generators are only accepted by the 'numpy' engine.
+    engine : 'python' or 'numpy', optional (default='python')
+        The 'numpy' engine draws the edges in batches with NumPy and adds
+        them to the graph in bulk, which is much faster for large graphs.
+        It uses a NumPy random generator, so a seed does not give the same
+        graph as with the 'python' engine.
+    output : 'graph', 'edges' or 'csr', optional (default='graph')
+        Return a graph, a NumPy array holding one edge per row or a compact
+        :class:`CSRGraph`, without building dictionaries for the edges.
+        The 'edges' and 'csr' outputs require the 'numpy' engine.
 
     See Also
     --------
@@ -404,6 +455,10 @@ def watts_strogatz_graph(n, k, p, seed=None):
     does not increase the number of edges. The rewired graph is not guaranteed
     to be connected as in :func:`connected_watts_strogatz_graph`.
 
+    The 'numpy' engine rewires all edges at once.  New ends making
+    self-loops or multiple edges in the rewired graph are drawn again, so
+    an edge may be rewired to a node whose original edge is rewired too.
+
     References
     ----------
     .. [1] Duncan J. Watts and Steven H. Strogatz,
@@ -412,6 +467,11 @@ def watts_strogatz_graph(n, k, p, seed=None):
     """
     if k>=n:
         raise nx.NetworkXError("k>=n, choose smaller k or larger n")
+    if _check_engine(engine, output):
+        G = nx.Graph()
+        G.name = "watts_strogatz_graph(%s,%s,%s)" % (n, k, p)
+        edges = watts_strogatz_edges(_default_rng(seed), n, k, p)
+        return edges_to_graph(G, n, edges, output)
     if seed is not None:
         random.seed(seed)
 
@@ -598,7 +658,7 @@ def _random_subset(seq,m):
         targets.add(x)
     return targets
 
-def barabasi_albert_graph(n, m, seed=None):
+def barabasi_albert_graph(n, m, seed=None, engine='python', output='graph'):
     """Returns a random graph according to the Barabási–Albert preferential
     attachment model.
 
@@ -611,8 +671,18 @@ def barabasi_albert_graph(n, m, seed=None):
         Number of nodes
     m : int
         Number of edges to attach from a new node to existing nodes
-    seed : int, optional
-        Seed for random number generator (default=None).
+    seed : int or numpy.random.Generator, optional
+        Seed for random number generator (default=None).  NumPy random
+        generators are only accepted by the 'numpy' engine.
+    engine : 'python' or 'numpy', optional (default='python')
+        The 'numpy' engine draws the edges in batches with NumPy and adds
+        them to the graph in bulk, which is much faster for large graphs.
+        It uses a NumPy random generator, so a seed does not give the same
+        graph as with the 'python' engine.
+    output : 'graph', 'edges' or 'csr', optional (default='graph')
+        Return a graph, a NumPy array holding one edge per row or a compact
+        :class:`CSRGraph`, without building dictionaries for the edges.
+        The 'edges' and 'csr' outputs require the 'numpy' engine.
 
     Returns
     -------
@@ -632,6 +702,11 @@ def barabasi_albert_graph(n, m, seed=None):
     if m < 1 or  m >=n:
         raise nx.NetworkXError("Barabási–Albert network must have m >= 1"
                                " and m < n, m = %d, n = %d" % (m, n))
+    if _check_engine(engine, output):
+        G = nx.Graph()
+        G.name = "barabasi_albert_graph(%s,%s)" % (n, m)
+        edges = barabasi_albert_edges(_default_rng(seed), n, m)
+        return edges_to_graph(G, n, edges, output)
     if seed is not None:
         random.seed(seed)
 
@@ -0,0 +1,175 @@
+"""Unit tests for the NumPy engine of the random graph generators."""
+from nose import SkipTest
+from nose.tools import assert_equal, assert_raises, assert_true
+
+import networkx as nx
+
+
+def setup_module(module):
+    global np
+    try:
+        import numpy as np
+    except ImportError:
+        raise SkipTest('NumPy not available.')
+
+
+def edge_set(edges, directed=False):
+    if directed:
+        return set(map(tuple, edges))
+    return set(frozenset(e) for e in edges)
+
+
+class TestNumPyEngine(object):
+
+    def test_fast_gnp_random_graph(self):
+        G = nx.fast_gnp_random_graph(1000, 0.01, seed=42, engine='numpy')
+        assert_equal(len(G), 1000)
+        assert_true(abs(G.number_of_edges() - 4995) < 500)
+        assert_equal(G.number_of_selfloops(), 0)
+        H = nx.fast_gnp_random_graph(1000, 0.01, seed=42, engine='numpy')
+        assert_equal(edge_set(G.edges()), edge_set(H.edges()))
+        D = nx.fast_gnp_random_graph(100, 0.1, seed=42, directed=True,
+                                     engine='numpy')
+        assert_true(D.is_directed())
+        assert_true(abs(D.number_of_edges() - 990) < 200)
+        assert_equal(D.number_of_selfloops(), 0)
+        G = nx.fast_gnp_random_graph(10, 1, engine='numpy')
+        assert_equal(G.number_of_edges(), 45)
+        G = nx.fast_gnp_random_graph(10, 0, engine='numpy')
+        assert_equal(G.number_of_edges(), 0)
+
+    def test_gnm_random_graph(self):
+        for directed, ms in ((False, (0, 20, 40, 55)),
+                             (True, (0, 20, 80, 110))):
+            for m in ms:
+                G = nx.gnm_random_graph(11, m, seed=1, directed=directed,
+                                        engine='numpy')
+                assert_equal(len(G), 11)
+                assert_equal(G.number_of_edges(), m)
+                assert_equal(G.number_of_selfloops(), 0)
+        G = nx.gnm_random_graph(10, 100, engine='numpy')
+        assert_equal(G.number_of_edges(), 45)
+
+    def test_pairs_are_uniform(self):
+        rng = np.random.default_rng(7)
+        counts = dict.fromkeys(edge_set(nx.complete_graph(5).edges()), 0)
+        for i in range(500):
+            G = nx.gnm_random_graph(5, 4, seed=rng, engine='numpy')
+            for e in G.edges():
+                counts[frozenset(e)] += 1
+        # Each of the 10 pairs is an edge with probability 0.4.
+        assert_true(all(150 < c < 250 for c in counts.values()))
+
+    def test_barabasi_albert_graph(self):
+        G = nx.barabasi_albert_graph(500, 3, seed=2, engine='numpy')
+        assert_equal(len(G), 500)
+        assert_equal(G.number_of_edges(), 3 * 497)
+        assert_true(min(d for n, d in G.degree()) >= 3)
+        G = nx.barabasi_albert_graph(4, 3, seed=2, engine='numpy')
+        assert_equal(G.number_of_edges(), 3)
+
+    def test_watts_strogatz_graph(self):
+        G = nx.watts_strogatz_graph(100, 4, 0, seed=3, engine='numpy')
+        assert_equal(edge_set(G.edges()),
+                     edge_set(nx.watts_strogatz_graph(100, 4, 0).edges()))
+        for p in (0.2, 1):
+            G = nx.watts_strogatz_graph(100, 4, p, seed=3, engine='numpy')
+            assert_equal(G.number_of_edges(), 200)
+            assert_equal(G.number_of_selfloops(), 0)
+        # Nodes adjacent to all other nodes cannot be rewired.
+        G = nx.watts_strogatz_graph(5, 4, 1, seed=3, engine='numpy')
+        assert_equal(G.number_of_edges(), 10)
+
+    def test_random_geometric_graph(self):
+        try:
+            import scipy.spatial
+        except ImportError:
+            raise SkipTest('SciPy not available.')
+        G = nx.random_geometric_graph(200, 0.1, seed=4, engine='numpy')
+        pos = nx.get_node_attributes(G, 'pos')
+        H = nx.random_geometric_graph(200, 0.1, pos=pos)
+        assert_equal(edge_set(G.edges()), edge_set(H.edges()))
+        nodes = ['n%d' % i for i in range(50)]
+        pos = dict((v, (i / 50.0, 0.5)) for i, v in enumerate(nodes))
+        G = nx.random_geometric_graph(nodes, 0.03, pos=pos, engine='numpy')
+        assert_equal(sorted(G), sorted(nodes))
+        assert_equal(G.number_of_edges(), 49)
+        assert_equal(G.node['n3']['pos'], (0.06, 0.5))
+
+    def test_configuration_model(self):
+        deg_sequence = [5, 3, 3, 3, 3, 2, 2, 2, 1, 1, 1]
+        G = nx.configuration_model(deg_sequence, seed=5, engine='numpy')
+        assert_true(G.is_multigraph())
+        assert_equal([d for n, d in sorted(G.degree())], deg_sequence)
+        G = nx.configuration_model([4], seed=5, engine='numpy')
+        assert_equal(G.number_of_edges(0, 0), 2)
+        G = nx.configuration_model(deg_sequence, create_using=nx.Graph(),
+                                   seed=5, engine='numpy')
+        assert_true(not G.is_multigraph())
+        assert_raises(nx.NetworkXError, nx.configuration_model, [1, 2],
+                      engine='numpy')
+
+    def test_seed(self):
+        rng = np.random.default_rng(6)
+        G = nx.gnm_random_graph(50, 100, seed=rng, engine='numpy')
+        H = nx.gnm_random_graph(50, 100, seed=rng, engine='numpy')
+        assert_true(edge_set(G.edges()) != edge_set(H.edges()))
+        G = nx.gnm_random_graph(50, 100, seed=np.random.default_rng(6),
+                                engine='numpy')
+        H = nx.gnm_random_graph(50, 100, seed=6, engine='numpy')
+        assert_equal(edge_set(G.edges()), edge_set(H.edges()))
+
+
+class TestOutput(object):
+    generators = [
+        (nx.fast_gnp_random_graph, (100, 0.05)),
+        (nx.gnm_random_graph, (100, 300)),
+        (nx.barabasi_albert_graph, (100, 2)),
+        (nx.watts_strogatz_graph, (100, 4, 0.3)),
+    ]
+
+    def test_edges(self):
+        for generator, args in self.generators:
+            edges = generator(*args, seed=8, engine='numpy', output='edges')
+            G = generator(*args, seed=8, engine='numpy')
+            assert_equal(edges.shape, (G.number_of_edges(), 2))
+            assert_equal(edge_set(edges.tolist()), edge_set(G.edges()))
+
+    def test_csr(self):
+        for generator, args in self.generators:
+            C = generator(*args, seed=8, engine='numpy', output='csr')
+            G = generator(*args, seed=8, engine='numpy')
+            assert_equal(type(C), nx.CSRGraph)
+            assert_equal(C.name, G.name)
+            assert_equal(list(C), list(G))
+            assert_equal(C.number_of_edges(), G.number_of_edges())
+            assert_equal(edge_set(C.edges()), edge_set(G.edges()))
+            for n in G:
+                assert_equal(sorted(C[n]), sorted(G[n]))
+
+    def test_directed_csr(self):
+        C = nx.gnm_random_graph(30, 200, seed=9, directed=True,
+                                engine='numpy', output='csr')
+        G = nx.gnm_random_graph(30, 200, seed=9, directed=True,
+                                engine='numpy')
+        assert_equal(type(C), nx.CSRDiGraph)
+        assert_equal(C.number_of_edges(), 200)
+        assert_equal(edge_set(C.edges(), True), edge_set(G.edges(), True))
+        for n in G:
+            assert_equal(sorted(C.predecessors(n)), sorted(G.predecessors(n)))
+
+    def test_csr_with_loops(self):
+        C = nx.configuration_model([4, 2, 2], create_using=nx.Graph(),
+                                   seed=10, engine='numpy', output='csr')
+        G = nx.configuration_model([4, 2, 2], create_using=nx.Graph(),
+                                   seed=10, engine='numpy')
+        assert_equal(C.number_of_edges(), G.number_of_edges())
+        assert_equal(edge_set(C.edges()), edge_set(G.edges()))
+
+    def test_unknown(self):
+        assert_raises(ValueError, nx.gnm_random_graph, 10, 5, engine='c')
+        assert_raises(ValueError, nx.gnm_random_graph, 10, 5,
+                      engine='numpy', output='array')
+        assert_raises(ValueError, nx.gnm_random_graph, 10, 5, output='edges')
+        assert_raises(nx.NetworkXError, nx.configuration_model, [1, 1],
+                      engine='numpy', output='csr')
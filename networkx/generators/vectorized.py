@@ -0,0 +1,396 @@
+# -*- coding: utf-8 -*-
+#
+# vectorized.py - NumPy engine of the random graph generators
+#
+# Copyright 2016 NetworkX developers.
+#
+# This file is part of NetworkX.
+#
+# NetworkX is distributed under a BSD license; see LICENSE.txt for more
+# information.
+"""NumPy engine of the random graph generators.
+
+The functions of this module draw all the edges of a random graph as an
+``(m, 2)`` array of node positions and build graphs from such arrays in
+bulk.  They back the ``engine='numpy'`` option of
+:func:`fast_gnp_random_graph`, :func:`gnm_random_graph`,
+:func:`barabasi_albert_graph`, :func:`watts_strogatz_graph`,
+:func:`random_geometric_graph` and :func:`configuration_model`.
+"""
+from __future__ import division
+from array import array
+
+import networkx as nx
+from networkx.classes.csrgraph import _index_typecode
+
+__all__ = []
+
+# Largest number of random variates drawn at once.
+_BATCH = 2 ** 20
+
+
+def _check_engine(engine, output):
+    """Return True if the NumPy engine is selected.
+
+    Raises
+    ------
+    ValueError
+        If `engine` or `output` is unknown, or if an edge array or a CSR
+        graph is requested from the Python engine.
+    """
+    if engine not in ('python', 'numpy'):
+        raise ValueError("Unknown engine %s, use 'python' or 'numpy'."
+                         % (engine,))
+    if output not in ('graph', 'edges', 'csr'):
+        raise ValueError("Unknown output %s, use 'graph', 'edges' or 'csr'."
+                         % (output,))
+    if output != 'graph' and engine != 'numpy':
+        raise ValueError("output='%s' requires engine='numpy'." % (output,))
+    return engine == 'numpy'
+
+
+def _default_rng(seed):
+    """Return a NumPy random generator for `seed`.
+
+    `seed` can be None, an integer or a :class:`numpy.random.Generator`,
+    which is used as is.
+    """
+    import numpy as np
+    return np.random.default_rng(seed)
+
+
+def _pair_edges(index, n, directed):
+    """Return the node pairs numbered by `index`.
+
+    The pairs ``(u, v)`` of distinct nodes with ``v < u`` are numbered
+    ``u (u - 1) / 2 + v`` for undirected graphs, and the pairs of distinct
+    nodes are numbered in row-major order for directed graphs.
+    """
+    import numpy as np
+    index = np.asarray(index, dtype=np.int64)
+    if directed:
+        u = index // (n - 1)
+        v = index % (n - 1)
+        v += v >= u
+    else:
+        u = ((1 + np.sqrt(1 + 8 * index.astype(float))) / 2).astype(np.int64)
+        # Correct the rounding errors of the square root.
+        u -= index < u * (u - 1) // 2
+        u += index >= u * (u + 1) // 2
+        v = index - u * (u - 1) // 2
+    return np.column_stack((u, v))
+
+
+def _unique(values):
+    """Return the sorted distinct values of an integer array."""
+    import numpy as np
+    values = np.sort(values)
+    if len(values) == 0:
+        return values
+    return values[np.concatenate(([True], values[1:] != values[:-1]))]
+
+
+def _number_of_pairs(n, directed):
+    return n * (n - 1) if directed else n * (n - 1) // 2
+
+
+def gnp_edges(rng, n, p, directed=False):
+    """Return the edges of a `G_{n,p}` random graph.
+
+    The gaps between the numbers of consecutive edges in the enumeration
+    of node pairs are geometrically distributed.  They are drawn in
+    batches and accumulated, which skips over the pairs that are not
+    edges as in the algorithm of Batagelj and Brandes.
+    """
+    import numpy as np
+    total = _number_of_pairs(n, directed)
+    if p <= 0 or total == 0:
+        index = np.zeros(0, dtype=np.int64)
+    elif p >= 1:
+        index = np.arange(total, dtype=np.int64)
+    else:
+        batches = []
+        last = -1
+        while True:
+            expected = (total - last - 1) * p
+            size = int(min(expected + 4 * expected ** 0.5 + 16, _BATCH))
+            index = last + np.cumsum(rng.geometric(p, size))
+            index = index[index < total]
+            batches.append(index)
+            if len(index) < size:
+                break
+            last = index[-1]
+        index = np.concatenate(batches)
+    return _pair_edges(index, n, directed)
+
+
+def gnm_edges(rng, n, m, directed=False):
+    """Return the edges of a `G_{n,m}` random graph.
+
+    Node pairs are drawn in batches until `m` distinct pairs are found.
+    When `m` is more than half the number of pairs, the pairs that are
+    not edges are drawn instead.
+    """
+    import numpy as np
+    total = _number_of_pairs(n, directed)
+    if m >= total:
+        return _pair_edges(np.arange(total), n, directed)
+    complement = m > total // 2
+    k = total - m if complement else m
+    index = _unique(rng.integers(0, total, k))
+    while len(index) < k:
+        size = min(int((k - len(index)) * 1.1) + 16, _BATCH)
+        extra = rng.integers(0, total, size)
+        index = _unique(np.concatenate((index, extra)))
+    if len(index) > k:
+        # A random subset of uniformly drawn distinct pairs is uniform.
+        surplus = rng.choice(len(index), len(index) - k, replace=False)
+        index = np.delete(index, surplus)
+    if complement:
+        index = np.setdiff1d(np.arange(total), index, assume_unique=True)
+    return _pair_edges(index, n, directed)
+
+
+def barabasi_albert_edges(rng, n, m):
+    """Return the edges of a Barabási–Albert preferential attachment graph.
+
+    The list of repeated nodes of :func:`barabasi_albert_graph` is laid
+    out in blocks of ``2 m`` slots, the targets of a new node followed by
+    `m` copies of the new node.  Each target is drawn as a uniformly
+    random slot of the earlier blocks.  Slots of new nodes are resolved
+    at once, and slots of earlier targets by pointer jumping.
+
+    As in :func:`barabasi_albert_graph`, the targets of a new node are
+    the first `m` distinct nodes of a sequence of draws.  The few blocks
+    whose first `m` draws repeat a node are completed one at a time, and
+    all slots are resolved again until no block changes.
+    """
+    import numpy as np
+    steps = n - m
+    block = 2 * m
+    # Draws of the first block are never used: its targets are fixed.
+    limits = np.maximum(np.arange(steps) * block, 1)[:, None]
+    slots = rng.integers(0, limits, size=(steps, m))
+    first = slots.copy()
+    draws = {}
+    while True:
+        targets = _resolve_slots(slots, m)
+        ranked = np.sort(targets, axis=1)
+        repeated = np.flatnonzero((ranked[:, 1:] == ranked[:, :-1]).any(1))
+        changed = False
+        for i in sorted(set(repeated.tolist()) | set(draws)):
+            sequence = draws.setdefault(i, first[i].tolist())
+            chosen = []
+            seen = set()
+            k = 0
+            while len(chosen) < m:
+                if k == len(sequence):
+                    sequence.append(int(rng.integers(0, i * block)))
+                b, offset = divmod(sequence[k], block)
+                node = m + b if offset >= m else targets[b, offset]
+                if node not in seen:
+                    seen.add(node)
+                    chosen.append(sequence[k])
+                k += 1
+            if chosen != slots[i].tolist():
+                slots[i] = chosen
+                changed = True
+        if not changed:
+            break
+    sources = np.repeat(np.arange(m, n, dtype=np.int64), m)
+    return np.column_stack((sources, targets.ravel()))
+
+
+def _resolve_slots(slots, m):
+    """Return the nodes held by the slots drawn for each target."""
+    import numpy as np
+    steps = slots.shape[0]
+    block, offset = np.divmod(slots, 2 * m)
+    targets = np.where(offset >= m, m + block, -1).ravel()
+    targets[:m] = np.arange(m)
+    # Slots of earlier targets point to their position in targets.
+    pointer = (block * m + offset).ravel()
+    pending = np.flatnonzero(targets < 0)
+    while len(pending):
+        found = targets[pointer[pending]]
+        targets[pending] = found
+        waiting = found < 0
+        pending = pending[waiting]
+        pointer[pending] = pointer[pointer[pending]]
+    return targets.reshape(steps, m)
+
+
+def watts_strogatz_edges(rng, n, k, p):
+    """Return the edges of a Watts–Strogatz small-world graph.
+
+    All rewired edges draw their new end at once.  The new ends making
+    self-loops or multiple edges are drawn again, and edges whose first
+    node is adjacent to all other nodes are not rewired.
+    """
+    import numpy as np
+    half = k // 2
+    u = np.tile(np.arange(n, dtype=np.int64), half)
+    v = (u + np.repeat(np.arange(1, half + 1), n)) % n
+    rewired = rng.random(len(u)) < p
+    w = v.copy()
+    draw = np.flatnonzero(rewired)
+    while True:
+        w[draw] = rng.integers(0, n, len(draw))
+        # Rank the edges that keep their place, then the edges rewired in
+        # earlier rounds, then the new ones, so that a multiple edge keeps
+        # the first of them.
+        rank = rewired.astype(np.int8)
+        rank[draw] = 2
+        key = np.minimum(u, w) * n + np.maximum(u, w)
+        order = np.lexsort((rank, key))
+        repeated = np.zeros(len(u), dtype=bool)
+        repeated[order[1:]] = key[order[1:]] == key[order[:-1]]
+        bad = repeated | (u == w) | (rewired & (w == v))
+        if not bad.any():
+            break
+        # As in watts_strogatz_graph, the degree of a node includes the
+        # edges waiting to be rewired.
+        good = ~bad
+        pending = np.flatnonzero(bad)
+        degree = (np.bincount(u[good], minlength=n) +
+                  np.bincount(w[good], minlength=n) +
+                  np.bincount(u[pending], minlength=n))
+        full = degree[u[pending]] >= n - 1
+        kept = pending[full]
+        rewired[kept] = False
+        w[kept] = v[kept]
+        draw = pending[~full]
+    return np.column_stack((u, w))
+
+
+def geometric_edges(pos, radius):
+    """Return the pairs of points of `pos` at distance at most `radius`.
+
+    The pairs are found with a k-d tree.
+    """
+    from scipy.spatial import cKDTree
+    return cKDTree(pos).query_pairs(radius, output_type='ndarray')
+
+
+def configuration_edges(rng, deg_sequence):
+    """Return the edges of a configuration model pseudograph."""
+    import numpy as np
+    stubs = np.repeat(np.arange(len(deg_sequence)), deg_sequence)
+    rng.shuffle(stubs)
+    return stubs.reshape(-1, 2)
+
+
+def edges_to_graph(G, n, edges, output, nodes=None, node_data=None):
+    """Return the graph with `n` nodes and edges given by positions.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        An empty graph giving the class and the attributes of the result.
+
+    n : int
+        The number of nodes.
+
+    edges : array
+        An ``(m, 2)`` array of node positions.
+
+    output : 'graph', 'edges' or 'csr'
+        Return `G` holding the edges, `edges` itself or a
+        :class:`CSRGraph` (or :class:`CSRDiGraph`) of the same class of
+        graphs as `G`.
+
+    nodes : list, optional
+        The nodes, in order of position.  The default is ``range(n)``.
+
+    node_data : dict, optional
+        Node attribute dictionaries keyed by node.
+    """
+    if output == 'edges':
+        return edges
+    if output == 'csr':
+        if G.is_multigraph():
+            raise nx.NetworkXError('CSR graphs do not support multigraphs.')
+        if nodes is None:
+            nodes = range(n)
+        return _csr_graph(G, nodes, edges, node_data)
+    G.add_nodes_from(range(n) if nodes is None else nodes)
+    if node_data is not None:
+        for u, data in node_data.items():
+            G.node[u].update(data)
+    _add_edge_array(G, edges, nodes)
+    return G
+
+
+def _add_edge_array(G, edges, nodes=None):
+    """Add the rows of `edges` as edges of the graph `G`.
+
+    The neighbor dictionaries are filled directly instead of adding the
+    edges one by one.  Positions are mapped to `nodes` if given.
+    """
+    us = edges[:, 0].tolist()
+    vs = edges[:, 1].tolist()
+    if nodes is not None:
+        us = [nodes[u] for u in us]
+        vs = [nodes[v] for v in vs]
+    new_edge_data = G.edge_attr_dict_factory
+    succ = G.adj
+    pred = G.pred if G.is_directed() else G.adj
+    if G.is_multigraph():
+        new_keys = G.edge_key_dict_factory
+        for u, v in zip(us, vs):
+            keydict = succ[u].get(v)
+            if keydict is None:
+                keydict = new_keys()
+                succ[u][v] = keydict
+                pred[v][u] = keydict
+            key = len(keydict)
+            while key in keydict:
+                key += 1
+            keydict[key] = new_edge_data()
+    else:
+        for u, v in zip(us, vs):
+            datadict = new_edge_data()
+            succ[u][v] = datadict
+            pred[v][u] = datadict
+    G._version += 1
+
+
+def _csr_graph(G, nodes, edges, node_data):
+    """Return a CSR graph holding the nodes and edges without dicts."""
+    import numpy as np
+    n = len(nodes)
+    u = edges[:, 0].astype(np.int64)
+    v = edges[:, 1].astype(np.int64)
+    directed = G.is_directed()
+    if not directed:
+        loops = u == v
+        u, v = (np.concatenate((u, v[~loops])),
+                np.concatenate((v, u[~loops])))
+    # Sorting the keys orders the rows and their neighbors by position,
+    # and removes multiple edges.
+    key = _unique(u * n + v)
+    rows, indices = np.divmod(key, n)
+    if directed:
+        number_of_edges = len(key)
+    else:
+        number_of_edges = (len(key) + np.count_nonzero(rows == indices)) // 2
+    code = _index_typecode(max(len(key), n))
+
+    def compact(x):
+        return array(code, np.asarray(x, dtype=np.dtype(code)).tobytes())
+
+    def offsets(rows):
+        return np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=n))))
+
+    pred = None
+    if directed:
+        cls = nx.CSRDiGraph
+        slots = np.lexsort((rows, indices))
+        pred = (compact(offsets(indices)), compact(rows[slots]),
+                compact(slots))
+    else:
+        cls = nx.CSRGraph
+    return cls._from_arrays(list(nodes), compact(offsets(rows)),
+                            compact(indices), {}, int(number_of_edges),
+                            node_data=node_data, graph=dict(G.graph),
+                            pred=pred)
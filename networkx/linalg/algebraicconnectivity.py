@@ -15,12 +15,14 @@ from networkx.utils import reverse_cuthill_mckee_ordering
 from re import compile
 
 try:
-    from numpy import (array, asmatrix, asarray, dot, matrix, ndarray, ones,
-                       reshape, sqrt, zeros)
-    from numpy.linalg import norm, qr
-    from numpy.random import normal
+    from numpy import (arange, array, asmatrix, asarray, column_stack,
+                       concatenate, dot, flatnonzero, matrix, maximum,
+                       minimum, ndarray, ones, outer, repeat, reshape, sqrt,
+                       unique, zeros)
+    from numpy.linalg import norm, qr, svd
+    from numpy.random import normal, random
     from scipy.linalg import eigh, inv
-    from scipy.sparse import csc_matrix, spdiags
+    from scipy.sparse import csc_matrix, csr_matrix, spdiags
     from scipy.sparse.linalg import eigsh, lobpcg
     __all__ = ['algebraic_connectivity', 'fiedler_vector', 'spectral_ordering']
 except ImportError:
@@ -262,6 +264,156 @@ def _tracemin_fiedler(L, X, normalized, tol, method):
     return sigma, asarray(X)
 
 
+def _heaviest_neighbors(F):
+    """Return the column of the largest entry of each row of the CSR
+    matrix F, or the row itself for empty rows.
+    """
+    n = F.shape[0]
+    nodes = arange(n)
+    best = nodes.copy()
+    counts = F.indptr[1:] - F.indptr[:-1]
+    rows = flatnonzero(counts)
+    if len(rows):
+        row_of = repeat(nodes, counts)
+        largest = zeros(n)
+        largest[rows] = maximum.reduceat(F.data, F.indptr[rows])
+        entries = flatnonzero(F.data == largest[row_of])
+        rows, first = unique(row_of[entries], return_index=True)
+        best[rows] = F.indices[entries[first]]
+    return best
+
+
+def _aggregate(A):
+    """Return the aggregation matrix of a heavy-edge matching of the nodes
+    of the weighted adjacency matrix A.
+    """
+    n = A.shape[0]
+    nodes = arange(n)
+    group = nodes.copy()
+    matched = zeros(n, dtype=bool)
+    for attempt in range(4):
+        # Each unmatched node proposes to its unmatched neighbor of largest
+        # weight, ties being broken at random, and mutual proposals are
+        # matched.
+        free = spdiags((~matched).astype(float), [0], n, n)
+        F = (free * A * free).tocsr()
+        F.eliminate_zeros()
+        if not F.nnz:
+            break
+        F.data *= 1. + 1e-3 * random(len(F.data))
+        proposal = _heaviest_neighbors(F)
+        mutual = (proposal[proposal] == nodes) & (proposal != nodes)
+        group[mutual] = minimum(nodes[mutual], proposal[mutual])
+        matched |= mutual
+    # The nodes left unmatched join the group of their heaviest matched
+    # neighbor.
+    free = spdiags((~matched).astype(float), [0], n, n)
+    F = (free * A * spdiags(matched.astype(float), [0], n, n)).tocsr()
+    F.eliminate_zeros()
+    target = _heaviest_neighbors(F)
+    group = group[target]
+    group = unique(group, return_inverse=True)[1].ravel()
+    return csr_matrix((ones(n), (nodes, group)), shape=(n, group.max() + 1))
+
+
+def _multilevel_eigenvectors(L, k, normalized, tol, coarsest=100):
+    """Compute the `k` smallest eigenvalues of the Laplacian matrix L,
+    excluding the zero eigenvalue of the constant vector, and their
+    eigenvectors with a multilevel method.
+
+    The graph is coarsened by heavy-edge matching until it has at most
+    `coarsest` nodes, without going below ``5 (k + 1)`` nodes.  The
+    eigenproblem of the coarsest graph is solved exactly, and the
+    eigenvectors of each graph are interpolated to the next finer graph
+    and refined by LOBPCG.
+    """
+    n = L.shape[0]
+    L = csr_matrix(L, dtype=float)
+    # The eigenproblems are solved in the generalized form L x = sigma B x
+    # with B the identity or, for the normalized Laplacian matrix, the
+    # diagonal matrix of the degrees.  The Galerkin projection
+    # P' L P x = sigma P' B P x of this problem on the aggregation matrix P
+    # of a matching is the same problem for the coarse graph.
+    if normalized:
+        b = L.diagonal()
+        b[b == 0] = 1.
+    else:
+        b = ones(n)
+    levels = []
+    # Coarse graphs must keep enough nodes to carry k eigenvectors besides
+    # the constant vector.
+    smallest = 5 * (k + 1)
+    coarsest = max(coarsest, smallest)
+    while L.shape[0] > coarsest:
+        A = abs(L - spdiags(L.diagonal(), [0], L.shape[0], L.shape[0]))
+        P = _aggregate(A)
+        if P.shape[1] > 0.8 * L.shape[0] or P.shape[1] < smallest:
+            break
+        levels.append((L, b, P))
+        L = (P.T * L * P).tocsr()
+        b = P.T * b
+
+    if L.shape[0] <= max(coarsest, 1000):
+        # Solve the coarsest problem exactly and discard the constant
+        # vector, which is the vector c below in the symmetric form.
+        c = sqrt(b)
+        M = asarray(L.todense()) / c[:, None] / c[None, :]
+        sigma, X = eigh(M)
+        eps = 1e-8 * max(sigma[-1], 1.)
+        null = flatnonzero(sigma <= eps)
+        if len(null):
+            # Keep the part of the nullspace orthogonal to c, which is
+            # empty unless the graph is disconnected.
+            c /= norm(c)
+            Z = X[:, null] - outer(c, dot(c, X[:, null]))
+            Z = svd(Z, full_matrices=False)[0][:, :len(null) - 1]
+            rest = null[-1] + 1
+            sigma = concatenate((zeros(len(null) - 1), sigma[rest:]))
+            X = column_stack((Z, X[:, rest:]))
+        # Eigenvectors of a multiple eigenvalue are only defined up to a
+        # rotation.  Use random vectors of the eigenspace rather than the
+        # very regular ones returned by eigh.
+        tie = flatnonzero(abs(sigma - sigma[k - 1]) <= eps)
+        if len(tie) > 1:
+            t = k - tie[0]
+            X[:, tie[:t]] = qr(dot(X[:, tie], normal(size=(len(tie), t))))[0]
+        X = X[:, :k] / sqrt(b)[:, None]
+    else:
+        # The coarsening stalled: start from random vectors.
+        X = normal(size=(L.shape[0], k))
+        sigma, X = _refine_eigenvectors(L, b, X, tol, L.shape[0])
+
+    levels.append((L, b, None))
+    for i in range(len(levels) - 2, -1, -1):
+        L, b, P = levels[i]
+        X = P * X
+        if i > 0:
+            # Warm starts only need to be refined roughly.
+            sigma, X = _refine_eigenvectors(L, b, X, max(tol, 1e-3), 20)
+        else:
+            sigma, X = _refine_eigenvectors(L, b, X, tol, n)
+
+    if normalized:
+        X *= sqrt(b)[:, None]
+    X /= sqrt((X * X).sum(axis=0))
+    return sigma[:k], X
+
+
+def _refine_eigenvectors(L, b, X, tol, maxiter):
+    """Refine the approximate eigenvectors X of L x = sigma B x orthogonal
+    to the constant vector by LOBPCG, B being the diagonal matrix b.
+    """
+    n = L.shape[0]
+    d = L.diagonal()
+    d[d == 0] = 1.
+    Y = ones((n, 1))
+    sigma, X = lobpcg(L, X, B=spdiags(b, [0], n, n),
+                      M=spdiags(1. / d, [0], n, n), Y=Y, tol=tol,
+                      maxiter=maxiter, largest=False)
+    order = sigma.argsort()
+    return sigma[order], X[:, order]
+
+
 def _get_fiedler_func(method):
     """Return a function that solves the Fiedler eigenvalue problem.
     """
@@ -296,6 +448,10 @@ def _get_fiedler_func(method):
                 sigma, X = lobpcg(L, X, M=M, Y=asmatrix(Y).T, tol=tol,
                                   maxiter=n, largest=False)
                 return sigma[0], X[:, 0]
+    elif method == 'multilevel':
+        def find_fiedler(L, x, normalized, tol):
+            sigma, X = _multilevel_eigenvectors(L, 1, normalized, tol)
+            return sigma[0], X[:, 0]
     else:
         raise nx.NetworkXError("unknown method '%s'." % method)
 
@@ -7,6 +7,7 @@
 #    All rights reserved.
 #    BSD license.
 import networkx as nx
+from networkx.convert_matrix import _cached_matrix
 from networkx.utils import not_implemented_for
 __author__ = "\n".join(['Aric Hagberg <aric.hagberg@gmail.com>',
                         'Pieter Swart (swart@lanl.gov)',
@@ -49,7 +50,14 @@ def laplacian_matrix(G, nodelist=None, weight='weight'):
     --------
     to_numpy_matrix
     normalized_laplacian_matrix
+    cache_matrices
     """
+    key = ('laplacian', None if nodelist is None else tuple(nodelist), weight)
+    return _cached_matrix(G, key,
+                          lambda: _laplacian_matrix(G, nodelist, weight))
+
+
+def _laplacian_matrix(G, nodelist, weight):
     import scipy.sparse
     if nodelist is None:
         nodelist = list(G)
@@ -60,6 +68,7 @@ def laplacian_matrix(G, nodelist=None, weight='weight'):
     D = scipy.sparse.spdiags(diags.flatten(), [0], m, n, format='csr')
     return  D - A
 
+
 @not_implemented_for('directed')
 def normalized_laplacian_matrix(G, nodelist=None, weight='weight'):
     r"""Return the normalized Laplacian matrix of G.
@@ -102,6 +111,7 @@ def normalized_laplacian_matrix(G, nodelist=None, weight='weight'):
     See Also
     --------
     laplacian_matrix
+    cache_matrices
 
     References
     ----------
@@ -111,6 +121,13 @@ def normalized_laplacian_matrix(G, nodelist=None, weight='weight'):
        Laplacian, Electronic Journal of Linear Algebra, Volume 16, pp. 90-98,
        March 2007.
     """
+    key = ('normalized_laplacian',
+           None if nodelist is None else tuple(nodelist), weight)
+    return _cached_matrix(
+        G, key, lambda: _normalized_laplacian_matrix(G, nodelist, weight))
+
+
+def _normalized_laplacian_matrix(G, nodelist, weight):
     import scipy
     import scipy.sparse
     if nodelist is None:
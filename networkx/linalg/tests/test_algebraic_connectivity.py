@@ -4,7 +4,8 @@ import networkx as nx
 from nose import SkipTest
 from nose.tools import *
 
-methods = ('tracemin_pcg', 'tracemin_chol', 'tracemin_lu', 'lanczos', 'lobpcg')
+methods = ('tracemin_pcg', 'tracemin_chol', 'tracemin_lu', 'lanczos', 'lobpcg',
+           'multilevel')
 
 try:
     from numpy.random import get_state, seed, set_state, shuffle
@@ -51,7 +52,7 @@ class TestAlgebraicConnectivity(object):
 
     @classmethod
     def setupClass(cls):
-        global numpy
+        global numpy, scipy
         try:
             import numpy.linalg
             import scipy.sparse
@@ -184,7 +185,38 @@ class TestAlgebraicConnectivity(object):
                                       ('LU solver unavailable.',)):
                         raise
 
-    _methods = ('tracemin', 'lanczos', 'lobpcg')
+    @preserve_random_state
+    def test_multilevel(self):
+        # Large enough for the graph to be coarsened.
+        G = nx.grid_2d_graph(30, 20)
+        L = nx.laplacian_matrix(G).astype(float)
+        for normalized in (False, True):
+            if not normalized:
+                A = L
+            else:
+                D = scipy.sparse.diags(1. / numpy.sqrt(L.diagonal()))
+                A = D * L * D
+            sigma = nx.algebraic_connectivity(G, normalized=normalized,
+                                              method='lanczos')
+            assert_almost_equal(nx.algebraic_connectivity(
+                G, normalized=normalized, method='multilevel'), sigma)
+            x = nx.fiedler_vector(G, normalized=normalized,
+                                  method='multilevel')
+            check_eigenvector(A, sigma, x)
+
+    @preserve_random_state
+    def test_multilevel_collapsing_graphs(self):
+        # The matchings of these graphs collapse them to a few nodes.
+        for G, sigma in ((nx.star_graph(150), 1.),
+                         (nx.complete_graph(200), 200.)):
+            L = nx.laplacian_matrix(G).astype(float)
+            assert_almost_equal(nx.algebraic_connectivity(
+                G, method='multilevel'), sigma)
+            x = nx.fiedler_vector(G, method='multilevel')
+            check_eigenvector(L, sigma, x)
+            assert_true(len(set(numpy.round(x, 8))) > 2)
+
+    _methods = ('tracemin', 'lanczos', 'lobpcg', 'multilevel')
 
 
 class TestSpectralOrdering(object):
@@ -285,4 +317,4 @@ class TestSpectralOrdering(object):
                         ok_(order in [[1, 2, 3, 0, 4, 5, 9, 6, 7, 8],
                                       [8, 7, 6, 9, 5, 4, 0, 3, 2, 1]])
 
-    _methods = ('tracemin', 'lanczos', 'lobpcg')
+    _methods = ('tracemin', 'lanczos', 'lobpcg', 'multilevel')
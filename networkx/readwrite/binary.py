@@ -0,0 +1,336 @@
+"""
+*************
+Binary Graphs
+*************
+Read and write graphs in a compact binary format that can be memory-mapped.
+
+Pickles and text formats must rebuild every node, neighbor and edge
+attribute dictionary as Python objects when they are read, which is slow
+and uses a lot of memory for large graphs.  The binary format instead
+stores the graph as flat arrays laid out as in :class:`CSRGraph`, so that
+reading a graph amounts to reading (or mapping) a few large arrays.
+Graphs are read back as :class:`CSRGraph` or :class:`CSRDiGraph`.
+
+With ``mmap=True`` the edge arrays are mapped with :class:`numpy.memmap`
+instead of being read, and several processes reading the same file share
+a single copy of them in the operating system page cache.  The node
+table, the index of the nodes and the row offsets are still built in
+memory, so loading takes time and memory proportional to the number of
+nodes, but not to the number of edges.
+
+Format
+------
+A file starts with the 8 bytes ``NXBGRAPH``, followed by the length of a
+header as an unsigned 64-bit little-endian integer and by the header
+itself, a UTF-8 encoded JSON object.  The header lists, for each stored
+array, its NumPy dtype, its offset from the start of the file and its
+length, so that every array can be loaded on its own with
+``numpy.memmap(path, dtype, mode='r', offset=offset, shape=(length,))``.
+Arrays start at offsets multiple of 8.
+
+The arrays are:
+
+``indptr``, ``indices``
+    The compressed sparse rows of the adjacency (the successors of
+    directed graphs): the neighbors of the node numbered ``i`` are the
+    nodes numbered ``indices[indptr[i]:indptr[i + 1]]``.  Undirected
+    edges are stored in both directions.
+``pred_indptr``, ``pred_indices``, ``pred_slots``
+    For directed graphs only, the rows of the predecessors and, for each
+    of them, the position of the edge in ``indices``.
+``nodes``
+    The node table, if all nodes are integers.
+``column0``, ``column1``, ...
+    The numeric edge attributes present on all edges, parallel to
+    ``indices``.
+
+The graph attributes, the node attributes, the other edge attributes and
+the nodes when they are not all integers are stored in a Python pickle
+at the end of the file.
+"""
+#    Copyright (C) 2016 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+from array import array
+import json
+from numbers import Integral
+import struct
+import sys
+
+import networkx as nx
+from networkx.utils import open_file, not_implemented_for
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+__all__ = ['read_binary_graph', 'write_binary_graph']
+
+MAGIC = b'NXBGRAPH'
+VERSION = 1
+
+
+def _align(offset):
+    """Return the first multiple of 8 not smaller than `offset`."""
+    return (offset + 7) // 8 * 8
+
+
+def _dtype(typecode):
+    """Return the NumPy dtype string of an array typecode."""
+    order = '<' if sys.byteorder == 'little' else '>'
+    kind = 'f' if typecode in 'fd' else 'i'
+    return '%s%s%d' % (order, kind, array(typecode).itemsize)
+
+
+def _array_dtype(arr):
+    """Return the NumPy dtype string of an array or a memory-mapped array."""
+    if hasattr(arr, 'dtype'):
+        return arr.dtype.str
+    return _dtype(arr.typecode)
+
+
+def _typecode(dtype):
+    """Return the array typecode of a NumPy dtype string."""
+    kind, itemsize = dtype[1], int(dtype[2:])
+    codes = ('f', 'd') if kind == 'f' else ('b', 'h', 'i', 'l', 'q')
+    for code in codes:
+        try:
+            if array(code).itemsize == itemsize:
+                return code
+        except ValueError:  # 'q' is not available on Python 2
+            continue
+    raise nx.NetworkXError('Unsupported array type %s.' % dtype)
+
+
+def _node_array(nodes):
+    """Return the nodes in an array if they are all integers, else None."""
+    if all(isinstance(n, Integral) and not isinstance(n, bool) and
+           -2 ** 63 <= n < 2 ** 63 for n in nodes):
+        return array(_typecode('<i8'), nodes)
+    return None
+
+
+@not_implemented_for('multigraph')
+@open_file(1, mode='wb')
+def write_binary_graph(G, path):
+    """Write graph in the NetworkX binary format.
+
+    The format stores the adjacency of the graph as compressed sparse
+    rows and the numeric edge attributes as typed columns, see
+    :mod:`networkx.readwrite.binary`.  Other attributes are pickled.
+
+    Parameters
+    ----------
+    G : graph
+       A NetworkX graph, directed or undirected.
+
+    path : file or string
+       File or filename to write.
+       Filenames ending in .gz or .bz2 will be compressed, but
+       compressed files cannot be memory-mapped.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+       If `G` is a multigraph.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> nx.write_binary_graph(G, "test.nxb")
+
+    See Also
+    --------
+    read_binary_graph
+    """
+    if not isinstance(G, nx.CSRGraph) or G.adj._slots is not None:
+        # Reversed CSRDiGraph store their edges in predecessor order.
+        G = nx.CSRDiGraph(G) if G.is_directed() else nx.CSRGraph(G)
+    adj = G.adj
+    arrays = [('indptr', adj._indptr), ('indices', adj._indices)]
+    if G.is_directed():
+        pred = G.pred
+        arrays.extend([('pred_indptr', pred._indptr),
+                       ('pred_indices', pred._indices),
+                       ('pred_slots', pred._slots)])
+    nodes = _node_array(G._nodes)
+    if nodes is not None:
+        arrays.append(('nodes', nodes))
+    dense_keys = []
+    sparse_columns = {}
+    for key, column in G._columns.items():
+        if isinstance(column, dict):
+            sparse_columns[key] = column
+        else:
+            arrays.append(('column%d' % len(dense_keys), column))
+            dense_keys.append(key)
+    blob = pickle.dumps({'graph': G.graph,
+                         'node_data': G._node_data,
+                         'nodes': G._nodes if nodes is None else None,
+                         'dense_keys': dense_keys,
+                         'sparse_columns': sparse_columns},
+                        pickle.HIGHEST_PROTOCOL)
+
+    def layout(start):
+        offsets = {}
+        offset = start
+        for name, arr in arrays:
+            offsets[name] = {'dtype': _array_dtype(arr),
+                             'offset': offset,
+                             'length': len(arr)}
+            offset = _align(offset + len(arr) * arr.itemsize)
+        header = {'version': VERSION,
+                  'directed': G.is_directed(),
+                  'number_of_nodes': len(G),
+                  'number_of_edges': G.number_of_edges(),
+                  'arrays': offsets,
+                  'pickle': {'offset': offset, 'length': len(blob)}}
+        return json.dumps(header, sort_keys=True).encode('utf-8')
+
+    # The offsets stored in the header depend on the length of the header.
+    start = 0
+    header = layout(start)
+    while _align(16 + len(header)) != start:
+        start = _align(16 + len(header))
+        header = layout(start)
+    path.write(MAGIC)
+    path.write(struct.pack('<Q', len(header)))
+    path.write(header)
+    position = 16 + len(header)
+    for name, arr in arrays:
+        path.write(b'\0' * (_align(position) - position))
+        if hasattr(arr, 'dtype'):
+            path.write(arr.tobytes())
+        else:
+            arr.tofile(path)
+        position = _align(position) + len(arr) * arr.itemsize
+    path.write(b'\0' * (_align(position) - position))
+    path.write(blob)
+
+
+def _read_header(path):
+    """Return the header of the binary graph file `path`."""
+    if path.read(8) != MAGIC:
+        raise nx.NetworkXError('Not a NetworkX binary graph file.')
+    size, = struct.unpack('<Q', path.read(8))
+    header = json.loads(path.read(size).decode('utf-8'))
+    if header['version'] > VERSION:
+        raise nx.NetworkXError('Unsupported binary graph version %d.'
+                               % header['version'])
+    return header
+
+
+def _read_array(path, spec):
+    """Read the array described by `spec` from the file `path`."""
+    arr = array(_typecode(spec['dtype']))
+    path.seek(spec['offset'])
+    arr.fromfile(path, spec['length'])
+    if spec['dtype'][0] != ('<' if sys.byteorder == 'little' else '>'):
+        arr.byteswap()
+    return arr
+
+
+def _map_array(path, spec):
+    """Map the array described by `spec` from the file `path`."""
+    import numpy as np
+    if spec['length'] == 0:
+        return np.zeros(0, dtype=spec['dtype'])
+    return np.memmap(path, dtype=spec['dtype'], mode='r',
+                     offset=spec['offset'], shape=(spec['length'],))
+
+
+@open_file(0, mode='rb')
+def read_binary_graph(path, mmap=False):
+    """Read graph in the NetworkX binary format.
+
+    Parameters
+    ----------
+    path : file or string
+       File or filename to read.
+       Filenames ending in .gz or .bz2 will be uncompressed.
+
+    mmap : bool, optional (default=False)
+       If True, the edge arrays (the neighbor indices and the numeric edge
+       attribute columns) are memory-mapped with :class:`numpy.memmap`
+       instead of being read in memory.  Their pages are then loaded on
+       demand and shared between processes mapping the same file.  The
+       nodes and the row offsets are always read in memory.  Requires
+       NumPy and an uncompressed file.
+
+    Returns
+    -------
+    G : CSRGraph or CSRDiGraph
+       A read-only graph.  Use ``nx.Graph(G)`` or ``nx.DiGraph(G)`` to
+       get a mutable copy.
+
+    Raises
+    ------
+    NetworkXError
+       If the file is not a binary graph file.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> nx.write_binary_graph(G, "test.nxb")
+    >>> H = nx.read_binary_graph("test.nxb")
+    >>> sorted(H.edges())
+    [(0, 1), (1, 2), (2, 3)]
+
+    Notes
+    -----
+    Memory-mapped arrays return NumPy scalars, so that numeric edge
+    attributes of a memory-mapped graph are NumPy numbers.
+
+    The nodes and the attributes that are not stored in arrays are read
+    from a Python pickle.  As for :func:`read_gpickle`, only read files
+    from trusted sources.
+
+    See Also
+    --------
+    write_binary_graph
+    """
+    header = _read_header(path)
+    specs = header['arrays']
+    if mmap:
+        arrays = dict((name, _map_array(path, spec))
+                      for name, spec in specs.items())
+    else:
+        arrays = {}
+        for name, spec in sorted(specs.items(), key=lambda x: x[1]['offset']):
+            arrays[name] = _read_array(path, spec)
+    path.seek(header['pickle']['offset'])
+    data = pickle.loads(path.read(header['pickle']['length']))
+    if data['nodes'] is None:
+        nodes = arrays['nodes'].tolist()
+    else:
+        nodes = data['nodes']
+    columns = data['sparse_columns']
+    for i, key in enumerate(data['dense_keys']):
+        columns[key] = arrays['column%d' % i]
+    indptr = arrays['indptr']
+    if mmap:
+        # Offsets are read for every neighbor lookup: keep them in memory.
+        indptr = array(_typecode(specs['indptr']['dtype']), indptr.tolist())
+    if header['directed']:
+        cls = nx.CSRDiGraph
+        pred = (arrays['pred_indptr'], arrays['pred_indices'],
+                arrays['pred_slots'])
+        if mmap:
+            pred = (array(indptr.typecode, pred[0].tolist()),) + pred[1:]
+    else:
+        cls = nx.CSRGraph
+        pred = None
+    return cls._from_arrays(nodes, indptr, arrays['indices'], columns,
+                            header['number_of_edges'],
+                            node_data=data['node_data'], graph=data['graph'],
+                            pred=pred)
+
+
+# fixture for nose tests
+def teardown_module(module):
+    import os
+    os.unlink('test.nxb')
@@ -38,10 +38,17 @@ __all__ = ['generate_edgelist',
            'write_edgelist',
            'parse_edgelist',
            'read_edgelist',
+           'read_edgelist_batches',
            'read_weighted_edgelist',
            'write_weighted_edgelist']
 
-from networkx.utils import open_file, make_str
+from ast import literal_eval
+import csv
+from itertools import islice
+from os.path import splitext
+
+from networkx.utils import open_file, make_str, is_string_like
+from networkx.utils.decorators import _dispatch_dict
 import networkx as nx
 
 def generate_edgelist(G, delimiter=' ', data=True):
@@ -172,7 +179,8 @@ def write_edgelist(G, path, comments="#", delimiter=' ', data=True,
         path.write(line.encode(encoding))
 
 def parse_edgelist(lines, comments='#', delimiter=None,
-                   create_using=None, nodetype=None, data=True):
+                   create_using=None, nodetype=None, data=True,
+                   engine='python', chunksize=100000):
     """Parse lines of an edge list representation of a graph.
 
     Parameters
@@ -191,6 +199,14 @@ def parse_edgelist(lines, comments='#', delimiter=None,
        If False generate no edge data or if True use a dictionary
        representation of edge data or a list tuples specifying dictionary
        key names and types for edge data.
+    engine : 'python' or 'fast', optional (default='python')
+       With 'python' the lines are parsed and added to the graph one at
+       a time.  With 'fast' blocks of `chunksize` lines are split at
+       once, the node and data columns are converted in bulk and each
+       block is added to the graph with a single call to
+       ``add_edges_from``.
+    chunksize : int, optional (default=100000)
+       The number of lines in a block for the 'fast' engine.
 
     Returns
     -------
@@ -237,15 +253,15 @@ def parse_edgelist(lines, comments='#', delimiter=None,
     read_weighted_edgelist
 
     """
-    from ast import literal_eval
-    if create_using is None:
-        G=nx.Graph()
-    else:
-        try:
-            G=create_using
-            G.clear()
-        except:
-            raise TypeError("create_using input is not a NetworkX graph type")
+    G = _prepare_graph(create_using)
+    if engine == 'fast':
+        lines = iter(lines)
+        blocks = iter(lambda: list(islice(lines, chunksize)), [])
+        return _add_edge_batches(G, (_parse_edgelist_block(
+            block, comments, delimiter, nodetype, data) for block in blocks))
+    elif engine != 'python':
+        raise ValueError("Unknown engine %s, use 'python' or 'fast'."
+                         % (engine,))
 
     for line in lines:
         p=line.find(comments)
@@ -296,9 +312,171 @@ def parse_edgelist(lines, comments='#', delimiter=None,
         G.add_edge(u, v, attr_dict=edgedata)
     return G
 
+
+def _prepare_graph(create_using):
+    """Return an empty graph of the type given by `create_using`."""
+    if create_using is None:
+        G=nx.Graph()
+    else:
+        try:
+            G=create_using
+            G.clear()
+        except:
+            raise TypeError("create_using input is not a NetworkX graph type")
+    return G
+
+
+def _add_edge_batches(G, batches):
+    """Add each list of edges in `batches` to `G`."""
+    for edges in batches:
+        G.add_edges_from(edges)
+    return G
+
+
+def _convert_column(values, convert, what):
+    """Return the list of `values` converted by the function `convert`."""
+    if convert is None:
+        return list(values)
+    try:
+        return list(map(convert, values))
+    except:
+        raise TypeError("Failed to convert %s to type %s." % (what, convert))
+
+
+def _edges_from_columns(columns, nodetype, data):
+    """Return the edges of an edge list given as columns of strings.
+
+    All the columns have the same length.  Edges are returned as
+    (u, v) or (u, v, data) tuples ready for ``add_edges_from``.
+    """
+    us = _convert_column(columns[0], nodetype, 'nodes')
+    vs = _convert_column(columns[1], nodetype, 'nodes')
+    if data is False or len(columns) == 2:
+        return list(zip(us, vs))
+    if data is True:
+        try:
+            datas = [dict(literal_eval(' '.join(d)))
+                     for d in zip(*columns[2:])]
+        except:
+            raise TypeError("Failed to convert edge data to dictionary.")
+        return list(zip(us, vs, datas))
+    if len(columns) - 2 != len(data):
+        raise IndexError("Edge data and data_keys %s are not the same length"
+                         % (data,))
+    keys = [edge_key for edge_key, edge_type in data]
+    values = [_convert_column(col, edge_type, '%s data' % (edge_key,))
+              for (edge_key, edge_type), col in zip(data, columns[2:])]
+    if len(keys) == 1:
+        key = keys[0]
+        datas = [{key: value} for value in values[0]]
+    else:
+        datas = [dict(zip(keys, vals)) for vals in zip(*values)]
+    return list(zip(us, vs, datas))
+
+
+def _edges_from_rows(rows, nodetype, data):
+    """Return the edges of an edge list given as rows of strings."""
+    if data is False:
+        return _edges_from_columns(list(zip(*rows))[:2], nodetype, data)
+    if data is True:
+        # Python dictionaries may span a varying number of fields.
+        rows = [s[:2] + [' '.join(s[2:])] if len(s) > 3 else s for s in rows]
+    lengths = set(map(len, rows))
+    if len(lengths) == 1:
+        return _edges_from_columns(list(zip(*rows)), nodetype, data)
+    # Rows of different lengths: group consecutive rows of equal length.
+    edges = []
+    start = 0
+    for i in range(1, len(rows) + 1):
+        if i == len(rows) or len(rows[i]) != len(rows[start]):
+            columns = list(zip(*rows[start:i]))
+            edges.extend(_edges_from_columns(columns, nodetype, data))
+            start = i
+    return edges
+
+
+def _parse_edgelist_block(lines, comments, delimiter, nodetype, data):
+    """Return the edges parsed from a block of lines."""
+    if comments is not None:
+        lines = [line.partition(comments)[0] for line in lines]
+    rows = [s for s in (line.strip().split(delimiter) for line in lines)
+            if len(s) >= 2]
+    if not rows:
+        return []
+    return _edges_from_rows(rows, nodetype, data)
+
+
+def _pandas_edgelist_batches(path, comments, delimiter, nodetype, data,
+                             chunksize, encoding):
+    """Yield lists of edges read from `path` with the pandas CSV parser."""
+    import pandas as pd
+    if data is False:
+        names = [0, 1]
+        usecols = names
+    else:
+        # One spare column detects rows with too many fields.
+        names = list(range(3 + len(data)))
+        usecols = None
+    reader = pd.read_csv(path, sep=r'\s+' if delimiter is None else delimiter,
+                         header=None, names=names, usecols=usecols,
+                         index_col=False, comment=comments, dtype=str,
+                         keep_default_na=False, na_filter=False,
+                         quoting=csv.QUOTE_NONE, encoding=encoding,
+                         skip_blank_lines=True, chunksize=chunksize)
+    while True:
+        try:
+            frame = next(reader)
+        except StopIteration:
+            break
+        except pd.errors.ParserError:
+            frame = None
+        if frame is None or (data is not False and
+                             (frame[names[-1]] != '').values.any()):
+            raise IndexError("Edge data and data_keys %s are not the same "
+                             "length" % (data,))
+        if data is not False:
+            frame = frame.iloc[:, :-1]
+        # Without NA filtering, the missing fields of short rows are empty
+        # strings and tokens such as 'NA' or 'null' are kept as is.
+        if (frame.values == '').any():
+            rows = []
+            for row in frame.itertuples(index=False):
+                row = list(row)
+                while row and row[-1] == '':
+                    row.pop()
+                if len(row) >= 2:
+                    rows.append(row)
+            if rows:
+                yield _edges_from_rows(rows, nodetype, data)
+        else:
+            columns = [frame[c].tolist() for c in frame.columns]
+            yield _edges_from_columns(columns, nodetype, data)
+
+
+def _edgelist_batches(path, comments, delimiter, nodetype, data, chunksize,
+                      encoding):
+    """Yield lists of edges read from the binary file object `path`."""
+    if (data is not True and comments is not None and len(comments) == 1
+            and (delimiter is None or len(delimiter) == 1)):
+        try:
+            import pandas
+        except ImportError:
+            pass
+        else:
+            for edges in _pandas_edgelist_batches(path, comments, delimiter,
+                                                  nodetype, data, chunksize,
+                                                  encoding):
+                yield edges
+            return
+    for block in iter(lambda: list(islice(path, chunksize)), []):
+        lines = b''.join(block).decode(encoding).splitlines()
+        yield _parse_edgelist_block(lines, comments, delimiter, nodetype,
+                                    data)
+
 @open_file(0,mode='rb')
 def read_edgelist(path, comments="#", delimiter=None, create_using=None,
-                  nodetype=None, data=True, edgetype=None, encoding='utf-8'):
+                  nodetype=None, data=True, edgetype=None, encoding='utf-8',
+                  engine='python', chunksize=100000):
     """Read a graph from a list of edges.
 
     Parameters
@@ -322,6 +500,14 @@ def read_edgelist(path, comments="#", delimiter=None, create_using=None,
        Convert edge data from strings to specified type and use as 'weight'
     encoding: string, optional
        Specify which encoding to use when reading file.
+    engine : 'python' or 'fast', optional (default='python')
+       With 'python' the lines are parsed and added to the graph one at
+       a time.  With 'fast' the file is read in blocks of `chunksize`
+       lines that are tokenized at once, by pandas when it is installed,
+       converted column by column and added to the graph with a single
+       call to ``add_edges_from``.
+    chunksize : int, optional (default=100000)
+       The number of lines in a block for the 'fast' engine.
 
     Returns
     -------
@@ -339,6 +525,7 @@ def read_edgelist(path, comments="#", delimiter=None, create_using=None,
 
     >>> G=nx.read_edgelist("test.edgelist", nodetype=int)
     >>> G=nx.read_edgelist("test.edgelist",create_using=nx.DiGraph())
+    >>> G=nx.read_edgelist("test.edgelist", nodetype=int, engine='fast')
 
     Edgelist with data in a list:
 
@@ -357,16 +544,76 @@ def read_edgelist(path, comments="#", delimiter=None, create_using=None,
     See Also
     --------
     parse_edgelist
+    read_edgelist_batches
 
     Notes
     -----
     Since nodes must be hashable, the function nodetype must return hashable
     types (e.g. int, float, str, frozenset - or tuples of those, etc.)
     """
+    if engine == 'fast':
+        G = _prepare_graph(create_using)
+        return _add_edge_batches(G, _edgelist_batches(
+            path, comments, delimiter, nodetype, data, chunksize, encoding))
     lines = (line.decode(encoding) for line in path)
     return parse_edgelist(lines,comments=comments, delimiter=delimiter,
                           create_using=create_using, nodetype=nodetype,
-                          data=data)
+                          data=data, engine=engine)
+
+
+def read_edgelist_batches(path, comments="#", delimiter=None, nodetype=None,
+                          data=True, encoding='utf-8', chunksize=100000):
+    """Read an edge list in batches of edges without building a graph.
+
+    Parameters
+    ----------
+    path : file or string
+       File or filename to read. If a file is provided, it must be
+       opened in 'rb' mode.
+       Filenames ending in .gz or .bz2 will be uncompressed.
+    comments : string, optional
+       The character used to indicate the start of a comment.
+    delimiter : string, optional
+       The string used to separate values.  The default is whitespace.
+    nodetype : int, float, str, Python type, optional
+       Convert node data from strings to specified type
+    data : bool or list of (label,type) tuples
+       Tuples specifying dictionary key names and types for edge data
+    encoding: string, optional
+       Specify which encoding to use when reading file.
+    chunksize : int, optional (default=100000)
+       The number of lines read for each batch.
+
+    Returns
+    -------
+    batches : generator
+       A generator of lists of (u, v) or (u, v, data) edge tuples, one
+       list for each block of `chunksize` lines, suitable for
+       ``G.add_edges_from``.
+
+    Examples
+    --------
+    >>> nx.write_edgelist(nx.path_graph(4), "test.edgelist", data=False)
+    >>> batches = nx.read_edgelist_batches("test.edgelist", nodetype=int,
+    ...                                    chunksize=2)
+    >>> [batch for batch in batches]
+    [[(0, 1), (1, 2)], [(2, 3)]]
+
+    See Also
+    --------
+    read_edgelist
+    """
+    if is_string_like(path):
+        fh = _dispatch_dict[splitext(path)[1]](path, mode='rb')
+    else:
+        fh = path
+    try:
+        for edges in _edgelist_batches(fh, comments, delimiter, nodetype,
+                                       data, chunksize, encoding):
+            yield edges
+    finally:
+        if fh is not path:
+            fh.close()
 
 
 def write_weighted_edgelist(G, path, comments="#",
@@ -405,7 +652,8 @@ def write_weighted_edgelist(G, path, comments="#",
                    data=('weight',), encoding = encoding)
 
 def read_weighted_edgelist(path, comments="#", delimiter=None,
-                           create_using=None, nodetype=None, encoding='utf-8'):
+                           create_using=None, nodetype=None, encoding='utf-8',
+                           engine='python', chunksize=100000):
 
     """Read a graph as list of edges with numeric weights.
 
@@ -426,6 +674,10 @@ def read_weighted_edgelist(path, comments="#", delimiter=None,
        Convert node data from strings to specified type
     encoding: string, optional
        Specify which encoding to use when reading file.
+    engine : 'python' or 'fast', optional (default='python')
+       The parser to use, see :func:`read_edgelist`.
+    chunksize : int, optional (default=100000)
+       The number of lines in a block for the 'fast' engine.
 
     Returns
     -------
@@ -454,7 +706,9 @@ def read_weighted_edgelist(path, comments="#", delimiter=None,
                          create_using=create_using,
                          nodetype=nodetype,
                          data=(('weight',float),),
-                         encoding = encoding
+                         encoding = encoding,
+                         engine=engine,
+                         chunksize=chunksize
                          )
 
 
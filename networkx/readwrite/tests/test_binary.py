@@ -0,0 +1,98 @@
+import io
+import os
+import pickle
+import tempfile
+
+from nose import SkipTest
+from nose.tools import assert_equal, assert_raises, assert_true
+
+import networkx as nx
+from networkx.testing import assert_edges_equal, assert_nodes_equal
+
+
+class TestBinaryGraph(object):
+
+    def setUp(self):
+        G = nx.Graph(name='test')
+        G.add_edges_from([('a', 'b'), ('b', 'c'), ('c', 'a')], weight=2.5)
+        G.add_edge('c', 'c', weight=0.5, color='red')
+        G.add_node('g', color='green')
+        self.G = G
+        D = nx.DiGraph()
+        D.add_weighted_edges_from([(0, 1, 3), (1, 2, 4), (2, 0, 5), (0, 2, 6)])
+        D.graph['number'] = 1
+        self.D = D
+
+    def roundtrip(self, G, **kwds):
+        (fd, fname) = tempfile.mkstemp()
+        nx.write_binary_graph(G, fname)
+        H = nx.read_binary_graph(fname, **kwds)
+        os.close(fd)
+        os.unlink(fname)
+        return H
+
+    def check(self, G, H):
+        assert_equal(H.is_directed(), G.is_directed())
+        assert_nodes_equal(list(H.nodes(data=True)),
+                           list(G.nodes(data=True)))
+        assert_edges_equal(list(H.edges(data=True)),
+                           list(G.edges(data=True)))
+        assert_equal(H.graph, G.graph)
+        assert_equal(H.number_of_edges(), G.number_of_edges())
+
+    def test_roundtrip(self):
+        for G in (self.G, self.D):
+            H = self.roundtrip(G)
+            self.check(G, H)
+            assert_true(isinstance(H, nx.CSRGraph))
+        H = self.roundtrip(self.D)
+        assert_equal(sorted(H.predecessors(2)), [0, 1])
+        assert_equal(H.pred[0][2], {'weight': 5})
+
+    def test_roundtrip_csr(self):
+        H = self.roundtrip(nx.CSRGraph(self.G))
+        self.check(self.G, H)
+        R = nx.CSRDiGraph(self.D).reverse()
+        H = self.roundtrip(R)
+        self.check(R, H)
+        assert_edges_equal(list(H.edges()), list(self.D.reverse().edges()))
+
+    def test_mmap(self):
+        try:
+            import numpy
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+        for G in (self.G, self.D):
+            H = self.roundtrip(G, mmap=True)
+            self.check(G, H)
+            H = pickle.loads(pickle.dumps(H))
+            self.check(G, H)
+        H = self.roundtrip(nx.empty_graph(3), mmap=True)
+        assert_equal(sorted(H), [0, 1, 2])
+        assert_equal(H.number_of_edges(), 0)
+
+    def test_mmap_rewrite(self):
+        try:
+            import numpy
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+        for G in (nx.path_graph(4), self.G, self.D):
+            H = self.roundtrip(G, mmap=True)
+            K = self.roundtrip(H)
+            self.check(G, K)
+            K = self.roundtrip(H, mmap=True)
+            self.check(G, K)
+
+    def test_file_object(self):
+        f = io.BytesIO()
+        nx.write_binary_graph(self.D, f)
+        f.seek(0)
+        H = nx.read_binary_graph(f)
+        self.check(self.D, H)
+        assert_equal(nx.dijkstra_path(H, 0, 2), [0, 2])
+
+    def test_errors(self):
+        assert_raises(nx.NetworkXNotImplemented, nx.write_binary_graph,
+                      nx.MultiGraph(), io.BytesIO())
+        assert_raises(nx.NetworkXError, nx.read_binary_graph,
+                      io.BytesIO(b'not a graph file'))
@@ -223,3 +223,90 @@ class TestEdgelist:
         assert_edges_equal(list(H.edges()), list(G.edges()))
         os.close(fd)
         os.unlink(fname)
+
+
+class TestFastEdgelist:
+
+    def setUp(self):
+        self.s = b"""\
+# comment line
+1 2 {'weight': 2.0, 'color': 'red'}
+2 3 {'weight':3.0} # trailing comment
+3
+
+4 5
+5 1 {}
+"""
+        self.weighted = b"""\
+# comment line
+1 2 2.0
+2 3 3.0
+3
+4 5
+"""
+
+    def read_both(self, s, **kwds):
+        G = nx.read_edgelist(io.BytesIO(s), **kwds)
+        H = nx.read_edgelist(io.BytesIO(s), engine='fast', chunksize=2,
+                             **kwds)
+        return G, H
+
+    def test_fast_engine(self):
+        G, H = self.read_both(self.s, nodetype=int)
+        assert_edges_equal(H.edges(data=True), G.edges(data=True))
+        assert_equal(H[1][2], {'weight': 2.0, 'color': 'red'})
+        G, H = self.read_both(self.s, nodetype=int, data=False)
+        assert_edges_equal(H.edges(data=True), G.edges(data=True))
+        G, H = self.read_both(self.weighted, nodetype=int,
+                              data=[('weight', float)])
+        assert_edges_equal(H.edges(data=True), G.edges(data=True))
+        G, H = self.read_both(self.weighted, nodetype=int,
+                              data=[('weight', float)],
+                              create_using=nx.MultiDiGraph())
+        assert_edges_equal(H.edges(data=True), G.edges(data=True))
+        H = nx.read_weighted_edgelist(io.BytesIO(self.weighted), nodetype=int,
+                                      engine='fast')
+        assert_edges_equal(H.edges(data=True),
+                           [(1, 2, {'weight': 2.0}), (2, 3, {'weight': 3.0}),
+                            (4, 5, {})])
+
+    def test_na_tokens(self):
+        # Tokens that pandas reads as missing values by default are names.
+        s = b"NA US\nnull FR 1\nA\nnan N/A 2\n"
+        G, H = self.read_both(s, data=False)
+        assert_edges_equal(H.edges(data=True), G.edges(data=True))
+        assert_equal(len(H), 6)
+        G, H = self.read_both(s.replace(b'US', b'US 3'),
+                              data=[('weight', float)])
+        assert_edges_equal(H.edges(data=True), G.edges(data=True))
+        assert_equal(H['NA']['US'], {'weight': 3.0})
+        batches = list(nx.read_edgelist_batches(io.BytesIO(s), data=False))
+        assert_equal(batches, [[('NA', 'US'), ('null', 'FR'), ('nan', 'N/A')]])
+        s = b"1 2 NA\n"
+        assert_raises(TypeError, nx.read_edgelist, io.BytesIO(s),
+                      data=[('weight', float)], engine='fast')
+
+    def test_fast_engine_errors(self):
+        s = b"1 2 3.0 red\n"
+        assert_raises(IndexError, nx.read_edgelist, io.BytesIO(s),
+                      data=[('weight', float)], engine='fast')
+        s = b"1 2 heavy\n"
+        assert_raises(TypeError, nx.read_edgelist, io.BytesIO(s),
+                      data=[('weight', float)], engine='fast')
+        assert_raises(ValueError, nx.read_edgelist, io.BytesIO(s),
+                      engine='other')
+
+    def test_parse_edgelist_fast(self):
+        lines = self.s.decode().splitlines()
+        G = nx.parse_edgelist(lines, nodetype=int)
+        H = nx.parse_edgelist(lines, nodetype=int, engine='fast', chunksize=3)
+        assert_edges_equal(H.edges(data=True), G.edges(data=True))
+
+    def test_read_edgelist_batches(self):
+        (fd, fname) = tempfile.mkstemp(suffix='.gz')
+        nx.write_edgelist(nx.path_graph(5), fname, data=False)
+        batches = list(nx.read_edgelist_batches(fname, nodetype=int,
+                                                chunksize=3))
+        assert_equal(batches, [[(0, 1), (1, 2), (2, 3)], [(3, 4)]])
+        os.close(fd)
+        os.unlink(fname)
@@ -191,6 +191,56 @@ class TestConvertNumpy(object):
         M = nx.to_scipy_sparse_matrix(G)
         np_assert_equal(M.todense(), np.matrix([[1]]))
 
+    def test_nodelist_subgraph(self):
+        G = nx.DiGraph([(0, 1), (1, 2), (2, 0), (2, 3)])
+        G.add_edge(3, 3, weight=4)
+        M = nx.to_scipy_sparse_matrix(G, nodelist=[3, 2, 5, 1])
+        np_assert_equal(M.todense(), np.matrix([[4, 0, 0, 0],
+                                                [1, 0, 0, 0],
+                                                [0, 0, 0, 0],
+                                                [0, 1, 0, 0]]))
+
+    def test_multigraph_weights(self):
+        G = nx.MultiGraph()
+        G.add_edge(0, 1, weight=2)
+        G.add_edge(0, 1, weight=3)
+        G.add_edge(1, 1, weight=0.5)
+        G.add_edge(1, 1)
+        M = nx.to_scipy_sparse_matrix(G)
+        np_assert_equal(M.todense(), np.matrix([[0, 5], [5, 1.5]]))
+        M = nx.to_scipy_sparse_matrix(G, weight=None)
+        np_assert_equal(M.todense(), np.matrix([[0, 2], [2, 2]]))
+
+    def test_dtype(self):
+        G = nx.Graph([(0, 1)])
+        assert_equal(nx.to_scipy_sparse_matrix(G).dtype.kind, 'i')
+        assert_equal(nx.to_scipy_sparse_matrix(G, weight=None).dtype.kind,
+                     'i')
+        G.add_edge(1, 2, weight=0.5)
+        assert_equal(nx.to_scipy_sparse_matrix(G).dtype.kind, 'f')
+        M = nx.to_scipy_sparse_matrix(G, dtype=np.float32)
+        assert_equal(M.dtype, np.float32)
+        assert_true(M.has_sorted_indices)
+
+    def test_from_scipy_sparse_matrix_formats(self):
+        A = sparse.csr_matrix([[0, 2, 0], [2, 0, 0], [0, 5, 1]])
+        expected = nx.DiGraph()
+        expected.add_weighted_edges_from([(0, 1, 2), (1, 0, 2), (2, 1, 5),
+                                          (2, 2, 1)])
+        for fmt in ('csr', 'csc', 'coo', 'lil', 'dok'):
+            G = nx.from_scipy_sparse_matrix(A.asformat(fmt),
+                                            create_using=nx.DiGraph())
+            assert_graphs_equal(G, expected)
+            G = nx.from_scipy_sparse_matrix(A.asformat(fmt),
+                                            create_using=nx.MultiDiGraph())
+            assert_equal(sorted(G.edges(data='weight')), [(0, 1, 2), (1, 0, 2),
+                                                          (2, 1, 5), (2, 2, 1)])
+        G = nx.from_scipy_sparse_matrix(A)
+        assert_equal(G[1][2], {'weight': 5})
+        assert_true(G[1][2] is G[2][1])
+        G.add_edge(0, 1, weight=3)
+        assert_equal(G[1][0]['weight'], 3)
+
     def test_from_scipy_sparse_matrix_parallel_edges(self):
         """Tests that the :func:`networkx.from_scipy_sparse_matrix` function
         interprets integer weights as the number of parallel edges when
@@ -238,3 +288,99 @@ class TestConvertNumpy(object):
         expected = nx.MultiGraph()
         expected.add_edge(0, 1, weight=1)
         assert_graphs_equal(G, expected)
+
+    def test_duplicate_entries(self):
+        """Tests that the last of duplicate entries of a matrix sets the
+        weight of an edge.
+
+        """
+        A = sparse.coo_matrix(([1, 5, 2], ([0, 0, 1], [1, 1, 0])),
+                              shape=(2, 2))
+        G = nx.from_scipy_sparse_matrix(A, create_using=nx.DiGraph())
+        assert_equal(G[0][1]['weight'], 5)
+        assert_equal(G[1][0]['weight'], 2)
+        G = nx.from_scipy_sparse_matrix(A)
+        assert_equal(G[0][1]['weight'], 2)
+
+
+class TestCacheMatrices(object):
+    @classmethod
+    def setupClass(cls):
+        global sparse
+        try:
+            import scipy.sparse as sparse
+        except ImportError:
+            raise SkipTest('SciPy sparse library not available.')
+
+    def test_cache_hit(self):
+        G = nx.path_graph(4)
+        nx.cache_matrices(G)
+        A = nx.to_scipy_sparse_matrix(G)
+        cached = G._matrix_cache.matrices[('adjacency', None, None,
+                                           'weight', 'csr')]
+        B = nx.to_scipy_sparse_matrix(G)
+        assert_true(A is not cached and B is not cached)
+        assert_equal((A - B).nnz, 0)
+        assert_equal(len(G._matrix_cache.matrices), 1)
+        nx.to_scipy_sparse_matrix(G, nodelist=[3, 2, 1, 0])
+        nx.to_scipy_sparse_matrix(G, weight=None, format='coo')
+        assert_equal(len(G._matrix_cache.matrices), 3)
+
+    def test_copies(self):
+        G = nx.path_graph(4)
+        nx.cache_matrices(G)
+        A = nx.to_scipy_sparse_matrix(G, format='lil')
+        A[0, 0] = 5
+        B = nx.to_scipy_sparse_matrix(G, format='lil')
+        assert_equal(B[0, 0], 0)
+
+    def test_invalidation(self):
+        G = nx.path_graph(4)
+        nx.cache_matrices(G)
+        assert_equal(nx.to_scipy_sparse_matrix(G).nnz, 6)
+        G.add_edge(0, 3)
+        assert_equal(nx.to_scipy_sparse_matrix(G).nnz, 8)
+        G.remove_node(3)
+        assert_equal(nx.to_scipy_sparse_matrix(G).nnz, 4)
+        L = nx.laplacian_matrix(G)
+        G.add_edge(0, 2, weight=3)
+        assert_equal(nx.laplacian_matrix(G)[0, 0], L[0, 0] + 3)
+
+    def test_reverse(self):
+        G = nx.DiGraph([(0, 1)])
+        nx.cache_matrices(G)
+        A = nx.to_scipy_sparse_matrix(G)
+        G.reverse(copy=False)
+        B = nx.to_scipy_sparse_matrix(G)
+        assert_equal((A.T - B).nnz, 0)
+
+    def test_eviction(self):
+        G = nx.path_graph(4)
+        nx.cache_matrices(G, maxsize=2)
+        nx.to_scipy_sparse_matrix(G, format='csr')
+        nx.to_scipy_sparse_matrix(G, format='csc')
+        nx.to_scipy_sparse_matrix(G, format='csr')
+        nx.to_scipy_sparse_matrix(G, format='coo')
+        formats = [key[-1] for key in G._matrix_cache.matrices]
+        assert_equal(formats, ['csr', 'coo'])
+
+    def test_disable(self):
+        G = nx.path_graph(4)
+        nx.cache_matrices(G)
+        nx.to_scipy_sparse_matrix(G)
+        nx.cache_matrices(G, maxsize=0)
+        assert_true(G._matrix_cache is None)
+        assert_equal(nx.to_scipy_sparse_matrix(G).nnz, 6)
+        assert_raises(ValueError, nx.cache_matrices, G, -1)
+
+    def test_copy_graph(self):
+        import copy
+        import pickle
+        G = nx.path_graph(4)
+        nx.cache_matrices(G, maxsize=3)
+        nx.to_scipy_sparse_matrix(G)
+        for H in (G.copy(), copy.deepcopy(G),
+                  pickle.loads(pickle.dumps(G))):
+            assert_equal(len(H._matrix_cache.matrices), 0)
+            assert_equal(H._matrix_cache.maxsize, 3)
+            assert_true(H._matrix_cache is not G._matrix_cache)
@@ -11,7 +11,7 @@ from heapq import heappop, heappush
 from itertools import count
 import networkx as nx
 
-__all__ = ['MinHeap', 'PairingHeap', 'BinaryHeap']
+__all__ = ['MinHeap', 'PairingHeap', 'BinaryHeap', 'DaryHeap']
 
 
 class MinHeap(object):
@@ -366,3 +366,117 @@ class BinaryHeap(MinHeap):
             dict[key] = value
             heappush(self._heap, (value, next(self._count), key))
             return True
+
+
+class DaryHeap(MinHeap):
+    """A d-ary heap with an index of the positions of its keys.
+
+    Unlike :class:`BinaryHeap`, which leaves stale pairs in the heap when
+    a value is changed, the position of every key in the underlying array
+    is known, so that values are decreased (or increased) in place.  The
+    heap thus never holds more pairs than there are keys, and a larger
+    arity `d` makes the heap shallower, which speeds up insertions and
+    decreases at the expense of slower pops.
+
+    Pairs with equal values are popped in the order in which their values
+    were last set.
+
+    Parameters
+    ----------
+    d : int
+        The arity of the heap, that is the number of children of each
+        node.  Must be at least 2.  Default value: 4.
+    """
+    def __init__(self, d=4):
+        """Initialize a d-ary heap.
+        """
+        if d < 2:
+            raise ValueError('the arity of a heap must be at least 2.')
+        super(DaryHeap, self).__init__()
+        self._d = d
+        # The heap holds (value, count, key) triples. The dict maps each
+        # key to the position of its triple in the heap.
+        self._heap = []
+        self._count = count()
+
+    @_inherit_doc(MinHeap)
+    def min(self):
+        if not self._heap:
+            raise nx.NetworkXError('heap is empty.')
+        value, _, key = self._heap[0]
+        return (key, value)
+
+    @_inherit_doc(MinHeap)
+    def pop(self):
+        heap = self._heap
+        if not heap:
+            raise nx.NetworkXError('heap is empty.')
+        value, _, key = heap[0]
+        del self._dict[key]
+        last = heap.pop()
+        if heap:
+            self._sift_down(0, last)
+        return (key, value)
+
+    @_inherit_doc(MinHeap)
+    def get(self, key, default=None):
+        pos = self._dict.get(key)
+        return self._heap[pos][0] if pos is not None else default
+
+    @_inherit_doc(MinHeap)
+    def insert(self, key, value, allow_increase=False):
+        heap = self._heap
+        pos = self._dict.get(key)
+        if pos is None:
+            heap.append(None)
+            self._sift_up(len(heap) - 1, (value, next(self._count), key))
+            return True
+        old_value = heap[pos][0]
+        if value < old_value:
+            self._sift_up(pos, (value, next(self._count), key))
+            return True
+        if allow_increase and value > old_value:
+            self._sift_down(pos, (value, next(self._count), key))
+        return False
+
+    def _sift_up(self, pos, item):
+        """Move `item`, to be stored at `pos`, towards the root.
+        """
+        heap = self._heap
+        positions = self._dict
+        d = self._d
+        while pos > 0:
+            parent_pos = (pos - 1) // d
+            parent = heap[parent_pos]
+            if not item < parent:
+                break
+            heap[pos] = parent
+            positions[parent[2]] = pos
+            pos = parent_pos
+        heap[pos] = item
+        positions[item[2]] = pos
+
+    def _sift_down(self, pos, item):
+        """Move `item`, to be stored at `pos`, towards the leaves.
+        """
+        heap = self._heap
+        positions = self._dict
+        d = self._d
+        size = len(heap)
+        while True:
+            first = pos * d + 1
+            if first >= size:
+                break
+            child_pos = first
+            child = heap[first]
+            for i in range(first + 1, min(first + d, size)):
+                if heap[i] < child:
+                    child_pos = i
+                    child = heap[i]
+            if not child < item:
+                break
+            heap[pos] = child
+            positions[child[2]] = pos
+            pos = child_pos
+        heap[pos] = item
+        positions[item[2]] = pos
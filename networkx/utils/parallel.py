@@ -0,0 +1,119 @@
+"""
+Helpers to run per-source computations in a pool of worker processes.
+
+Many algorithms, such as all-pairs shortest paths or betweenness
+centrality, repeat the same single-source computation for every node of
+a graph.  The helpers below split the sources in chunks and evaluate the
+chunks in a :class:`multiprocessing.Pool`.  The graph is sent once to each
+worker process when the pool starts, not once per chunk.
+"""
+#    Copyright (C) 2016 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+import multiprocessing
+
+__all__ = ['effective_n_jobs', 'map_sources']
+
+# The graph of the current worker process, set by the pool initializer.
+_graph = None
+
+
+def effective_n_jobs(n_jobs=None):
+    """Return the number of processes to use for `n_jobs`.
+
+    Parameters
+    ----------
+    n_jobs : int or None
+        The requested number of processes.  None and 1 mean no
+        parallelism, -1 means one process per CPU, -2 one process per
+        CPU but one, and so on.
+
+    Raises
+    ------
+    ValueError
+        If `n_jobs` is zero.
+
+    Examples
+    --------
+    >>> from networkx.utils import effective_n_jobs
+    >>> effective_n_jobs(None)
+    1
+    >>> effective_n_jobs(4)
+    4
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs == 0:
+        raise ValueError('n_jobs == 0 has no meaning.')
+    if n_jobs < 0:
+        return max(1, multiprocessing.cpu_count() + 1 + n_jobs)
+    return n_jobs
+
+
+def _init_worker(G):
+    global _graph
+    _graph = G
+
+
+def _run_chunk(task):
+    func, chunk, args = task
+    return func(_graph, chunk, *args)
+
+
+def map_sources(func, G, sources, n_jobs=None, args=(), chunksize=None):
+    """Return an iterator of `func` applied to chunks of `sources`.
+
+    The iterator yields ``func(G, chunk, *args)`` for consecutive chunks
+    of `sources`, in order.  With more than one job the chunks are
+    evaluated in a pool of worker processes.
+
+    Parameters
+    ----------
+    func : function
+        A module level function (so that it can be pickled) accepting
+        the graph, a list of source nodes and the extra `args`.
+
+    G : NetworkX graph
+        The graph, sent once to each worker process.  Compact graphs
+        such as :class:`CSRGraph` are much cheaper to send.
+
+    sources : iterable
+        The source nodes to split in chunks.
+
+    n_jobs : int or None, optional (default=None)
+        The number of worker processes, see :func:`effective_n_jobs`.
+
+    args : tuple, optional
+        Extra arguments passed to `func`.  They must be picklable.
+
+    chunksize : int, optional
+        The number of sources in each chunk.  By default the sources are
+        split in about four chunks per worker process.
+
+    Notes
+    -----
+    On platforms that start worker processes by spawning a new
+    interpreter (Windows, and macOS on recent Python versions) the calling
+    code must be protected by ``if __name__ == '__main__':``.
+    """
+    n_jobs = effective_n_jobs(n_jobs)
+    sources = list(sources)
+    if chunksize is None:
+        chunksize = max(1, -(-len(sources) // (4 * n_jobs)))
+    chunks = [sources[i:i + chunksize]
+              for i in range(0, len(sources), chunksize)]
+    if n_jobs == 1 or len(chunks) < 2:
+        for chunk in chunks:
+            yield func(G, chunk, *args)
+        return
+    pool = multiprocessing.Pool(min(n_jobs, len(chunks)), _init_worker, (G,))
+    try:
+        tasks = ((func, chunk, args) for chunk in chunks)
+        for result in pool.imap(_run_chunk, tasks):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
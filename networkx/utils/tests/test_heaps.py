@@ -128,3 +128,48 @@ def test_PairingHeap():
 
 def test_BinaryHeap():
     _test_heap_class(BinaryHeap)
+
+
+def test_DaryHeap():
+    _test_heap_class(DaryHeap)
+    _test_heap_class(DaryHeap, 2)
+    _test_heap_class(DaryHeap, d=3)
+    assert_raises(ValueError, DaryHeap, 1)
+
+
+def test_DaryHeap_ties():
+    # Pairs with equal values are popped in the order they were set.
+    heap = DaryHeap()
+    for key in 'abcde':
+        heap.insert(key, 1)
+    heap.insert('f', 2)
+    heap.insert('f', 1)
+    heap.insert('b', 0)
+    heap.insert('b', 1, allow_increase=True)
+    assert_equal([heap.pop()[0] for i in range(6)],
+                 ['a', 'c', 'd', 'e', 'f', 'b'])
+    assert_equal(len(heap), 0)
+
+
+def test_DaryHeap_random():
+    import random
+    rng = random.Random(42)
+    for d in (2, 3, 4, 8):
+        heap = DaryHeap(d)
+        values = {}
+        for i in range(500):
+            key = rng.randint(0, 100)
+            value = rng.randint(0, 1000)
+            if key in values and rng.random() < 0.5:
+                heap.insert(key, value, allow_increase=True)
+                values[key] = value
+            elif heap.insert(key, value):
+                values[key] = value
+            assert_equal(heap.get(key), values[key])
+            assert_equal(len(heap), len(values))
+            if rng.random() < 0.3:
+                key, value = heap.pop()
+                assert_equal(value, min(values.values()))
+                assert_equal(values.pop(key), value)
+        popped = [heap.pop()[1] for i in range(len(heap))]
+        assert_equal(popped, sorted(values.values()))
@@ -0,0 +1,37 @@
+from nose.tools import assert_equal
+from nose.tools import raises
+
+import networkx as nx
+from networkx.utils import effective_n_jobs, map_sources
+
+
+def _degrees(G, sources, offset):
+    return [G.degree(n) + offset for n in sources]
+
+
+def test_effective_n_jobs():
+    assert_equal(effective_n_jobs(None), 1)
+    assert_equal(effective_n_jobs(3), 3)
+    cpus = nx.utils.parallel.multiprocessing.cpu_count()
+    assert_equal(effective_n_jobs(-1), cpus)
+    assert_equal(effective_n_jobs(-1000), 1)
+
+
+@raises(ValueError)
+def test_effective_n_jobs_zero():
+    effective_n_jobs(0)
+
+
+def test_map_sources():
+    G = nx.star_graph(10)
+    expected = [d + 1 for n, d in G.degree()]
+    for n_jobs in (None, 1, 2):
+        chunks = list(map_sources(_degrees, G, G, n_jobs, args=(1,)))
+        assert_equal(sum(chunks, []), expected)
+    chunks = list(map_sources(_degrees, G, G, 2, args=(0,), chunksize=4))
+    assert_equal([len(c) for c in chunks], [4, 4, 3])
+
+
+def test_map_sources_empty():
+    assert_equal(list(map_sources(_degrees, nx.Graph(), [], 2, args=(0,))),
+                 [])